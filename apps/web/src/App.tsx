@@ -16,8 +16,18 @@ import "@livekit/components-styles";
 import { Track, ConnectionState } from "livekit-client";
 import "./styles.css";
 import type { GuideItem, SessionStatus, Role } from "./types";
-import { getGuideItems, getGuideMeta } from "./lib/guide";
-import { createSession, joinSession, startSession, endSession, getSession, getSessionStatus, SessionNotFoundError } from "./lib/session";
+import { loadSessionGuide } from "./lib/guide";
+import type { SessionGuide } from "./lib/guide";
+import {
+  createSession,
+  joinSession,
+  startSession,
+  endSession,
+  getSession,
+  subscribeSessionEvents,
+  SessionNotFoundError
+} from "./lib/session";
+import type { SessionEventData } from "./lib/session";
 
 const UI_NOTICE = "This session may be recorded/transcribed.";
 const LIVEKIT_URL = import.meta.env.VITE_LIVEKIT_URL ?? "wss://ai-XXXXXXXXXXX.livekit.cloud";
@@ -33,13 +43,6 @@ const joinNotice = {
   text: UI_NOTICE
 };
 
-const getGuideTitle = () => {
-  const meta = getGuideMeta();
-  return meta.title;
-};
-
-const getGuideItemsForSession = (): GuideItem[] => getGuideItems();
-
 // LiveKit Room Content Component
 const RoomContent = ({
   sessionId,
@@ -47,6 +50,7 @@ const RoomContent = ({
   setSessionStatus,
   role,
   displayName,
+  guideTitle,
   guideItems,
   guideIndex,
   setGuideIndex,
@@ -60,6 +64,7 @@ const RoomContent = ({
   setSessionStatus: (status: SessionStatus) => void;
   role: Role;
   displayName: string;
+  guideTitle: string;
   guideItems: GuideItem[];
   guideIndex: number;
   setGuideIndex: (fn: (n: number) => number) => void;
@@ -83,7 +88,6 @@ const RoomContent = ({
   const [agentJoined, setAgentJoined] = useState(false);
   const [agentIdentity, setAgentIdentity] = useState<string | null>(null);
   
-  const guideTitle = getGuideTitle();
   const currentGuideItem = guideItems[guideIndex];
 
   // STRUCTURED LOG: When connected to room
@@ -93,39 +97,32 @@ const RoomContent = ({
     }
   }, [connectionState, room]);
 
-  // Poll session status with agent presence check
+  // Session deltas pushed by the API (SSE, or polled where unavailable) — status and agent presence
   useEffect(() => {
     if (!sessionId) return;
-    
-    const interval = setInterval(async () => {
-      try {
-        const status = await getSessionStatus(sessionId);
-        if (status.status !== sessionStatus) {
-          setSessionStatus(status.status as SessionStatus);
-        }
-        // Update agent status
-        if (status.agentJoined !== agentJoined) {
-          setAgentJoined(status.agentJoined);
-          if (status.agentJoined) {
-            console.log(`[ui][AGENT_JOINED] roomName=${roomName} agentIdentity=${status.agentIdentity}`);
+
+    return subscribeSessionEvents(
+      sessionId,
+      (topic, data) => {
+        if (topic === "status") {
+          setSessionStatus((data as SessionEventData["status"]).status);
+        } else if (topic === "agent") {
+          const agent = data as SessionEventData["agent"];
+          setAgentJoined(agent.agentJoined);
+          if (agent.agentIdentity) {
+            setAgentIdentity(agent.agentIdentity);
+          }
+          if (agent.agentJoined) {
+            console.log(`[ui][AGENT_JOINED] roomName=${roomName} agentIdentity=${agent.agentIdentity}`);
           }
         }
-        if (status.agentIdentity) {
-          setAgentIdentity(status.agentIdentity);
-        }
-      } catch (e) {
-        // Handle 404 - session no longer exists (e.g., API restarted)
-        if (e instanceof SessionNotFoundError) {
-          console.warn("[ui][SESSION_NOT_FOUND] redirecting to join page:", sessionId);
-          onSessionNotFound();
-          return;
-        }
-        console.error("[ui][POLL_ERROR]", e);
+      },
+      () => {
+        console.warn("[ui][SESSION_NOT_FOUND] redirecting to join page:", sessionId);
+        onSessionNotFound();
       }
-    }, 2000);
-    
-    return () => clearInterval(interval);
-  }, [sessionId, sessionStatus, setSessionStatus, onSessionNotFound, agentJoined, roomName]);
+    );
+  }, [sessionId, setSessionStatus, onSessionNotFound, roomName]);
 
   const onStartSession = async () => {
     if (!sessionId) return;
@@ -385,7 +382,28 @@ const App = () => {
   const [agentJoined, setAgentJoined] = useState(false);
   const [livekitUrl, setLivekitUrl] = useState(LIVEKIT_URL);
 
-  const guideItems = useMemo(getGuideItemsForSession, []);
+  const [guideHash, setGuideHash] = useState("");
+  const [guideTitle, setGuideTitle] = useState("Focus Group");
+  const [guide, setGuide] = useState<SessionGuide | null>(null);
+
+  const guideItems = useMemo(() => guide?.items ?? [], [guide]);
+
+  // Load only the active session's guide, once per guide hash
+  useEffect(() => {
+    if (!sessionId || !guideHash) return;
+    let cancelled = false;
+    loadSessionGuide(sessionId, guideHash)
+      .then((loaded) => {
+        if (!cancelled) {
+          setGuide(loaded);
+          setGuideTitle(loaded.title);
+        }
+      })
+      .catch((e) => console.error("[ui][GUIDE_LOAD_ERROR]", e));
+    return () => {
+      cancelled = true;
+    };
+  }, [sessionId, guideHash]);
 
   // Reset to join page (e.g., when session 404s)
   const resetToJoinPage = useCallback(() => {
@@ -395,6 +413,8 @@ const App = () => {
     setToken("");
     setSessionStatus("waiting");
     setGuideIndex(0);
+    setGuideHash("");
+    setGuide(null);
     setError("Session expired or not found. Please create a new session.");
   }, []);
 
@@ -417,6 +437,10 @@ const App = () => {
       setSessionId(session.id);
       setRoomName(session.roomName);
       setSessionStatus(session.status);
+      setGuideHash(session.guideHash ?? "");
+      if (session.guideTitle) {
+        setGuideTitle(session.guideTitle);
+      }
       
       // Then join and get token
       const joinResponse = await joinSession(
@@ -537,6 +561,7 @@ const App = () => {
         setSessionStatus={setSessionStatus}
         role={role}
         displayName={displayName}
+        guideTitle={guideTitle}
         guideItems={guideItems}
         guideIndex={guideIndex}
         setGuideIndex={setGuideIndex}
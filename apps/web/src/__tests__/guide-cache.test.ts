@@ -0,0 +1,57 @@
+import { vi, describe, it, expect } from "vitest";
+import { loadSessionGuide } from "../lib/guide";
+
+const guideBody = {
+  meta: { title: "App Feedback" },
+  sections: [{ id: "intro", title: "Intro", questions: [{ id: "q1", text: "How do you use the app?" }] }]
+};
+
+const jsonResponse = (body: unknown, status = 200) => new Response(JSON.stringify(body), { status });
+
+// The cache is module-level, so each test uses its own guide hashes
+describe("loadSessionGuide", () => {
+  it("fetches a guide hash once and shares the result", async () => {
+    const fetchMock = vi.fn(async () => jsonResponse(guideBody));
+    vi.stubGlobal("fetch", fetchMock);
+
+    const [first, second] = await Promise.all([
+      loadSessionGuide("session-1", "hash-a"),
+      loadSessionGuide("session-1", "hash-a")
+    ]);
+    const again = await loadSessionGuide("session-2", "hash-a");
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(fetchMock).toHaveBeenCalledWith(expect.stringMatching(/\/api\/sessions\/session-1\/guide$/));
+    expect(first).toEqual({
+      title: "App Feedback",
+      items: [{ id: "q1", sectionId: "intro", sectionTitle: "Intro", type: "question", text: "How do you use the app?" }]
+    });
+    expect(second).toBe(first);
+    expect(again).toBe(first);
+  });
+
+  it("fetches again for a different guide hash", async () => {
+    const fetchMock = vi.fn(async () => jsonResponse(guideBody));
+    vi.stubGlobal("fetch", fetchMock);
+
+    await loadSessionGuide("session-1", "hash-b");
+    await loadSessionGuide("session-3", "hash-c");
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(fetchMock).toHaveBeenLastCalledWith(expect.stringMatching(/\/api\/sessions\/session-3\/guide$/));
+  });
+
+  it("does not cache a failed fetch", async () => {
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce(jsonResponse({ detail: "Guide not found" }, 404))
+      .mockResolvedValueOnce(jsonResponse(guideBody));
+    vi.stubGlobal("fetch", fetchMock);
+
+    await expect(loadSessionGuide("session-1", "hash-d")).rejects.toThrow("Failed to load guide");
+    const guide = await loadSessionGuide("session-1", "hash-d");
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(guide.title).toBe("App Feedback");
+  });
+});
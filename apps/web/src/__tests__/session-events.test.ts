@@ -0,0 +1,186 @@
+import { vi, describe, it, expect, beforeEach, afterEach } from "vitest";
+import { subscribeSessionEvents } from "../lib/session";
+
+// Minimal EventSource: records instances so tests can push events and drop the stream
+class FakeEventSource {
+  static CONNECTING = 0;
+  static OPEN = 1;
+  static CLOSED = 2;
+  static instances: FakeEventSource[] = [];
+
+  url: string;
+  readyState = FakeEventSource.OPEN;
+  onerror: (() => void) | null = null;
+  listeners = new Map<string, Array<(event: Event) => void>>();
+
+  constructor(url: string) {
+    this.url = url;
+    FakeEventSource.instances.push(this);
+  }
+
+  addEventListener(type: string, listener: (event: Event) => void) {
+    this.listeners.set(type, [...(this.listeners.get(type) ?? []), listener]);
+  }
+
+  emit(type: string, data: unknown, lastEventId = "") {
+    const event = new MessageEvent(type, { data: JSON.stringify(data), lastEventId });
+    (this.listeners.get(type) ?? []).forEach((listener) => listener(event));
+  }
+
+  drop(readyState: number) {
+    this.readyState = readyState;
+    this.onerror?.();
+  }
+
+  close() {
+    this.readyState = FakeEventSource.CLOSED;
+  }
+}
+
+// Resolves without real I/O, so fake timers alone drive each poll
+const jsonResponse = (body: unknown, status = 200) =>
+  ({ ok: status < 400, status, json: async () => body }) as Response;
+
+const statusBody = (overrides: Record<string, unknown> = {}) => ({
+  sessionId: "session-1",
+  roomName: "leverai-demo",
+  status: "waiting",
+  agentJoined: false,
+  agentIdentity: null,
+  participantCount: 1,
+  livekitParticipants: [],
+  prerender: null,
+  ...overrides
+});
+
+describe("subscribeSessionEvents over SSE", () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    FakeEventSource.instances = [];
+    vi.stubGlobal("EventSource", FakeEventSource);
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("delivers the snapshot and deltas", () => {
+    const onEvent = vi.fn();
+    subscribeSessionEvents("session-1", onEvent, vi.fn());
+    const [source] = FakeEventSource.instances;
+
+    source.emit("snapshot", { status: { status: "waiting" }, agent: { agentJoined: false, agentIdentity: null } }, "3");
+    source.emit("agent", { agentJoined: true, agentIdentity: "agent-AJ_1" }, "4");
+
+    expect(source.url).toMatch(/\/api\/sessions\/session-1\/events$/);
+    expect(onEvent.mock.calls).toEqual([
+      ["status", { status: "waiting" }],
+      ["agent", { agentJoined: false, agentIdentity: null }],
+      ["agent", { agentJoined: true, agentIdentity: "agent-AJ_1" }]
+    ]);
+  });
+
+  it("leaves transient drops to the browser's Last-Event-ID retry", async () => {
+    const fetchMock = vi.fn();
+    vi.stubGlobal("fetch", fetchMock);
+    subscribeSessionEvents("session-1", vi.fn(), vi.fn());
+
+    FakeEventSource.instances[0].drop(FakeEventSource.CONNECTING);
+    await vi.advanceTimersByTimeAsync(5000);
+
+    expect(FakeEventSource.instances).toHaveLength(1);
+    expect(fetchMock).not.toHaveBeenCalled();
+  });
+
+  it("resumes from the last event ID after the stream is closed", async () => {
+    vi.stubGlobal("fetch", vi.fn(async () => jsonResponse({ id: "session-1", roomName: "leverai-demo", status: "waiting" })));
+    const onEvent = vi.fn();
+    subscribeSessionEvents("session-1", onEvent, vi.fn());
+    const [first] = FakeEventSource.instances;
+    first.emit("status", { status: "in_session" }, "7");
+
+    first.drop(FakeEventSource.CLOSED);
+    await vi.advanceTimersByTimeAsync(2000);
+
+    expect(FakeEventSource.instances).toHaveLength(2);
+    const [, second] = FakeEventSource.instances;
+    expect(second.url).toMatch(/\/events\?cursor=7$/);
+    second.emit("agent", { agentJoined: true, agentIdentity: "agent-AJ_1" }, "8");
+    expect(onEvent).toHaveBeenLastCalledWith("agent", { agentJoined: true, agentIdentity: "agent-AJ_1" });
+  });
+
+  it("reports a session that no longer exists instead of reconnecting", async () => {
+    vi.stubGlobal("fetch", vi.fn(async () => jsonResponse({ detail: "Session not found" }, 404)));
+    const onNotFound = vi.fn();
+    subscribeSessionEvents("session-1", vi.fn(), onNotFound);
+
+    FakeEventSource.instances[0].drop(FakeEventSource.CLOSED);
+    await vi.advanceTimersByTimeAsync(5000);
+
+    expect(onNotFound).toHaveBeenCalledTimes(1);
+    expect(FakeEventSource.instances).toHaveLength(1);
+  });
+
+  it("stops reconnecting once unsubscribed", async () => {
+    vi.stubGlobal("fetch", vi.fn(async () => jsonResponse({ id: "session-1", roomName: "leverai-demo", status: "waiting" })));
+    const unsubscribe = subscribeSessionEvents("session-1", vi.fn(), vi.fn());
+
+    FakeEventSource.instances[0].drop(FakeEventSource.CLOSED);
+    unsubscribe();
+    await vi.advanceTimersByTimeAsync(5000);
+
+    expect(FakeEventSource.instances).toHaveLength(1);
+  });
+});
+
+describe("subscribeSessionEvents polling fallback", () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    vi.stubGlobal("EventSource", undefined);
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("polls status and reports only changes", async () => {
+    let body = statusBody();
+    const fetchMock = vi.fn(async () => jsonResponse(body));
+    vi.stubGlobal("fetch", fetchMock);
+    const onEvent = vi.fn();
+    const unsubscribe = subscribeSessionEvents("session-1", onEvent, vi.fn());
+
+    await vi.advanceTimersByTimeAsync(2000);
+    expect(fetchMock).toHaveBeenCalledWith(expect.stringMatching(/\/api\/sessions\/session-1\/status$/));
+    expect(onEvent.mock.calls).toEqual([
+      ["status", { status: "waiting" }],
+      ["agent", { agentJoined: false, agentIdentity: null }],
+      ["prerender", null]
+    ]);
+
+    onEvent.mockClear();
+    await vi.advanceTimersByTimeAsync(2000);
+    expect(onEvent).not.toHaveBeenCalled();
+
+    body = statusBody({ agentJoined: true, agentIdentity: "agent-AJ_1" });
+    await vi.advanceTimersByTimeAsync(2000);
+    expect(onEvent.mock.calls).toEqual([["agent", { agentJoined: true, agentIdentity: "agent-AJ_1" }]]);
+
+    unsubscribe();
+    const polls = fetchMock.mock.calls.length;
+    await vi.advanceTimersByTimeAsync(6000);
+    expect(fetchMock).toHaveBeenCalledTimes(polls);
+  });
+
+  it("stops polling when the session is gone", async () => {
+    const fetchMock = vi.fn(async () => jsonResponse({ detail: "Session not found" }, 404));
+    vi.stubGlobal("fetch", fetchMock);
+    const onNotFound = vi.fn();
+    subscribeSessionEvents("session-1", vi.fn(), onNotFound);
+
+    await vi.advanceTimersByTimeAsync(6000);
+
+    expect(onNotFound).toHaveBeenCalledTimes(1);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+});
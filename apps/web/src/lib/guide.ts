@@ -1,16 +1,16 @@
-import guide from "../../../../discussion_guide.json";
+import { apiBaseUrl } from "./session";
 import type { GuideItem, GuideItemType } from "../types";
 
 type GuideSource = {
   meta: {
     title: string;
-    duration_minutes: number;
+    duration_minutes?: number;
   };
   sections: Array<{
     id: string;
     title: string;
     script_md?: string;
-    questions: Array<{
+    questions?: Array<{
       id: string;
       type?: GuideItemType;
       text?: string;
@@ -19,7 +19,13 @@ type GuideSource = {
   }>;
 };
 
-const guideSource = guide as GuideSource;
+export type SessionGuide = {
+  title: string;
+  items: GuideItem[];
+};
+
+// Guides are content-addressed, so a hash always maps to the same items
+const guideCache = new Map<string, Promise<SessionGuide>>();
 
 const normalizeType = (type?: GuideItemType): GuideItemType => {
   if (!type) {
@@ -28,9 +34,7 @@ const normalizeType = (type?: GuideItemType): GuideItemType => {
   return type;
 };
 
-export const getGuideMeta = () => guideSource.meta;
-
-export const getGuideItems = (): GuideItem[] => {
+export const getGuideItems = (guideSource: GuideSource): GuideItem[] => {
   const items: GuideItem[] = [];
 
   guideSource.sections.forEach((section) => {
@@ -44,7 +48,7 @@ export const getGuideItems = (): GuideItem[] => {
       });
     }
 
-    section.questions.forEach((question) => {
+    (section.questions ?? []).forEach((question) => {
       const text = question.text ?? question.script_md ?? "";
       if (!text) {
         return;
@@ -61,3 +65,27 @@ export const getGuideItems = (): GuideItem[] => {
 
   return items;
 };
+
+// Fetch the session's guide on demand; cached per guide hash for the page's lifetime
+export const loadSessionGuide = (sessionId: string, guideHash: string): Promise<SessionGuide> => {
+  const cached = guideCache.get(guideHash);
+  if (cached) {
+    return cached;
+  }
+
+  const pending = fetch(`${apiBaseUrl}/api/sessions/${sessionId}/guide`)
+    .then(async (response) => {
+      if (!response.ok) {
+        throw new Error("Failed to load guide");
+      }
+      const guideSource = (await response.json()) as GuideSource;
+      return { title: guideSource.meta?.title ?? "Focus Group", items: getGuideItems(guideSource) };
+    })
+    .catch((error) => {
+      guideCache.delete(guideHash);
+      throw error;
+    });
+
+  guideCache.set(guideHash, pending);
+  return pending;
+};
@@ -4,6 +4,9 @@ type ApiSession = {
   id: string;
   roomName: string;
   status: SessionStatus;
+  guideId?: string | null;
+  guideTitle?: string | null;
+  guideHash?: string | null;
 };
 
 type JoinResponse = {
@@ -24,7 +27,7 @@ export class SessionNotFoundError extends Error {
 }
 
 // Use port 8000 for Python FastAPI server
-const apiBaseUrl = import.meta.env.VITE_API_URL ?? "http://localhost:8000";
+export const apiBaseUrl = import.meta.env.VITE_API_URL ?? "http://localhost:8000";
 
 export const createSession = async (roomName: string): Promise<ApiSession> => {
   const response = await fetch(`${apiBaseUrl}/api/sessions`, {
@@ -121,6 +124,15 @@ export const endSession = async (sessionId: string) => {
   return response.json();
 };
 
+export type PrerenderStatus = {
+  total: number;
+  ready: number;
+  failed: number;
+  coverage: number;
+  elapsedMs: number;
+  done: boolean;
+};
+
 export type SessionStatusResponse = {
   sessionId: string;
   roomName: string;
@@ -129,6 +141,7 @@ export type SessionStatusResponse = {
   agentIdentity: string | null;
   participantCount: number;
   livekitParticipants: string[];
+  prerender?: PrerenderStatus | null;
 };
 
 export const getSessionStatus = async (sessionId: string): Promise<SessionStatusResponse> => {
@@ -144,3 +157,145 @@ export const getSessionStatus = async (sessionId: string): Promise<SessionStatus
 
   return response.json() as Promise<SessionStatusResponse>;
 };
+
+export type SessionEventTopic = "status" | "agent" | "roster" | "hands" | "question" | "prerender";
+
+export type SessionEventData = {
+  // Timestamps are pushed only; the polling fallback reports the status alone
+  status: { status: SessionStatus; startedAt?: string | null; endedAt?: string | null };
+  agent: { agentJoined: boolean; agentIdentity: string | null };
+  roster: { participants: unknown[] };
+  hands: { handRaiseQueue: string[] };
+  question: { currentQuestionId: string | null; currentSectionId: string | null; currentSpeakerId: string | null };
+  prerender: PrerenderStatus | null;
+};
+
+const SESSION_EVENT_TOPICS: SessionEventTopic[] = ["status", "agent", "roster", "hands", "question", "prerender"];
+
+const SESSION_POLL_MS = 2000;
+
+// Where EventSource is unavailable: poll the status endpoint and report
+// status, agent and prerender as events, each only when it has changed
+const pollSessionEvents = (
+  sessionId: string,
+  onEvent: (topic: SessionEventTopic, data: SessionEventData[SessionEventTopic]) => void,
+  onNotFound: () => void
+): (() => void) => {
+  const last = new Map<SessionEventTopic, string>();
+  let closed = false;
+
+  const report = (topic: SessionEventTopic, data: SessionEventData[SessionEventTopic]) => {
+    const json = JSON.stringify(data);
+    if (last.get(topic) !== json) {
+      last.set(topic, json);
+      onEvent(topic, data);
+    }
+  };
+
+  const interval = setInterval(async () => {
+    try {
+      const status = await getSessionStatus(sessionId);
+      if (closed) {
+        return;
+      }
+      report("status", { status: status.status });
+      report("agent", { agentJoined: status.agentJoined, agentIdentity: status.agentIdentity });
+      report("prerender", status.prerender ?? null);
+    } catch (e) {
+      // Handle 404 - session no longer exists (e.g., API restarted)
+      if (e instanceof SessionNotFoundError) {
+        clearInterval(interval);
+        if (!closed) {
+          onNotFound();
+        }
+        return;
+      }
+      console.error("[ui][POLL_ERROR]", e);
+    }
+  }, SESSION_POLL_MS);
+
+  return () => {
+    closed = true;
+    clearInterval(interval);
+  };
+};
+
+// Subscribe to pushed session deltas (polled where EventSource is unavailable).
+// Returns an unsubscribe function.
+export const subscribeSessionEvents = (
+  sessionId: string,
+  onEvent: (topic: SessionEventTopic, data: SessionEventData[SessionEventTopic]) => void,
+  onNotFound: () => void
+): (() => void) => {
+  if (typeof EventSource === "undefined") {
+    return pollSessionEvents(sessionId, onEvent, onNotFound);
+  }
+
+  let cursor: string | null = null;
+  let source: EventSource | null = null;
+  let retry: ReturnType<typeof setTimeout> | null = null;
+  let closed = false;
+
+  const track = (event: Event) => {
+    const { lastEventId } = event as MessageEvent;
+    if (lastEventId) {
+      cursor = lastEventId;
+    }
+  };
+
+  const reconnectLater = () => {
+    if (!closed) {
+      retry = setTimeout(connect, 2000);
+    }
+  };
+
+  function connect() {
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+    source = new EventSource(`${apiBaseUrl}/api/sessions/${sessionId}/events${query}`);
+
+    source.addEventListener("snapshot", (event) => {
+      track(event);
+      const snapshot = JSON.parse((event as MessageEvent).data) as Partial<SessionEventData>;
+      SESSION_EVENT_TOPICS.forEach((topic) => {
+        if (topic in snapshot) {
+          onEvent(topic, snapshot[topic] as SessionEventData[SessionEventTopic]);
+        }
+      });
+    });
+
+    SESSION_EVENT_TOPICS.forEach((topic) => {
+      source?.addEventListener(topic, (event) => {
+        track(event);
+        onEvent(topic, JSON.parse((event as MessageEvent).data));
+      });
+    });
+
+    source.onerror = () => {
+      // Transient drops are retried by the browser with Last-Event-ID; a stream
+      // it gave up on (e.g. a 404 after an API restart) resumes from our cursor
+      if (closed || source?.readyState !== EventSource.CLOSED) {
+        return;
+      }
+      source.close();
+      getSession(sessionId)
+        .then(reconnectLater)
+        .catch((e) => {
+          if (e instanceof SessionNotFoundError) {
+            onNotFound();
+          } else {
+            reconnectLater();
+          }
+        });
+    };
+  }
+
+  connect();
+
+  return () => {
+    closed = true;
+    source?.close();
+    if (retry) {
+      clearTimeout(retry);
+    }
+  };
+};
@@ -0,0 +1,222 @@
+"""
+Worker-to-API event channel.
+
+One websocket per worker process, shared by every room the worker is
+moderating. Sessions subscribe to receive their control messages (start,
+end, hand raise) and emit compact events:
+
+    {"s": session_id, "k": kind, "t": epoch_ms, ...fields}
+
+emit() never blocks or awaits: events go into a bounded buffer that a
+background task flushes in batches. While the API is slow or unreachable
+the buffer absorbs the backlog — state-like kinds (question, speaker) keep
+only their latest value per session, and the oldest other events are
+dropped once the buffer is full — so the speech loop is never held up.
+
+The API only accepts the channel with a short-lived LiveKit access token
+carrying the agent grant, signed with the project's API secret, so only
+a worker holding the LiveKit credentials can drive session state.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+from livekit import api
+
+from logs import log_event
+
+AGENT_CHANNEL_ENABLED = os.getenv("AGENT_CHANNEL_ENABLED", "true").lower() == "true"
+AGENT_CHANNEL_FLUSH_SECONDS = float(os.getenv("AGENT_CHANNEL_FLUSH_MS", "100")) / 1000
+AGENT_CHANNEL_BUFFER = int(os.getenv("AGENT_CHANNEL_BUFFER", "512"))
+AGENT_CHANNEL_BATCH = 64
+AGENT_CHANNEL_MAX_BACKOFF = 30.0
+AGENT_CHANNEL_TOKEN_TTL = timedelta(minutes=5)  # only checked on connect
+
+# Kinds where only the latest value per session matters
+COALESCED_KINDS = {"question", "speaker"}
+
+
+def channel_url(api_base: str) -> str:
+    """ws(s):// URL of the API's agent channel for an http(s):// API base."""
+    if api_base.startswith("https://"):
+        api_base = "wss://" + api_base[len("https://"):]
+    elif api_base.startswith("http://"):
+        api_base = "ws://" + api_base[len("http://"):]
+    return api_base.rstrip("/") + "/api/agent/ws"
+
+
+def agent_token(worker_id: str) -> Optional[str]:
+    """LiveKit-signed token the API verifies on connect; None without credentials."""
+    key, secret = os.getenv("LIVEKIT_API_KEY"), os.getenv("LIVEKIT_API_SECRET")
+    if not key or not secret:
+        return None
+    return (api.AccessToken(key, secret).with_identity(worker_id)
+            .with_grants(api.VideoGrants(agent=True)).with_ttl(AGENT_CHANNEL_TOKEN_TTL).to_jwt())
+
+
+class ApiChannel:
+    """Multiplexed, reconnecting, non-blocking event channel to the API."""
+
+    def __init__(self, url: str, worker_id: Optional[str] = None,
+                 flush_interval: float = AGENT_CHANNEL_FLUSH_SECONDS,
+                 max_pending: int = AGENT_CHANNEL_BUFFER):
+        self.url = url
+        self.worker_id = worker_id or f"worker-{os.getpid()}"
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.handlers: Dict[str, Callable[[dict], None]] = {}
+        self.identities: Dict[str, str] = {}  # session -> agent participant identity in its room
+        self.connected = False
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._pending: "OrderedDict[Tuple, dict]" = OrderedDict()
+        self._control: List[dict] = []  # subscribe / unsubscribe, sent before events
+        self._seq = 0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    # ---- session side (never blocks) ----
+
+    def subscribe(self, session_id: str, handler: Callable[[dict], None], identity: Optional[str] = None):
+        """
+        Route control messages for session_id to handler. Subscribing also
+        tells the API the agent (as identity) is present in the room.
+        """
+        self.handlers[session_id] = handler
+        message = {"type": "subscribe", "s": session_id}
+        if identity:
+            self.identities[session_id] = identity
+            message["identity"] = identity
+        self._send_control(message)
+        self.start()
+
+    def unsubscribe(self, session_id: str):
+        self.identities.pop(session_id, None)
+        if self.handlers.pop(session_id, None) is not None:
+            self._send_control({"type": "unsubscribe", "s": session_id})
+
+    def emit(self, session_id: str, kind: str, **fields):
+        event = {"s": session_id, "k": kind, "t": int(time.time() * 1000), **fields}
+        if kind in COALESCED_KINDS:
+            key: Tuple = (session_id, kind)
+            if self._pending.pop(key, None) is not None:
+                self.coalesced += 1
+        else:
+            self._seq += 1
+            key = (session_id, kind, self._seq)
+        self._pending[key] = event
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+            self.dropped += 1
+        if len(self._pending) >= AGENT_CHANNEL_BATCH:
+            self._wake.set()
+
+    def _send_control(self, message: dict):
+        if self.connected:
+            self._control.append(message)
+            self._wake.set()
+        # Otherwise the hello on (re)connect carries every subscription
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> dict:
+        return {"sent": self.sent, "coalesced": self.coalesced, "dropped": self.dropped,
+                "pending": len(self._pending), "connected": self.connected}
+
+    # ---- connection ----
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        backoff = 1.0
+        async with aiohttp.ClientSession() as http:
+            while True:
+                token = agent_token(self.worker_id)
+                headers = {"Authorization": f"Bearer {token}"} if token else {}
+                try:
+                    async with http.ws_connect(self.url, params={"worker": self.worker_id},
+                                               headers=headers, heartbeat=30) as ws:
+                        await self._serve(ws)
+                        backoff = 1.0
+                except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as e:
+                    log_event("AGENT_CHANNEL_ERROR", worker=self.worker_id, error=str(e) or type(e).__name__)
+                finally:
+                    self.connected = False
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, AGENT_CHANNEL_MAX_BACKOFF)
+
+    async def _serve(self, ws):
+        self._control.clear()
+        await ws.send_json({"type": "hello", "worker": self.worker_id, "sessions": list(self.handlers),
+                            "identities": dict(self.identities)})
+        self.connected = True
+        log_event("AGENT_CHANNEL_CONNECTED", worker=self.worker_id, sessions=len(self.handlers))
+        reader = asyncio.create_task(self._read(ws))
+        try:
+            while not reader.done():
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                await self._flush(ws)
+        finally:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+
+    async def _flush(self, ws):
+        while self._control:
+            await ws.send_json(self._control.pop(0))
+        while self._pending:
+            batch = []
+            while self._pending and len(batch) < AGENT_CHANNEL_BATCH:
+                batch.append(self._pending.popitem(last=False)[1])
+            await ws.send_json({"type": "events", "events": batch})
+            self.sent += len(batch)
+
+    async def _read(self, ws):
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                continue
+            try:
+                data = json.loads(msg.data)
+            except ValueError:
+                continue
+            if data.get("type") != "control":
+                continue
+            handler = self.handlers.get(data.get("s"))
+            if handler is None:
+                continue
+            try:
+                handler(data.get("message") or {})
+            except Exception as e:
+                log_event("AGENT_CHANNEL_HANDLER_ERROR", session_id=data.get("s"), error=str(e))
+
+
+_channel: Optional[ApiChannel] = None
+
+
+def get_api_channel(api_base: str) -> Optional[ApiChannel]:
+    """Process-wide channel, or None when AGENT_CHANNEL_ENABLED is false."""
+    global _channel
+    if not AGENT_CHANNEL_ENABLED:
+        return None
+    if _channel is None:
+        _channel = ApiChannel(channel_url(api_base))
+    return _channel
@@ -0,0 +1,193 @@
+"""
+Replay benchmark: gap from end of speech to the next moderator prompt.
+
+Replays timed answer traces (VAD transitions plus interim/final transcripts,
+shaped like Silero + Deepgram output) through the real TurnEngine, once with
+the fixed END_OF_SPEECH_SILENCE window (pause model off), once with the multi-signal end-of-turn
+detector, and once with the detector but no pause-model floor (a confident
+turn commits after commit_seconds). Each trace belongs to a speaker whose
+pause history from earlier turns is loaded into the PauseModel first; None is
+a participant we have not heard pause yet.
+
+For every mode it reports the gap between the participant's actual end of
+speech and the moment the turn completes (i.e. when the next prompt can
+start), over the turns that were not cut short, and how many turns ended
+before the participant had finished (premature end of turn). Traces that
+pause after a complete sentence and then carry on are the ones a latency-only
+figure hides.
+
+Run with: python services/agent/bench/bench_end_of_turn.py
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import moderator
+from moderator import ModeratorState, TurnEngine, TurnEventKind, wait_for_turn_completion
+import pause_model
+from pause_model import PauseModel
+
+VAD_MIN_SILENCE = 0.55  # Silero default min_silence_duration
+
+# Inter-utterance pauses (seconds) each speaker showed on earlier questions
+SPEAKERS = {
+    "quick": [0.4, 0.5, 0.6, 0.5],
+    "steady": [0.9, 1.1, 1.3, 1.0, 1.2],
+    "deliberate": [1.6, 2.0, 2.4, 1.8, 2.2],
+}
+
+# name -> (speaker, [(seconds from turn start, kind, payload)]); "end" marks the true end of speech
+TRACES = {
+    "short_answer": ("quick", [
+        (0.3, "vad", "speaking"),
+        (1.0, "interim", "I think the"),
+        (1.8, "interim", "I think the price is"),
+        (2.5, "end", None),
+        (2.7, "final", "I think the price is fair."),
+        (2.5 + VAD_MIN_SILENCE, "vad", "listening"),
+    ]),
+    "consent": (None, [
+        (0.4, "vad", "speaking"),
+        (0.8, "end", None),
+        (0.9, "final", "Yes."),
+        (0.8 + VAD_MIN_SILENCE, "vad", "listening"),
+    ]),
+    "mid_answer_pause": ("steady", [
+        (0.2, "vad", "speaking"),
+        (1.2, "interim", "I liked the app"),
+        (2.0, "final", "I liked the app because"),
+        (2.0 + VAD_MIN_SILENCE, "vad", "listening"),
+        (3.4, "vad", "speaking"),
+        (4.2, "interim", "it saves me"),
+        (4.8, "end", None),
+        (5.0, "final", "it saves me time every week."),
+        (4.8 + VAD_MIN_SILENCE, "vad", "listening"),
+    ]),
+    "multi_sentence": ("steady", [
+        (0.3, "vad", "speaking"),
+        (1.5, "final", "Honestly it was fine."),
+        (3.0, "interim", "The onboarding was"),
+        (4.1, "final", "The onboarding was a bit slow."),
+        (5.5, "interim", "But support helped"),
+        (6.2, "end", None),
+        (6.4, "final", "But support helped me quickly."),
+        (6.2 + VAD_MIN_SILENCE, "vad", "listening"),
+    ]),
+    "trailing_filler": ("quick", [
+        (0.3, "vad", "speaking"),
+        (1.4, "interim", "It was okay I guess"),
+        (2.2, "end", None),
+        (2.4, "final", "It was okay I guess, um"),
+        (2.2 + VAD_MIN_SILENCE, "vad", "listening"),
+    ]),
+    # Complete sentence, VAD silence, then the answer continues
+    "pause_between_sentences": ("steady", [
+        (0.2, "vad", "speaking"),
+        (1.4, "final", "I use it every morning."),
+        (1.4 + VAD_MIN_SILENCE, "vad", "listening"),
+        (3.0, "vad", "speaking"),
+        (3.8, "end", None),
+        (4.0, "final", "Mostly for the news."),
+        (3.8 + VAD_MIN_SILENCE, "vad", "listening"),
+    ]),
+    "deliberate_pause": ("deliberate", [
+        (0.3, "vad", "speaking"),
+        (1.8, "final", "I switched last year."),
+        (1.8 + VAD_MIN_SILENCE, "vad", "listening"),
+        (4.3, "vad", "speaking"),
+        (4.9, "interim", "The old one kept"),
+        (5.6, "end", None),
+        (5.8, "final", "The old one kept crashing."),
+        (5.6 + VAD_MIN_SILENCE, "vad", "listening"),
+    ]),
+    "quick_pause": ("quick", [
+        (0.3, "vad", "speaking"),
+        (1.2, "final", "It's great."),
+        (1.2 + VAD_MIN_SILENCE, "vad", "listening"),
+        (2.2, "vad", "speaking"),
+        (2.9, "end", None),
+        (3.1, "final", "I'd pay for it."),
+        (2.9 + VAD_MIN_SILENCE, "vad", "listening"),
+    ]),
+}
+
+# label, end-of-turn detector, pause model floor under confident commits
+MODES = [("fixed_silence", False, False), ("eot_detector", True, True), ("eot_no_floor", True, False)]
+
+
+class _Handle:
+    def __init__(self):
+        self._callbacks = []
+        asyncio.get_running_loop().call_soon(lambda: [cb(self) for cb in self._callbacks])
+
+    def add_done_callback(self, cb):
+        self._callbacks.append(cb)
+
+
+class _Session:
+    def say(self, text, **kwargs):
+        return _Handle()
+
+
+async def replay(name: str, speaker: Optional[str], trace: list) -> Optional[float]:
+    """Gap from end of speech to turn completion; None if the turn ended before the speaker finished."""
+    state = ModeratorState()
+    state.turn_controller.room = f"bench-{name}"
+    if speaker is not None:
+        model = state.turn_controller.pause_models["p1"] = PauseModel()
+        for gap in SPEAKERS[speaker]:
+            model.record_pause(gap)
+    state.turn_engine = TurnEngine(state, _Session())
+    state.turn_controller.start_turn("p1", "Participant", "Question", "q1")
+    started = time.time()
+    speech_end = None
+
+    async def play():
+        nonlocal speech_end
+        for at, kind, payload in trace:
+            await asyncio.sleep(max(0.0, started + at - time.time()))
+            if kind == "end":
+                speech_end = time.time()
+            elif kind == "vad":
+                state.turn_engine.post(TurnEventKind.VAD, name=payload)
+            else:
+                state.turn_controller.on_speech_detected(payload, is_final=kind == "final")
+                state.turn_engine.post(TurnEventKind.TRANSCRIPT, text=payload, is_final=kind == "final")
+
+    player = asyncio.ensure_future(play())
+    await wait_for_turn_completion(state, _Session(), "q1", 0, "Participant")
+    gap = None if speech_end is None else time.time() - speech_end
+    player.cancel()
+    await state.turn_engine.stop()
+    return gap
+
+
+async def run_mode(detector_enabled: bool, floor: bool) -> dict:
+    no_floor = patch.object(PauseModel, "min_hold", lambda self, threshold: 0.0)
+    with patch.object(moderator, "EOT_DETECTOR_ENABLED", detector_enabled), \
+            patch.object(pause_model, "PAUSE_MODEL_ENABLED", detector_enabled), \
+            no_floor if not floor else nullcontext():
+        gaps = await asyncio.gather(*(replay(name, speaker, trace) for name, (speaker, trace) in TRACES.items()))
+    return dict(zip(TRACES, gaps))
+
+
+def main():
+    print(f"[bench] traces={len(TRACES)} fallback_silence_s={moderator.END_OF_SPEECH_SILENCE}")
+    for label, enabled, floor in MODES:
+        gaps = asyncio.run(run_mode(enabled, floor))
+        completed = [gap for gap in gaps.values() if gap is not None]
+        detail = " ".join(f"{name}={'cut' if gap is None else f'{gap:.2f}s'}" for name, gap in gaps.items())
+        median = f"{statistics.median(completed):.2f}" if completed else "n/a"
+        print(f"[bench] {label:<14} median_gap_s={median} premature={len(gaps) - len(completed)}/{len(gaps)} {detail}")
+
+
+if __name__ == "__main__":
+    main()
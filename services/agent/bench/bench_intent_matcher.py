@@ -0,0 +1,72 @@
+"""
+Micro-benchmark: intent checks over a turn's transcript.
+
+Compares the previous approach (join every final of the turn, lowercase it and
+run one re.search per repeat pattern on each check) with the streaming
+IntentMatcher (scan each segment once as it arrives, answer checks from
+per-turn flags), for realistic answers fed as STT finals. The old approach is
+shown for the repeat intent only; adding don't-know and off-topic would
+multiply its cost again.
+
+Run with: python services/agent/bench/bench_intent_matcher.py
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from intent_matcher import INTENT_PATTERNS, IntentMatcher
+
+SEGMENTS = [
+    "Honestly the onboarding was a bit slow.",
+    "I had to ask support twice before my account worked,",
+    "but once it was set up the weekly report saved me a lot of time.",
+    "The pricing seems fair compared to what we used before.",
+    "I would like better export options though, maybe a CSV download.",
+    "My team mostly uses it on mobile so the app matters more to us.",
+]
+CHECKS_PER_SEGMENT = 3  # engine evaluates the turn on several events per final
+TURNS = 2000
+
+
+def baseline(turns: list) -> float:
+    started = time.perf_counter()
+    for segments in turns:
+        transcripts = []
+        for text in segments:
+            transcripts.append(text)
+            for _ in range(CHECKS_PER_SEGMENT):
+                joined = " ".join(transcripts).lower()
+                any(re.search(p, joined) for p in INTENT_PATTERNS["repeat"])
+    return time.perf_counter() - started
+
+
+def streaming(turns: list) -> float:
+    started = time.perf_counter()
+    matcher = IntentMatcher()
+    for segments in turns:
+        matcher.reset()
+        for text in segments:
+            matcher.feed(text)
+            for _ in range(CHECKS_PER_SEGMENT):
+                matcher.matched("repeat")
+                matcher.matched("dont_know")
+                matcher.matched("off_topic")
+    return time.perf_counter() - started
+
+
+def main():
+    for length in (2, 6, 24):
+        turns = [(SEGMENTS * 4)[:length] for _ in range(TURNS)]
+        old, new = baseline(turns), streaming(turns)
+        checks = TURNS * length * CHECKS_PER_SEGMENT
+        print(f"[bench] segments_per_turn={length:<3} turns={TURNS} checks={checks} "
+              f"per_search_us={old / checks * 1e6:.2f} streaming_us={new / checks * 1e6:.2f} "
+              f"speedup={old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Micro-benchmark: off-topic scoring cost during a turn.
+
+Builds the question vectors for a 20-question guide, then replays answers as
+final transcript chunks through a TopicTracker and reports the time spent
+embedding per batch and at end of turn (embedding the last chunks plus the
+cosine decision), which is what sits between end of speech and the next
+prompt. In the worker the embedding runs on its own thread, so these are
+delays to the decision, not time the event loop is blocked. Uses the worker's embedder: the local model when installed, else the
+hashing fallback.
+
+Run with: python services/agent/bench/bench_off_topic.py
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guide_plan import compile_guide
+from topic_match import TOPIC_BATCH_SIZE, TopicTracker, embed_texts, get_embedder, question_vectors
+
+GUIDE = {
+    "meta": {"title": "Bench"},
+    "sections": [{"id": f"s{s}", "title": f"Topic {s}", "questions": [
+        {"id": f"q{s}_{q}", "text": f"What do you think about feature {s}.{q} and how often do you use it?"}
+        for q in range(5)]} for s in range(4)],
+}
+ANSWER = [
+    "Honestly I use it most days,", "mostly on my phone when I'm commuting.",
+    "The search could be faster though", "and sometimes the sync takes a while.",
+    "Overall it saves me time every week,", "so I'd keep paying for it.", "That's about it.",
+]
+TURNS = 200
+
+
+def main():
+    embedder = get_embedder()
+    plan = compile_guide(GUIDE, "Mixed")
+    started = time.perf_counter()
+    vectors = question_vectors(plan, embedder)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    tracker = TopicTracker(embedder)
+    during, at_end = [], []
+    for turn in range(TURNS):
+        tracker.reset(vectors.vector(f"q{turn % 4}_{turn % 5}"))
+        for text in ANSWER:
+            texts = tracker.add(text)
+            if texts:
+                tracker.apply(embed_texts(embedder, texts))
+        during.append(tracker.embed_ms)
+        started = time.perf_counter()
+        tracker.flush()
+        tracker.is_off_topic()
+        at_end.append((time.perf_counter() - started) * 1000)
+
+    print(f"[bench] model={embedder.name} questions={len(vectors)} build_ms={build_ms:.1f} "
+          f"batch={TOPIC_BATCH_SIZE} chunks_per_answer={len(ANSWER)}")
+    print(f"[bench] during_turn_ms median={statistics.median(during):.3f} "
+          f"end_of_turn_ms median={statistics.median(at_end):.3f} "
+          f"p99={sorted(at_end)[int(len(at_end) * 0.99) - 1]:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Replay benchmark: time from end of answer to a follow-up probe being ready.
+
+Feeds an answer's final segments to a SpeculativeProbe backed by the stub
+backend with a simulated LLM latency, then measures how long commit() takes
+after the last segment, against drafting the probe only once the answer is
+over. commit() uses the default PROBE_COMMIT_WAIT_MS and PROBE_MIN_COVERAGE.
+Timings are scaled down (segments every SEGMENT_GAP seconds) so the
+run takes a few seconds; the LLM latency is the figure that matters.
+
+Run with: python services/agent/bench/bench_probe_latency.py
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from probes import SpeculativeProbe, StubProbeBackend
+
+SEGMENTS = [
+    "I started using it last spring.", "Mostly for planning my week.", "The calendar sync is handy,",
+    "but reminders sometimes arrive late.", "Support fixed that once,", "and the new widget helps a lot.",
+]
+SEGMENT_GAP = 0.3
+LLM_LATENCIES = [0.2, 0.6, 1.2]
+RUNS = 3
+
+
+async def speculative(latency: float) -> tuple:
+    probe = SpeculativeProbe(StubProbeBackend(latency), min_answer_seconds=0, budget=2.0)
+    probe.reset("How do you use the app?")
+    answer = []
+    for text in SEGMENTS:
+        answer.append(text)
+        probe.update(" ".join(answer), answer_duration=len(answer) * SEGMENT_GAP)
+        await asyncio.sleep(SEGMENT_GAP)
+    started = time.perf_counter()
+    committed = await probe.commit(" ".join(answer)) is not None
+    return time.perf_counter() - started, committed
+
+
+async def after_answer(latency: float) -> float:
+    started = time.perf_counter()
+    await StubProbeBackend(latency).draft("How do you use the app?", " ".join(SEGMENTS))
+    return time.perf_counter() - started
+
+
+def main():
+    print(f"[bench] segments={len(SEGMENTS)} segment_gap_s={SEGMENT_GAP} runs={RUNS}")
+    for latency in LLM_LATENCIES:
+        spec = [asyncio.run(speculative(latency)) for _ in range(RUNS)]
+        post = [asyncio.run(after_answer(latency)) for _ in range(RUNS)]
+        print(f"[bench] llm_latency_s={latency:<4} after_answer_ms={statistics.median(post) * 1000:.0f} "
+              f"speculative_ms={statistics.median(t for t, _ in spec) * 1000:.0f} "
+              f"committed={sum(c for _, c in spec)}/{RUNS}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: turn-deadline arm/cancel throughput.
+
+Compares the worker-wide TimerWheel against the previous task-per-timer
+approach (asyncio.create_task(asyncio.sleep(...)) + task.cancel()) and plain
+loop.call_later handles, simulating participant switches across many rooms:
+each "turn" arms silence/max-answer/end-of-speech deadlines, then cancels them.
+
+Run with: python services/agent/bench/bench_timer_wheel.py [--rooms 50] [--turns 200]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from timer_wheel import TimerWheel
+
+DEADLINES = (("silence_prompt", 12.0), ("max_answer", 35.0), ("end_of_speech", 4.0))
+
+
+def _noop(*_args):
+    pass
+
+
+async def bench_tasks(rooms: int, turns: int) -> float:
+    async def watcher(delay: float):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            pass
+
+    started = time.perf_counter()
+    for turn in range(turns):
+        tasks = [asyncio.create_task(watcher(delay)) for _ in range(rooms) for _, delay in DEADLINES]
+        await asyncio.sleep(0)  # let tasks start sleeping, as real watchers do
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return time.perf_counter() - started
+
+
+async def bench_call_later(rooms: int, turns: int) -> float:
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    for turn in range(turns):
+        handles = [loop.call_later(delay, _noop) for _ in range(rooms) for _, delay in DEADLINES]
+        for handle in handles:
+            handle.cancel()
+    await asyncio.sleep(0)
+    return time.perf_counter() - started
+
+
+async def bench_wheel(rooms: int, turns: int) -> float:
+    wheel = TimerWheel()
+    started = time.perf_counter()
+    for turn in range(turns):
+        for room in range(rooms):
+            for name, delay in DEADLINES:
+                wheel.arm((room, turn, name), delay, _noop)
+        for room in range(rooms):
+            for name, _ in DEADLINES:
+                wheel.cancel((room, turn, name))
+    await asyncio.sleep(0)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    ops = args.rooms * args.turns * len(DEADLINES)
+    print(f"[bench] rooms={args.rooms} turns={args.turns} arm+cancel pairs={ops}")
+    for label, fn in [("task_per_timer", bench_tasks),
+                      ("loop_call_later", bench_call_later),
+                      ("timer_wheel", bench_wheel)]:
+        elapsed = asyncio.run(fn(args.rooms, args.turns))
+        print(f"[bench] {label:<16} total_s={elapsed:.3f} "
+              f"pairs_per_s={ops / elapsed:,.0f} us_per_pair={elapsed / ops * 1e6:.2f}")
+
+
+if __name__ == "__main__":
+    main()
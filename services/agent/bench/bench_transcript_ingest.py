@@ -0,0 +1,118 @@
+"""
+Micro-benchmark: transcription handler cost per STT event and answer buffer size.
+
+Feeds Deepgram-shaped event streams (a growing interim for every word or two
+of a segment, then the segment's final) through the handler as it was before
+interim coalescing — every event logged, its text appended to both
+QuestionContext and TurnController — and through ingest_transcript(), and
+reports the handler cost per event, log lines written, and the size of the
+answer text per turn.
+
+Run with: python services/agent/bench/bench_transcript_ingest.py
+"""
+
+import contextlib
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from moderator import ModeratorState, QuestionState, TurnEventKind, ingest_transcript, log_event
+
+ANSWERS = [
+    ["Honestly I mostly shop online these days.",
+     "It is just easier with two kids at home and the delivery is usually next day."],
+    ["Yes."],
+    ["The price matters but not as much as whether I trust the brand.",
+     "If a friend recommends something I will usually try it even if it costs a bit more.",
+     "I did that with my running shoes last spring and I have not looked back."],
+    ["I am not sure, um, maybe the packaging?",
+     "It felt a bit cheap compared to what they charge for it."],
+    ["Can you repeat the question please?"],
+]
+WORDS_PER_INTERIM = 2
+REPEATS = 200
+
+
+def events(answer):
+    """(text, is_final) like Deepgram interim_results: growing interims, then the final."""
+    for sentence in answer:
+        words = sentence.split()
+        for n in range(WORDS_PER_INTERIM, len(words), WORDS_PER_INTERIM):
+            yield " ".join(words[:n]), False
+        yield sentence, True
+
+
+class _Engine:
+    def post(self, kind, **kwargs):
+        pass
+
+
+def legacy_ingest(state, transcript, is_final, speech_final=False):
+    """The transcription handler before interim coalescing."""
+    log_event("USER_INPUT_TRANSCRIBED",
+              transcript=transcript[:80] if transcript else "(empty)",
+              is_final=is_final,
+              agent_speaking=state.agent_speaking,
+              current_state=state.current_question.state.value)
+    if not transcript:
+        return
+    if state.turn_controller.turn_ended.is_set():
+        state.turn_controller.on_late_speech(None)
+    if state.agent_speaking:
+        log_event("TRANSCRIPT_IGNORED", reason="agent_speaking")
+        return
+    waiting_states = [
+        QuestionState.WAITING_FOR_RESPONSE,
+        QuestionState.SILENCE_PROMPTED,
+        QuestionState.USER_SPEAKING,
+        QuestionState.WRAPUP_REQUESTED,
+    ]
+    if state.current_question.state not in waiting_states:
+        log_event("TRANSCRIPT_IGNORED", reason=f"wrong_state:{state.current_question.state.value}")
+        return
+    state.current_question.add_transcript(transcript)  # every result kept as text
+    state.current_question.cancel_timer()
+    state.turn_controller.on_speech_detected(transcript)
+    state.turn_engine.post(TurnEventKind.TRANSCRIPT, text=transcript, is_final=is_final,
+                           speech_final=speech_final)
+
+
+def run(handler) -> dict:
+    state = ModeratorState()
+    state.turn_engine = _Engine()
+    per_event, sizes = [], []
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        for _ in range(REPEATS):
+            for answer in ANSWERS:
+                state.turn_controller.start_turn("p1", "Dana", "Question", "q1")
+                state.current_question.reset()
+                state.current_question.state = QuestionState.WAITING_FOR_RESPONSE
+                for text, is_final in events(answer):
+                    started = time.perf_counter()
+                    handler(state, text, is_final)
+                    per_event.append(time.perf_counter() - started)
+                sizes.append(len(state.turn_controller.get_full_text()) + len(state.current_question.get_full_text()))
+    spoken = sum(len(" ".join(answer)) for answer in ANSWERS) * 2 / len(ANSWERS)
+    return {
+        "us_per_event": statistics.mean(per_event) * 1e6,
+        "log_lines_per_answer": out.getvalue().count("\n") / (REPEATS * len(ANSWERS)),
+        "buffer_chars_per_answer": statistics.mean(sizes),
+        "vs_spoken": statistics.mean(sizes) / spoken,
+    }
+
+
+def main():
+    count = sum(1 for answer in ANSWERS for _ in events(answer))
+    print(f"[bench] answers={len(ANSWERS)} events_per_pass={count} repeats={REPEATS}")
+    for label, handler in [("before", legacy_ingest), ("coalesced", ingest_transcript)]:
+        stats = run(handler)
+        print(f"[bench] {label:<10} " + " ".join(f"{k}={v:.2f}" for k, v in stats.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Time-to-first-audio for long section scripts: whole-script vs sentence-streamed TTS.
+
+Uses a TTS stand-in whose latency grows with text length (as the OpenAI TTS
+endpoint does for non-streamed synthesis) and a consumer that plays frames
+in real time, so both time-to-first-audio and mid-script stalls are visible.
+All durations are scaled by TIME_SCALE to keep the run short and reported
+unscaled.
+
+Run with: python services/agent/bench/bench_tts_first_audio.py
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livekit import rtc
+
+from speech_text import normalize_text, split_sentences
+from tts_cache import TTSCache
+
+TIME_SCALE = 0.05
+FIRST_BYTE_S = 0.35       # request overhead
+SYNTH_S_PER_CHAR = 0.004  # generation time per input character
+SPEECH_S_PER_CHAR = 0.065 # spoken duration per character (~15 chars/s)
+FRAME_S = 0.1
+
+# Representative long section scripts (the repo does not ship a guide file)
+SCRIPTS = {
+    "intro": """## Welcome
+
+Thank you all for joining today's session. My name is Echo and I'll be guiding our
+conversation over the next forty-five minutes. There are no right or wrong answers here;
+we're interested in your honest opinions and experiences.
+
+A few ground rules before we begin:
+- Please speak one at a time so everyone can be heard.
+- If you need me to repeat a question, just ask.
+- Everything you share stays within this research team.
+
+We'll start with some warm-up questions and then move on to the product concepts.""",
+    "concepts": """## Product concepts
+
+In this part of the session I'll describe three concepts for a new subscription service.
+After each one, I'll ask what you liked, what you didn't, and whether you would try it.
+The first concept is a weekly box of locally roasted coffee, delivered to your door,
+with tasting notes from the roaster. The second concept is a flexible plan where you
+choose your beans each month through an app. The third is an office plan that supplies
+a whole team. Take a moment to think about which of these fits the way you drink coffee.""",
+    "closing": """## Wrapping up
+
+We're nearly out of time. Before we finish, I'd like to hear one final thought from each
+of you about what would make you choose one service over another. Thank you again for
+your time and your candor today; your feedback will directly shape what we build next.""",
+}
+
+
+class ModelTTS:
+    """Latency grows with text length; audio length is proportional to text."""
+
+    def synthesize(self, text):
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __aiter__(self):
+                return self._gen()
+
+            async def _gen(self):
+                await asyncio.sleep((FIRST_BYTE_S + SYNTH_S_PER_CHAR * len(text)) * TIME_SCALE)
+                frames = max(1, int(len(text) * SPEECH_S_PER_CHAR / FRAME_S))
+                for _ in range(frames):
+                    yield type("Audio", (), {"frame": rtc.AudioFrame(b"\x00\x00" * 240, 24000, 1, 240)})()
+
+        return Stream()
+
+
+async def play(frames) -> tuple[float, float, float]:
+    """Consume frames in (scaled) real time; returns (first audio, stall, total) seconds."""
+    started = time.perf_counter()
+    first = None
+    playhead = started  # when the audio queued so far finishes playing
+    stall = 0.0
+    async for _ in frames:
+        now = time.perf_counter()
+        if first is None:
+            first = now - started
+            playhead = now
+        elif now > playhead:
+            stall += now - playhead
+            playhead = now
+        playhead += FRAME_S * TIME_SCALE
+        await asyncio.sleep(max(0.0, playhead - time.perf_counter() - 0.5 * TIME_SCALE))
+    return first / TIME_SCALE, stall / TIME_SCALE, (time.perf_counter() - started) / TIME_SCALE
+
+
+async def whole_script(tts, text):
+    async with tts.synthesize(normalize_text(text)) as stream:
+        async for audio in stream:
+            yield audio.frame
+
+
+async def main():
+    tts = ModelTTS()
+    print(f"[bench] scripts={len(SCRIPTS)} time_scale={TIME_SCALE}")
+    for name, script in sorted(SCRIPTS.items(), key=lambda kv: -len(kv[1])):
+        before, _, _ = await play(whole_script(tts, script))
+        with tempfile.TemporaryDirectory() as tmp:
+            after, stall, _ = await play(TTSCache(tmp).audio(tts, "echo", "bench", script))
+        print(f"[bench] {name:<9} chars={len(normalize_text(script)):>4} sentences={len(split_sentences(script)):>2} "
+              f"first_audio_ms before={before * 1000:>5.0f} after={after * 1000:>5.0f} "
+              f"stall_ms={stall * 1000:.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
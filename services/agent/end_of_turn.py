@@ -0,0 +1,113 @@
+"""
+Multi-signal end-of-turn detection.
+
+Combines the signals we already receive for a participant's answer into a
+single confidence score instead of waiting a fixed silence window:
+
+- Silero VAD end of speech (user_state_changed: speaking -> listening)
+- STT finality (is_final) and, when the event carries it, Deepgram speech_final
+- A cheap local check of whether the last sentence sounds complete
+
+The detector is pure bookkeeping with no timers of its own; the TurnEngine
+feeds it events and asks how long to hold before committing the turn. A
+confident hold never drops below the floor the caller passes in (the
+participant's learned pause length), so confidence shortens the wait without
+cutting off someone who habitually pauses between sentences.
+"""
+
+import os
+import re
+import time
+from typing import Optional
+
+EOT_DETECTOR_ENABLED = os.getenv("EOT_DETECTOR_ENABLED", "true").lower() == "true"
+EOT_CONFIDENCE_THRESHOLD = float(os.getenv("EOT_CONFIDENCE_THRESHOLD", "0.75"))
+EOT_COMMIT_SECONDS = float(os.getenv("EOT_COMMIT_SECONDS", "0.3"))
+
+# Signal weights (sum to 1.0)
+WEIGHT_VAD_END = 0.35
+WEIGHT_FINAL = 0.2
+WEIGHT_ENDPOINT = 0.15
+WEIGHT_COMPLETE = 0.3
+
+# Trailing words that mean the speaker is mid-thought
+INCOMPLETE_ENDINGS = {
+    "and", "but", "or", "so", "because", "um", "uh", "er", "like", "the", "a", "an",
+    "to", "of", "with", "that", "if", "my", "i", "is", "was", "for", "in", "on",
+    "when", "which", "then", "also", "just", "really",
+}
+SHORT_ANSWERS = {"yes", "no", "yeah", "yep", "nope", "sure", "okay", "ok", "correct", "agreed"}
+
+_WORD_RE = re.compile(r"[a-z']+")
+
+
+def sentence_sounds_complete(text: str) -> bool:
+    """Heuristic: terminal punctuation without a dangling connective, or a bare short answer."""
+    stripped = text.strip()
+    if not stripped or stripped.endswith(("...", "…", ",", "-", "—")):
+        return False
+    words = _WORD_RE.findall(stripped.lower())
+    if not words:
+        return False
+    if len(words) <= 2 and words[0] in SHORT_ANSWERS:
+        return True
+    if words[-1] in INCOMPLETE_ENDINGS:
+        return False
+    return stripped[-1] in ".!?"
+
+
+class EndOfTurnDetector:
+    """Per-turn signal state and confidence that the participant has finished."""
+
+    def __init__(self, threshold: float = EOT_CONFIDENCE_THRESHOLD, commit_seconds: float = EOT_COMMIT_SECONDS):
+        self.threshold = threshold
+        self.commit_seconds = commit_seconds
+        self.reset()
+
+    def reset(self):
+        self.vad_speaking: bool = False
+        self.vad_ended: bool = False
+        self.last_final: bool = False
+        self.endpoint: bool = False
+        self.complete: bool = False
+        self.last_activity_at: float = 0
+
+    def on_vad(self, speaking: bool, now: Optional[float] = None):
+        now = now or time.time()
+        if speaking:
+            self.vad_speaking = True
+            self.vad_ended = False
+        elif self.vad_speaking:
+            self.vad_speaking = False
+            self.vad_ended = True
+        self.last_activity_at = max(self.last_activity_at, now)
+
+    def on_transcript(self, text: str, is_final: bool, speech_final: bool = False, now: Optional[float] = None):
+        now = now or time.time()
+        self.last_final = is_final
+        self.endpoint = speech_final
+        self.complete = sentence_sounds_complete(text)
+        self.last_activity_at = max(self.last_activity_at, now)
+
+    def confidence(self) -> float:
+        score = 0.0
+        if self.vad_ended:
+            score += WEIGHT_VAD_END
+        if self.last_final:
+            score += WEIGHT_FINAL
+        if self.endpoint:
+            score += WEIGHT_ENDPOINT
+        if self.complete:
+            score += WEIGHT_COMPLETE
+        return round(score, 3)
+
+    def hold_seconds(self, fallback: float, floor: float = 0.0) -> float:
+        """Silence required before ending the turn: short (but not below floor) when confident, else the fallback."""
+        if self.vad_speaking or self.confidence() < self.threshold:
+            return fallback
+        return max(self.commit_seconds, floor)
+
+    def silence_elapsed(self, now: Optional[float] = None) -> float:
+        if self.last_activity_at == 0:
+            return float('inf')
+        return (now or time.time()) - self.last_activity_at
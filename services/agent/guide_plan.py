@@ -0,0 +1,192 @@
+"""
+Compiled discussion guide.
+
+The guide JSON (sections -> questions, with optional routing) is flattened
+once into a tuple of read-only Step records in the order run_discussion will
+visit them. Routing (routing.include_if_group) is evaluated for the
+session's group type at compile time, so excluded sections never appear and
+navigation is an index increment. Spoken text is normalized and split into
+sentences up front.
+
+Plans are cached by (guide hash, group type); a guide loaded from disk or
+fetched from the API is keyed by the sha256 of its bytes (the API's ETag),
+so reloading an unchanged guide skips JSON parsing as well as compilation,
+and fetching one the worker already holds is answered with a 304.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from speech_text import normalize_text, split_sentences
+
+GROUP_TYPE = os.getenv("GROUP_TYPE", "Mixed")
+GUIDE_PLAN_CACHE_SIZE = 32
+
+
+class Step:
+    """One stop in the guide: a question, or a question-less section script."""
+
+    __slots__ = (
+        "index", "section_index", "question_index", "section", "question",
+        "section_id", "section_title", "section_script", "section_start",
+        "qid", "type", "text", "script", "speech",
+    )
+
+    def __init__(self, index: int, section_index: int, question_index: int,
+                 section: Dict[str, Any], question: Optional[Dict[str, Any]], section_start: bool):
+        setattr_ = super().__setattr__
+        setattr_("index", index)
+        setattr_("section_index", section_index)
+        setattr_("question_index", question_index)  # -1 for a section with no questions
+        setattr_("section", section)
+        setattr_("question", question)
+        setattr_("section_id", section.get("id", ""))
+        setattr_("section_title", section.get("title", ""))
+        setattr_("section_script", section.get("script_md", "") if section_start else "")
+        setattr_("section_start", section_start)
+        question = question or {}
+        setattr_("qid", question.get("id", f"q{index}"))
+        setattr_("type", question.get("type", "question"))
+        setattr_("text", question.get("text", ""))
+        setattr_("script", question.get("script_md", ""))
+        # What this step says, in order, already normalized for TTS (pre-rendered as is)
+        spoken = [self.section_script, self.script if self.type in ("info", "closing") else self.text]
+        setattr_("speech", tuple(s for line in spoken if line for s in split_sentences(line)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Step is read-only")
+
+    def __repr__(self) -> str:
+        return f"Step({self.index}, {self.section_index}/{self.question_index}, {self.type}, {self.qid!r})"
+
+
+class GuidePlan:
+    """Immutable, flat view of a guide for one group type."""
+
+    __slots__ = ("guide", "guide_hash", "group_type", "title", "steps", "_positions", "_section_starts")
+
+    def __init__(self, guide: Dict[str, Any], guide_hash: str, group_type: str):
+        self.guide = guide
+        self.guide_hash = guide_hash
+        self.group_type = group_type
+        self.title = normalize_text(guide.get("meta", {}).get("title", "Focus Group"))
+        steps = []
+        for section_index, section in enumerate(guide.get("sections", [])):
+            if not section_included(section, group_type):
+                continue
+            questions = section.get("questions", [])
+            if not questions:
+                steps.append(Step(len(steps), section_index, -1, section, None, True))
+            for question_index, question in enumerate(questions):
+                steps.append(Step(len(steps), section_index, question_index, section, question,
+                                  question_index == 0))
+        self.steps: Tuple[Step, ...] = tuple(steps)
+        self._positions = {(s.section_index, max(s.question_index, 0)): s.index for s in steps}
+        self._section_starts = {}
+        for step in steps:
+            self._section_starts.setdefault(step.section_index, step.index)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __getitem__(self, index: int) -> Step:
+        return self.steps[index]
+
+    def step(self, index: int) -> Optional[Step]:
+        return self.steps[index] if 0 <= index < len(self.steps) else None
+
+    def position(self, section_index: int, question_index: int = 0) -> int:
+        """Step index for a raw (section, question) position; len(plan) if past the end."""
+        index = self._positions.get((section_index, question_index))
+        if index is not None:
+            return index
+        # Excluded or out-of-range section: next included step at or after it
+        for later, start in self._section_starts.items():
+            if later > section_index:
+                return start
+        return len(self.steps)
+
+    @property
+    def section_count(self) -> int:
+        return len(self.guide.get("sections", []))
+
+
+def section_included(section: Dict[str, Any], group_type: str) -> bool:
+    """routing.include_if_group: a list of group types the section applies to."""
+    include = (section.get("routing") or {}).get("include_if_group")
+    return not include or group_type in include
+
+
+def content_hash(guide: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(guide, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+_plans: "OrderedDict[Tuple[str, str], GuidePlan]" = OrderedDict()
+
+
+def _remember(plan: GuidePlan) -> GuidePlan:
+    _plans[(plan.guide_hash, plan.group_type)] = plan
+    while len(_plans) > GUIDE_PLAN_CACHE_SIZE:
+        _plans.popitem(last=False)
+    return plan
+
+
+def cached_plan(guide_hash: str, group_type: str = GROUP_TYPE) -> Optional[GuidePlan]:
+    plan = _plans.get((guide_hash, group_type))
+    if plan is not None:
+        _plans.move_to_end((guide_hash, group_type))
+    return plan
+
+
+def compile_guide(guide: Dict[str, Any], group_type: str = GROUP_TYPE,
+                  guide_hash: Optional[str] = None) -> GuidePlan:
+    """Compile (or fetch the cached plan for) a guide dict."""
+    guide_hash = guide_hash or content_hash(guide)
+    return cached_plan(guide_hash, group_type) or _remember(GuidePlan(guide, guide_hash, group_type))
+
+
+def load_guide_plan(path: str, group_type: str = GROUP_TYPE) -> GuidePlan:
+    """Compile a guide file, keyed by the hash of its bytes."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    guide_hash = hashlib.sha256(raw).hexdigest()
+    return cached_plan(guide_hash, group_type) or _remember(
+        GuidePlan(json.loads(raw.decode("utf-8")), guide_hash, group_type))
+
+
+def _known_guide(guide_hash: str) -> Optional[Dict[str, Any]]:
+    """A cached guide with this hash, compiled for any group type."""
+    for (plan_hash, _), plan in _plans.items():
+        if plan_hash == guide_hash:
+            return plan.guide
+    return None
+
+
+async def fetch_guide_plan(http, url: str, group_type: str = GROUP_TYPE) -> Optional[GuidePlan]:
+    """
+    GET a guide from the API (aiohttp session), revalidating against every
+    guide this process already holds. None if the API has no guide for url.
+    """
+    held = list(dict.fromkeys(guide_hash for guide_hash, _ in _plans))
+    headers = {"If-None-Match": ", ".join(f'"{h}"' for h in held)} if held else {}
+    async with http.get(url, headers=headers) as resp:
+        if resp.status == 404:
+            return None
+        guide_hash = resp.headers.get("ETag", "").strip('"')
+        if resp.status == 304:
+            plan = cached_plan(guide_hash, group_type)
+            if plan is None:
+                guide = _known_guide(guide_hash)
+                if guide is None:
+                    raise RuntimeError(f"guide fetch: 304 for unknown guide {guide_hash[:12]}")
+                plan = _remember(GuidePlan(guide, guide_hash, group_type))
+            return plan
+        if resp.status != 200:
+            raise RuntimeError(f"guide fetch failed: HTTP {resp.status}")
+        raw = await resp.read()
+    guide_hash = hashlib.sha256(raw).hexdigest()
+    return cached_plan(guide_hash, group_type) or _remember(
+        GuidePlan(json.loads(raw.decode("utf-8")), guide_hash, group_type))
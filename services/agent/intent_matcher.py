@@ -0,0 +1,97 @@
+"""
+Streaming intent matcher for a participant's answer.
+
+Recognises the utterances the moderator reacts to rather than records:
+
+- repeat:    "can you repeat that", "what was the question" (FR-14)
+- dont_know: "I don't know", "no idea" (FR-13)
+- off_topic: "by the way", "unrelated, but" (FR-12)
+
+All patterns are compiled once into a single alternation with one named group
+per intent. Each transcript segment is scanned once as it arrives, together
+with a short tail of the previous finals so a phrase split across two STT
+segments still matches, and the intents found are kept as per-turn flags.
+Asking whether the turn contains an intent is then a set lookup, no matter
+how long the answer ran.
+"""
+
+import re
+from typing import Dict, FrozenSet, List, Set
+
+INTENT_PATTERNS: Dict[str, List[str]] = {
+    "repeat": [
+        r"\brepeat\b", r"\bsay that again\b", r"\bwhat was the question\b",
+        r"\bdidn'?t (?:hear|understand|catch)\b", r"\bcouldn'?t (?:hear|understand)\b",
+        r"\bpardon\b", r"\bcome again\b", r"\bone more time\b",
+    ],
+    "dont_know": [
+        r"\bi (?:really |just )?(?:don'?t|do not) know\b", r"\bdunno\b", r"\bno idea\b",
+        r"\bnot sure\b", r"\bi can'?t (?:say|think of anything|remember)\b",
+        r"\bno (?:opinion|comment)\b", r"\bnothing comes to mind\b",
+    ],
+    "off_topic": [
+        r"\boff[- ]topic\b", r"\bunrelated\b", r"\bchange the subject\b", r"\bby the way\b",
+        r"\bon a different note\b", r"\bspeaking of which\b", r"\brandom question\b",
+    ],
+}
+
+# Finals are joined with single spaces, so a phrase can straddle at most this
+# much of the previous text (longer than any pattern above)
+_TAIL_CHARS = 40
+
+_NO_INTENTS: FrozenSet[str] = frozenset()
+
+
+def compile_intents(patterns: Dict[str, List[str]] = INTENT_PATTERNS) -> "re.Pattern":
+    """One regex for every intent; a match's lastgroup names its intent."""
+    return re.compile("|".join(f"(?P<{intent}>{'|'.join(alternatives)})"
+                               for intent, alternatives in patterns.items()))
+
+
+_INTENT_RE = compile_intents()
+
+
+def _tail(window: str) -> str:
+    """The end of the scanned text a later phrase could still start in, cut at a word."""
+    if len(window) <= _TAIL_CHARS:
+        return window
+    tail = window[-_TAIL_CHARS:]
+    cut = tail.find(" ")
+    return tail[cut + 1:] if cut >= 0 else ""
+
+
+class IntentMatcher:
+    """Per-turn intent flags, fed one transcript result at a time."""
+
+    def __init__(self, regex: "re.Pattern" = _INTENT_RE):
+        self.regex = regex
+        self.reset()
+
+    def reset(self):
+        self.found: Set[str] = set()                 # from final results
+        self.partial_found: FrozenSet[str] = _NO_INTENTS  # from the latest interim
+        self.scanned_chars = 0
+        self._tail = ""
+
+    def feed(self, text: str, is_final: bool = True):
+        """
+        Scan one result. Finals are kept; an interim only replaces the flags
+        of the previous interim, since each interim repeats the whole segment.
+        """
+        text = text.lower()
+        window = f"{self._tail} {text}" if self._tail else text
+        self.scanned_chars += len(window)
+        found = {m.lastgroup for m in self.regex.finditer(window)}
+        if not is_final:
+            self.partial_found = frozenset(found)
+            return
+        self.found |= found
+        self.partial_found = _NO_INTENTS
+        self._tail = _tail(window)
+
+    def matched(self, intent: str) -> bool:
+        return intent in self.found or intent in self.partial_found
+
+    def intents(self) -> List[str]:
+        """Intents heard this turn, in INTENT_PATTERNS order."""
+        return [intent for intent in INTENT_PATTERNS if self.matched(intent)]
@@ -0,0 +1,17 @@
+"""
+Structured agent logging shared by every worker module.
+
+One line per event: "[<epoch ms>ms][EVENT] key=value ...", printed to stdout
+where the worker's log collector picks it up.
+"""
+
+import time
+
+
+def log_event(event: str, **kwargs):
+    """Structured log with timestamp and correlation ID."""
+    ts = int(time.time() * 1000)  # milliseconds
+    parts = [f"[{ts}ms][{event}]"]
+    for k, v in kwargs.items():
+        parts.append(f"{k}={v}")
+    print(" ".join(parts))
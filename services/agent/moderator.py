@@ -1,6 +1,6 @@
 """
 LiveKit Voice Agent – Focus Group Moderator (Enhanced MVP)
-Event-driven speech detection with cancellable timers, turn timing,
+Event-driven speech detection with a per-session turn engine, turn timing,
 silence prompting, and wrap-up management.
 
 Run with: python moderator.py dev
@@ -11,7 +11,6 @@ import asyncio
 import aiohttp
 import json
 import os
-import re
 import time
 import uuid
 from typing import Dict, Any, Optional, List, Callable
@@ -23,6 +22,21 @@ from livekit import agents, rtc
 from livekit.agents import Agent, AgentSession, RoomInputOptions
 from livekit.plugins import openai, deepgram, silero
 
+from logs import log_event
+from timer_wheel import get_timer_wheel
+from end_of_turn import EndOfTurnDetector, EOT_DETECTOR_ENABLED
+from pause_model import PauseModel, FALSE_EOT_WINDOW_SECONDS
+from tts_cache import get_tts_cache
+from pacing import Pacer
+from prerender import Prerenderer, PrerenderProgress, ParticipantPhrases, Lookahead, PRERENDER_ENABLED
+from api_channel import ApiChannel, get_api_channel
+from guide_plan import GuidePlan, Step, cached_plan, compile_guide, load_guide_plan, fetch_guide_plan, GROUP_TYPE
+from transcript_store import Segment, TranscriptLog, TRANSCRIPTS_ENABLED
+from intent_matcher import IntentMatcher
+from topic_match import (QuestionVectors, TopicBatch, TopicTracker, embed_in_worker, question_vectors,
+                         get_embedder, OFF_TOPIC_ENABLED)
+from probes import SpeculativeProbe, get_probe_backend, PROBES_ENABLED
+
 # Load ENV from project root
 env_paths = [
     Path(__file__).parent.parent.parent / ".env",
@@ -36,6 +50,13 @@ for env_path in env_paths:
         break
 
 API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
+# Name this worker registers under; the API dispatches it explicitly into each
+# session's room (must match the API's AGENT_NAME). Empty = automatic dispatch.
+AGENT_NAME = os.getenv("AGENT_NAME", "moderator")
+# The API pushes session start/end into the room (and repeats it whenever the
+# worker channel subscribes); a positive value also re-reads the status this
+# often as a safety net (0 = push only, no polling)
+SESSION_START_RECHECK_SECONDS = float(os.getenv("SESSION_START_RECHECK_SECONDS", "0"))
 LIVEKIT_URL = os.getenv("LIVEKIT_URL", "wss://ai-moderator-pkxfi93j.livekit.cloud")
 
 def get_redacted_livekit_url():
@@ -60,7 +81,7 @@ MAX_ANSWER_SECONDS = float(os.getenv("MAX_ANSWER_SECONDS", "35"))
 WRAPUP_SECONDS = float(os.getenv("WRAPUP_SECONDS", "15"))
 
 # End of speech detection
-END_OF_SPEECH_SILENCE = 4.0  # Seconds of silence after speech to consider "done"
+END_OF_SPEECH_SILENCE = 4.0  # Fallback silence when end-of-turn signals are inconclusive
 
 # Legacy (kept for backward compat when TURN_TIMERS_ENABLED=false)
 SILENCE_TIMEOUT = 20.0
@@ -71,23 +92,46 @@ SPEECH_SILENCE_PROMPT = "{name}, I'd love to hear your thoughts. Anything you'd
 SPEECH_SILENCE_MOVEON = "No worries—let's come back if we have time."
 SPEECH_WRAPUP_PROMPT = "Thanks—can you wrap that up in the next few seconds?"
 SPEECH_WRAPUP_END = "Got it—thank you."
+SPEECH_WELCOME = "Welcome everyone! I'm your AI moderator for today's focus group. We're waiting for the organizer to start the session. Please stand by."
+SPEECH_BEGIN = "Let's begin our discussion on {title}."
+SPEECH_REPEAT = "Of course. Let me repeat that. {question}"
+SPEECH_REPEAT_LIMIT = "I've repeated that a couple of times. Let me move on."
+SPEECH_OFF_TOPIC = "Thanks, {name}. To bring us back to the question: {question}"
+SPEECH_ROLLCALL_DONE = "Thank you all. Let's proceed with the discussion."
+SPEECH_QUESTION_DONE = "Thank you all for sharing. Let's move on."
+SPEECH_REFLECT = "I'll give you a moment to reflect."
+SPEECH_CLOSING = "Thank you all so much for participating! Your insights have been incredibly valuable. Have a wonderful day!"
 
-# Patterns to detect "repeat" requests
-REPEAT_PATTERNS = [
-    r"\brepeat\b", r"\bsay that again\b", r"\bwhat was the question\b",
-    r"\bdidn'?t (hear|understand|catch)\b", r"\bcouldn'?t (hear|understand)\b",
-    r"\bpardon\b", r"\bcome again\b", r"\bone more time\b",
+# Name-templated lines, in the order a participant first hears them
+SPEECH_CONSENT = "{name}, please say yes to confirm your consent."
+SPEECH_CONSENT_THANKS = "Thank you, {name}."
+SPEECH_FIRST_TURN = "Let's start with you, {name}. Please take your time to share your thoughts."
+SPEECH_NEXT_TURN = "Thank you for sharing. {name}, I'd like to hear from you now."
+SPEECH_CONSENT_MISSED = "I didn't hear from {name}. We'll follow up separately."
+PARTICIPANT_SPEECH_LINES = [
+    SPEECH_CONSENT, SPEECH_CONSENT_THANKS, SPEECH_FIRST_TURN, SPEECH_NEXT_TURN,
+    SPEECH_SILENCE_PROMPT, SPEECH_CONSENT_MISSED,
 ]
 
+# LiveKit data topic for API -> agent control messages
+AGENT_CONTROL_TOPIC = "agent-control"
+
+# Interim transcript events arrive several times a second; log at most one per interval
+TRANSCRIPT_LOG_INTERVAL_SECONDS = float(os.getenv("TRANSCRIPT_LOG_INTERVAL_MS", "1000")) / 1000
+
+# ============ TTS ============
+TTS_VOICE = os.getenv("TTS_VOICE", "echo")
+TTS_MODEL = os.getenv("TTS_MODEL", "gpt-4o-mini-tts")
 
-# ============ Structured Logging ============
-def log_event(event: str, **kwargs):
-    """Structured log with timestamp and correlation ID."""
-    ts = int(time.time() * 1000)  # milliseconds
-    parts = [f"[{ts}ms][{event}]"]
-    for k, v in kwargs.items():
-        parts.append(f"{k}={v}")
-    print(" ".join(parts))
+
+# ============ Speech ============
+def speak(session: AgentSession, text: str, **kwargs):
+    """session.say with audio served from the shared TTS cache when available."""
+    cache = get_tts_cache()
+    tts = getattr(session, "tts", None)
+    if cache is None or tts is None:
+        return session.say(text, **kwargs)
+    return session.say(text, audio=cache.audio(tts, TTS_VOICE, TTS_MODEL, text), **kwargs)
 
 
 # ============ Question State Machine ============
@@ -103,6 +147,30 @@ class QuestionState(Enum):
     SILENCE_SKIPPED = "silence_skipped"
 
 
+class LogThrottle:
+    """
+    Per-event-name log limiter for high-rate events: every final transcript
+    event is logged, interim ones at most once per interval, and the next
+    logged line carries how many were skipped.
+    """
+    
+    def __init__(self, interval: float = TRANSCRIPT_LOG_INTERVAL_SECONDS):
+        self.interval = interval
+        self._last: Dict[str, float] = {}
+        self._skipped: Dict[str, int] = {}
+    
+    def log(self, event: str, final: bool, **kwargs):
+        now = time.monotonic()
+        if not final and now - self._last.get(event, -self.interval) < self.interval:
+            self._skipped[event] = self._skipped.get(event, 0) + 1
+            return
+        self._last[event] = now
+        skipped = self._skipped.pop(event, 0)
+        if skipped:
+            kwargs["skipped"] = skipped
+        log_event(event, **kwargs)
+
+
 @dataclass
 class QuestionContext:
     """State for a single question turn (legacy, kept for backward compat)."""
@@ -116,8 +184,11 @@ class QuestionContext:
     timer_started_at: float = 0
     timer_duration: float = 0
     
-    # Transcript collection
+    # Transcript collection: final STT results only, plus the latest interim
+    # of the segment still being spoken (each interim repeats the whole segment)
     transcripts: List[str] = field(default_factory=list)
+    partial: str = ""
+    intents: IntentMatcher = field(default_factory=IntentMatcher)
     first_speech_at: float = 0
     last_speech_at: float = 0
     has_speech: bool = False
@@ -125,8 +196,8 @@ class QuestionContext:
     # Timer handle (for cancellation)
     timeout_task: Optional[asyncio.Task] = None
     
-    def add_transcript(self, text: str):
-        """Add a transcript segment with structured logging."""
+    def add_transcript(self, text: str, is_final: bool = True):
+        """Add a transcript segment with structured logging (interim results only mark activity)."""
         now = time.time()
         if not self.has_speech:
             self.first_speech_at = now
@@ -137,6 +208,11 @@ class QuestionContext:
                       elapsed_ms=int((now - self.question_asked_at) * 1000))
         
         self.last_speech_at = now
+        self.intents.feed(text, is_final)
+        if not is_final:
+            self.partial = text
+            return
+        self.partial = ""
         self.transcripts.append(text)
         
         log_event("TRANSCRIPT_RECEIVED",
@@ -146,7 +222,7 @@ class QuestionContext:
                   transcript_count=len(self.transcripts))
     
     def get_full_text(self) -> str:
-        return " ".join(self.transcripts)
+        return " ".join(self.transcripts + [self.partial] if self.partial else self.transcripts)
     
     def time_since_last_speech(self) -> float:
         if self.last_speech_at == 0:
@@ -154,11 +230,7 @@ class QuestionContext:
         return time.time() - self.last_speech_at
     
     def is_asking_to_repeat(self) -> bool:
-        text = self.get_full_text().lower()
-        for pattern in REPEAT_PATTERNS:
-            if re.search(pattern, text):
-                return True
-        return False
+        return self.intents.matched("repeat")
     
     def cancel_timer(self):
         """Cancel the timeout timer if running."""
@@ -174,6 +246,8 @@ class QuestionContext:
         """Reset for next question."""
         self.cancel_timer()
         self.transcripts = []
+        self.partial = ""
+        self.intents.reset()
         self.first_speech_at = 0
         self.last_speech_at = 0
         self.has_speech = False
@@ -183,25 +257,30 @@ class QuestionContext:
 @dataclass
 class TurnController:
     """
-    Manages per-participant turn timers with turn_id guards.
-    Prevents ghost timers from firing on subsequent participants.
+    Manages per-participant turn deadlines on the worker-wide timer wheel.
+    Deadlines are keyed by (room, turn_id, name), so a ghost timer from a
+    previous turn is simply a key that is no longer armed.
     """
     turn_id: int = 0
+    room: str = ""
     participant_id: str = ""
     participant_name: str = ""
     question_text: str = ""
     question_id: str = ""
     
-    # Timer tasks (all must check turn_id before firing)
-    silence_prompt_task: Optional[asyncio.Task] = None
-    silence_grace_task: Optional[asyncio.Task] = None
-    max_answer_task: Optional[asyncio.Task] = None
-    wrapup_task: Optional[asyncio.Task] = None
-    end_of_speech_task: Optional[asyncio.Task] = None
+    # Deadlines armed for this turn: name -> wheel seq
+    deadlines: Dict[str, int] = field(default_factory=dict)
+    
+    # Per-participant pause history (persists across turns)
+    pause_models: Dict[str, PauseModel] = field(default_factory=dict)
+    
+    # Turn event sink (ModeratorState.emit), e.g. the API channel
+    emit: Optional[Callable[..., None]] = None
+    end_of_speech_silence: float = END_OF_SPEECH_SILENCE
+    false_eot_count: int = 0
     
     # Events for coordination
     turn_ended: asyncio.Event = field(default_factory=asyncio.Event)
-    speech_detected: asyncio.Event = field(default_factory=asyncio.Event)
     
     # Timing state
     turn_started_at: float = 0
@@ -210,13 +289,21 @@ class TurnController:
     has_speech: bool = False
     silence_prompted: bool = False
     wrapup_prompted: bool = False
-    
-    # Transcript buffer for this turn
+    user_vad_speaking: bool = False
+    vad_silent_at: float = 0     # when VAD last went speaking -> listening (0 while speaking)
+    resumed_gap: float = 0       # VAD silence before speech resumed after the turn ended
+    ended_at: float = 0
+    end_reason: str = ""
+    false_eot_flagged: bool = False
+    
+    # Transcript buffer for this turn: final results only, plus the latest interim
     transcripts: List[str] = field(default_factory=list)
+    partial: str = ""
+    intents: IntentMatcher = field(default_factory=IntentMatcher)
     
     def start_turn(self, participant_id: str, participant_name: str, question_text: str, question_id: str = ""):
-        """Initialize a new turn, incrementing turn_id to invalidate stale tasks."""
-        self.cancel_all_tasks()
+        """Initialize a new turn, incrementing turn_id to invalidate stale deadlines."""
+        self.cancel_all_deadlines()
         self.turn_id += 1
         self.participant_id = participant_id
         self.participant_name = participant_name
@@ -228,17 +315,29 @@ class TurnController:
         self.has_speech = False
         self.silence_prompted = False
         self.wrapup_prompted = False
+        self.user_vad_speaking = False
+        self.vad_silent_at = 0
+        self.resumed_gap = 0
+        self.ended_at = 0
+        self.end_reason = ""
+        self.false_eot_flagged = False
         self.transcripts = []
+        self.partial = ""
+        self.intents.reset()
         self.turn_ended = asyncio.Event()
-        self.speech_detected = asyncio.Event()
         
         log_event("TURN_START",
                   turn_id=self.turn_id,
                   participant=participant_name,
                   qid=question_id)
+        if self.emit:
+            self.emit("turn_start", pid=participant_id, qid=question_id, turn=self.turn_id)
     
-    def on_speech_detected(self, transcript: str = ""):
-        """Called when transcript is received for current participant."""
+    def on_speech_detected(self, transcript: str = "", is_final: bool = True):
+        """
+        Called when transcript is received for current participant. Any result
+        counts as speech activity; only final results are kept as text.
+        """
         now = time.time()
         if not self.has_speech:
             self.first_speech_at = now
@@ -247,50 +346,132 @@ class TurnController:
                       turn_id=self.turn_id,
                       participant=self.participant_name,
                       elapsed_ms=int((now - self.turn_started_at) * 1000))
+            if self.emit:
+                self.emit("speaker", pid=self.participant_id)
+                self.emit("timing", name="first_speech", ms=int((now - self.turn_started_at) * 1000))
         
         self.last_speech_at = now
-        self.speech_detected.set()
         
         if transcript:
+            self.intents.feed(transcript, is_final)
+        if transcript and is_final:
             self.transcripts.append(transcript)
+            self.partial = ""
+        elif transcript:
+            self.partial = transcript
         
-        # Cancel silence timers (but not max answer / wrapup)
-        self._cancel_task("silence_prompt", self.silence_prompt_task)
-        self._cancel_task("silence_grace", self.silence_grace_task)
-        self.silence_prompt_task = None
-        self.silence_grace_task = None
+        # Cancel silence deadlines (but not max answer / wrapup)
+        self.cancel_deadline("silence_prompt")
+        self.cancel_deadline("silence_grace")
     
     def on_turn_end(self, reason: str):
-        """End the current turn and cancel all tasks."""
+        """End the current turn and cancel all deadlines."""
         log_event("TURN_END",
                   turn_id=self.turn_id,
                   participant=self.participant_name,
                   reason=reason,
-                  has_speech=self.has_speech)
+                  has_speech=self.has_speech,
+                  intents=",".join(self.intents.intents()) or "none",
+                  eos_silence_s=self.end_of_speech_silence)
+        self.ended_at = time.time()
+        self.end_reason = reason
+        if reason == "answer":
+            self.pause_model().eot_commits += 1
+        if self.emit:
+            self.emit("turn_end", pid=self.participant_id, reason=reason, has_speech=self.has_speech,
+                      turnMs=int((self.ended_at - self.turn_started_at) * 1000))
         self.turn_ended.set()
-        self.cancel_all_tasks()
-    
-    def cancel_all_tasks(self):
-        """Cancel all timer tasks."""
-        for name, task in [
-            ("silence_prompt", self.silence_prompt_task),
-            ("silence_grace", self.silence_grace_task),
-            ("max_answer", self.max_answer_task),
-            ("wrapup", self.wrapup_task),
-            ("end_of_speech", self.end_of_speech_task),
-        ]:
-            self._cancel_task(name, task)
-        self.silence_prompt_task = None
-        self.silence_grace_task = None
-        self.max_answer_task = None
-        self.wrapup_task = None
-        self.end_of_speech_task = None
-    
-    def _cancel_task(self, name: str, task: Optional[asyncio.Task]):
-        if task and not task.done():
-            task.cancel()
+        self.cancel_all_deadlines()
+    
+    def on_vad(self, speaking: bool):
+        """
+        VAD transition on the participant's audio. A listening -> speaking gap
+        inside an answer is a pause sample; interim transcripts never are.
+        """
+        now = time.time()
+        self.user_vad_speaking = speaking
+        if not speaking:
+            self.vad_silent_at = now
+            return
+        if self.vad_silent_at and self.has_speech:
+            gap = now - self.vad_silent_at
+            if self.turn_ended.is_set():
+                self.resumed_gap = gap  # judged by on_late_speech once we know who spoke
+            else:
+                self.pause_model().record_pause(gap)
+        self.vad_silent_at = 0
+    
+    def pause_model(self) -> PauseModel:
+        model = self.pause_models.get(self.participant_id)
+        if model is None:
+            model = self.pause_models[self.participant_id] = PauseModel()
+        return model
+    
+    def resolve_end_of_speech_silence(self, fallback: float) -> float:
+        """Fix this turn's end-of-speech silence from the participant's pause history."""
+        self.end_of_speech_silence = self.pause_model().threshold(fallback)
+        return self.end_of_speech_silence
+    
+    def on_late_speech(self, speaker: Optional[str]) -> bool:
+        """
+        Called for speech arriving after the turn ended. If it came from the
+        same participant and their turn was committed on end of speech moments
+        ago, count a false end of turn and feed the gap (the VAD silence, when
+        known) back into the pause model. Returns True when counted.
+        """
+        if speaker != self.participant_id:
+            return False
+        if self.end_reason != "answer" or self.false_eot_flagged or not self.last_speech_at:
+            return False
+        now = time.time()
+        if now - self.ended_at > FALSE_EOT_WINDOW_SECONDS:
+            return False
+        gap = self.resumed_gap or now - self.last_speech_at
+        self.false_eot_flagged = True
+        self.false_eot_count += 1
+        model = self.pause_model()
+        model.false_eots += 1
+        model.record_pause(gap)
+        log_event("FALSE_END_OF_TURN",
+                  turn_id=self.turn_id,
+                  participant=self.participant_name,
+                  gap_s=round(gap, 2),
+                  eos_silence_s=self.end_of_speech_silence,
+                  participant_false_eots=model.false_eots,
+                  participant_rate=round(model.false_eot_rate(), 3),
+                  session_false_eots=self.false_eot_count)
+        return True
+    
+    def deadline_key(self, name: str) -> tuple:
+        return (self.room, self.turn_id, name)
+    
+    def arm_deadline(self, name: str, delay: float, fire: Callable[[str, int], None]) -> int:
+        """
+        Arm (or re-arm) a named deadline for this turn on the timer wheel.
+        fire(name, seq) is called when it expires; returns the seq.
+        """
+        seq = get_timer_wheel().arm(self.deadline_key(name), delay,
+                                    lambda key, seq: fire(key[2], seq))
+        self.deadlines[name] = seq
+        return seq
+    
+    def claim_deadline(self, name: str, seq: int) -> bool:
+        """Consume a fired deadline. False if it was cancelled or re-armed since."""
+        if not get_timer_wheel().claim(self.deadline_key(name), seq):
+            return False
+        self.deadlines.pop(name, None)
+        return True
+    
+    def cancel_deadline(self, name: str):
+        if self.deadlines.pop(name, None) is not None:
+            get_timer_wheel().cancel(self.deadline_key(name))
             log_event("TIMER_CANCELLED", turn_id=self.turn_id, timer=name)
     
+    def cancel_all_deadlines(self):
+        """Cancel all armed deadlines."""
+        for name in list(self.deadlines):
+            self.cancel_deadline(name)
+    
     def time_since_last_speech(self) -> float:
         if self.last_speech_at == 0:
             return float('inf')
@@ -302,75 +483,219 @@ class TurnController:
         return time.time() - self.first_speech_at
     
     def get_full_text(self) -> str:
-        return " ".join(self.transcripts)
+        return " ".join(self.transcripts + [self.partial] if self.partial else self.transcripts)
     
     def is_asking_to_repeat(self) -> bool:
-        text = self.get_full_text().lower()
-        for pattern in REPEAT_PATTERNS:
-            if re.search(pattern, text):
-                return True
-        return False
+        return self.intents.matched("repeat")
 
 
 class ModeratorState:
     """State management for the moderator agent."""
     
     def __init__(self):
-        self.guide: Optional[Dict] = None
+        self.group_type: str = GROUP_TYPE
+        self.plan: Optional[GuidePlan] = None
+        self.step_idx: int = 0
         self.session_id: Optional[str] = None
         self.room_name: Optional[str] = None
-        self.section_idx: int = 0
-        self.question_idx: int = 0
         self.section_script_read: bool = False
         self.participants: Dict[str, Dict] = {}
         self.session_started: bool = False
         self.session_ended: bool = False
+        self.session_changed: asyncio.Event = asyncio.Event()  # set on start / end
+        self.hand_raise_queue: List[str] = []
+        self.channel: Optional[ApiChannel] = None
         self.current_question: QuestionContext = QuestionContext()
         self.agent_speaking: bool = False
         self.turn_controller: TurnController = TurnController()
+        self.turn_engine: Optional["TurnEngine"] = None
+        self.phrases: Optional[ParticipantPhrases] = None
+        self.lookahead: Optional[Lookahead] = None
+        self.pacer: Pacer = Pacer()
+        self.transcript_log: Optional[TranscriptLog] = None
+        self.transcript_logs: LogThrottle = LogThrottle()
+        self.segment_started_ms: int = 0  # first transcript event of the segment being spoken
+        self.question_vectors: Optional[QuestionVectors] = None  # off-topic scoring, per guide
+        self.probe: Optional[SpeculativeProbe] = None
+    
+    @property
+    def guide(self) -> Optional[Dict]:
+        return self.plan.guide if self.plan else None
+    
+    @guide.setter
+    def guide(self, guide: Optional[Dict]):
+        self.plan = compile_guide(guide, self.group_type) if guide else None
+        self.step_idx = 0
+        self.section_script_read = False
+    
+    @property
+    def step(self) -> Optional[Step]:
+        return self.plan.step(self.step_idx) if self.plan else None
+    
+    @property
+    def section_idx(self) -> int:
+        """Raw guide section index of the current step (section count once complete)."""
+        step = self.step
+        if step is not None:
+            return step.section_index
+        return self.plan.section_count if self.plan else 0
+    
+    @section_idx.setter
+    def section_idx(self, value: int):
+        if self.plan:
+            self.step_idx = self.plan.position(value, 0)
+    
+    @property
+    def question_idx(self) -> int:
+        step = self.step
+        return max(step.question_index, 0) if step is not None else 0
+    
+    @question_idx.setter
+    def question_idx(self, value: int):
+        if self.plan:
+            self.step_idx = self.plan.position(self.section_idx, value)
     
     def load_guide(self, path: str) -> bool:
         if not os.path.exists(path):
             return False
-        with open(path, "r", encoding="utf-8") as f:
-            self.guide = json.load(f)
+        self.plan = load_guide_plan(path, self.group_type)
+        self.step_idx = 0
+        self.section_script_read = False
+        return True
+    
+    async def fetch_guide(self, guide_hash: Optional[str] = None) -> bool:
+        """
+        Resolve this session's guide by the hash the API recorded for it (from
+        the dispatch metadata, or else the session). A plan already compiled in
+        this worker is used as is; otherwise the guide is fetched by hash (304
+        when another group type's plan already holds it).
+        """
+        try:
+            async with aiohttp.ClientSession() as http:
+                if guide_hash is None:
+                    async with http.get(f"{API_BASE}/api/sessions/{self.session_id}") as resp:
+                        if resp.status != 200:
+                            return False
+                        guide_hash = (await resp.json()).get("guideHash")
+                if not guide_hash:
+                    return False
+                plan = cached_plan(guide_hash, self.group_type) or await fetch_guide_plan(
+                    http, f"{API_BASE}/api/guides/{guide_hash}", self.group_type)
+        except Exception as e:
+            log_event("GUIDE_FETCH_FAILED", session_id=self.session_id, error=str(e))
+            return False
+        if plan is None:
+            return False
+        self.plan = plan
+        self.step_idx = 0
+        self.section_script_read = False
         return True
     
     def get_current(self) -> tuple[Optional[Dict], Optional[Dict]]:
-        if not self.guide:
+        step = self.step
+        if step is None:
             return None, None
-        sections = self.guide.get("sections", [])
-        if self.section_idx >= len(sections):
-            return None, None
-        section = sections[self.section_idx]
-        questions = section.get("questions", [])
-        question = questions[self.question_idx] if self.question_idx < len(questions) else None
-        return section, question
+        return step.section, step.question
     
     def advance(self):
-        if not self.guide:
-            return
-        sections = self.guide.get("sections", [])
-        if self.section_idx >= len(sections):
+        if self.step is None:
             return
-        section = sections[self.section_idx]
-        questions = section.get("questions", [])
-        
-        if self.question_idx + 1 < len(questions):
-            self.question_idx += 1
-            self.section_script_read = True
-        else:
-            self.section_idx += 1
-            self.question_idx = 0
-            self.section_script_read = False
+        self.step_idx += 1
+        # The next step's section script was already read if it is in the same section
+        nxt = self.step
+        self.section_script_read = nxt is not None and not nxt.section_start
+    
+    def peek_next_utterance(self) -> Optional[str]:
+        """First line run_discussion will speak after advance(), without advancing."""
+        if not self.plan:
+            return None
+        for step in self.plan.steps[self.step_idx + 1:]:
+            if step.section_script:
+                return step.section_script
+            if step.question is not None:
+                if step.type in ("info", "closing"):
+                    return step.script or None
+                return step.text or None
+        return SPEECH_CLOSING
+    
+    def predict_next_utterances(self, participant_id: str) -> List[str]:
+        """Most likely lines after this participant's turn ends, most likely first."""
+        participants = self.get_all_participants()
+        identities = [p.get("identity", p.get("displayName")) for p in participants]
+        if participant_id in identities:
+            idx = identities.index(participant_id)
+            if idx + 1 < len(participants):
+                nxt = participants[idx + 1]
+                return [SPEECH_NEXT_TURN.format(name=nxt.get("displayName", nxt.get("identity", "Participant")))]
+        return [line for line in (SPEECH_QUESTION_DONE, self.peek_next_utterance()) if line]
     
     def is_complete(self) -> bool:
-        if not self.guide:
-            return True
-        return self.section_idx >= len(self.guide.get("sections", []))
+        return self.plan is None or self.step_idx >= len(self.plan)
+    
+    def apply_session_status(self, data: Dict, source: str) -> Optional[bool]:
+        """
+        Apply a session status from the API (pushed or fetched). True once the
+        session is in progress, False once it has ended, None while waiting.
+        """
+        status = data.get("status")
+        if status == "in_session":
+            if not self.session_started:
+                self.session_started = True
+                log_event("SESSION_STARTED", session_id=self.session_id, source=source)
+            for p in data.get("participants", []):
+                self.participants[p["identity"]] = p
+                # Fallback for joins whose control message we missed
+                self.queue_participant_phrases(p["identity"], p.get("displayName", p["identity"]))
+        elif status == "ended":
+            self.session_ended = True
+        else:
+            return None
+        self.session_changed.set()
+        return not self.session_ended
+    
+    def emit(self, kind: str, **fields):
+        """Report a progress event to the API (non-blocking; no-op without a channel)."""
+        if self.channel is not None:
+            self.channel.emit(self.session_id, kind, **fields)
+    
+    def record_transcript(self, text: str, is_final: bool, speaker: Optional[str] = None):
+        """
+        Log final transcript segments to the session transcript, attributed to
+        the participant who spoke (the one whose turn it is when `speaker` is
+        unknown) and the question and turn in progress. A segment spans from
+        its first (interim) transcript event to its final one.
+        """
+        now_ms = int(time.time() * 1000)
+        if not self.segment_started_ms:
+            self.segment_started_ms = now_ms
+        if not is_final:
+            return
+        if self.transcript_log is not None:
+            tc = self.turn_controller
+            pid, name = tc.participant_id, tc.participant_name
+            if speaker and speaker != pid:
+                pid, name = speaker, self.participants.get(speaker, {}).get("displayName", speaker)
+            self.transcript_log.append(Segment(pid, name, tc.question_id,
+                                               tc.turn_id, self.segment_started_ms, now_ms, text))
+        self.segment_started_ms = 0
+    
+    def on_probe_drafted(self, text: str):
+        """Synthesize a fresh probe draft ahead of the lines that would follow it."""
+        if self.lookahead is not None:
+            self.lookahead.schedule([text] + self.predict_next_utterances(self.turn_controller.participant_id))
     
     def get_all_participants(self) -> List[Dict]:
         return list(self.participants.values())
+    
+    def queue_participant_phrases(self, identity: str, display_name: str) -> bool:
+        """Pre-synthesize a participant's name-templated lines in the background."""
+        if self.phrases is None:
+            return False
+        lines = [line.format(name=display_name) for line in PARTICIPANT_SPEECH_LINES]
+        if not self.phrases.submit(identity, lines, display_name):
+            return False
+        log_event("PARTICIPANT_PHRASES_QUEUED", identity=identity, lines=len(lines))
+        return True
 
 
 class FocusGroupModerator(Agent):
@@ -383,204 +708,372 @@ class FocusGroupModerator(Agent):
         )
 
 
-# ============ Turn Timing: Event-Driven Wait with Silence + Wrap-up ============
+# ============ Turn Engine: One Event Queue per Session ============
 
-async def wait_for_turn_completion(
-    state: ModeratorState,
-    session: AgentSession,
-    question_id: str,
-    question_index: int,
-    participant_name: str,
-) -> tuple[bool, bool, str]:
+class TurnEventKind(Enum):
+    TRANSCRIPT = "transcript"
+    VAD = "vad"
+    PLAYOUT = "playout"
+    DEADLINE = "deadline"
+    TOPIC = "topic"
+    END = "end"
+
+
+@dataclass
+class TurnEvent:
+    kind: TurnEventKind
+    turn_id: int
+    name: str = ""  # deadline / playout name, VAD state or end reason
+    seq: int = 0    # deadline sequence (see TurnController.claim_deadline)
+    text: str = ""  # transcript text
+    is_final: bool = False
+    speech_final: bool = False
+    topic: Optional[TopicBatch] = None  # embedded answer chunks
+
+
+class TurnEngine:
     """
-    Event-driven turn management with silence prompting and wrap-up.
-    
-    Returns: (got_response, asked_to_repeat, end_reason)
-    end_reason: "answer" | "silence_skip" | "wrapup" | "repeat"
+    Single long-lived coroutine per session that drives turn timing.
+    
+    Transcript, VAD, playout and deadline events are posted to one queue and
+    advance the QuestionState machine directly. Deadlines are entries on the
+    process-wide TimerWheel, keyed by (room, turn, name): arming returns a
+    seq, an expiry posts a DEADLINE event carrying it, and the engine acts
+    only if it can still claim that seq (a cancel or re-arm since makes the
+    claim fail). Agent prompts report completion through speech-handle
+    callbacks, so no tasks are created per turn. Answer chunks for off-topic
+    scoring are embedded on the embedding thread and come back as TOPIC events.
     """
-    tc = state.turn_controller
     
-    # Events for different outcomes
-    silence_skip_event = asyncio.Event()
-    answer_complete_event = asyncio.Event()
-    wrapup_complete_event = asyncio.Event()
+    def __init__(self, state: "ModeratorState", session: AgentSession):
+        self.state = state
+        self.session = session
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._outcome: Optional[asyncio.Future] = None
+        self._turn_id: int = -1
+        self._participant_name: str = ""
+        self._max_answer_armed: bool = False
+        self.detector = EndOfTurnDetector()
+        self.topic: Optional[TopicTracker] = None
+        self._topic_in_flight: int = 0
+        self._deferred_finish: Optional[tuple[bool, str]] = None  # waiting on the last embeddings
+        self.probe: Optional[SpeculativeProbe] = None  # drafting a follow-up this turn
+    
+    def start(self):
+        """Start the engine loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
     
-    # Capture turn_id at start to guard against ghost timers
-    current_turn_id = tc.turn_id
+    def post(self, kind: TurnEventKind, name: str = "", seq: int = 0,
+             text: str = "", is_final: bool = False, speech_final: bool = False,
+             topic: Optional[TopicBatch] = None, turn_id: Optional[int] = None):
+        """Queue an event for the current turn (or `turn_id`). Safe to call from callbacks."""
+        if turn_id is None:
+            turn_id = self.state.turn_controller.turn_id
+        self.queue.put_nowait(TurnEvent(kind, turn_id, name, seq, text, is_final, speech_final, topic))
     
-    def is_current_turn() -> bool:
-        return tc.turn_id == current_turn_id and not tc.turn_ended.is_set()
+    def end_turn(self, reason: str = "external"):
+        """End the active turn from outside (session end, disconnect, etc.)."""
+        self.post(TurnEventKind.END, name=reason)
     
-    async def silence_prompt_watcher():
-        """Wait for silence prompt threshold, then prompt user."""
+    async def run_turn(self, participant_name: str, probe: bool = False) -> tuple[bool, bool, str]:
+        """
+        Wait for the turn started by TurnController.start_turn to complete.
+        With probe=True a follow-up is drafted while the participant answers
+        (see ModeratorState.probe); the caller commits or discards it.
+        
+        Returns: (got_response, asked_to_repeat, end_reason)
+        """
+        tc = self.state.turn_controller
+        self.start()
+        
+        self._outcome = asyncio.get_running_loop().create_future()
+        self._turn_id = tc.turn_id
+        self._participant_name = participant_name
+        self._max_answer_armed = False
+        self._deferred_finish = None
+        self.detector.reset()
+        self._reset_topic()
+        self._reset_probe(probe)
+        tc.resolve_end_of_speech_silence(END_OF_SPEECH_SILENCE)
+        
+        tc.arm_deadline("silence_prompt", SILENCE_PROMPT_SECONDS, self._fire_deadline)
+        if tc.has_speech:
+            # Speech arrived between start_turn and this wait
+            self.post(TurnEventKind.TRANSCRIPT, text=tc.get_full_text())
+        
+        log_event("TURN_WAIT_STARTED",
+                  turn_id=self._turn_id,
+                  participant=participant_name,
+                  silence_prompt_s=SILENCE_PROMPT_SECONDS,
+                  max_answer_s=MAX_ANSWER_SECONDS,
+                  eos_silence_s=tc.end_of_speech_silence)
+        
         try:
-            await asyncio.sleep(SILENCE_PROMPT_SECONDS)
-            if not is_current_turn():
+            return await self._outcome
+        finally:
+            self._outcome = None
+            tc.cancel_all_deadlines()
+    
+    # ---- internals ----
+    
+    def _fire_deadline(self, name: str, seq: int):
+        self.post(TurnEventKind.DEADLINE, name=name, seq=seq)
+    
+    def _set_state(self, question_state: QuestionState):
+        self.state.current_question.state = question_state
+    
+    def _reset_topic(self):
+        """Point the topic tracker at this turn's question (no-op for unscored questions)."""
+        tc = self.state.turn_controller
+        vectors = self.state.question_vectors
+        question = vectors.vector(tc.question_id) if vectors is not None else None
+        if question is not None and (self.topic is None or self.topic.embedder is not vectors.embedder):
+            self.topic = TopicTracker(vectors.embedder)
+        self._topic_in_flight = 0
+        if self.topic is not None:
+            self.topic.reset(question)
+            for text in tc.transcripts:  # finals heard before the wait started
+                self._add_topic_chunk(text)
+    
+    def _add_topic_chunk(self, text: str):
+        texts = self.topic.add(text)
+        if texts:
+            self._embed_topic(texts)
+    
+    def _embed_topic(self, texts: List[str]):
+        """Embed answer chunks off the loop; the result is posted as a TOPIC event."""
+        turn_id = self._turn_id
+        self._topic_in_flight += 1
+        
+        def on_done(future: asyncio.Future):
+            batch = TopicBatch(texts)
+            if not future.cancelled():
+                if future.exception() is not None:
+                    log_event("TOPIC_EMBED_FAILED", turn_id=turn_id, error=str(future.exception()))
+                else:
+                    batch = future.result()
+            self.post(TurnEventKind.TOPIC, topic=batch, turn_id=turn_id)
+        
+        embed_in_worker(self.topic.embedder, texts).add_done_callback(on_done)
+    
+    def _topic_pending(self) -> bool:
+        """Send off any queued chunks; True while embeddings are still outstanding."""
+        if self.topic is None or self.topic.question is None:
+            return False
+        texts = self.topic.take()
+        if texts:
+            self._embed_topic(texts)
+        return self._topic_in_flight > 0
+    
+    def _reset_probe(self, enabled: bool):
+        tc = self.state.turn_controller
+        self.probe = self.state.probe if enabled else None
+        if self.state.probe is not None:
+            self.state.probe.reset(tc.question_text if enabled else None)
+        if self.probe is not None and tc.transcripts:
+            self.probe.update(" ".join(tc.transcripts), tc.answer_duration())
+    
+    def _is_off_topic(self) -> bool:
+        if self.topic is None or self.topic.question is None:
+            return False
+        tc = self.state.turn_controller
+        off_topic = self.topic.is_off_topic(cue=tc.intents.matched("off_topic"))
+        similarity = self.topic.similarity()
+        if similarity is not None:
+            log_event("TOPIC_SCORED",
+                      turn_id=self._turn_id,
+                      qid=tc.question_id,
+                      similarity=round(similarity, 3),
+                      best_chunk=round(self.topic.best, 3),
+                      chunks=self.topic.chunks,
+                      words=self.topic.words,
+                      embed_ms=round(self.topic.embed_ms, 1),
+                      off_topic=off_topic)
+        return off_topic
+    
+    def _finish(self, got_response: bool, end_reason: str):
+        if self._outcome is None or self._outcome.done():
+            return
+        tc = self.state.turn_controller
+        asked_to_repeat = False
+        if got_response and end_reason in ("answer", "wrapup") and tc.is_asking_to_repeat():
+            asked_to_repeat, end_reason = True, "repeat"
+        elif got_response and end_reason == "answer" and self._topic_pending():
+            self._deferred_finish = (got_response, end_reason)  # decided on the last TOPIC event
+            return
+        elif got_response and end_reason == "answer" and self._is_off_topic():
+            end_reason = "off_topic"
+        self._outcome.set_result((got_response, asked_to_repeat, end_reason))
+    
+    def _end_of_speech_timing(self) -> tuple[float, float]:
+        """(required silence, elapsed silence) for the end-of-speech decision."""
+        tc = self.state.turn_controller
+        if EOT_DETECTOR_ENABLED:
+            floor = tc.pause_model().min_hold(tc.end_of_speech_silence)
+            return (self.detector.hold_seconds(tc.end_of_speech_silence, floor),
+                    self.detector.silence_elapsed())
+        return tc.end_of_speech_silence, tc.time_since_last_speech()
+    
+    def _arm_end_of_speech(self):
+        hold, elapsed = self._end_of_speech_timing()
+        self.state.turn_controller.arm_deadline("end_of_speech", hold - elapsed, self._fire_deadline)
+    
+    def _speak(self, text: str, name: str):
+        """Start an agent prompt; a PLAYOUT event is posted when it finishes."""
+        self.state.agent_speaking = True
+        
+        def on_done(_handle=None):
+            self.state.agent_speaking = False
+            self.post(TurnEventKind.PLAYOUT, name=name)
+        
+        try:
+            handle = speak(self.session, text)
+        except RuntimeError:
+            on_done()
+            return
+        handle.add_done_callback(on_done)
+    
+    async def _run(self):
+        while True:
+            event = await self.queue.get()
+            if self._outcome is None or self._outcome.done():
+                continue
+            if event.turn_id != self._turn_id:
+                continue  # stale event from a previous turn
+            try:
+                self._dispatch(event)
+            except Exception as e:
+                log_event("TURN_ENGINE_ERROR", turn_id=self._turn_id, error=str(e))
+    
+    def _dispatch(self, event: TurnEvent):
+        tc = self.state.turn_controller
+        
+        if event.kind == TurnEventKind.TRANSCRIPT:
+            if not tc.has_speech:
                 return
+            self.detector.on_transcript(event.text, event.is_final, event.speech_final)
+            if event.is_final and self.topic is not None:
+                self._add_topic_chunk(event.text)
+            if event.is_final and self.probe is not None:
+                self.probe.update(" ".join(tc.transcripts), tc.answer_duration())
+            if not tc.wrapup_prompted:
+                self._set_state(QuestionState.USER_SPEAKING)
+            if not self._max_answer_armed:
+                self._max_answer_armed = True
+                tc.arm_deadline("max_answer", MAX_ANSWER_SECONDS - tc.answer_duration(),
+                                self._fire_deadline)
+            self._arm_end_of_speech()
+        
+        elif event.kind == TurnEventKind.VAD:
+            tc.user_vad_speaking = event.name == "speaking"
+            self.detector.on_vad(tc.user_vad_speaking)
+            if tc.has_speech:
+                self._arm_end_of_speech()
+        
+        elif event.kind == TurnEventKind.PLAYOUT:
+            if event.name == "silence_prompt" and not tc.has_speech:
+                tc.arm_deadline("silence_grace", SILENCE_GRACE_SECONDS, self._fire_deadline)
+            elif event.name == "wrapup_prompt":
+                tc.arm_deadline("wrapup_end", WRAPUP_SECONDS, self._fire_deadline)
+        
+        elif event.kind == TurnEventKind.DEADLINE:
+            if tc.claim_deadline(event.name, event.seq):
+                self._on_deadline(event.name)
+        
+        elif event.kind == TurnEventKind.TOPIC:
+            self._topic_in_flight -= 1
+            if self.topic is not None:
+                self.topic.apply(event.topic)
+            if self._topic_in_flight == 0 and self._deferred_finish is not None:
+                got_response, end_reason = self._deferred_finish
+                self._deferred_finish = None
+                self._finish(got_response, end_reason)
+        
+        elif event.kind == TurnEventKind.END:
+            self._finish(tc.has_speech, event.name or "external")
+    
+    def _on_deadline(self, name: str):
+        tc = self.state.turn_controller
+        
+        if name == "silence_prompt":
             if tc.has_speech:
                 return  # Already speaking, no need to prompt
-            
             log_event("SILENCE_PROMPT_TRIGGERED",
-                      turn_id=current_turn_id,
+                      turn_id=self._turn_id,
                       elapsed_s=round(time.time() - tc.turn_started_at, 1))
-            
             tc.silence_prompted = True
-            
-            # Say the prompt
-            try:
-                state.agent_speaking = True
-                await session.say(SPEECH_SILENCE_PROMPT.format(name=participant_name))
-            except RuntimeError:
-                pass
-            finally:
-                state.agent_speaking = False
-            
-            # Start grace timer
-            if is_current_turn():
-                tc.silence_grace_task = asyncio.create_task(silence_grace_watcher())
-            
-        except asyncio.CancelledError:
-            pass
-    
-    async def silence_grace_watcher():
-        """Wait for grace period after prompt, then skip participant."""
-        try:
-            await asyncio.sleep(SILENCE_GRACE_SECONDS)
-            if not is_current_turn():
-                return
+            self._set_state(QuestionState.SILENCE_PROMPTED)
+            self._speak(SPEECH_SILENCE_PROMPT.format(name=self._participant_name), "silence_prompt")
+        
+        elif name == "silence_grace":
             if tc.has_speech:
                 return  # Started speaking during grace
-            
             log_event("SILENCE_SKIP_TRIGGERED",
-                      turn_id=current_turn_id,
+                      turn_id=self._turn_id,
                       elapsed_s=round(time.time() - tc.turn_started_at, 1))
-            
-            silence_skip_event.set()
-            
-        except asyncio.CancelledError:
-            pass
-    
-    async def max_answer_watcher():
-        """Watch for max answer duration and trigger wrap-up."""
-        try:
-            # Wait until speech starts, then track duration
-            await tc.speech_detected.wait()
-            if not is_current_turn():
-                return
-            
-            # Now wait for max answer duration from first speech
-            remaining = MAX_ANSWER_SECONDS - tc.answer_duration()
-            if remaining > 0:
-                await asyncio.sleep(remaining)
-            
-            if not is_current_turn():
-                return
-            
+            self._set_state(QuestionState.SILENCE_SKIPPED)
+            self._finish(False, "silence_skip")
+        
+        elif name == "max_answer":
             log_event("WRAPUP_TRIGGERED",
-                      turn_id=current_turn_id,
+                      turn_id=self._turn_id,
                       answer_duration_s=round(tc.answer_duration(), 1))
-            
             tc.wrapup_prompted = True
-            
-            # Say the wrap-up prompt
-            try:
-                state.agent_speaking = True
-                await session.say(SPEECH_WRAPUP_PROMPT)
-            except RuntimeError:
-                pass
-            finally:
-                state.agent_speaking = False
-            
-            # Start wrapup timer
-            if is_current_turn():
-                tc.wrapup_task = asyncio.create_task(wrapup_end_watcher())
-            
-        except asyncio.CancelledError:
-            pass
-    
-    async def wrapup_end_watcher():
-        """End turn after wrap-up period expires."""
-        try:
-            await asyncio.sleep(WRAPUP_SECONDS)
-            if not is_current_turn():
-                return
-            
-            log_event("WRAPUP_END_TRIGGERED", turn_id=current_turn_id)
-            wrapup_complete_event.set()
-            
-        except asyncio.CancelledError:
-            pass
-    
-    async def end_of_speech_watcher():
-        """Watch for end of speech (silence after speaking)."""
-        try:
-            while is_current_turn():
-                await asyncio.sleep(0.5)
-                
-                if tc.has_speech:
-                    silence_duration = tc.time_since_last_speech()
-                    
-                    # Check if user finished speaking (enough silence)
-                    if silence_duration >= END_OF_SPEECH_SILENCE:
-                        log_event("END_OF_SPEECH_DETECTED",
-                                  turn_id=current_turn_id,
-                                  silence_s=round(silence_duration, 2),
-                                  transcript_count=len(tc.transcripts))
-                        answer_complete_event.set()
-                        return
-                
-        except asyncio.CancelledError:
-            pass
-    
-    # Start watchers
-    tc.silence_prompt_task = asyncio.create_task(silence_prompt_watcher())
-    tc.max_answer_task = asyncio.create_task(max_answer_watcher())
-    tc.end_of_speech_task = asyncio.create_task(end_of_speech_watcher())
-    
-    log_event("TURN_WAIT_STARTED",
-              turn_id=current_turn_id,
-              participant=participant_name,
-              silence_prompt_s=SILENCE_PROMPT_SECONDS,
-              max_answer_s=MAX_ANSWER_SECONDS)
-    
-    try:
-        # Wait for any terminal event
-        done, pending = await asyncio.wait(
-            [
-                asyncio.create_task(silence_skip_event.wait()),
-                asyncio.create_task(answer_complete_event.wait()),
-                asyncio.create_task(wrapup_complete_event.wait()),
-                asyncio.create_task(tc.turn_ended.wait()),
-            ],
-            return_when=asyncio.FIRST_COMPLETED
-        )
+            self._set_state(QuestionState.WRAPUP_REQUESTED)
+            self._speak(SPEECH_WRAPUP_PROMPT, "wrapup_prompt")
         
-        # Cancel pending wait tasks
-        for task in pending:
-            task.cancel()
-    
-    finally:
-        # Cleanup all timer tasks
-        tc.cancel_all_tasks()
-    
-    # Determine outcome
-    if silence_skip_event.is_set():
-        return False, False, "silence_skip"
-    
-    if wrapup_complete_event.is_set():
-        # Check if asking to repeat (unlikely after wrapup, but check)
-        if tc.is_asking_to_repeat():
-            return True, True, "repeat"
-        return True, False, "wrapup"
-    
-    if answer_complete_event.is_set():
-        # Check if asking to repeat
-        if tc.is_asking_to_repeat():
-            return True, True, "repeat"
-        return True, False, "answer"
+        elif name == "wrapup_end":
+            log_event("WRAPUP_END_TRIGGERED", turn_id=self._turn_id)
+            self._set_state(QuestionState.RESPONSE_COMPLETE)
+            self._finish(True, "wrapup")
+        
+        elif name == "end_of_speech":
+            hold, silence_duration = self._end_of_speech_timing()
+            if silence_duration < hold:
+                tc.arm_deadline("end_of_speech", hold - silence_duration, self._fire_deadline)
+                return
+            log_event("END_OF_SPEECH_DETECTED",
+                      turn_id=self._turn_id,
+                      silence_s=round(silence_duration, 2),
+                      hold_s=round(hold, 2),
+                      confidence=self.detector.confidence(),
+                      transcript_count=len(tc.transcripts))
+            self._set_state(QuestionState.RESPONSE_COMPLETE)
+            self._finish(True, "answer")
+
+
+# ============ Turn Timing: Event-Driven Wait with Silence + Wrap-up ============
+
+async def wait_for_turn_completion(
+    state: ModeratorState,
+    session: AgentSession,
+    question_id: str,
+    question_index: int,
+    participant_name: str,
+    probe: bool = False,
+) -> tuple[bool, bool, str]:
+    """
+    Event-driven turn management with silence prompting and wrap-up,
+    delegated to the session's TurnEngine. probe=True drafts a follow-up
+    probe during the answer.
     
-    # Turn was ended externally (session end, disconnect, etc.)
-    return tc.has_speech, False, "external"
+    Returns: (got_response, asked_to_repeat, end_reason)
+    end_reason: "answer" | "silence_skip" | "wrapup" | "repeat" | "off_topic" | "external"
+    """
+    if state.turn_engine is None:
+        state.turn_engine = TurnEngine(state, session)
+    return await state.turn_engine.run_turn(participant_name, probe=probe)
 
 
 # ============ Legacy Wait Function (for backward compat) ============
@@ -701,12 +1194,66 @@ async def wait_for_response_event_driven(
     return True, False
 
 
+# ============ Transcript Ingestion ============
+
+# Question states in which transcripts count toward the current answer
+WAITING_STATES = frozenset({
+    QuestionState.WAITING_FOR_RESPONSE,
+    QuestionState.SILENCE_PROMPTED,
+    QuestionState.USER_SPEAKING,
+    QuestionState.WRAPUP_REQUESTED,
+})
+
+
+def ingest_transcript(state: ModeratorState, transcript: str, is_final: bool, speech_final: bool = False,
+                      speaker: Optional[str] = None):
+    """
+    One STT result for the current participant. Interim results only signal
+    speech activity (timing, silence deadlines, end of turn); the answer text
+    is built from final results, and interim logging is throttled. `speaker`
+    is the identity of the participant the audio came from, when known.
+    """
+    state.transcript_logs.log("USER_INPUT_TRANSCRIBED", is_final,
+                              transcript=transcript[:80] if transcript else "(empty)",
+                              is_final=is_final,
+                              agent_speaking=state.agent_speaking,
+                              current_state=state.current_question.state.value)
+    
+    # Only process if we have text and agent isn't speaking
+    if not transcript:
+        return
+    
+    state.record_transcript(transcript, is_final, speaker)
+    
+    if state.turn_controller.turn_ended.is_set():
+        # Participant still talking after we committed their turn
+        state.turn_controller.on_late_speech(speaker)
+    
+    if state.agent_speaking:
+        state.transcript_logs.log("TRANSCRIPT_IGNORED", is_final, reason="agent_speaking")
+        return
+    
+    if state.current_question.state not in WAITING_STATES:
+        state.transcript_logs.log("TRANSCRIPT_IGNORED", is_final,
+                                  reason=f"wrong_state:{state.current_question.state.value}")
+        return
+    
+    # Update legacy QuestionContext (for backward compat)
+    state.current_question.add_transcript(transcript, is_final)
+    state.current_question.cancel_timer()
+    
+    # Update TurnController (for new turn timing) and wake the turn engine
+    state.turn_controller.on_speech_detected(transcript, is_final)
+    state.turn_engine.post(TurnEventKind.TRANSCRIPT, text=transcript, is_final=is_final,
+                           speech_final=speech_final)
+
+
 # ============ Session Management ============
 
 async def wait_for_session_start(state: ModeratorState, session: AgentSession, room: rtc.Room) -> bool:
     """Wait for the organizer to start the session."""
     log_event("WAITING_FOR_START", session_id=state.session_id)
-    await session.say("Welcome everyone! I'm your AI moderator for today's focus group. We're waiting for the organizer to start the session. Please stand by.")
+    await speak(session, SPEECH_WELCOME)
     
     def update_participants():
         for participant in room.remote_participants.values():
@@ -719,29 +1266,55 @@ async def wait_for_session_start(state: ModeratorState, session: AgentSession, r
                 log_event("PARTICIPANT_JOINED", identity=participant.identity)
     
     update_participants()
-    
-    async with aiohttp.ClientSession() as http:
-        while not state.session_started and not state.session_ended:
+    room.on("participant_connected", lambda participant: update_participants())
+    
+    # One read covers a start that happened before we were listening; after
+    # that the API pushes session_started / session_ended into the room
+    await check_session_status(state)
+    while not state.session_started and not state.session_ended:
+        state.session_changed.clear()
+        if SESSION_START_RECHECK_SECONDS > 0:
             try:
-                async with http.get(f"{API_BASE}/api/sessions/{state.session_id}") as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if data.get("status") == "in_session":
-                            state.session_started = True
-                            log_event("SESSION_STARTED", session_id=state.session_id)
-                            for p in data.get("participants", []):
-                                state.participants[p["identity"]] = p
-                            return True
-                        elif data.get("status") == "ended":
-                            state.session_ended = True
-                            return False
-            except Exception as e:
-                log_event("SESSION_POLL_ERROR", error=str(e))
-            
-            update_participants()
-            await asyncio.sleep(2)
+                await asyncio.wait_for(state.session_changed.wait(), SESSION_START_RECHECK_SECONDS)
+            except asyncio.TimeoutError:
+                await check_session_status(state)
+        else:
+            await state.session_changed.wait()
     
-    return False
+    update_participants()
+    return state.session_started and not state.session_ended
+
+
+def handle_control_message(state: ModeratorState, message: Dict, source: str = "channel"):
+    """Control messages from the API, via the worker channel or the room data channel."""
+    kind = message.get("type")
+    log_event("CONTROL_MESSAGE", type=kind, source=source)
+    if kind == "participant_joined":
+        state.queue_participant_phrases(message["identity"], message.get("displayName", message["identity"]))
+    elif kind == "session_started":
+        state.apply_session_status({"status": "in_session", "participants": message.get("participants", [])},
+                                   source=source)
+    elif kind == "session_ended":
+        state.apply_session_status({"status": "ended"}, source=source)
+        if state.turn_engine is not None:
+            state.turn_engine.end_turn("session_end")  # don't run the current turn to its deadline
+    elif kind == "hand_raised":
+        if message["identity"] not in state.hand_raise_queue:
+            state.hand_raise_queue.append(message["identity"])
+    elif kind == "hand_lowered":
+        if message["identity"] in state.hand_raise_queue:
+            state.hand_raise_queue.remove(message["identity"])
+
+
+async def check_session_status(state: ModeratorState):
+    """Read the session status from the API once."""
+    try:
+        async with aiohttp.ClientSession() as http:
+            async with http.get(f"{API_BASE}/api/sessions/{state.session_id}") as resp:
+                if resp.status == 200:
+                    state.apply_session_status(await resp.json(), source="api")
+    except Exception as e:
+        log_event("SESSION_STATUS_ERROR", error=str(e))
 
 
 async def ask_participant(
@@ -759,9 +1332,9 @@ async def ask_participant(
     
     # Build prompt
     if is_first:
-        prompt = f"Let's start with you, {display_name}. Please take your time to share your thoughts."
+        prompt = SPEECH_FIRST_TURN.format(name=display_name)
     else:
-        prompt = f"Thank you for sharing. {display_name}, I'd like to hear from you now."
+        prompt = SPEECH_NEXT_TURN.format(name=display_name)
     
     # Mark agent as speaking
     state.agent_speaking = True
@@ -774,7 +1347,7 @@ async def ask_participant(
               participant=display_name)
     
     try:
-        await session.say(prompt)
+        await speak(session, prompt)
     except RuntimeError as e:
         if "closing" in str(e).lower():
             return False
@@ -783,7 +1356,7 @@ async def ask_participant(
         state.agent_speaking = False
     
     # Small pause after agent finishes speaking
-    await asyncio.sleep(0.5)
+    await state.pacer.gap("after_prompt")
     
     log_event("AGENT_DONE_SPEAKING", qid=question_id, participant=display_name)
     
@@ -791,13 +1364,19 @@ async def ask_participant(
     state.turn_controller.start_turn(participant_id, display_name, question_text, question_id)
     state.current_question.state = QuestionState.WAITING_FOR_RESPONSE
     
+    # Synthesize what we'll most likely say next while they answer
+    if state.lookahead is not None:
+        state.lookahead.schedule(state.predict_next_utterances(participant_id))
+    
     max_repeats = 2
     repeat_count = 0
+    redirected = False
+    probed = False
     
     while repeat_count <= max_repeats:
         if TURN_TIMERS_ENABLED:
             got_response, asked_to_repeat, end_reason = await wait_for_turn_completion(
-                state, session, question_id, question_index, display_name
+                state, session, question_id, question_index, display_name, probe=not probed
             )
         else:
             got_response, asked_to_repeat = await wait_for_response_event_driven(
@@ -807,31 +1386,61 @@ async def ask_participant(
         
         # End the turn
         state.turn_controller.on_turn_end(end_reason)
+        if state.probe is not None and end_reason != "answer":
+            state.probe.discard(end_reason)
+        
+        redirect = end_reason == "off_topic" and not redirected
+        if state.lookahead is not None and (asked_to_repeat or redirect or state.session_ended):
+            # Conversation branched away from the prediction
+            state.lookahead.cancel(end_reason if asked_to_repeat or redirect else "session_end")
+        
+        if state.session_ended:
+            return True  # nothing more to say to them; run_discussion wraps up
         
         if asked_to_repeat:
             repeat_count += 1
             if repeat_count <= max_repeats:
                 try:
                     state.agent_speaking = True
-                    await session.say(f"Of course. Let me repeat that. {question_text}")
+                    await speak(session, SPEECH_REPEAT.format(question=question_text))
                 finally:
                     state.agent_speaking = False
-                await asyncio.sleep(0.5)
+                await state.pacer.gap("after_prompt")
                 # Restart turn for repeat
                 state.turn_controller.start_turn(participant_id, display_name, question_text, question_id)
                 state.current_question.state = QuestionState.WAITING_FOR_RESPONSE
+                if state.lookahead is not None:
+                    state.lookahead.schedule(state.predict_next_utterances(participant_id))
                 continue
             else:
                 try:
-                    await session.say("I've repeated that a couple of times. Let me move on.")
+                    await speak(session, SPEECH_REPEAT_LIMIT)
                 except RuntimeError:
                     return False
                 return True
         
+        if redirect:
+            # Off-topic answer (FR-12): steer back once, then accept whatever follows
+            redirected = True
+            log_event("OFF_TOPIC_REDIRECT", qid=question_id, participant=display_name)
+            try:
+                state.agent_speaking = True
+                await speak(session, SPEECH_OFF_TOPIC.format(name=display_name, question=question_text))
+            except RuntimeError:
+                return False
+            finally:
+                state.agent_speaking = False
+            await state.pacer.gap("after_prompt")
+            state.turn_controller.start_turn(participant_id, display_name, question_text, question_id)
+            state.current_question.state = QuestionState.WAITING_FOR_RESPONSE
+            if state.lookahead is not None:
+                state.lookahead.schedule(state.predict_next_utterances(participant_id))
+            continue
+        
         if not got_response:
             # Silence skip - use the configured speech line
             try:
-                await session.say(SPEECH_SILENCE_MOVEON)
+                await speak(session, SPEECH_SILENCE_MOVEON)
             except RuntimeError:
                 return False
             return True
@@ -839,25 +1448,120 @@ async def ask_participant(
         if end_reason == "wrapup":
             # Wrap-up completed - use the configured speech line
             try:
-                await session.say(SPEECH_WRAPUP_END)
+                await speak(session, SPEECH_WRAPUP_END)
             except RuntimeError:
                 return False
             return True
         
+        probe = None
+        if state.probe is not None:
+            probe = await state.probe.commit(" ".join(state.turn_controller.transcripts))
+        if probe:
+            # Follow up once on the answer, with the probe drafted while they spoke
+            probed = True
+            log_event("PROBE_ASKED", qid=question_id, participant=display_name, probe=probe[:60])
+            try:
+                state.agent_speaking = True
+                await speak(session, probe)
+            except RuntimeError:
+                return False
+            finally:
+                state.agent_speaking = False
+            await state.pacer.gap("after_prompt")
+            state.turn_controller.start_turn(participant_id, display_name, question_text, question_id)
+            state.current_question.state = QuestionState.WAITING_FOR_RESPONSE
+            if state.lookahead is not None:
+                state.lookahead.schedule(state.predict_next_utterances(participant_id))
+            continue
+        
         # Normal answer completion
         return True
     
     return True
 
 
+def guide_speech_lines(guide: Dict, group_type: str = GROUP_TYPE) -> List[str]:
+    """
+    Every guide-derived and fixed line the discussion can speak, in the order
+    run_discussion would speak them. Name-templated lines are excluded, as are
+    sections routed away from this group type.
+    """
+    plan = compile_guide(guide, group_type)
+    lines = [SPEECH_WELCOME, SPEECH_BEGIN.format(title=plan.title)]
+    turn_lines_added = False
+    
+    for step in plan.steps:
+        lines += step.speech  # section script, then the question or script
+        if step.question is None or step.type in ("info", "closing"):
+            continue
+        if step.type == "rollcall":
+            lines.append(SPEECH_ROLLCALL_DONE)
+        else:
+            if not turn_lines_added:
+                # Lines that can interrupt the first answered question
+                lines += [SPEECH_WRAPUP_PROMPT, SPEECH_WRAPUP_END, SPEECH_SILENCE_MOVEON]
+                turn_lines_added = True
+            lines += [SPEECH_QUESTION_DONE, SPEECH_REPEAT.format(question=step.text)]
+    
+    lines += [SPEECH_REPEAT_LIMIT, SPEECH_REFLECT, SPEECH_CLOSING]
+    return [line for line in lines if line]
+
+
+async def report_agent_status(state: ModeratorState, **status):
+    """Push agent-side status (e.g. pre-render progress) to the API session."""
+    async with aiohttp.ClientSession() as http:
+        async with http.post(f"{API_BASE}/api/sessions/{state.session_id}/agent-status",
+                             json=status) as resp:
+            if resp.status != 200:
+                log_event("AGENT_STATUS_REPORT_FAILED", status=resp.status)
+
+
+async def embed_guide_questions(state: ModeratorState) -> Optional[QuestionVectors]:
+    """Embed the loaded guide's questions for off-topic scoring, off the event loop."""
+    if not OFF_TOPIC_ENABLED or state.plan is None:
+        return None
+    started = time.time()
+    try:
+        vectors = await asyncio.to_thread(question_vectors, state.plan, get_embedder())
+    except Exception as e:
+        log_event("TOPIC_INDEX_FAILED", session_id=state.session_id, error=str(e))
+        return None
+    state.question_vectors = vectors
+    log_event("TOPIC_INDEX_READY",
+              session_id=state.session_id,
+              questions=len(vectors),
+              model=vectors.embedder.name,
+              elapsed_ms=int((time.time() - started) * 1000))
+    return vectors
+
+
+async def prerender_guide(state: ModeratorState, tts) -> Optional[PrerenderProgress]:
+    """Synthesize the loaded guide into the TTS cache before the session starts."""
+    cache = get_tts_cache()
+    if not PRERENDER_ENABLED or cache is None or not state.guide:
+        return None
+    
+    async def on_progress(progress: PrerenderProgress):
+        await report_agent_status(state, prerender=progress.to_dict())
+    
+    lines = guide_speech_lines(state.guide, state.group_type)
+    log_event("PRERENDER_START", session_id=state.session_id, lines=len(lines))
+    progress = await Prerenderer(cache, tts, TTS_VOICE, TTS_MODEL, on_progress=on_progress).run(lines)
+    log_event("PRERENDER_DONE",
+              session_id=state.session_id,
+              **{k: v for k, v in progress.to_dict().items() if k != "done"})
+    return progress
+
+
 async def run_discussion(state: ModeratorState, session: AgentSession, room: rtc.Room):
     """Run through the discussion guide."""
     if not state.guide:
-        await session.say("I don't have a discussion guide loaded.")
+        await speak(session, "I don't have a discussion guide loaded.")
         return
     
     guide_title = state.guide.get("meta", {}).get("title", "Focus Group")
-    log_event("DISCUSSION_START", title=guide_title, turn_timers_enabled=TURN_TIMERS_ENABLED)
+    log_event("DISCUSSION_START", title=guide_title, turn_timers_enabled=TURN_TIMERS_ENABLED,
+              pacing=state.pacer.profile.name)
     
     participant_names = [p.get("displayName", p.get("identity", "Participant")) 
                          for p in state.participants.values()]
@@ -865,65 +1569,63 @@ async def run_discussion(state: ModeratorState, session: AgentSession, room: rtc
     try:
         if participant_names:
             names_str = ", ".join(participant_names)
-            await session.say(f"Wonderful! Let's begin our discussion on {guide_title}. I see we have {names_str} with us today. If you need me to repeat a question, just ask.")
+            await speak(session, f"Wonderful! Let's begin our discussion on {guide_title}. I see we have {names_str} with us today. If you need me to repeat a question, just ask.")
         else:
-            await session.say(f"Let's begin our discussion on {guide_title}.")
+            await speak(session, SPEECH_BEGIN.format(title=guide_title))
     except RuntimeError:
         return
     
-    await asyncio.sleep(2)
+    await state.pacer.gap("after_intro")
     question_global_index = 0
     
     while not state.is_complete() and not state.session_ended:
-        section, question = state.get_current()
-        
-        if not section:
-            break
-        
-        section_script = section.get("script_md", "")
+        step = state.step
         
         # Read section intro
-        if state.question_idx == 0 and section_script and not state.section_script_read:
-            log_event("SECTION_START", title=section.get('title', ''))
+        if step.section_script and not state.section_script_read:
+            log_event("SECTION_START", title=step.section_title)
             try:
-                await session.say(section_script)
+                await speak(session, step.section_script)
             except RuntimeError:
                 return
             state.section_script_read = True
-            await asyncio.sleep(2)
+            await state.pacer.gap("after_section")
         
-        if not question:
+        if step.question is None:
             state.advance()
             continue
         
-        question_id = question.get("id", f"q{question_global_index}")
-        question_type = question.get("type", "question")
-        question_text = question.get("text", "")
-        question_script = question.get("script_md", "")
+        question_id = step.qid
+        question_type = step.type
+        question_text = step.text
+        question_script = step.script
         
         log_event("QUESTION_BEGIN",
                   qid=question_id,
                   type=question_type,
                   index=question_global_index)
+        state.emit("question", qid=question_id, sid=step.section_id, idx=question_global_index)
         
         try:
             if question_type == "info":
                 if question_script:
-                    await session.say(question_script)
-                await asyncio.sleep(2)
+                    await speak(session, question_script)
+                await state.pacer.gap("after_info")
             
             elif question_type == "closing":
                 if question_script:
-                    await session.say(question_script)
-                await asyncio.sleep(2)
+                    await speak(session, question_script)
+                await state.pacer.gap("after_info")
             
             elif question_type == "rollcall":
-                await session.say(question_text)
-                await asyncio.sleep(1)
+                await speak(session, question_text)
+                await state.pacer.gap("after_question")
                 
-                for identity, participant in state.participants.items():
+                for identity, participant in list(state.participants.items()):
+                    if state.session_ended:
+                        break
                     display_name = participant.get("displayName", identity)
-                    await session.say(f"{display_name}, please say yes to confirm your consent.")
+                    await speak(session, SPEECH_CONSENT.format(name=display_name))
                     
                     # For rollcall, use simpler timing
                     state.turn_controller.start_turn(identity, display_name, "consent", f"{question_id}_{identity}")
@@ -940,23 +1642,29 @@ async def run_discussion(state: ModeratorState, session: AgentSession, room: rtc
                         end_reason = "answer" if got_response else "timeout"
                     
                     state.turn_controller.on_turn_end(end_reason)
+                    if state.session_ended:
+                        break
                     
                     if not got_response:
-                        await session.say(f"I didn't hear from {display_name}. We'll follow up separately.")
+                        await speak(session, SPEECH_CONSENT_MISSED.format(name=display_name))
                     else:
-                        await session.say(f"Thank you, {display_name}.")
+                        await speak(session, SPEECH_CONSENT_THANKS.format(name=display_name))
                 
-                await session.say("Thank you all. Let's proceed with the discussion.")
+                if state.session_ended:
+                    break
+                await speak(session, SPEECH_ROLLCALL_DONE)
             
             else:
                 # Regular question
-                await session.say(question_text)
-                await asyncio.sleep(1)
+                await speak(session, question_text)
+                await state.pacer.gap("after_question")
                 
                 all_participants = state.get_all_participants()
                 
                 if all_participants:
                     for i, participant in enumerate(all_participants):
+                        if state.session_ended:
+                            break
                         should_continue = await ask_participant(
                             state, session, participant,
                             question_text, question_id, question_global_index,
@@ -964,12 +1672,14 @@ async def run_discussion(state: ModeratorState, session: AgentSession, room: rtc
                         )
                         if not should_continue:
                             return
-                        await asyncio.sleep(0.5)
+                        await state.pacer.gap("between_participants")
                     
-                    await session.say("Thank you all for sharing. Let's move on.")
+                    if state.session_ended:
+                        break
+                    await speak(session, SPEECH_QUESTION_DONE)
                 else:
-                    await session.say("I'll give you a moment to reflect.")
-                    await asyncio.sleep(5)
+                    await speak(session, SPEECH_REFLECT)
+                    await state.pacer.gap("reflect")
         
         except RuntimeError as e:
             if "closing" in str(e).lower():
@@ -979,11 +1689,11 @@ async def run_discussion(state: ModeratorState, session: AgentSession, room: rtc
         
         state.advance()
         question_global_index += 1
-        await asyncio.sleep(1)
+        await state.pacer.gap("after_step")
     
     # Session complete
     try:
-        await session.say("Thank you all so much for participating! Your insights have been incredibly valuable. Have a wonderful day!")
+        await speak(session, SPEECH_CLOSING)
     except RuntimeError:
         pass
     
@@ -991,6 +1701,41 @@ async def run_discussion(state: ModeratorState, session: AgentSession, room: rtc
     state.session_ended = True
 
 
+def job_metadata(job) -> Dict:
+    """
+    Session metadata for a job: the explicit dispatch's, else the room's
+    (the API sets both to {"sessionId", "guideHash"}).
+    """
+    for raw in (job.metadata, job.room.metadata):
+        if not raw:
+            continue
+        try:
+            metadata = json.loads(raw)
+        except ValueError:
+            log_event("JOB_METADATA_INVALID", metadata=raw[:80])
+            continue
+        if isinstance(metadata, dict) and metadata.get("sessionId"):
+            return metadata
+    return {}
+
+
+def session_id_from_room(room_name: str) -> str:
+    """Session ID from an API room name (focusgroup-<ts>-<id>), for jobs without session metadata."""
+    if room_name.startswith("focusgroup-"):
+        parts = room_name.split("-")
+        return parts[-1] if len(parts) >= 3 else room_name
+    if room_name.startswith("focus-group-"):
+        return room_name.replace("focus-group-", "")
+    return room_name
+
+
+def prewarm(proc: agents.JobProcess):
+    """Load Silero VAD (and the off-topic embedder) once per worker process, before a job is assigned to it."""
+    proc.userdata["vad"] = silero.VAD.load()
+    if OFF_TOPIC_ENABLED:
+        get_embedder()
+
+
 async def entrypoint(ctx: agents.JobContext):
     """Main entry point for the moderator agent."""
     room_name = ctx.room.name
@@ -999,32 +1744,54 @@ async def entrypoint(ctx: agents.JobContext):
     
     state = ModeratorState()
     state.room_name = room_name
+    state.turn_controller.room = room_name
     
-    # Parse session ID
-    if room_name.startswith("focusgroup-"):
-        parts = room_name.split("-")
-        state.session_id = parts[-1] if len(parts) >= 3 else room_name
-    elif room_name.startswith("focus-group-"):
-        state.session_id = room_name.replace("focus-group-", "")
-    else:
-        state.session_id = room_name
+    # The API names the session (and its guide) in the dispatch metadata; an
+    # automatically dispatched job, or a room the API failed to prepare, has
+    # none, so fall back to the session ID in the room name
+    metadata = job_metadata(ctx.job)
+    state.session_id = metadata.get("sessionId") or session_id_from_room(room_name)
     
-    log_event("SESSION_PARSED", session_id=state.session_id)
+    log_event("SESSION_PARSED", session_id=state.session_id, dispatch_id=ctx.job.dispatch_id or "-",
+              guide_hash=(metadata.get("guideHash") or "-")[:12])
     
+    if TRANSCRIPTS_ENABLED:
+        state.transcript_log = TranscriptLog(state.session_id)
+    
+    # The session's guide comes from the API by hash; the local file is a fallback
     guide_file = os.getenv("GUIDE_FILE")
-    if guide_file and state.load_guide(guide_file):
-        log_event("GUIDE_LOADED", title=state.guide.get('meta', {}).get('title', 'Untitled'))
+    if await state.fetch_guide(metadata.get("guideHash")) or (guide_file and state.load_guide(guide_file)):
+        log_event("GUIDE_LOADED",
+                  title=state.guide.get('meta', {}).get('title', 'Untitled'),
+                  group_type=state.group_type,
+                  steps=len(state.plan),
+                  guide_hash=state.plan.guide_hash[:12])
     else:
         log_event("GUIDE_NOT_LOADED", path=guide_file)
     
     stt = deepgram.STT(model="nova-3")
+    tts = openai.TTS(model=TTS_MODEL, voice=TTS_VOICE)
+    
+    # Fill the TTS cache for the whole guide while the room waits for Start
+    prerender_task = asyncio.create_task(prerender_guide(state, tts))
+    await embed_guide_questions(state)
+    cache = get_tts_cache()
+    if PRERENDER_ENABLED and cache is not None:
+        state.phrases = ParticipantPhrases(cache, tts, TTS_VOICE, TTS_MODEL)
+    if cache is not None:
+        state.lookahead = Lookahead(cache, tts, TTS_VOICE, TTS_MODEL)
+    if PROBES_ENABLED:
+        state.probe = SpeculativeProbe(get_probe_backend(), on_draft=state.on_probe_drafted)
     
     session = AgentSession(
         stt=stt,
-        tts=openai.TTS(voice="echo"),
-        vad=silero.VAD.load(),
+        tts=tts,
+        vad=ctx.proc.userdata.get("vad") or silero.VAD.load(),
     )
     
+    state.turn_engine = TurnEngine(state, session)
+    state.turn_engine.start()
+    
     # ============ CRITICAL: Register transcript handler ============
     # The correct event name is "user_input_transcribed" (NOT "user_speech_committed")
     # UserInputTranscribedEvent has: transcript, is_final, speaker_id, language, created_at
@@ -1040,45 +1807,43 @@ async def entrypoint(ctx: agents.JobContext):
                 - speaker_id: Optional[str]
                 - language: Optional[str]
         """
-        transcript = getattr(event, 'transcript', '')
-        is_final = getattr(event, 'is_final', False)
-        
-        log_event("USER_INPUT_TRANSCRIBED",
-                  transcript=transcript[:80] if transcript else "(empty)",
-                  is_final=is_final,
-                  agent_speaking=state.agent_speaking,
-                  current_state=state.current_question.state.value)
-        
-        # Only process if we have text and agent isn't speaking
-        if not transcript:
-            return
-            
-        if state.agent_speaking:
-            log_event("TRANSCRIPT_IGNORED", reason="agent_speaking")
+        ingest_transcript(state, getattr(event, 'transcript', ''), getattr(event, 'is_final', False),
+                          getattr(event, 'speech_final', False), speaker=linked_identity())
+    
+    def linked_identity() -> Optional[str]:
+        """Identity of the participant whose audio the session is transcribing."""
+        try:
+            participant = session.room_io.linked_participant
+        except RuntimeError:
+            return None
+        return participant.identity if participant is not None else None
+    
+    def on_user_state_changed(event):
+        """Forward Silero VAD speaking/listening transitions to the turn engine."""
+        new_state = str(getattr(event, 'new_state', ''))
+        state.turn_controller.on_vad(new_state == "speaking")
+        state.turn_engine.post(TurnEventKind.VAD, name=new_state)
+    
+    def on_agent_state_changed(event):
+        """Playout end (speaking -> listening) anchors the pacing gaps."""
+        state.pacer.on_agent_state(str(getattr(event, 'new_state', '')))
+    
+    def on_data_received(packet: rtc.DataPacket):
+        """Control messages sent by the API into the room."""
+        if packet.topic != AGENT_CONTROL_TOPIC:
             return
-        
-        # Check if we're waiting for response
-        waiting_states = [
-            QuestionState.WAITING_FOR_RESPONSE,
-            QuestionState.SILENCE_PROMPTED,
-            QuestionState.USER_SPEAKING,
-            QuestionState.WRAPUP_REQUESTED,
-        ]
-        
-        if state.current_question.state not in waiting_states:
-            log_event("TRANSCRIPT_IGNORED", 
-                      reason=f"wrong_state:{state.current_question.state.value}")
+        try:
+            message = json.loads(bytes(packet.data).decode("utf-8"))
+        except ValueError:
+            log_event("CONTROL_MESSAGE_INVALID")
             return
-        
-        # Update legacy QuestionContext (for backward compat)
-        state.current_question.add_transcript(transcript)
-        state.current_question.cancel_timer()
-        
-        # Update TurnController (for new turn timing)
-        state.turn_controller.on_speech_detected(transcript)
+        handle_control_message(state, message, source="room")
     
     # Register for the correct event name
     session.on("user_input_transcribed", on_user_input_transcribed)
+    session.on("user_state_changed", on_user_state_changed)
+    session.on("agent_state_changed", on_agent_state_changed)
+    ctx.room.on("data_received", on_data_received)
     
     agent = FocusGroupModerator()
     
@@ -1103,21 +1868,48 @@ async def entrypoint(ctx: agents.JobContext):
                 await asyncio.sleep(retry_delay)
                 retry_delay *= 2
             else:
+                prerender_task.cancel()
                 raise
     
-    started = await wait_for_session_start(state, session, ctx.room)
-    
-    if not started:
-        log_event("SESSION_NOT_STARTED")
-        try:
-            await session.say("The session has ended before starting. Goodbye!")
-        except RuntimeError:
-            pass
-        return
+    # Worker-wide API channel: progress events out, control messages in.
+    # Subscribing once we are in the room doubles as the presence confirmation.
+    state.channel = get_api_channel(API_BASE)
+    if state.channel is not None:
+        state.channel.subscribe(state.session_id, lambda message: handle_control_message(state, message),
+                                identity=ctx.room.local_participant.identity)
+        state.turn_controller.emit = state.emit
     
-    await run_discussion(state, session, ctx.room)
-    log_event("AGENT_EXIT", room_name=room_name)
+    try:
+        started = await wait_for_session_start(state, session, ctx.room)
+        
+        if not started:
+            log_event("SESSION_NOT_STARTED")
+            try:
+                await speak(session, "The session has ended before starting. Goodbye!")
+            except RuntimeError:
+                pass
+            return
+        
+        await run_discussion(state, session, ctx.room)
+        log_event("AGENT_EXIT", room_name=room_name)
+    finally:
+        prerender_task.cancel()
+        log_event("PACING_SUMMARY", session_id=state.session_id, **state.pacer.summary())
+        if state.lookahead is not None:
+            state.lookahead.cancel("session_end")
+        if state.phrases is not None:
+            log_event("PARTICIPANT_PHRASES_EVICTED", entries=await state.phrases.evict())
+        if state.channel is not None:
+            state.channel.unsubscribe(state.session_id)
+            log_event("AGENT_CHANNEL_STATS", session_id=state.session_id, **state.channel.stats())
+        if state.transcript_log is not None:
+            await state.transcript_log.close()
+        if state.probe is not None:
+            log_event("PROBE_STATS", session_id=state.session_id, **state.probe.stats())
+            await state.probe.close()
+        await state.turn_engine.stop()
 
 
 if __name__ == "__main__":
-    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint))
+    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm,
+                                            agent_name=AGENT_NAME))
@@ -0,0 +1,96 @@
+"""
+Pacing between agent utterances.
+
+Gaps are measured from the end of the agent's last playout (AgentSession
+agent_state_changed: speaking -> anything else) rather than slept blindly
+after each say(), and their lengths come from a named profile:
+
+- tight:   minimal pauses, for rehearsals and quick internal sessions
+- natural: short conversational pauses (default)
+- legacy:  the original fixed asyncio.sleep schedule
+
+The pacer also totals how much wall-clock time the active profile saved
+compared with the legacy schedule, logged once per session.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, fields
+from typing import Dict, Optional
+
+from logs import log_event
+
+PACING_PROFILE = os.getenv("PACING_PROFILE", "natural")
+
+
+@dataclass(frozen=True)
+class PacingProfile:
+    name: str
+    after_intro: float           # after the "let's begin" line
+    after_section: float         # after a section script
+    after_info: float            # after info / closing scripts
+    after_question: float        # after reading the question, before the first hand-off
+    after_prompt: float          # after a participant hand-off, before their turn starts
+    between_participants: float  # after one participant's turn, before the next hand-off
+    after_step: float            # after a guide step completes
+    reflect: float               # reflection time when nobody is in the room
+
+
+PROFILES: Dict[str, PacingProfile] = {
+    "legacy": PacingProfile("legacy", 2.0, 2.0, 2.0, 1.0, 0.5, 0.5, 1.0, 5.0),
+    "natural": PacingProfile("natural", 0.8, 0.8, 0.8, 0.5, 0.3, 0.2, 0.4, 5.0),
+    "tight": PacingProfile("tight", 0.3, 0.3, 0.3, 0.2, 0.15, 0.0, 0.1, 3.0),
+}
+
+GAP_NAMES = [f.name for f in fields(PacingProfile) if f.name != "name"]
+
+
+def get_profile(name: str = PACING_PROFILE) -> PacingProfile:
+    profile = PROFILES.get(name)
+    if profile is None:
+        log_event("PACING_PROFILE_UNKNOWN", profile=name, using="natural")
+        profile = PROFILES["natural"]
+    return profile
+
+
+class Pacer:
+    """Playout-aware gaps for one session, with time-saved accounting."""
+
+    def __init__(self, profile: Optional[PacingProfile] = None):
+        self.profile = profile or get_profile()
+        self.agent_speaking = False
+        self.playout_ended_at: float = 0
+        self.gaps = 0
+        self.slept = 0.0
+        self.saved = 0.0
+
+    def on_agent_state(self, new_state: str):
+        """Feed AgentSession agent_state_changed; speaking -> other marks playout end."""
+        speaking = new_state == "speaking"
+        if self.agent_speaking and not speaking:
+            self.playout_ended_at = time.time()
+        self.agent_speaking = speaking
+
+    async def gap(self, name: str):
+        """Wait out the profile's gap, counted from the end of the last playout."""
+        target = getattr(self.profile, name)
+        baseline = getattr(PROFILES["legacy"], name)
+        if self.agent_speaking or not self.playout_ended_at:
+            since_playout = 0.0  # playout end not reported yet: take the full gap
+        else:
+            since_playout = time.time() - self.playout_ended_at
+        delay = max(0.0, target - since_playout)
+        if delay:
+            await asyncio.sleep(delay)
+        self.gaps += 1
+        self.slept += delay
+        self.saved += baseline - delay
+
+    def summary(self) -> dict:
+        return {
+            "profile": self.profile.name,
+            "gaps": self.gaps,
+            "slept_s": round(self.slept, 1),
+            "saved_s": round(self.saved, 1),
+        }
@@ -0,0 +1,81 @@
+"""
+Per-participant pause model for end-of-speech thresholds.
+
+Each participant gets a bounded history of the pauses between their
+utterances (VAD speaking -> listening -> speaking gaps within a turn). The
+end-of-speech silence for their next turn is a high percentile of that
+history plus a margin, clamped to configured bounds, so deliberate speakers
+are given room to think and quick speakers are not kept waiting.
+
+A pause only shows up in the history if the turn survived it, so pauses
+longer than the current threshold are never observed directly. A false end
+of turn (the participant keeps talking right after we committed their turn)
+closes that loop: the gap that fooled us is recorded as a pause.
+
+The same history bounds the end-of-turn detector: a confident commit may
+wait less than the threshold only once the participant has PAUSE_MIN_SAMPLES
+pauses on record, and never less than their PAUSE_PERCENTILE pause.
+"""
+
+import os
+from collections import deque
+from typing import Deque
+
+PAUSE_MODEL_ENABLED = os.getenv("PAUSE_MODEL_ENABLED", "true").lower() == "true"
+PAUSE_PERCENTILE = float(os.getenv("PAUSE_PERCENTILE", "0.9"))
+PAUSE_MARGIN_SECONDS = float(os.getenv("PAUSE_MARGIN_SECONDS", "0.5"))
+PAUSE_MIN_SAMPLES = int(os.getenv("PAUSE_MIN_SAMPLES", "4"))
+PAUSE_HISTORY = int(os.getenv("PAUSE_HISTORY", "64"))
+
+# Bounds for the adaptive end-of-speech silence
+END_OF_SPEECH_MIN_SECONDS = float(os.getenv("END_OF_SPEECH_MIN_SECONDS", "1.5"))
+END_OF_SPEECH_MAX_SECONDS = float(os.getenv("END_OF_SPEECH_MAX_SECONDS", "6.0"))
+
+# Gaps shorter than this are VAD flicker between words, not pauses
+PAUSE_MIN_GAP_SECONDS = 0.25
+
+# Speech resuming within this window after an "answer" commit is a false end of turn
+FALSE_EOT_WINDOW_SECONDS = float(os.getenv("FALSE_EOT_WINDOW_SECONDS", "2.5"))
+
+
+class PauseModel:
+    """Running pause distribution and turn counters for one participant."""
+
+    def __init__(self, history: int = PAUSE_HISTORY):
+        self.pauses: Deque[float] = deque(maxlen=history)
+        self.eot_commits: int = 0  # turns ended on end of speech
+        self.false_eots: int = 0
+
+    def record_pause(self, gap: float) -> bool:
+        """Add an inter-utterance gap; returns False if it was too short to count."""
+        if gap < PAUSE_MIN_GAP_SECONDS:
+            return False
+        self.pauses.append(min(gap, END_OF_SPEECH_MAX_SECONDS))
+        return True
+
+    def percentile(self, q: float = PAUSE_PERCENTILE) -> float:
+        """Nearest-rank percentile of recorded pauses (0 when empty)."""
+        if not self.pauses:
+            return 0.0
+        ordered = sorted(self.pauses)
+        rank = min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.5) - 1))
+        return ordered[rank]
+
+    def has_evidence(self) -> bool:
+        return PAUSE_MODEL_ENABLED and len(self.pauses) >= PAUSE_MIN_SAMPLES
+
+    def threshold(self, fallback: float) -> float:
+        """End-of-speech silence for this participant's next turn."""
+        if not self.has_evidence():
+            return fallback
+        value = self.percentile() + PAUSE_MARGIN_SECONDS
+        return round(min(END_OF_SPEECH_MAX_SECONDS, max(END_OF_SPEECH_MIN_SECONDS, value)), 2)
+
+    def min_hold(self, threshold: float) -> float:
+        """Shortest silence a confident end of turn may commit on: the threshold until we know their pauses."""
+        if not self.has_evidence():
+            return threshold
+        return min(threshold, self.percentile())
+
+    def false_eot_rate(self) -> float:
+        return self.false_eots / self.eot_commits if self.eot_commits else 0.0
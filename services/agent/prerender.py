@@ -0,0 +1,231 @@
+"""
+Background pre-rendering of a session's scripted speech into the TTS cache.
+
+The lines are synthesized in the order they will be spoken, by a bounded pool
+of workers pulling from one shared iterator, so the first prompts are ready
+first and later ones fill in while the room waits for the organizer.
+
+ParticipantPhrases does the same for each participant's name-templated
+lines as they join, and removes the sentences naming them from the cache
+when the session ends.
+Lookahead speculatively fills the next one or two utterances while a
+participant is answering.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from logs import log_event
+from speech_text import split_sentences
+from tts_cache import TTSCache, cache_key
+
+PRERENDER_ENABLED = os.getenv("PRERENDER_ENABLED", "true").lower() == "true"
+PRERENDER_CONCURRENCY = int(os.getenv("PRERENDER_CONCURRENCY", "3"))
+PRERENDER_REPORT_INTERVAL = 1.0  # seconds between progress callbacks
+LOOKAHEAD_DEPTH = int(os.getenv("LOOKAHEAD_DEPTH", "2"))
+
+
+@dataclass
+class PrerenderProgress:
+    total: int = 0
+    cached: int = 0    # already in the cache when pre-render started
+    rendered: int = 0  # synthesized by this run
+    failed: int = 0
+    started_at: float = 0
+    finished_at: float = 0
+
+    @property
+    def ready(self) -> int:
+        return self.cached + self.rendered
+
+    def coverage(self) -> float:
+        return self.ready / self.total if self.total else 1.0
+
+    def to_dict(self) -> dict:
+        end = self.finished_at or time.time()
+        return {
+            "total": self.total,
+            "ready": self.ready,
+            "failed": self.failed,
+            "coverage": round(self.coverage(), 3),
+            "elapsedMs": int((end - self.started_at) * 1000) if self.started_at else 0,
+            "done": self.finished_at > 0,
+        }
+
+
+class Prerenderer:
+    """Fills the TTS cache for an ordered list of lines with bounded concurrency."""
+
+    def __init__(
+        self,
+        cache: TTSCache,
+        tts,
+        voice: str,
+        model: str,
+        concurrency: int = PRERENDER_CONCURRENCY,
+        on_progress: Optional[Callable[[PrerenderProgress], Awaitable[None]]] = None,
+    ):
+        self.cache = cache
+        self.tts = tts
+        self.voice = voice
+        self.model = model
+        self.concurrency = max(1, concurrency)
+        self.on_progress = on_progress
+        self.progress = PrerenderProgress()
+        self._last_report = 0.0
+
+    async def run(self, texts: List[str]) -> PrerenderProgress:
+        progress = self.progress
+        progress.started_at = time.time()
+
+        # Cache entries are per sentence, the unit speak() plays
+        pending, seen = [], set()
+        for sentence in (s for text in texts for s in split_sentences(text)):
+            key = cache_key(self.voice, self.model, sentence)
+            if key in seen:
+                continue
+            seen.add(key)
+            if key in self.cache:
+                progress.cached += 1
+            else:
+                pending.append(sentence)
+        progress.total = len(seen)
+        await self._report(force=True)
+
+        queue = iter(pending)  # shared by workers, so lines start in spoken order
+        await asyncio.gather(*(self._worker(queue) for _ in range(min(self.concurrency, len(pending)))))
+
+        progress.finished_at = time.time()
+        await self._report(force=True)
+        return progress
+
+    async def _worker(self, queue):
+        for text in queue:
+            try:
+                await self.cache.fill(self.tts, self.voice, self.model, text)
+                self.progress.rendered += 1
+            except Exception as e:
+                self.progress.failed += 1
+                log_event("PRERENDER_ERROR", text=repr(text[:40]), error=e)
+            await self._report()
+
+    async def _report(self, force: bool = False):
+        if self.on_progress is None:
+            return
+        now = time.time()
+        if not force and now - self._last_report < PRERENDER_REPORT_INTERVAL:
+            return
+        self._last_report = now
+        try:
+            await self.on_progress(self.progress)
+        except Exception as e:
+            log_event("PRERENDER_REPORT_ERROR", error=e)
+
+
+class ParticipantPhrases:
+    """
+    Per-session queue that pre-synthesizes each participant's personal lines.
+    
+    submit() is idempotent per participant and returns immediately; a single
+    worker renders participants in join order. evict() drops the cached audio
+    of the sentences that name a participant; the rest ("Thank you for
+    sharing.") are the same for everyone and stay cached for other sessions.
+    """
+
+    def __init__(self, cache: TTSCache, tts, voice: str, model: str,
+                 concurrency: int = PRERENDER_CONCURRENCY):
+        self.cache = cache
+        self.tts = tts
+        self.voice = voice
+        self.model = model
+        self.concurrency = concurrency
+        self.keys: Dict[str, List[str]] = {}  # participant identity -> cache keys of sentences naming them
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, identity: str, lines: List[str], name: str) -> bool:
+        """Queue a participant's lines (already formatted with name); False if they were already queued."""
+        if identity in self.keys:
+            return False
+        self.keys[identity] = [cache_key(self.voice, self.model, sentence)
+                               for line in lines for sentence in split_sentences(line) if name in sentence]
+        self._queue.put_nowait((identity, lines))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return True
+
+    async def _run(self):
+        while not self._queue.empty():
+            identity, lines = self._queue.get_nowait()
+            progress = await Prerenderer(self.cache, self.tts, self.voice, self.model,
+                                         concurrency=self.concurrency).run(lines)
+            log_event("PARTICIPANT_PHRASES_READY",
+                      identity=identity,
+                      ready=f"{progress.ready}/{progress.total}",
+                      elapsed_ms=progress.to_dict()["elapsedMs"])
+
+    async def wait_idle(self):
+        if self._task is not None:
+            await self._task
+
+    async def evict(self) -> int:
+        """Stop pending work and remove the rendered sentences that name a participant."""
+        if self._task is not None:
+            self._task.cancel()
+        keys = [key for keys in self.keys.values() for key in keys]
+        self.keys.clear()
+        return sum([await self.cache.discard(key) for key in keys])
+
+
+class Lookahead:
+    """
+    Speculative synthesis of the utterances most likely to follow the current
+    turn. One background task fills them in order; scheduling again or
+    cancelling (the conversation branched) drops whatever has not finished.
+    """
+
+    def __init__(self, cache: TTSCache, tts, voice: str, model: str, depth: int = LOOKAHEAD_DEPTH):
+        self.cache = cache
+        self.tts = tts
+        self.voice = voice
+        self.model = model
+        self.depth = depth
+        self.lines: List[str] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def schedule(self, lines: List[str]):
+        """Replace any pending prediction with the first `depth` of lines."""
+        self.cancel("rescheduled")
+        self.lines = [line for line in lines if line and line.strip()][:self.depth]
+        if self.lines:
+            self._task = asyncio.create_task(self._run(self.lines))
+
+    def cancel(self, reason: str = "branch") -> bool:
+        """Drop unfinished speculative work. True if anything was still running."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return False
+        task.cancel()
+        log_event("LOOKAHEAD_DROPPED", reason=reason, lines=len(self.lines))
+        return True
+
+    async def wait_idle(self):
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self, lines: List[str]):
+        started = time.time()
+        filled = 0
+        for line in lines:
+            for sentence in split_sentences(line):
+                try:
+                    filled += await self.cache.fill(self.tts, self.voice, self.model, sentence)
+                except Exception as e:
+                    log_event("LOOKAHEAD_ERROR", error=e)
+        log_event("LOOKAHEAD_READY",
+                  lines=len(lines),
+                  synthesized=filled,
+                  elapsed_ms=int((time.time() - started) * 1000))
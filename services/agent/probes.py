@@ -0,0 +1,244 @@
+"""
+Speculative follow-up probes ("Can you say more about...").
+
+A probe is drafted while the participant is still answering, so asking it
+does not cost an LLM round trip (and, via the lookahead, TTS) after they stop.
+Once the answer has run past PROBE_MIN_ANSWER_SECONDS, every final transcript
+segment refreshes the draft: one draft request is in flight at a time and,
+when it returns, the next one starts from the latest answer if it has grown.
+Each request has a hard PROBE_BUDGET_MS; one that overruns is dropped.
+
+At end of turn commit() uses the latest draft if it was made from enough of
+the answer (PROBE_MIN_COVERAGE); if not, it waits at most
+PROBE_COMMIT_WAIT_MS for the draft in flight and otherwise discards it. Any other end of turn
+(repeat, off-topic, silence, wrap-up) discards it.
+
+Backends are pluggable: anything with `async draft(question, answer) -> str`.
+"openai" calls the chat completions API; "stub" is a deterministic local
+backend for tests and offline runs.
+"""
+
+import asyncio
+import os
+import re
+import time
+from typing import Callable, Optional
+
+import aiohttp
+
+from logs import log_event
+from speech_text import normalize_text, split_sentences
+
+PROBES_ENABLED = os.getenv("PROBES_ENABLED", "false").lower() == "true"
+PROBE_BACKEND = os.getenv("PROBE_BACKEND", "openai")
+PROBE_MODEL = os.getenv("PROBE_MODEL", "gpt-4o-mini")
+PROBE_MIN_ANSWER_SECONDS = float(os.getenv("PROBE_MIN_ANSWER_SECONDS", "8"))
+PROBE_BUDGET_SECONDS = float(os.getenv("PROBE_BUDGET_MS", "1500")) / 1000
+PROBE_COMMIT_WAIT_SECONDS = float(os.getenv("PROBE_COMMIT_WAIT_MS", "250")) / 1000
+PROBE_MIN_COVERAGE = float(os.getenv("PROBE_MIN_COVERAGE", "0.6"))  # share of the answer's words drafted from
+OPENAI_API_BASE = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+PROBE_INSTRUCTIONS = (
+    "You are a neutral, friendly focus group moderator. Given the question and a participant's "
+    "answer so far, write one short follow-up question (at most 20 words) inviting them to expand "
+    "on the most interesting point they made. Do not give opinions or lead the participant."
+)
+
+_WORD_RE = re.compile(r"[A-Za-z0-9']+")
+_STOPWORDS = {
+    "a", "an", "the", "and", "or", "but", "so", "of", "to", "in", "on", "for", "with", "at", "by",
+    "is", "are", "was", "were", "be", "it", "its", "it's", "this", "that", "i", "i'm", "you", "we",
+    "they", "my", "me", "do", "did", "have", "has", "had", "just", "really", "like", "um", "uh",
+    "yeah", "okay", "well", "very", "think", "because", "also", "then", "there", "would", "could",
+    "about", "when",
+}
+
+
+def clean_probe(text: str) -> str:
+    """First sentence of a backend reply, normalized for TTS."""
+    sentences = split_sentences(normalize_text(text or ""))
+    return sentences[0].strip("\"'“”") if sentences else ""
+
+
+class StubProbeBackend:
+    """Deterministic local backend: asks about the last content words of the answer."""
+
+    name = "stub"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def draft(self, question: str, answer: str) -> str:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        last = split_sentences(answer)[-1:] or ("",)
+        words = [w for w in _WORD_RE.findall(last[0]) if w.lower() not in _STOPWORDS]
+        if not words:
+            return "Could you say a bit more about that?"
+        return f"Could you say more about {' '.join(words[-3:]).lower()}?"
+
+
+class OpenAIProbeBackend:
+    """Chat completions backend; one pooled HTTP session per worker."""
+
+    name = "openai"
+
+    def __init__(self, model: str = PROBE_MODEL, api_key: Optional[str] = None, base_url: str = OPENAI_API_BASE):
+        self.model = model
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY", "")
+        self.url = f"{base_url.rstrip('/')}/chat/completions"
+        self._http: Optional[aiohttp.ClientSession] = None
+
+    async def draft(self, question: str, answer: str) -> str:
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.api_key}"})
+        body = {
+            "model": self.model,
+            "temperature": 0.3,
+            "max_tokens": 60,
+            "messages": [
+                {"role": "system", "content": PROBE_INSTRUCTIONS},
+                {"role": "user", "content": f"Question: {question}\nAnswer so far: {answer}"},
+            ],
+        }
+        async with self._http.post(self.url, json=body) as resp:
+            if resp.status != 200:
+                raise RuntimeError(f"probe draft failed: HTTP {resp.status}")
+            data = await resp.json()
+        return data["choices"][0]["message"]["content"]
+
+    async def close(self):
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+
+def get_probe_backend(name: str = PROBE_BACKEND):
+    if name == "stub":
+        return StubProbeBackend()
+    if name == "openai":
+        return OpenAIProbeBackend()
+    raise ValueError(f"unknown probe backend: {name}")
+
+
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+
+class SpeculativeProbe:
+    """Per-session probe drafter; reset() arms it for one turn."""
+
+    def __init__(self, backend, on_draft: Optional[Callable[[str], None]] = None,
+                 min_answer_seconds: float = PROBE_MIN_ANSWER_SECONDS, budget: float = PROBE_BUDGET_SECONDS,
+                 commit_wait: float = PROBE_COMMIT_WAIT_SECONDS, min_coverage: float = PROBE_MIN_COVERAGE):
+        self.backend = backend
+        self.on_draft = on_draft  # e.g. pre-synthesize the draft
+        self.min_answer_seconds = min_answer_seconds
+        self.budget = budget
+        self.commit_wait = commit_wait
+        self.min_coverage = min_coverage
+        self._task: Optional[asyncio.Task] = None
+        # Session totals
+        self.committed = 0
+        self.discarded = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.reset(None)
+
+    def reset(self, question: Optional[str]):
+        """Start drafting for a new turn of `question` (None: no probe this turn)."""
+        self._cancel()
+        self.question = question
+        self.answer = ""        # latest answer text handed to the drafter
+        self.draft: Optional[str] = None
+        self.drafted_from = ""  # answer text the current draft was made from
+        self.drafts = 0
+
+    @property
+    def active(self) -> bool:
+        return self.question is not None
+
+    def update(self, answer: str, answer_duration: float):
+        """A final segment arrived: refresh the draft once the answer is long enough."""
+        if self.question is None or answer == self.answer:
+            return
+        if not self.answer and answer_duration < self.min_answer_seconds:
+            return
+        self.answer = answer
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self.question is not None and self.answer != self.drafted_from:
+            answer = self.answer
+            started = time.time()
+            try:
+                text = clean_probe(await asyncio.wait_for(self.backend.draft(self.question, answer), self.budget))
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                log_event("PROBE_DRAFT_TIMEOUT", backend=self.backend.name, budget_ms=int(self.budget * 1000))
+                return
+            except Exception as e:
+                self.errors += 1
+                log_event("PROBE_DRAFT_FAILED", backend=self.backend.name, error=str(e))
+                return
+            if not text:
+                return
+            self.draft, self.drafted_from = text, answer
+            self.drafts += 1
+            log_event("PROBE_DRAFTED",
+                      backend=self.backend.name,
+                      draft=self.drafts,
+                      words=_word_count(answer),
+                      elapsed_ms=int((time.time() - started) * 1000))
+            if self.on_draft is not None:
+                self.on_draft(text)
+
+    async def commit(self, answer: str) -> Optional[str]:
+        """End of turn: the probe to ask about `answer`, or None if it was discarded."""
+        if self.question is None:
+            return None
+        started = time.time()
+        if self.answer:
+            self.update(answer, float("inf"))
+        coverage = _word_count(self.drafted_from) / max(_word_count(answer), 1)
+        if coverage < self.min_coverage and self._task is not None and not self._task.done() \
+                and self.commit_wait > 0:
+            await asyncio.wait({self._task}, timeout=self.commit_wait)
+            coverage = _word_count(self.drafted_from) / max(_word_count(answer), 1)
+        wait_ms = int((time.time() - started) * 1000)
+        if self.draft is None or coverage < self.min_coverage:
+            self.discard("no_draft" if self.draft is None else "stale", wait_ms=wait_ms,
+                         coverage=round(coverage, 2))
+            return None
+        probe = self.draft
+        self.committed += 1
+        log_event("PROBE_COMMITTED", drafts=self.drafts, coverage=round(coverage, 2), wait_ms=wait_ms)
+        self.reset(None)
+        return probe
+
+    def discard(self, reason: str, **fields):
+        """Drop this turn's draft (and any request still in flight)."""
+        if self.question is None:
+            return
+        if self.answer:
+            self.discarded += 1
+            log_event("PROBE_DISCARDED", reason=reason, drafts=self.drafts, **fields)
+        self.reset(None)
+
+    def _cancel(self):
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+
+    def stats(self) -> dict:
+        return {"committed": self.committed, "discarded": self.discarded,
+                "timeouts": self.timeouts, "errors": self.errors}
+
+    async def close(self):
+        self.reset(None)
+        close = getattr(self.backend, "close", None)
+        if close is not None:
+            await close()
@@ -0,0 +1,61 @@
+"""
+Text normalization for speech.
+
+Guide text is authored as markdown (section script_md) and hand-typed
+question text, so the same spoken line can arrive with different emphasis
+markers, bullets or whitespace. normalize_text produces the exact string
+sent to TTS, which also makes it a stable cache key.
+
+split_sentences breaks a script into the normalized sentences that are
+synthesized and cached one at a time, so long scripts start playing after
+the first sentence rather than after the whole block.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Tuple
+
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s+", re.MULTILINE)
+_BULLET_RE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+", re.MULTILINE)
+_EMPHASIS_RE = re.compile(r"(\*\*|__|\*|`+|~~)")
+_SPACE_RE = re.compile(r"\s+")
+_BLOCK_RE = re.compile(r"\n\s*\n|\n(?=\s*(?:[-*+]|\d+[.)]|#{1,6})\s)")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?…])([\"'”’)]*)\s+(?=[\"'“‘(]?[A-Z0-9])")
+_ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "vs.", "etc.", "e.g.", "i.e.", "approx."}
+
+
+def normalize_text(text: str) -> str:
+    """Strip markdown markup and collapse whitespace, keeping the spoken words."""
+    text = unicodedata.normalize("NFKC", text)
+    text = _LINK_RE.sub(r"\1", text)
+    text = _HEADING_RE.sub("", text)
+    text = _BULLET_RE.sub("", text)
+    text = _EMPHASIS_RE.sub("", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+@lru_cache(maxsize=4096)
+def split_sentences(text: str) -> Tuple[str, ...]:
+    """
+    Normalized sentences of a markdown script, in order. Paragraphs, headings
+    and list items always end a sentence; common abbreviations do not.
+    """
+    sentences = []
+    for block in _BLOCK_RE.split(text):
+        block = normalize_text(block)
+        if not block:
+            continue
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(block):
+            candidate = block[start:match.end(1)].strip()
+            last_word = candidate.rsplit(" ", 1)[-1].lower().rstrip("\"'”’)")
+            if last_word in _ABBREVIATIONS:
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        tail = block[start:].strip()
+        if tail:
+            sentences.append(tail)
+    return tuple(sentences)
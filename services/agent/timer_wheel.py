@@ -0,0 +1,183 @@
+"""
+Hierarchical timer wheel shared by every session in an agent process.
+
+Turn deadlines (silence prompt/grace, max answer, wrap-up, end of speech) are
+armed here keyed by (room, turn_id, name) instead of one asyncio timer or task
+each. Arm and cancel are O(1) dict operations; a single loop callback ticks the
+wheel while anything is armed and stops when the wheel is empty.
+
+A deadline that has fired stays in the index (marked fired) until its owner
+claims or cancels it, so "is this deadline still current?" is a lookup rather
+than a turn_id comparison against a stale task.
+"""
+
+import asyncio
+import os
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from logs import log_event
+
+TIMER_WHEEL_TICK_MS = float(os.getenv("TIMER_WHEEL_TICK_MS", "10"))
+
+
+class _Entry:
+    __slots__ = ("key", "seq", "expires_tick", "callback", "fired", "level", "slot")
+
+    def __init__(self, key: Hashable, seq: int, expires_tick: int, callback: Callable[[Hashable, int], Any]):
+        self.key = key
+        self.seq = seq
+        self.expires_tick = expires_tick
+        self.callback = callback
+        self.fired = False
+        self.level = -1
+        self.slot = -1
+
+
+class TimerWheel:
+    """
+    Kernel-style hierarchical timing wheel driven by the asyncio loop.
+
+    Level 0 has 2**slot_bits slots of one tick each; every higher level covers
+    2**slot_bits slots of the level below. Entries cascade down a level when
+    the lower level wraps, so each entry is touched at most `levels` times.
+    """
+
+    def __init__(self, tick: float = TIMER_WHEEL_TICK_MS / 1000.0, slot_bits: int = 8, levels: int = 4):
+        self.tick = tick
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._num_levels = levels
+        self._max_delta = (1 << (slot_bits * levels)) - 1
+        self._reset()
+
+    def _reset(self):
+        self._levels: List[List[Dict[Hashable, _Entry]]] = [
+            [{} for _ in range(1 << self._bits)] for _ in range(self._num_levels)
+        ]
+        self._index: Dict[Hashable, _Entry] = {}
+        self._pending = 0
+        self._seq = 0
+        self._now_tick = 0
+        self._origin = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        """Number of armed deadlines that have not fired yet."""
+        return self._pending
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return self._loop
+
+    # ---- public API ----
+
+    def arm(self, key: Hashable, delay: float, callback: Callable[[Hashable, int], Any]) -> int:
+        """
+        Arm (or re-arm) the deadline for key. callback(key, seq) runs on expiry.
+        Returns the seq identifying this arming.
+        """
+        self._ensure_running()
+        self.cancel(key)
+        self._seq += 1
+        ticks = max(1, int(-(-max(0.0, delay) // self.tick)))  # ceil
+        entry = _Entry(key, self._seq, self._now_tick + ticks, callback)
+        self._index[key] = entry
+        self._insert(entry)
+        self._pending += 1
+        return entry.seq
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel the deadline for key (armed or fired-but-unclaimed)."""
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return False
+        if not entry.fired:
+            del self._levels[entry.level][entry.slot][key]
+            self._pending -= 1
+        return True
+
+    def claim(self, key: Hashable, seq: int) -> bool:
+        """Consume a fired deadline. False if it was cancelled or re-armed since."""
+        entry = self._index.get(key)
+        if entry is None or entry.seq != seq or not entry.fired:
+            return False
+        del self._index[key]
+        return True
+
+    def is_armed(self, key: Hashable) -> bool:
+        entry = self._index.get(key)
+        return entry is not None and not entry.fired
+
+    # ---- internals ----
+
+    def _ensure_running(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # New event loop (e.g. a fresh asyncio.run): start from scratch
+            self._reset()
+            self._loop = loop
+        if self._handle is None:
+            # Idle wheel: re-anchor time so empty slots are not replayed
+            self._origin = loop.time()
+            self._now_tick = 0
+            self._handle = loop.call_at(self._origin + self.tick, self._on_tick)
+
+    def _insert(self, entry: _Entry):
+        delta = min(entry.expires_tick - self._now_tick, self._max_delta)
+        level = 0
+        while delta > self._mask:
+            delta >>= self._bits
+            level += 1
+        slot = (entry.expires_tick >> (self._bits * level)) & self._mask
+        entry.level = level
+        entry.slot = slot
+        self._levels[level][slot][entry.key] = entry
+
+    def _cascade(self, level: int) -> int:
+        slot = (self._now_tick >> (self._bits * level)) & self._mask
+        bucket = self._levels[level][slot]
+        if bucket:
+            self._levels[level][slot] = {}
+            for entry in bucket.values():
+                self._insert(entry)
+        return slot
+
+    def _advance(self):
+        self._now_tick += 1
+        if (self._now_tick & self._mask) == 0:
+            level = 1
+            while level < self._num_levels and self._cascade(level) == 0:
+                level += 1
+        slot = self._now_tick & self._mask
+        due = self._levels[0][slot]
+        if not due:
+            return
+        self._levels[0][slot] = {}
+        for entry in due.values():
+            entry.fired = True
+            self._pending -= 1
+            try:
+                entry.callback(entry.key, entry.seq)
+            except Exception as e:
+                log_event("TIMER_WHEEL_CALLBACK_ERROR", key=entry.key, error=e)
+
+    def _on_tick(self):
+        self._handle = None
+        target = int((self._loop.time() - self._origin) / self.tick)
+        while self._now_tick < target and self._pending:
+            self._advance()
+        if self._pending:
+            next_at = self._origin + (self._now_tick + 1) * self.tick
+            self._handle = self._loop.call_at(next_at, self._on_tick)
+
+
+_wheel: Optional[TimerWheel] = None
+
+
+def get_timer_wheel() -> TimerWheel:
+    """Process-wide wheel shared by all sessions running in this worker."""
+    global _wheel
+    if _wheel is None:
+        _wheel = TimerWheel()
+    return _wheel
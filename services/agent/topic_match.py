@@ -0,0 +1,250 @@
+"""
+Off-topic detection (FR-12) from sentence embeddings.
+
+Every question in a compiled guide is embedded once, when the guide is
+loaded, into a unit-vector matrix cached by guide hash. During a turn the
+participant's final transcript chunks are embedded in small batches as they
+arrive; each batch is scored against the question with one matrix-vector
+product and folded into a running answer vector, so deciding at end of turn
+only embeds the last few chunks. The model runs on one dedicated embedding
+thread (embed_in_worker), never on the event loop; the turn engine folds
+each finished batch in as a TOPIC event.
+
+The embedding model is a small CPU-only sentence-transformers model
+(OFF_TOPIC_MODEL; `pip install sentence-transformers`). If it is not
+installed, a dependency-free hashed bag-of-words embedder stands in; it only
+measures word overlap, so on its own it never calls an answer off-topic,
+only in agreement with a spoken cue ("by the way...") from the intent
+matcher.
+"""
+
+import asyncio
+import os
+import re
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from guide_plan import GuidePlan
+from logs import log_event
+
+OFF_TOPIC_ENABLED = os.getenv("OFF_TOPIC_ENABLED", "true").lower() == "true"
+OFF_TOPIC_MODEL = os.getenv("OFF_TOPIC_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+OFF_TOPIC_THRESHOLD = float(os.getenv("OFF_TOPIC_THRESHOLD", "0.15"))
+OFF_TOPIC_MIN_WORDS = int(os.getenv("OFF_TOPIC_MIN_WORDS", "12"))  # too little to judge below this
+TOPIC_BATCH_SIZE = 4
+TOPIC_INDEX_CACHE_SIZE = 32
+
+# Question types whose replies are not answers to the question text (see run_discussion)
+UNSCORED_TYPES = {"info", "closing", "rollcall"}
+
+# One thread for every model call: keeps batches in order and the model single-threaded
+_EMBED_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="topic-embed")
+
+_WORD_RE = re.compile(r"[a-z']+")
+_STOPWORDS = {
+    "a", "an", "the", "and", "or", "but", "so", "of", "to", "in", "on", "for", "with", "at", "by",
+    "is", "are", "was", "were", "be", "been", "it", "its", "it's", "this", "that", "i", "you",
+    "we", "they", "he", "she", "my", "your", "our", "me", "do", "did", "does", "have", "has",
+    "had", "what", "how", "about", "just", "really", "like", "um", "uh", "yeah", "think",
+}
+
+
+class HashingEmbedder:
+    """Fallback embedder: hashed counts of content-word stems, L2-normalized."""
+
+    semantic = False
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in _WORD_RE.findall(text.lower()):
+                if word not in _STOPWORDS:
+                    # Crude stemming: price / prices / pricing share a bucket
+                    vectors[row, zlib.crc32(word[:5].encode()) % self.dim] += 1.0
+        np.sqrt(vectors, out=vectors)  # damp repeated words
+        return _normalize(vectors)
+
+
+class SentenceEmbedder:
+    """Small local sentence-transformers model, run on the CPU."""
+
+    semantic = True
+
+    def __init__(self, model_name: str = OFF_TOPIC_MODEL):
+        from sentence_transformers import SentenceTransformer
+
+        self.name = model_name
+        self.model = SentenceTransformer(model_name, device="cpu")
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(self.model.encode(texts, batch_size=max(len(texts), 1), normalize_embeddings=True,
+                                            convert_to_numpy=True), dtype=np.float32)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+_embedder = None
+
+
+def get_embedder():
+    """The worker-wide embedder: the local model if it loads, else the hashing fallback."""
+    global _embedder
+    if _embedder is None:
+        started = time.time()
+        try:
+            _embedder = SentenceEmbedder(OFF_TOPIC_MODEL) if OFF_TOPIC_MODEL else HashingEmbedder()
+        except Exception as e:  # not installed, or the model cannot be loaded
+            log_event("TOPIC_MODEL_UNAVAILABLE", model=OFF_TOPIC_MODEL, error=str(e)[:120])
+            _embedder = HashingEmbedder()
+        log_event("TOPIC_MODEL_LOADED", model=_embedder.name, semantic=_embedder.semantic,
+                  load_ms=int((time.time() - started) * 1000))
+    return _embedder
+
+
+class QuestionVectors:
+    """One unit vector per scored question of a guide plan."""
+
+    def __init__(self, guide_hash: str, embedder, rows: Dict[str, int], matrix: np.ndarray):
+        self.guide_hash = guide_hash
+        self.embedder = embedder  # answers must be embedded by the same model
+        self.rows = rows
+        self.matrix = matrix
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def vector(self, question_id: str) -> Optional[np.ndarray]:
+        row = self.rows.get(question_id)
+        return self.matrix[row] if row is not None else None
+
+
+_question_vectors: "OrderedDict[Tuple[str, str, str], QuestionVectors]" = OrderedDict()
+
+
+def question_vectors(plan: GuidePlan, embedder) -> QuestionVectors:
+    """Embed every scored question of a plan (cached by guide hash, group type and model)."""
+    key = (plan.guide_hash, plan.group_type, embedder.name)
+    cached = _question_vectors.get(key)
+    if cached is not None:
+        _question_vectors.move_to_end(key)
+        return cached
+    steps = [s for s in plan.steps if s.question is not None and s.type not in UNSCORED_TYPES and s.text]
+    # The section title gives short questions ("Why?") their topic
+    texts = [f"{s.section_title}. {s.text}" if s.section_title else s.text for s in steps]
+    matrix = embedder.embed(texts) if texts else np.zeros((0, 1), dtype=np.float32)
+    vectors = QuestionVectors(plan.guide_hash, embedder, {s.qid: i for i, s in enumerate(steps)}, matrix)
+    _question_vectors[key] = vectors
+    while len(_question_vectors) > TOPIC_INDEX_CACHE_SIZE:
+        _question_vectors.popitem(last=False)
+    return vectors
+
+
+@dataclass
+class TopicBatch:
+    """A batch of answer chunks and their embeddings (None if embedding failed)."""
+    texts: List[str]
+    vectors: Optional[np.ndarray] = None
+    embed_ms: float = 0.0
+
+
+def embed_texts(embedder, texts: List[str]) -> TopicBatch:
+    started = time.perf_counter()
+    vectors = embedder.embed(texts)
+    return TopicBatch(texts, vectors, (time.perf_counter() - started) * 1000)
+
+
+def embed_in_worker(embedder, texts: List[str]) -> asyncio.Future:
+    """Embed `texts` on the embedding thread; the future resolves to a TopicBatch."""
+    return asyncio.get_running_loop().run_in_executor(_EMBED_EXECUTOR, embed_texts, embedder, texts)
+
+
+class TopicTracker:
+    """
+    How closely the current answer tracks its question. Final chunks are
+    queued by add(), which hands back a batch to embed every TOPIC_BATCH_SIZE
+    chunks; take() hands back whatever is left. Embedded batches are folded
+    in with apply(). flush() does all of this synchronously (offline use).
+    """
+
+    def __init__(self, embedder, threshold: float = OFF_TOPIC_THRESHOLD,
+                 min_words: int = OFF_TOPIC_MIN_WORDS, batch_size: int = TOPIC_BATCH_SIZE):
+        self.embedder = embedder
+        self.threshold = threshold
+        self.min_words = min_words
+        self.batch_size = batch_size
+        self.reset(None)
+
+    def reset(self, question: Optional[np.ndarray]):
+        self.question = question
+        self.pending: List[str] = []
+        self.answer: Optional[np.ndarray] = None  # word-weighted sum of chunk vectors
+        self.best = -1.0                          # best single-chunk similarity
+        self.chunks = 0
+        self.words = 0
+        self.embed_ms = 0.0
+
+    def add(self, text: str) -> Optional[List[str]]:
+        """Queue a final chunk; returns a batch to embed once one is full."""
+        if self.question is None or not text.strip():
+            return None
+        self.pending.append(text)
+        if len(self.pending) >= self.batch_size:
+            return self.take()
+        return None
+
+    def take(self) -> List[str]:
+        """Hand back the queued chunks for embedding."""
+        texts, self.pending = self.pending, []
+        return texts
+
+    def apply(self, batch: TopicBatch):
+        """Fold an embedded batch into the answer score."""
+        if self.question is None or batch.vectors is None:
+            return
+        weights = np.array([len(t.split()) for t in batch.texts], dtype=np.float32)
+        scores = batch.vectors @ self.question
+        weighted = weights @ batch.vectors
+        self.answer = weighted if self.answer is None else self.answer + weighted
+        self.best = max(self.best, float(scores.max()))
+        self.chunks += len(batch.texts)
+        self.words += int(weights.sum())
+        self.embed_ms += batch.embed_ms
+
+    def flush(self):
+        """Embed the queued chunks on the calling thread."""
+        texts = self.take()
+        if texts:
+            self.apply(embed_texts(self.embedder, texts))
+
+    def similarity(self) -> Optional[float]:
+        """Cosine similarity of the answer applied so far to the question."""
+        if self.answer is None:
+            return None
+        norm = float(np.linalg.norm(self.answer))
+        return float(self.answer @ self.question) / norm if norm else 0.0
+
+    def is_off_topic(self, cue: bool = False) -> bool:
+        """
+        True when neither the answer as a whole nor any one chunk of it comes
+        near the question. Short answers are never judged; with the fallback
+        embedder a spoken off-topic cue is also required.
+        """
+        score = self.similarity()
+        if score is None or self.words < self.min_words:
+            return False
+        if not (self.embedder.semantic or cue):
+            return False
+        return score < self.threshold and self.best < self.threshold
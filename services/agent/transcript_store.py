@@ -0,0 +1,255 @@
+"""
+Append-only, speaker-attributed transcript log (FR-17).
+
+One file per session holds every final transcript segment with who said it,
+for which question and turn, and when. append() only encodes the record into
+an in-memory buffer; a background task writes the buffer out every
+TRANSCRIPT_FLUSH_MS (or sooner once it grows past a threshold), so the
+transcription handler never waits on disk. Offsets of each question's
+records are kept as they are appended and saved next to the log on close;
+reading back memory-maps the log and decodes one record at a time, so a
+two-hour session is never loaded into RAM whole.
+
+File layout (<dir>/<session_id>.seg):
+    header   b"TSEG" | version u8
+    records  repeated: byte length u32 | compact JSON
+             {"p": identity, "n": name, "q": question_id, "t": turn_id,
+              "s": start epoch ms, "e": end epoch ms, "x": text}
+
+Index (<dir>/<session_id>.idx): JSON {question_id: [record offsets]}. It is
+only a shortcut; a missing or stale index is rebuilt by scanning the log.
+"""
+
+import asyncio
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from logs import log_event
+
+TRANSCRIPTS_ENABLED = os.getenv("TRANSCRIPTS_ENABLED", "true").lower() == "true"
+TRANSCRIPT_DIR = os.getenv("TRANSCRIPT_DIR", str(Path(__file__).parent / "transcripts"))
+TRANSCRIPT_FLUSH_SECONDS = float(os.getenv("TRANSCRIPT_FLUSH_MS", "1000")) / 1000
+TRANSCRIPT_FLUSH_BYTES = 64 * 1024
+
+_MAGIC = b"TSEG"
+_VERSION = 1
+_HEADER = struct.Struct("<4sB")
+_RECORD_LEN = struct.Struct("<I")
+
+
+class Segment(NamedTuple):
+    participant: str
+    name: str
+    question_id: str
+    turn_id: int
+    start_ms: int
+    end_ms: int
+    text: str
+
+    def encode(self) -> bytes:
+        record = json.dumps({"p": self.participant, "n": self.name, "q": self.question_id,
+                             "t": self.turn_id, "s": self.start_ms, "e": self.end_ms, "x": self.text},
+                            separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        return _RECORD_LEN.pack(len(record)) + record
+
+    @classmethod
+    def decode(cls, record: bytes) -> "Segment":
+        d = json.loads(record)
+        return cls(d["p"], d["n"], d["q"], d["t"], d["s"], d["e"], d["x"])
+
+
+def log_path(session_id: str, directory: str = TRANSCRIPT_DIR) -> Path:
+    return Path(directory) / f"{session_id}.seg"
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_suffix(".idx")
+
+
+def _scan(mm, start: int = _HEADER.size) -> Iterator[tuple]:
+    """(offset, record bytes) for each complete record; stops at a torn tail."""
+    offset, size = start, len(mm)
+    while offset + _RECORD_LEN.size <= size:
+        (length,) = _RECORD_LEN.unpack_from(mm, offset)
+        end = offset + _RECORD_LEN.size + length
+        if end > size:
+            break  # partially written last record (crash mid-flush)
+        yield offset, mm[offset + _RECORD_LEN.size:end]
+        offset = end
+
+
+def _open_map(path: Path):
+    """Read-only map of a transcript log, or None if it is missing or empty."""
+    if not path.exists() or path.stat().st_size <= _HEADER.size:
+        return None
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version = _HEADER.unpack_from(mm, 0)
+    if magic != _MAGIC or version != _VERSION:
+        mm.close()
+        raise ValueError(f"not a transcript log: {path}")
+    return mm
+
+
+def _scan_index(path: Path) -> tuple:
+    """(question ID -> record offsets, end of the last complete record)."""
+    index: Dict[str, List[int]] = {}
+    mm = _open_map(path)
+    if mm is None:
+        return index, _HEADER.size
+    end = _HEADER.size
+    with mm:
+        for offset, record in _scan(mm):
+            index.setdefault(Segment.decode(record).question_id, []).append(offset)
+            end = offset + _RECORD_LEN.size + len(record)
+    return index, end
+
+
+def build_index(path: Path) -> Dict[str, List[int]]:
+    """Question ID -> record offsets, by scanning the log."""
+    return _scan_index(path)[0]
+
+
+def load_index(path: Path) -> Dict[str, List[int]]:
+    """The saved index if it covers the whole log, else a rebuilt one."""
+    try:
+        saved = json.loads(_index_path(path).read_text())
+        if saved.get("size") == path.stat().st_size:
+            return saved["questions"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return build_index(path)
+
+
+def read_segments(path: Path, question_id: Optional[str] = None) -> Iterator[Segment]:
+    """
+    Segments in the order they were spoken, optionally for one question only
+    (via the offset index, without touching the other records).
+    """
+    mm = _open_map(Path(path))
+    if mm is None:
+        return
+    with mm:
+        if question_id is None:
+            for _, record in _scan(mm):
+                yield Segment.decode(record)
+            return
+        for offset in load_index(Path(path)).get(question_id, []):
+            (length,) = _RECORD_LEN.unpack_from(mm, offset)
+            start = offset + _RECORD_LEN.size
+            yield Segment.decode(mm[start:start + length])
+
+
+class TranscriptLog:
+    """Per-session append-only segment log with a buffered background writer."""
+
+    def __init__(self, session_id: str, directory: str = TRANSCRIPT_DIR,
+                 flush_interval: float = TRANSCRIPT_FLUSH_SECONDS):
+        self.session_id = session_id
+        self.path = log_path(session_id, directory)
+        self.flush_interval = flush_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # A restarted agent keeps appending to the same session's log, after
+        # dropping any record torn by a crash mid-write
+        self.index: Dict[str, List[int]] = {}
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if 0 < size < _HEADER.size:
+            os.truncate(self.path, 0)
+        elif size:
+            self.index, end = _scan_index(self.path)
+            if end < size:
+                os.truncate(self.path, end)
+        # Unbuffered, so a failed write can be cut back without stale bytes left in a buffer
+        self._file = open(self.path, "ab", buffering=0)
+        if self._file.tell() == 0:
+            self._file.write(_HEADER.pack(_MAGIC, _VERSION))
+        self._size = self._file.tell()  # end of the last record known to be on disk
+        self._buffer = bytearray()
+        self._pending: List[tuple] = []  # (question ID, offset in _buffer), indexed once written
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.segments = 0
+        self.flushes = 0
+
+    def append(self, segment: Segment):
+        """Queue a segment for writing (never blocks on disk)."""
+        if self._closed:
+            log_event("TRANSCRIPT_APPEND_AFTER_CLOSE", session_id=self.session_id)
+            return
+        record = segment.encode()
+        self._pending.append((segment.question_id, len(self._buffer)))
+        self._buffer += record
+        self.segments += 1
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        if len(self._buffer) >= TRANSCRIPT_FLUSH_BYTES:
+            self._wake.set()
+
+    async def _run(self):
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self):
+        """
+        Write out the buffer. The size and index only advance once the write
+        has succeeded; on failure the records stay queued for the next flush.
+        """
+        if not self._buffer:
+            return
+        data, self._buffer = bytes(self._buffer), bytearray()
+        pending, self._pending = self._pending, []
+        try:
+            await asyncio.to_thread(self._write, data, self._size)
+        except OSError as e:
+            log_event("TRANSCRIPT_WRITE_FAILED", session_id=self.session_id, bytes=len(data), error=str(e))
+            # Segments appended during the write go after the ones being retried
+            self._pending = pending + [(qid, offset + len(data)) for qid, offset in self._pending]
+            self._buffer[:0] = data
+            return
+        for question_id, offset in pending:
+            self.index.setdefault(question_id, []).append(self._size + offset)
+        self._size += len(data)
+
+    def _write(self, data: bytes, size: int):
+        view = memoryview(data)
+        try:
+            while view:
+                view = view[self._file.write(view):]
+        except OSError:
+            try:
+                os.ftruncate(self._file.fileno(), size)  # drop a partly written record
+            except OSError:
+                pass  # a torn tail is also dropped when the log is reopened
+            raise
+        self.flushes += 1
+
+    async def close(self):
+        """Flush what is buffered, save the question index and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is not None:
+            # Let an in-progress write finish rather than interleave with the last one
+            self._wake.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+        if self._buffer:
+            log_event("TRANSCRIPT_UNWRITTEN", session_id=self.session_id, segments=len(self._pending))
+        self._file.close()
+        index_path = _index_path(self.path)
+        tmp = index_path.with_suffix(".idx.tmp")
+        tmp.write_text(json.dumps({"size": self._size, "questions": self.index}, separators=(",", ":")))
+        os.replace(tmp, index_path)
+        log_event("TRANSCRIPT_CLOSED", session_id=self.session_id, segments=self.segments,
+                  bytes=self._size, flushes=self.flushes, path=self.path)
@@ -0,0 +1,304 @@
+"""
+Content-addressed on-disk cache of synthesized speech.
+
+Entries are keyed by sha256(voice, model, normalized sentence) and hold the
+raw PCM frames produced by the TTS plugin, so a cache hit can be handed
+straight to AgentSession.say(audio=...) without decoding. Multi-sentence
+lines are played sentence by sentence, synthesizing the next sentence while
+the current one plays. The cache directory is
+shared by every session (and every worker process) on the host; files are
+written atomically and evicted least-recently-used once the total size
+exceeds TTS_CACHE_MAX_MB. Apart from the directory scan at startup, file
+reads, writes, stats and unlinks run in a worker thread; only the in-memory
+LRU index is touched on the event loop.
+
+File layout (<dir>/<key[:2]>/<key>.pcm):
+    header  b"TTSC" | version u8 | sample_rate u32 | num_channels u16
+    frames  repeated: byte length u32 | int16 PCM bytes
+"""
+
+import asyncio
+import hashlib
+import os
+import struct
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from livekit import rtc
+
+from logs import log_event
+from speech_text import normalize_text, split_sentences
+
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", str(Path.home() / ".cache" / "ai-moderator" / "tts"))
+TTS_CACHE_MAX_MB = float(os.getenv("TTS_CACHE_MAX_MB", "512"))
+
+_MAGIC = b"TTSC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBIH")
+_FRAME_LEN = struct.Struct("<I")
+_SAMPLE_WIDTH = 2  # int16 PCM
+
+# fill()'s on-disk check: one thread, so fills resume in the order they were
+# claimed and pre-rendering keeps starting lines in spoken order
+_FILL_CHECKS = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-cache-check")
+
+
+def cache_key(voice: str, model: str, text: str) -> str:
+    """Content address for a spoken line."""
+    payload = "\x1f".join((voice, model, normalize_text(text)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    """LRU-bounded directory of synthesized PCM, keyed by content hash."""
+
+    def __init__(self, directory: str = TTS_CACHE_DIR, max_bytes: int = int(TTS_CACHE_MAX_MB * 1024 * 1024)):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # key -> size in bytes, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        # key -> future resolved when a background fill for it finishes
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._scan()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    # ---- storage ----
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pcm"
+
+    def _scan(self):
+        """Rebuild the LRU index from disk, oldest access first."""
+        if not self.directory.exists():
+            return
+        found = []
+        for path in self.directory.glob("*/*.pcm"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            found.append((st.st_mtime, path.stem, st.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total += size
+
+    async def load(self, key: str) -> Optional[List[rtc.AudioFrame]]:
+        """Load cached frames, or None on miss / unreadable entry."""
+        return self._index_loaded(key, *await asyncio.to_thread(self._load_file, key))
+
+    async def store(self, key: str, frames: List[rtc.AudioFrame]):
+        """Store frames atomically and evict least recently used entries."""
+        if not frames:
+            return
+        size = await asyncio.to_thread(self._write_file, key, frames)
+        evicted = self._index_stored(key, size)
+        if evicted:
+            await asyncio.to_thread(_unlink, evicted)
+
+    def _load_file(self, key: str) -> Tuple[Optional[List[rtc.AudioFrame]], int]:
+        """(frames, size) from disk; (None, 0) if missing or unreadable (removed)."""
+        # Looked up on disk even when not indexed: another worker process may have written it
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return None, 0
+        try:
+            frames = self._read(path)
+            os.utime(path)
+        except (OSError, ValueError, struct.error) as e:
+            log_event("TTS_CACHE_READ_ERROR", key=key[:12], error=str(e))
+            path.unlink(missing_ok=True)
+            return None, 0
+        return frames, size
+
+    def _index_loaded(self, key: str, frames: Optional[List[rtc.AudioFrame]], size: int):
+        self._total += size - self._entries.pop(key, 0)
+        if frames is None:
+            self.misses += 1
+            return None
+        self._entries[key] = size
+        self.hits += 1
+        return frames
+
+    def _write_file(self, key: str, frames: List[rtc.AudioFrame]) -> Optional[int]:
+        """Write an entry atomically; its size, or None if the write failed."""
+        path = self._path(key)
+        first = frames[0]
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, first.sample_rate, first.num_channels))
+                for frame in frames:
+                    data = frame.data.tobytes()
+                    f.write(_FRAME_LEN.pack(len(data)))
+                    f.write(data)
+            os.replace(tmp, path)
+            return path.stat().st_size
+        except OSError as e:
+            log_event("TTS_CACHE_WRITE_ERROR", key=key[:12], error=str(e))
+            tmp.unlink(missing_ok=True)
+            return None
+
+    def _index_stored(self, key: str, size: Optional[int]) -> List[Path]:
+        """Index a written entry; returns the files evicted to make room."""
+        if size is None:
+            return []
+        self._total += size - self._entries.pop(key, 0)
+        self._entries[key] = size
+        return self._evict()
+
+    def _read(self, path: Path) -> List[rtc.AudioFrame]:
+        with open(path, "rb") as f:
+            blob = f.read()
+        magic, version, sample_rate, num_channels = _HEADER.unpack_from(blob, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("bad cache header")
+        frames = []
+        offset = _HEADER.size
+        while offset < len(blob):
+            (length,) = _FRAME_LEN.unpack_from(blob, offset)
+            offset += _FRAME_LEN.size
+            data = blob[offset:offset + length]
+            if len(data) != length:
+                raise ValueError("truncated cache entry")
+            offset += length
+            frames.append(rtc.AudioFrame(data, sample_rate, num_channels,
+                                         length // (_SAMPLE_WIDTH * num_channels)))
+        return frames
+
+    async def discard(self, key: str) -> bool:
+        """Remove an entry from the index and disk (e.g. personal phrases at session end)."""
+        indexed = key in self._entries
+        self._total -= self._entries.pop(key, 0)
+        return await asyncio.to_thread(_remove, self._path(key)) or indexed
+
+    def _evict(self) -> List[Path]:
+        """Drop least recently used entries from the index; the caller unlinks the files."""
+        evicted = []
+        while self._total > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total -= size
+            evicted.append(self._path(key))
+            log_event("TTS_CACHE_EVICT", key=key[:12], total_bytes=self._total)
+        return evicted
+
+    # ---- synthesis ----
+
+    async def audio(self, tts, voice: str, model: str, text: str) -> AsyncIterator[rtc.AudioFrame]:
+        """
+        Frames for text, one sentence after another as a single gapless
+        stream. Sentence N+1 is filled in the background once sentence N has
+        started playing; a sentence that fails to synthesize is skipped.
+        """
+        sentences = split_sentences(text)
+        lookahead: Optional[asyncio.Task] = None
+        try:
+            for i, sentence in enumerate(sentences):
+                if lookahead is not None:
+                    # Failure here falls through to a live attempt below
+                    await asyncio.gather(lookahead, return_exceptions=True)
+                lookahead = None
+                try:
+                    async for frame in self._sentence_audio(tts, voice, model, sentence):
+                        if lookahead is None and i + 1 < len(sentences):
+                            lookahead = asyncio.ensure_future(self.fill(tts, voice, model, sentences[i + 1]))
+                        yield frame
+                except Exception as e:
+                    log_event("TTS_SENTENCE_FAILED", index=i, sentences=len(sentences), error=str(e))
+        finally:
+            if lookahead is not None:
+                lookahead.cancel()
+
+    async def _sentence_audio(self, tts, voice: str, model: str, text: str) -> AsyncIterator[rtc.AudioFrame]:
+        """
+        Frames for one sentence: replayed from disk on a hit, otherwise streamed
+        from the TTS as they are synthesized and stored once synthesis completes.
+        """
+        key = cache_key(voice, model, text)
+        if key in self._inflight:
+            # Pre-render is already synthesizing this line; wait rather than duplicate
+            await asyncio.shield(self._inflight[key])
+        frames = await self.load(key)
+        if frames is not None:
+            for frame in frames:
+                yield frame
+            return
+
+        started = time.time()
+        collected: List[rtc.AudioFrame] = []
+        async with tts.synthesize(normalize_text(text)) as stream:
+            async for audio in stream:
+                collected.append(audio.frame)
+                yield audio.frame
+        # Only reached when playback consumed the whole stream (not interrupted)
+        await self.store(key, collected)
+        log_event("TTS_CACHE_FILL",
+                  key=key[:12],
+                  frames=len(collected),
+                  synth_ms=int((time.time() - started) * 1000))
+
+    async def fill(self, tts, voice: str, model: str, text: str) -> bool:
+        """Synthesize text into the cache without playing it. False if already cached."""
+        key = cache_key(voice, model, text)
+        while key in self._inflight:
+            await asyncio.shield(self._inflight[key])
+        if key in self._entries:
+            return False
+        # Claimed before the disk check so a concurrent fill of the same line waits on it
+        done = asyncio.get_running_loop().create_future()
+        self._inflight[key] = done
+        try:
+            if await asyncio.get_running_loop().run_in_executor(_FILL_CHECKS, self._path(key).exists):
+                return False
+            async with tts.synthesize(normalize_text(text)) as stream:
+                frames = [audio.frame async for audio in stream]
+            await self.store(key, frames)
+        finally:
+            del self._inflight[key]
+            done.set_result(None)
+        return True
+
+
+def _unlink(paths: List[Path]):
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _remove(path: Path) -> bool:
+    """Unlink one file; False if it was not there."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+_cache: Optional[TTSCache] = None
+
+
+def get_tts_cache() -> Optional[TTSCache]:
+    """Process-wide cache, or None when TTS_CACHE_ENABLED is false."""
+    global _cache
+    if not TTS_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = TTSCache()
+    return _cache
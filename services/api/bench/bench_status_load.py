@@ -0,0 +1,128 @@
+"""
+Load benchmark: GET /api/sessions/{id}/status under concurrent pollers.
+
+Runs the real FastAPI app in-process (httpx ASGI transport, so no socket
+overhead) with 500 pollers hitting /status at once, answered from the room
+mirror. For comparison it also drives the old per-request path — a
+RoomService participant listing per poll — against a stub with fixed
+upstream latency and a pool of LIVEKIT_POOL_SIZE connections, with and
+without per-room request coalescing.
+
+Run with: python services/api/bench/bench_status_load.py
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import main as api_main
+from livekit import api
+
+POLLERS = 500
+ROUNDS = 4
+UPSTREAM_LATENCY = 0.03  # one RoomService round trip on a warm connection
+
+
+class _RoomService:
+    """RoomService stand-in: fixed latency, at most LIVEKIT_POOL_SIZE calls in flight."""
+
+    def __init__(self, identities):
+        self.identities = identities
+        self.calls = 0
+        self.pool = asyncio.Semaphore(api_main.LIVEKIT_POOL_SIZE)
+
+    async def list_rooms(self, request):
+        return SimpleNamespace(rooms=[SimpleNamespace(name=name) for name in self.identities])
+
+    async def list_participants(self, request):
+        async with self.pool:
+            self.calls += 1
+            await asyncio.sleep(UPSTREAM_LATENCY)
+            return SimpleNamespace(participants=[
+                api.ParticipantInfo(identity=identity) for identity in self.identities[request.room]])
+
+
+class _NoCoalescing:
+    async def do(self, key, fn):
+        return await fn()
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    return {
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p99_ms": ordered[int(len(ordered) * 0.99) - 1] * 1000,
+    }
+
+
+async def timed(fn):
+    started = time.perf_counter()
+    await fn()
+    return time.perf_counter() - started
+
+
+async def status_from_mirror(session: api_main.Session) -> dict:
+    transport = httpx.ASGITransport(app=api_main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def poll():
+            response = await client.get(f"/api/sessions/{session.id}/status")
+            assert response.json()["agentJoined"] is True
+
+        async def poller():
+            return [await timed(poll) for _ in range(ROUNDS)]
+
+        started = time.perf_counter()
+        latencies = [t for ts in await asyncio.gather(*(poller() for _ in range(POLLERS))) for t in ts]
+        elapsed = time.perf_counter() - started
+    return {**percentiles(latencies), "req_per_s": len(latencies) / elapsed}
+
+
+async def listing_per_poll(room_name: str, service: _RoomService, coalesce: bool) -> dict:
+    api_main.room_listings = api_main.SingleFlight() if coalesce else _NoCoalescing()
+
+    async def poll():
+        participants = await api_main.list_room_participants(room_name)
+        assert any(p["is_agent"] for p in participants)
+
+    async def poller():
+        return [await timed(poll) for _ in range(ROUNDS)]
+
+    service.calls = 0
+    latencies = [t for ts in await asyncio.gather(*(poller() for _ in range(POLLERS))) for t in ts]
+    return {**percentiles(latencies), "upstream_calls": service.calls}
+
+
+async def run():
+    session = api_main.Session()
+    api_main.sessions[session.id] = session
+    service = _RoomService({session.room_name: ["dana_1", "lee_2", "agent-AJ_bench"]})
+
+    async def room_service():
+        return service
+
+    api_main.get_room_service = room_service
+    await api_main.room_mirror.reconcile(service)
+
+    results = {"status_from_mirror": await status_from_mirror(session)}
+    for label, coalesce in [("listing_per_poll", False), ("listing_coalesced", True)]:
+        results[label] = await listing_per_poll(session.room_name, service, coalesce)
+    return results
+
+
+def main():
+    print(f"[bench] pollers={POLLERS} rounds={ROUNDS} upstream_latency_ms={UPSTREAM_LATENCY * 1000:.0f} "
+          f"pool={api_main.LIVEKIT_POOL_SIZE}")
+    for label, stats in asyncio.run(run()).items():
+        detail = " ".join(f"{k}={v:.1f}" if isinstance(v, float) else f"{k}={v}" for k, v in stats.items())
+        print(f"[bench] {label:<18} {detail}")
+
+
+if __name__ == "__main__":
+    main()
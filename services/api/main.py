@@ -7,13 +7,19 @@ import json
 import hashlib
 import base64
 import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List
 from pathlib import Path
 from enum import Enum
+from dataclasses import dataclass
 
-from fastapi import FastAPI, HTTPException, Request, Query
+import aiohttp
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 from livekit import api
@@ -31,7 +37,22 @@ for env_path in env_paths:
         print(f"[api] Loaded .env from: {env_path}")
         break
 
-app = FastAPI(title="XXXXX Focus Group API", version="0.2.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global livekit_client
+    reconcile = None
+    if LIVEKIT_API_KEY and LIVEKIT_API_SECRET:
+        livekit_client = create_livekit_client()
+        if LIVEKIT_RECONCILE_SECONDS > 0:
+            reconcile = asyncio.create_task(reconcile_room_mirror())
+    yield
+    if reconcile is not None:
+        reconcile.cancel()
+        await asyncio.gather(reconcile, return_exceptions=True)
+    await close_livekit_client()
+
+
+app = FastAPI(title="XXXXX Focus Group API", version="0.2.0", lifespan=lifespan)
 
 # CORS for local development
 app.add_middleware(
@@ -47,7 +68,32 @@ app.add_middleware(
 LIVEKIT_API_KEY = os.getenv("LIVEKIT_API_KEY")
 LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET")
 LIVEKIT_URL = os.getenv("LIVEKIT_URL", "wss://XXXXXXXXXXXXXXXX.livekit.cloud")
-GUIDE_FILE = os.getenv("GUIDE_FILE")
+GUIDE_FILE = os.getenv("GUIDE_FILE")  # default guide for sessions created without a guideId
+GUIDE_STORE_DIR = os.getenv("GUIDE_STORE_DIR", str(Path(__file__).parent / "guides"))
+GUIDE_MAX_BYTES = 2 * 1024 * 1024
+
+# Session event stream (SSE): events kept per session for reconnect replay
+SSE_BUFFER = 256
+SSE_HEARTBEAT_SECONDS = 15.0
+
+# Shared LiveKit API client: one keep-alive connection pool for every RoomService call
+LIVEKIT_POOL_SIZE = int(os.getenv("LIVEKIT_POOL_SIZE", "20"))
+LIVEKIT_TIMEOUT_SECONDS = float(os.getenv("LIVEKIT_TIMEOUT_SECONDS", "5"))
+LIVEKIT_KEEPALIVE_SECONDS = 60.0
+
+# Explicit agent dispatch: rooms are created with the session and the moderator
+# (registered under AGENT_NAME, see services/agent/moderator.py) dispatched into
+# them before anyone joins. Empty AGENT_NAME = rely on automatic dispatch.
+AGENT_NAME = os.getenv("AGENT_NAME", "moderator")
+ROOM_EMPTY_TIMEOUT_SECONDS = int(os.getenv("ROOM_EMPTY_TIMEOUT_SECONDS", "3600"))
+
+# LiveKit room mirror: webhooks keep it current, a periodic RoomService listing corrects drift
+LIVEKIT_RECONCILE_SECONDS = float(os.getenv("LIVEKIT_RECONCILE_SECONDS", "60"))
+# Status re-lists a room older than this while its session still waits for the agent
+ROOM_MIRROR_STALE_SECONDS = float(os.getenv("ROOM_MIRROR_STALE_SECONDS", "3"))
+
+# LiveKit data topic for API -> agent control messages (see services/agent/moderator.py)
+AGENT_CONTROL_TOPIC = "agent-control"
 
 # Redacted URL for logging (hide the project ID partially)
 def get_redacted_livekit_url():
@@ -89,14 +135,21 @@ class Session(BaseModel):
     created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     started_at: Optional[str] = None
     ended_at: Optional[str] = None
+    guide_id: Optional[str] = None
     guide_title: Optional[str] = None
     guide_hash: Optional[str] = None
     current_question_id: Optional[str] = None
     current_section_id: Optional[str] = None
+    current_speaker_id: Optional[str] = None
+    last_turn_end_reason: Optional[str] = None
+    # Agent timing samples by name: {"n": count, "meanMs": ..., "maxMs": ...}
+    agent_timing: Dict[str, Dict[str, float]] = Field(default_factory=dict)
     participants: List[Participant] = Field(default_factory=list)
     hand_raise_queue: List[str] = Field(default_factory=list)
     agent_joined: bool = False
     agent_identity: Optional[str] = None
+    agent_dispatch_id: Optional[str] = None
+    prerender: Optional[Dict[str, Any]] = None
 
     def __init__(self, **data):
         super().__init__(**data)
@@ -106,6 +159,10 @@ class Session(BaseModel):
             self.room_name = f"focusgroup-{timestamp}-{self.id}"
 
 
+class CreateSessionRequest(BaseModel):
+    guideId: Optional[str] = None  # uploaded guide ID (or hash prefix); GUIDE_FILE if omitted
+
+
 class JoinRequest(BaseModel):
     displayName: str
     email: Optional[str] = None
@@ -116,25 +173,198 @@ class RaiseHandRequest(BaseModel):
     participantId: str
 
 
+class AgentStatusRequest(BaseModel):
+    prerender: Optional[Dict[str, Any]] = None
+
+
 # ============ State ============
 
 sessions: Dict[str, Session] = {}
 
 
+class SessionEventLog:
+    """
+    Per-session change log behind GET /api/sessions/{id}/events. Each topic
+    (status, agent, roster, hands, question, prerender) is published only
+    when its value changes; events carry increasing ids so a client can
+    resume from its last id while it is still in the buffer.
+    """
+
+    def __init__(self, size: int = SSE_BUFFER):
+        self.seq = 0
+        self.events: deque = deque(maxlen=size)  # (id, topic, data)
+        self.last: Dict[str, Any] = {}
+        self._changed: Optional[asyncio.Event] = None
+
+    def publish(self, topics: Dict[str, Any]) -> int:
+        published = 0
+        for topic, data in topics.items():
+            if topic in self.last and self.last[topic] == data:
+                continue
+            self.last[topic] = data
+            self.seq += 1
+            self.events.append((self.seq, topic, data))
+            published += 1
+        if published and self._changed is not None:
+            self._changed.set()
+            self._changed = None
+        return published
+
+    def since(self, cursor: int) -> Optional[List[tuple]]:
+        """Events after cursor, or None if the buffer no longer reaches back that far."""
+        oldest = self.events[0][0] if self.events else self.seq + 1
+        if cursor > self.seq or cursor < oldest - 1:
+            return None
+        return [e for e in self.events if e[0] > cursor]
+
+    async def wait(self, timeout: float) -> bool:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+event_logs: Dict[str, SessionEventLog] = {}
+
+
 # ============ Helpers ============
 
-def get_guide_info() -> tuple[str | None, str | None]:
-    """Load guide title and compute hash for traceability."""
-    if not GUIDE_FILE or not os.path.exists(GUIDE_FILE):
-        return None, None
-    try:
-        with open(GUIDE_FILE, "r") as f:
-            guide = json.load(f)
-        title = guide.get("meta", {}).get("title")
-        content_hash = hashlib.md5(json.dumps(guide, sort_keys=True).encode()).hexdigest()[:8]
-        return title, content_hash
-    except Exception:
-        return None, None
+@dataclass(frozen=True)
+class GuideEntry:
+    """A parsed guide, addressed by the sha256 of its bytes."""
+    hash: str
+    raw: bytes
+    guide: Dict[str, Any]
+    title: Optional[str]
+
+    @property
+    def id(self) -> str:
+        return self.hash[:12]
+
+
+def parse_guide(raw: bytes) -> Dict[str, Any]:
+    """Parse and minimally validate guide JSON; ValueError if it is not a guide."""
+    guide = json.loads(raw.decode("utf-8"))
+    if not isinstance(guide, dict) or not isinstance(guide.get("sections"), list):
+        raise ValueError("guide must be an object with a sections list")
+    return guide
+
+
+class GuideRegistry:
+    """
+    In-memory guides keyed by content hash, backed by a content-addressed
+    store directory (<store>/<hash>.json) for uploaded guides.
+
+    GUIDE_FILE is re-read only when its mtime or size changes, and re-parsed
+    only when its bytes actually differ, so session creation and agent guide
+    fetches never touch the disk for an unchanged guide. Stored guides are
+    loaded on first use. Entries are kept by hash for sessions created earlier.
+    """
+
+    def __init__(self, store_dir: Optional[str] = GUIDE_STORE_DIR):
+        self.store_dir = Path(store_dir) if store_dir else None
+        self._by_hash: Dict[str, GuideEntry] = {}
+        self._stats: Dict[str, tuple[int, int, str]] = {}  # path -> (mtime_ns, size, hash)
+        self.reads = 0
+        self.parses = 0
+
+    def _add(self, raw: bytes, content_hash: str) -> GuideEntry:
+        entry = self._by_hash.get(content_hash)
+        if entry is None:
+            guide = parse_guide(raw)
+            self.parses += 1
+            entry = GuideEntry(content_hash, raw, guide, guide.get("meta", {}).get("title"))
+            self._by_hash[content_hash] = entry
+            print(f"[api][GUIDE_LOADED] hash={content_hash[:12]} title={entry.title} bytes={len(raw)}")
+        return entry
+
+    def load(self, path: Optional[str]) -> Optional[GuideEntry]:
+        if not path:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        cached = self._stats.get(path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return self._by_hash[cached[2]]
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            self.reads += 1
+            content_hash = hashlib.sha256(raw).hexdigest()
+            entry = self._add(raw, content_hash)
+        except (OSError, ValueError) as e:
+            print(f"[api][GUIDE_LOAD_ERROR] path={path} error={e}")
+            return None
+        self._stats[path] = (st.st_mtime_ns, st.st_size, content_hash)
+        return entry
+
+    def put(self, raw: bytes) -> tuple[GuideEntry, bool]:
+        """Store an uploaded guide. Returns (entry, created); ValueError if invalid."""
+        content_hash = hashlib.sha256(raw).hexdigest()
+        existing = self.get(content_hash)
+        if existing is not None:
+            return existing, False
+        entry = self._add(raw, content_hash)
+        if self.store_dir is not None:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            path = self.store_dir / f"{content_hash}.json"
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(raw)
+            os.replace(tmp, path)
+        return entry, True
+
+    def get(self, content_hash: Optional[str]) -> Optional[GuideEntry]:
+        if not content_hash:
+            return None
+        entry = self._by_hash.get(content_hash)
+        if entry is None and self.store_dir is not None and len(content_hash) == 64:
+            entry = self.load(str(self.store_dir / f"{content_hash}.json"))
+        return entry
+
+    def resolve(self, guide_id: str) -> Optional[GuideEntry]:
+        """Find a guide by full hash or unique prefix of at least 8 characters."""
+        if len(guide_id) < 8:
+            return None
+        known = set(self._by_hash)
+        if self.store_dir is not None and self.store_dir.exists():
+            known.update(p.stem for p in self.store_dir.glob(f"{guide_id}*.json"))
+        matches = [h for h in known if h.startswith(guide_id)]
+        return self.get(matches[0]) if len(matches) == 1 else None
+
+
+guide_registry = GuideRegistry()
+
+
+def guide_summary(entry: GuideEntry) -> dict:
+    sections = entry.guide.get("sections", [])
+    return {
+        "id": entry.id,
+        "hash": entry.hash,
+        "title": entry.title,
+        "sections": len(sections),
+        "questions": sum(len(s.get("questions", [])) for s in sections),
+    }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def guide_response(entry: GuideEntry, request: Request) -> Response:
+    """Raw guide JSON with the content hash as a strong ETag (304 when unchanged)."""
+    etag = f'"{entry.hash}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.raw, media_type="application/json", headers=headers)
 
 
 def decode_token_claims(token: str) -> dict:
@@ -194,9 +424,12 @@ def session_to_response(s: Session) -> dict:
         "createdAt": s.created_at,
         "startedAt": s.started_at,
         "endedAt": s.ended_at,
+        "guideId": s.guide_id,
         "guideTitle": s.guide_title,
+        "guideHash": s.guide_hash,
         "currentQuestionId": s.current_question_id,
         "currentSectionId": s.current_section_id,
+        "currentSpeakerId": s.current_speaker_id,
         "participants": [
             {
                 "identity": p.identity,
@@ -217,57 +450,636 @@ def session_to_response(s: Session) -> dict:
     }
 
 
-async def get_room_service():
-    """Get LiveKit RoomService client."""
+def session_topics(s: Session) -> Dict[str, Any]:
+    response = session_to_response(s)
+    return {
+        "status": {"status": s.status.value, "startedAt": s.started_at, "endedAt": s.ended_at},
+        "agent": {"agentJoined": s.agent_joined, "agentIdentity": s.agent_identity},
+        "roster": {"participants": response["participants"]},
+        "hands": {"handRaiseQueue": list(s.hand_raise_queue)},
+        "question": {
+            "currentQuestionId": s.current_question_id,
+            "currentSectionId": s.current_section_id,
+            "currentSpeakerId": s.current_speaker_id,
+        },
+        "prerender": s.prerender,
+    }
+
+
+def publish_session(s: Session) -> int:
+    """Push whatever changed in this session to its event stream."""
+    log = event_logs.get(s.id)
+    if log is None:
+        log = event_logs[s.id] = SessionEventLog()
+    return log.publish(session_topics(s))
+
+
+def format_sse(event_id: int, topic: str, data: Any) -> str:
+    return f"id: {event_id}\nevent: {topic}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+async def session_event_stream(log: SessionEventLog, cursor: Optional[int], is_disconnected):
+    """
+    SSE body: replay after cursor (or a full snapshot if there is no usable
+    cursor), then live changes, with a comment line as heartbeat.
+    """
+    backlog = log.since(cursor) if cursor is not None else None
+    while True:
+        if backlog is None:
+            yield format_sse(log.seq, "snapshot", log.last)
+            cursor = log.seq
+        else:
+            for event_id, topic, data in backlog:
+                yield format_sse(event_id, topic, data)
+                cursor = event_id
+        if await is_disconnected():
+            return
+        if not await log.wait(SSE_HEARTBEAT_SECONDS):
+            yield ": keepalive\n\n"
+        backlog = log.since(cursor)
+
+
+livekit_client: Optional[api.LiveKitAPI] = None
+livekit_http: Optional[aiohttp.ClientSession] = None  # owned by us; aclose() leaves it open
+
+
+def create_livekit_client() -> api.LiveKitAPI:
+    """LiveKit API client over a bounded keep-alive pool with a per-call timeout."""
+    global livekit_http
+    # Extract HTTP URL from WSS URL
+    http_url = LIVEKIT_URL.replace("wss://", "https://").replace("ws://", "http://")
+    http = livekit_http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=LIVEKIT_POOL_SIZE, keepalive_timeout=LIVEKIT_KEEPALIVE_SECONDS),
+        timeout=aiohttp.ClientTimeout(total=LIVEKIT_TIMEOUT_SECONDS),
+    )
+    print(f"[api][LIVEKIT_CLIENT] pool={LIVEKIT_POOL_SIZE} timeout_s={LIVEKIT_TIMEOUT_SECONDS}")
+    return api.LiveKitAPI(http_url, LIVEKIT_API_KEY, LIVEKIT_API_SECRET, session=http)
+
+
+async def close_livekit_client():
+    global livekit_client, livekit_http
+    if livekit_client is not None:
+        client, livekit_client = livekit_client, None
+        await client.aclose()
+    if livekit_http is not None:
+        http, livekit_http = livekit_http, None
+        await http.close()
+
+
+async def get_livekit_api() -> api.LiveKitAPI:
+    """Get the shared LiveKit API client."""
+    global livekit_client
     if not LIVEKIT_API_KEY or not LIVEKIT_API_SECRET:
         raise HTTPException(status_code=500, detail="LiveKit credentials not configured")
     
-    # Extract HTTP URL from WSS URL
-    http_url = LIVEKIT_URL.replace("wss://", "https://").replace("ws://", "http://")
+    # Normally created in the app lifespan; lazily for callers outside it
+    if livekit_client is None:
+        livekit_client = create_livekit_client()
+    return livekit_client
+
+
+async def get_room_service():
+    """Get the shared LiveKit RoomService client."""
+    return (await get_livekit_api()).room
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one in-flight call and its result."""
+
+    def __init__(self):
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key, fn):
+        future = self._inflight.get(key)
+        if future is not None:
+            self.shared += 1
+        else:
+            self.calls += 1
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled caller must not cancel the call the others are waiting on
+        return await asyncio.shield(future)
+
+
+room_listings = SingleFlight()
+
+
+def participant_entry(p) -> dict:
+    """Mirror entry for a LiveKit ParticipantInfo."""
+    return {
+        "identity": p.identity,
+        "name": p.name,
+        "state": str(p.state),
+        "joined_at": p.joined_at,
+        "is_publisher": p.is_publisher,
+        # Agent identity typically contains "agent"; newer workers also set the kind
+        "is_agent": p.kind == api.ParticipantInfo.Kind.AGENT or "agent" in p.identity.lower(),
+    }
+
+
+async def fetch_room_participants(room_name: str) -> List[dict]:
+    """List participants in a LiveKit room using RoomService (coalesced per room); raises on failure."""
+    async def fetch():
+        room_service = await get_room_service()
+        participants = await room_service.list_participants(api.ListParticipantsRequest(room=room_name))
+        return [participant_entry(p) for p in participants.participants]
     
-    return api.RoomServiceClient(http_url, LIVEKIT_API_KEY, LIVEKIT_API_SECRET)
+    return await room_listings.do(room_name, fetch)
 
 
 async def list_room_participants(room_name: str) -> List[dict]:
-    """List participants in a LiveKit room using RoomService."""
+    """List participants in a LiveKit room, or [] if RoomService fails."""
     try:
-        room_service = await get_room_service()
-        participants = await room_service.list_participants(api.ListParticipantsRequest(room=room_name))
-        return [
-            {
-                "identity": p.identity,
-                "name": p.name,
-                "state": str(p.state),
-                "joined_at": p.joined_at,
-                "is_publisher": p.is_publisher,
-            }
-            for p in participants.participants
-        ]
+        return await fetch_room_participants(room_name)
     except Exception as e:
         print(f"[api][ERROR] Failed to list room participants: {e}")
         return []
 
 
-async def check_agent_in_room(room_name: str, max_attempts: int = 10, delay: float = 1.0) -> bool:
-    """Check if agent has joined the room with retries."""
-    for attempt in range(max_attempts):
-        participants = await list_room_participants(room_name)
-        for p in participants:
-            # Agent identity typically contains "agent" 
-            if "agent" in p.get("identity", "").lower():
-                print(f"[api][AGENT_FOUND] room={room_name} agent_identity={p['identity']} attempt={attempt+1}")
-                return True
+class RoomMirror:
+    """
+    In-memory view of LiveKit rooms and their participants, so status and
+    presence checks answer without calling RoomService. Webhooks
+    (room_started/finished, participant_joined/left) apply changes as they
+    happen; reconcile() replaces the view with a RoomService listing to
+    correct missed or reordered webhooks.
+    """
+
+    def __init__(self):
+        self.rooms: Dict[str, Dict[str, dict]] = {}  # room -> identity -> participant_entry
+        self.webhooks = 0
+        self.reconciles = 0
+        self.corrected = 0
+        self.last_reconcile_at: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self._versions: Dict[str, int] = {}
+        self._seen: Dict[tuple, int] = {}  # (room, identity) -> created_at of the last applied event
+        self._fresh_at: Dict[str, float] = {}  # room -> monotonic time of the last webhook or listing
+        self._changed: Optional[asyncio.Event] = None
+
+    def participants(self, room_name: str) -> List[dict]:
+        return list(self.rooms.get(room_name, {}).values())
+
+    def agent_identity(self, room_name: str) -> Optional[str]:
+        for p in self.rooms.get(room_name, {}).values():
+            if p["is_agent"]:
+                return p["identity"]
+        return None
+
+    def age(self, room_name: str) -> float:
+        """Seconds since a webhook or listing last vouched for this room (inf if never)."""
+        fresh_at = self._fresh_at.get(room_name)
+        return time.monotonic() - fresh_at if fresh_at is not None else float("inf")
+
+    def apply_webhook(self, event) -> Optional[str]:
+        """Apply a verified WebhookEvent; returns the room it changed, if any."""
+        self.webhooks += 1
+        room_name = event.room.name
+        if not room_name:
+            return None
+        if event.event == "room_started":
+            self.rooms.setdefault(room_name, {})
+        elif event.event == "room_finished":
+            self._forget(room_name)
+            return room_name
+        elif event.event in ("participant_joined", "participant_left"):
+            key = (room_name, event.participant.identity)
+            if event.created_at < self._seen.get(key, 0):
+                return None  # delivered late; a newer event for this participant already applied
+            self._seen[key] = event.created_at
+            if event.event == "participant_joined":
+                self.rooms.setdefault(room_name, {})[key[1]] = participant_entry(event.participant)
+            elif room_name in self.rooms:
+                self.rooms[room_name].pop(key[1], None)
+        else:
+            return None
+        self._fresh_at[room_name] = time.monotonic()
+        self._touch(room_name)
+        return room_name
+
+    def replace_room(self, room_name: str, participants: List[dict]) -> bool:
+        """Set a room's participants from a RoomService listing; True if that changed who is present."""
+        before = set(self.rooms.get(room_name, {}))
+        self.rooms[room_name] = {p["identity"]: p for p in participants}
+        self._fresh_at[room_name] = time.monotonic()
+        if before == set(self.rooms[room_name]):
+            return False
+        self._touch(room_name)
+        return True
+
+    async def reconcile(self, room_service) -> List[str]:
+        """Replace the view with RoomService's; returns the rooms that had drifted."""
+        versions = dict(self._versions)
+        listed = await room_service.list_rooms(api.ListRoomsRequest())
+        names = [r.name for r in listed.rooms]
+        listings = await asyncio.gather(*(
+            room_service.list_participants(api.ListParticipantsRequest(room=name)) for name in names))
+        actual = {name: [participant_entry(p) for p in l.participants] for name, l in zip(names, listings)}
         
-        if attempt < max_attempts - 1:
-            await asyncio.sleep(delay)
-            print(f"[api][AGENT_CHECK] room={room_name} attempt={attempt+1}/{max_attempts} agent_found=false")
+        drifted = []
+        for room_name in set(self.rooms) | set(actual):
+            if self._versions.get(room_name, 0) != versions.get(room_name, 0):
+                continue  # a webhook landed while listing; it is newer than the listing
+            if room_name in actual:
+                missing = room_name not in self.rooms
+                if self.replace_room(room_name, actual[room_name]) or missing:
+                    drifted.append(room_name)
+            else:
+                self._forget(room_name)
+                drifted.append(room_name)
+        
+        self.reconciles += 1
+        self.corrected += len(drifted)
+        self.last_reconcile_at = datetime.now(timezone.utc).isoformat()
+        self.last_error = None
+        return drifted
+
+    def _forget(self, room_name: str):
+        """Drop all state for a room that no longer exists (a reconcile in flight sees version 0 and skips it)."""
+        self.rooms.pop(room_name, None)
+        self._seen = {k: v for k, v in self._seen.items() if k[0] != room_name}
+        self._fresh_at.pop(room_name, None)
+        self._versions.pop(room_name, None)
+        self._notify()
+
+    def _touch(self, room_name: str):
+        self._versions[room_name] = self._versions.get(room_name, 0) + 1
+        self._notify()
+
+    def _notify(self):
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    async def wait(self, timeout: float) -> bool:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def stats(self) -> dict:
+        return {
+            "rooms": len(self.rooms),
+            "webhooks": self.webhooks,
+            "reconciles": self.reconciles,
+            "corrected": self.corrected,
+            "lastReconcileAt": self.last_reconcile_at,
+            "lastError": self.last_error,
+        }
+
+
+room_mirror = RoomMirror()
+
+
+def session_for_room(room_name: str) -> Optional[Session]:
+    for s in sessions.values():
+        if s.room_name == room_name:
+            return s
+    return None
+
+
+# Fallback start-time presence checks, by session; cancelled once the agent is confirmed
+agent_confirmations: Dict[str, asyncio.Task] = {}
+
+
+def confirm_agent(session: Session, identity: Optional[str], source: str):
+    """Record the agent as present and publish it on the session event stream."""
+    if session.agent_joined and (identity is None or identity == session.agent_identity):
+        return
+    session.agent_joined = True
+    session.agent_identity = identity or session.agent_identity
+    publish_session(session)
+    print(f"[api][AGENT_CONFIRMED] session_id={session.id} agent_identity={session.agent_identity} via={source}")
+    waiter = agent_confirmations.pop(session.id, None)
+    if waiter is not None:
+        waiter.cancel()
+
+
+async def refresh_room(room_name: str) -> bool:
+    """Re-list one room into the mirror (coalesced per room); False if RoomService failed."""
+    try:
+        participants = await fetch_room_participants(room_name)
+    except Exception as e:
+        room_mirror.last_error = str(e)
+        print(f"[api][ROOM_REFRESH_ERROR] room={room_name} error={e}")
+        return False
+    room_mirror.replace_room(room_name, participants)
+    return True
+
+
+def agent_left(session: Session, source: str):
+    """Record the agent as gone and publish it on the session event stream."""
+    if not session.agent_joined:
+        return
+    identity, session.agent_joined, session.agent_identity = session.agent_identity, False, None
+    publish_session(session)
+    print(f"[api][AGENT_LEFT] session_id={session.id} agent_identity={identity} via={source}")
+
+
+def sync_agent_presence(room_name: str, source: str = "livekit", mirror_changed: bool = False):
+    """
+    Reflect the room mirror's agent on the room's session. Callers that have
+    just applied a webhook or listing for the room pass mirror_changed, so an
+    agent missing from it has left; elsewhere it may not be mirrored yet.
+    """
+    session = session_for_room(room_name)
+    if session is None:
+        return
+    identity = room_mirror.agent_identity(room_name)
+    if identity is not None:
+        confirm_agent(session, identity, source)
+    elif mirror_changed:
+        agent_left(session, source)
+
+
+async def await_agent_confirmation(session: Session):
+    """
+    Background fallback after start for when neither a webhook nor the agent
+    channel reports the agent: wait on the room mirror (which polls
+    RoomService until webhooks arrive), then log if it never shows up.
+    """
+    agent_joined = await check_agent_in_room(session.room_name, max_attempts=10, delay=1.5)
+    agent_confirmations.pop(session.id, None)
+    if agent_joined:
+        confirm_agent(session, room_mirror.agent_identity(session.room_name), "livekit")
+    elif not session.agent_joined:
+        print(f"[api][SESSION_START_WARNING] session_id={session.id} room_name={session.room_name} "
+              f"agent_not_joined=true - session started without agent confirmation")
+
+
+async def reconcile_room_mirror():
+    """Background drift correction for the room mirror."""
+    while True:
+        try:
+            drifted = await room_mirror.reconcile(await get_room_service())
+            for room_name in drifted:
+                sync_agent_presence(room_name, "reconcile", mirror_changed=True)
+            if drifted:
+                print(f"[api][ROOM_MIRROR_DRIFT] rooms={','.join(sorted(drifted))}")
+        except Exception as e:
+            room_mirror.last_error = str(e)
+            print(f"[api][ROOM_MIRROR_RECONCILE_ERROR] error={e}")
+        await asyncio.sleep(LIVEKIT_RECONCILE_SECONDS)
+
+
+async def check_agent_in_room(room_name: str, max_attempts: int = 10, delay: float = 1.0) -> bool:
+    """
+    Wait for the agent to appear in the room mirror, up to max_attempts * delay.
+    Until a webhook has arrived the mirror may not be fed in real time, so
+    each attempt also refreshes this room from RoomService.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_attempts * delay
+    attempt = 0
+    while True:
+        attempt += 1
+        if room_mirror.webhooks == 0 and attempt <= max_attempts:
+            room_mirror.replace_room(room_name, await list_room_participants(room_name))
+        identity = room_mirror.agent_identity(room_name)
+        if identity is not None:
+            print(f"[api][AGENT_FOUND] room={room_name} agent_identity={identity} attempt={attempt}")
+            return True
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        await room_mirror.wait(min(delay, remaining) if room_mirror.webhooks == 0 else remaining)
     
-    print(f"[api][AGENT_NOT_FOUND] room={room_name} after {max_attempts} attempts")
+    print(f"[api][AGENT_NOT_FOUND] room={room_name} after {attempt} attempts")
     return False
 
 
+class AgentChannels:
+    """
+    Worker websockets (one per agent process, shared by all of its rooms),
+    indexed by the sessions each worker has subscribed to.
+    """
+
+    def __init__(self):
+        self._by_session: Dict[str, WebSocket] = {}
+
+    def attach(self, session_id: str, ws: WebSocket):
+        self._by_session[session_id] = ws
+
+    def detach(self, ws: WebSocket, session_id: Optional[str] = None):
+        for sid in [session_id] if session_id else list(self._by_session):
+            if self._by_session.get(sid) is ws:
+                del self._by_session[sid]
+
+    def get(self, session_id: Optional[str]) -> Optional[WebSocket]:
+        return self._by_session.get(session_id) if session_id else None
+
+
+agent_channels = AgentChannels()
+
+
+def record_timing(session: Session, name: str, ms: float):
+    stats = session.agent_timing.setdefault(name, {"n": 0, "meanMs": 0.0, "maxMs": 0.0})
+    stats["n"] += 1
+    stats["meanMs"] += (ms - stats["meanMs"]) / stats["n"]
+    stats["maxMs"] = max(stats["maxMs"], ms)
+
+
+def apply_agent_event(event: dict):
+    """Fold one compact agent event ({"s": session, "k": kind, ...}) into session state."""
+    session = sessions.get(event.get("s", ""))
+    if session is None:
+        return
+    kind = event.get("k")
+    if kind == "question":
+        session.current_question_id = event.get("qid")
+        session.current_section_id = event.get("sid")
+    elif kind in ("speaker", "turn_start"):
+        session.current_speaker_id = event.get("pid")
+    elif kind == "turn_end":
+        session.current_speaker_id = None
+        session.last_turn_end_reason = event.get("reason")
+        if event.get("turnMs") is not None:
+            record_timing(session, "turn", event["turnMs"])
+    elif kind == "timing":
+        record_timing(session, event.get("name", "unknown"), event.get("ms", 0))
+    publish_session(session)
+
+
+def session_metadata(session: Session) -> str:
+    """Room / dispatch metadata the agent reads its session from."""
+    return json.dumps({"sessionId": session.id, "guideHash": session.guide_hash}, separators=(",", ":"))
+
+
+async def prepare_room(session: Session):
+    """
+    Create the session's LiveKit room and dispatch the moderator into it, so
+    the agent has joined, compiled the guide and pre-rendered its audio before
+    the first participant arrives.
+    """
+    if not LIVEKIT_API_KEY or not LIVEKIT_API_SECRET:
+        return
+    metadata = session_metadata(session)
+    try:
+        lkapi = await get_livekit_api()
+        await lkapi.room.create_room(api.CreateRoomRequest(
+            name=session.room_name,
+            empty_timeout=ROOM_EMPTY_TIMEOUT_SECONDS,
+            metadata=metadata,
+        ))
+        if AGENT_NAME:
+            dispatch = await lkapi.agent_dispatch.create_dispatch(api.CreateAgentDispatchRequest(
+                agent_name=AGENT_NAME,
+                room=session.room_name,
+                metadata=metadata,
+            ))
+            session.agent_dispatch_id = dispatch.id
+        print(f"[api][ROOM_PREPARED] session_id={session.id} room_name={session.room_name} "
+              f"agent_name={AGENT_NAME or '-'} dispatch_id={session.agent_dispatch_id}")
+    except Exception as e:
+        print(f"[api][ROOM_PREPARE_FAILED] session_id={session.id} room_name={session.room_name} error={e}")
+
+
+def session_status_message(session: Session) -> Optional[dict]:
+    """The start/end control message for a session's current status (None while waiting)."""
+    if session.status == SessionStatus.IN_SESSION:
+        return {"type": "session_started", "participants": session_to_response(session)["participants"]}
+    if session.status == SessionStatus.ENDED:
+        return {"type": "session_ended"}
+    return None
+
+
+async def send_session_status(ws: WebSocket, session_id: str):
+    """
+    Repeat a session's start/end to a worker that has just (re)subscribed:
+    a push sent while its channel was down would otherwise be lost.
+    """
+    session = sessions.get(session_id)
+    message = session_status_message(session) if session is not None else None
+    if message is None:
+        return
+    await ws.send_json({"type": "control", "s": session_id, "message": message})
+    print(f"[api][AGENT_STATUS_RESENT] session_id={session_id} type={message['type']}")
+
+
+async def notify_agent(room_name: str, message: dict) -> bool:
+    """
+    Send a control message to the agent: over its worker channel when one is
+    subscribed to the session, otherwise over the room's data channel.
+    """
+    session_id = next((s.id for s in sessions.values() if s.room_name == room_name), None)
+    ws = agent_channels.get(session_id)
+    if ws is not None:
+        try:
+            await ws.send_json({"type": "control", "s": session_id, "message": message})
+            print(f"[api][AGENT_NOTIFY] room={room_name} type={message.get('type')} via=channel")
+            return True
+        except Exception as e:
+            agent_channels.detach(ws)
+            print(f"[api][AGENT_CHANNEL_SEND_FAILED] room={room_name} error={e}")
+    try:
+        room_service = await get_room_service()
+        await room_service.send_data(api.SendDataRequest(
+            room=room_name,
+            data=json.dumps(message).encode("utf-8"),
+            kind=api.DataPacket.Kind.RELIABLE,
+            topic=AGENT_CONTROL_TOPIC,
+        ))
+        print(f"[api][AGENT_NOTIFY] room={room_name} type={message.get('type')}")
+        return True
+    except Exception as e:
+        print(f"[api][AGENT_NOTIFY_FAILED] room={room_name} type={message.get('type')} error={e}")
+        return False
+
+
 # ============ Endpoints ============
 
+def verify_agent_token(websocket: WebSocket) -> Optional[str]:
+    """
+    Identity from the LiveKit-signed agent token on a channel handshake
+    (Authorization: Bearer, or ?token=), or None if it is missing, invalid,
+    expired or lacks the agent grant.
+    """
+    auth = websocket.headers.get("authorization", "")
+    token = auth[len("Bearer "):] if auth.startswith("Bearer ") else websocket.query_params.get("token", "")
+    if not token or not LIVEKIT_API_KEY or not LIVEKIT_API_SECRET:
+        return None
+    try:
+        claims = api.TokenVerifier(LIVEKIT_API_KEY, LIVEKIT_API_SECRET).verify(token)
+    except Exception:
+        return None
+    if claims.video is None or not claims.video.agent:
+        return None
+    return claims.identity or "unknown"
+
+
+@app.websocket("/api/agent/ws")
+async def agent_channel(websocket: WebSocket):
+    """
+    Long-lived agent worker channel. The worker sends hello/subscribe/
+    unsubscribe and batched events; the API sends control messages back,
+    starting with the current start/end of each session subscribed to.
+    Only workers presenting a LiveKit-signed agent token are accepted.
+    """
+    worker = verify_agent_token(websocket)
+    if worker is None:
+        print(f"[api][AGENT_CHANNEL_REJECTED] worker={websocket.query_params.get('worker', 'unknown')}")
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    received = 0
+    print(f"[api][AGENT_CHANNEL_OPEN] worker={worker}")
+    try:
+        while True:
+            message = await websocket.receive_json()
+            kind = message.get("type")
+            if kind == "hello":
+                identities = message.get("identities", {})
+                for session_id in message.get("sessions", []):
+                    agent_channels.attach(session_id, websocket)
+                    if session_id in identities and session_id in sessions:
+                        confirm_agent(sessions[session_id], identities[session_id], "channel")
+                    await send_session_status(websocket, session_id)
+            elif kind == "subscribe":
+                agent_channels.attach(message["s"], websocket)
+                if message.get("identity") and message["s"] in sessions:
+                    confirm_agent(sessions[message["s"]], message["identity"], "channel")
+                await send_session_status(websocket, message["s"])
+            elif kind == "unsubscribe":
+                agent_channels.detach(websocket, message["s"])
+            elif kind == "events":
+                for event in message.get("events", []):
+                    apply_agent_event(event)
+                received += len(message.get("events", []))
+    except (WebSocketDisconnect, ValueError, KeyError) as e:
+        if not isinstance(e, WebSocketDisconnect):
+            print(f"[api][AGENT_CHANNEL_BAD_MESSAGE] worker={worker} error={e}")
+    finally:
+        agent_channels.detach(websocket)
+        print(f"[api][AGENT_CHANNEL_CLOSED] worker={worker} events={received}")
+
+
+@app.post("/api/livekit/webhook")
+async def livekit_webhook(request: Request):
+    """LiveKit webhook receiver; feeds the room mirror."""
+    if not LIVEKIT_API_KEY or not LIVEKIT_API_SECRET:
+        raise HTTPException(status_code=500, detail="LiveKit credentials not configured")
+    body = (await request.body()).decode()
+    receiver = api.WebhookReceiver(api.TokenVerifier(LIVEKIT_API_KEY, LIVEKIT_API_SECRET))
+    try:
+        event = receiver.receive(body, request.headers.get("authorization", ""))
+    except Exception as e:
+        print(f"[api][WEBHOOK_REJECTED] error={e}")
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+    
+    room_name = room_mirror.apply_webhook(event)
+    if room_name:
+        print(f"[api][WEBHOOK] event={event.event} room={room_name} "
+              f"participant={event.participant.identity or '-'}")
+        sync_agent_presence(room_name, "webhook", mirror_changed=True)
+    return {"success": True}
+
+
 @app.get("/api/health")
 async def health():
     """Basic health check."""
@@ -283,7 +1095,8 @@ async def health():
 async def agent_health():
     """
     Check if agent worker is reachable and LiveKit connection works.
-    This verifies we can connect to LiveKit RoomService.
+    Answered from the room mirror; the background reconcile is what
+    actually reaches LiveKit RoomService.
     """
     errors = []
     
@@ -293,25 +1106,18 @@ async def agent_health():
     if not LIVEKIT_API_SECRET:
         errors.append("LIVEKIT_API_SECRET not configured")
     
-    # Try to list rooms to verify connectivity
-    livekit_reachable = False
-    if not errors:
-        try:
-            room_service = await get_room_service()
-            rooms = await room_service.list_rooms(api.ListRoomsRequest())
-            livekit_reachable = True
-            active_rooms = [r.name for r in rooms.rooms]
-        except Exception as e:
-            errors.append(f"LiveKit connection failed: {str(e)}")
-            active_rooms = []
-    else:
-        active_rooms = []
+    # Connectivity is whatever the last background reconcile saw
+    livekit_reachable = room_mirror.last_reconcile_at is not None and room_mirror.last_error is None
+    if not errors and room_mirror.last_error:
+        errors.append(f"LiveKit connection failed: {room_mirror.last_error}")
+    active_rooms = sorted(room_mirror.rooms)
     
     return {
         "status": "ok" if not errors else "error",
         "livekit_url": REDACTED_LIVEKIT_URL,
         "livekit_reachable": livekit_reachable,
         "active_rooms": active_rooms,
+        "room_mirror": room_mirror.stats(),
         "errors": errors,
     }
 
@@ -322,16 +1128,13 @@ async def session_debug(room: str = Query(..., description="Room name to debug")
     Debug endpoint to list participants in a LiveKit room.
     Useful for diagnosing room mismatch or agent join issues.
     """
-    participants = await list_room_participants(room)
+    participants = room_mirror.participants(room)
     
     # Find matching session
-    matching_session = None
-    for sid, s in sessions.items():
-        if s.room_name == room:
-            matching_session = session_to_response(s)
-            break
+    session = session_for_room(room)
+    matching_session = session_to_response(session) if session else None
     
-    agent_present = any("agent" in p.get("identity", "").lower() for p in participants)
+    agent_present = room_mirror.agent_identity(room) is not None
     
     return {
         "room": room,
@@ -345,14 +1148,26 @@ async def session_debug(room: str = Query(..., description="Room name to debug")
 
 
 @app.post("/api/sessions")
-async def create_session():
-    """Create a new session with deterministic room name."""
-    guide_title, guide_hash = get_guide_info()
-    session = Session(guide_title=guide_title, guide_hash=guide_hash)
+async def create_session(background_tasks: BackgroundTasks, request: Optional[CreateSessionRequest] = None):
+    """Create a new session with deterministic room name, and warm its room."""
+    if request and request.guideId:
+        guide = guide_registry.resolve(request.guideId)
+        if guide is None:
+            raise HTTPException(status_code=404, detail="Guide not found")
+    else:
+        guide = guide_registry.load(GUIDE_FILE)
+    session = Session(
+        guide_id=guide.id if guide else None,
+        guide_title=guide.title if guide else None,
+        guide_hash=guide.hash if guide else None,
+    )
     sessions[session.id] = session
+    publish_session(session)
     
     print(f"[api][SESSION_CREATE] session_id={session.id} room_name={session.room_name} "
-          f"guide={guide_title} livekit_url={REDACTED_LIVEKIT_URL}")
+          f"guide={session.guide_title} guide_id={session.guide_id} livekit_url={REDACTED_LIVEKIT_URL}")
+    
+    background_tasks.add_task(prepare_room, session)
     
     return session_to_response(session)
 
@@ -364,8 +1179,53 @@ async def get_session(session_id: str):
     return session_to_response(sessions[session_id])
 
 
+@app.get("/api/sessions/{session_id}/guide")
+async def get_session_guide(session_id: str, request: Request):
+    """The guide this session was created with (ETag = content hash)."""
+    if session_id not in sessions:
+        raise HTTPException(status_code=404, detail="Session not found")
+    entry = guide_registry.get(sessions[session_id].guide_hash)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Session has no guide")
+    return guide_response(entry, request)
+
+
+@app.get("/api/guide")
+async def get_current_guide_info():
+    """Metadata for the default (GUIDE_FILE) guide, served from memory."""
+    entry = guide_registry.load(GUIDE_FILE)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="No guide configured")
+    return guide_summary(entry)
+
+
+@app.post("/api/guides", status_code=201)
+async def upload_guide(request: Request, response: Response):
+    """Store a guide (raw JSON body) by content hash; re-uploading is a no-op."""
+    raw = await request.body()
+    if len(raw) > GUIDE_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="Guide too large")
+    try:
+        entry, created = guide_registry.put(raw)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid guide: {e}")
+    if not created:
+        response.status_code = 200
+    print(f"[api][GUIDE_UPLOAD] guide_id={entry.id} title={entry.title} created={created}")
+    return guide_summary(entry)
+
+
+@app.get("/api/guides/{guide_hash}")
+async def get_guide(guide_hash: str, request: Request):
+    """A guide by content hash or guide ID (ETag = hash)."""
+    entry = guide_registry.get(guide_hash) if len(guide_hash) == 64 else guide_registry.resolve(guide_hash)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Guide not found")
+    return guide_response(entry, request)
+
+
 @app.post("/api/sessions/{session_id}/join")
-async def join_session(session_id: str, request: JoinRequest):
+async def join_session(session_id: str, request: JoinRequest, background_tasks: BackgroundTasks):
     """Join a session and get a LiveKit token."""
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -387,6 +1247,7 @@ async def join_session(session_id: str, request: JoinRequest):
         joined_at=datetime.now(timezone.utc).isoformat(),
     )
     session.participants.append(participant)
+    publish_session(session)
     
     # Generate token with structured logging
     token = generate_token(session.room_name, identity, is_organizer)
@@ -394,6 +1255,13 @@ async def join_session(session_id: str, request: JoinRequest):
     print(f"[api][PARTICIPANT_JOIN] session_id={session_id} room_name={session.room_name} "
           f"identity={identity} is_organizer={is_organizer}")
     
+    # Let the agent pre-synthesize this participant's name-templated lines
+    background_tasks.add_task(notify_agent, session.room_name, {
+        "type": "participant_joined",
+        "identity": identity,
+        "displayName": request.displayName,
+    })
+    
     return {
         "token": token,
         "sessionId": session_id,
@@ -404,14 +1272,16 @@ async def join_session(session_id: str, request: JoinRequest):
     }
 
 
-@app.post("/api/sessions/{session_id}/start")
+@app.post("/api/sessions/{session_id}/start", status_code=202)
 async def start_session(session_id: str):
     """
     Start a session. This:
     1. Updates session status
-    2. Optionally creates the room in LiveKit
-    3. Waits for agent to join (with timeout)
-    4. Returns success only when agent is confirmed present
+    2. Pushes the start to the agent, and dispatches it again if the
+       dispatch at creation failed
+    3. Returns 202 without waiting for the agent; its presence is confirmed
+       later (webhook, agent channel, or a background room check) and
+       published on the session event stream as the "agent" topic
     """
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -426,52 +1296,72 @@ async def start_session(session_id: str):
     # Update status
     session.status = SessionStatus.IN_SESSION
     session.started_at = datetime.now(timezone.utc).isoformat()
+    publish_session(session)
     
-    # Wait for agent to join (the agent should auto-dispatch when room has participants)
-    # Give it up to 15 seconds with 1.5 second intervals
-    agent_joined = await check_agent_in_room(session.room_name, max_attempts=10, delay=1.5)
+    # Push the start to an agent already waiting in the room; one that joins
+    # later reads the status when it begins waiting
+    await notify_agent(session.room_name, session_status_message(session))
     
-    if agent_joined:
-        session.agent_joined = True
-        # Find agent identity
-        participants = await list_room_participants(session.room_name)
-        for p in participants:
-            if "agent" in p.get("identity", "").lower():
-                session.agent_identity = p.get("identity")
-                break
-        
-        print(f"[api][SESSION_START_SUCCESS] session_id={session_id} room_name={session.room_name} "
-              f"agent_identity={session.agent_identity}")
-    else:
-        print(f"[api][SESSION_START_WARNING] session_id={session_id} room_name={session.room_name} "
-              f"agent_not_joined=true - session started without agent confirmation")
+    sync_agent_presence(session.room_name)
+    if not session.agent_joined and AGENT_NAME and session.agent_dispatch_id is None:
+        # Dispatch at creation failed (or has not landed); without a retry nothing would join
+        print(f"[api][AGENT_REDISPATCH] session_id={session_id} room_name={session.room_name}")
+        await prepare_room(session)
+    if not session.agent_joined:
+        agent_confirmations[session_id] = asyncio.create_task(await_agent_confirmation(session))
+    
+    print(f"[api][SESSION_START_ACCEPTED] session_id={session_id} room_name={session.room_name} "
+          f"agent_confirmed={session.agent_joined}")
     
     return {
         **session_to_response(session),
-        "agentConfirmed": agent_joined,
-        "message": "Session started" + ("" if agent_joined else " (warning: agent not confirmed)")
+        "agentConfirmed": session.agent_joined,
+        "message": "Session started" + ("" if session.agent_joined else "; waiting for agent confirmation"),
     }
 
 
+@app.get("/api/sessions/{session_id}/events")
+async def session_events(session_id: str, request: Request, cursor: Optional[int] = Query(None)):
+    """
+    Server-sent session deltas (status, agent, roster, hands, question,
+    prerender), each sent only when it changes. Resume with the last event id
+    via the Last-Event-ID header or ?cursor=.
+    """
+    if session_id not in sessions:
+        raise HTTPException(status_code=404, detail="Session not found")
+    log = event_logs.get(session_id)
+    if log is None:
+        publish_session(sessions[session_id])
+        log = event_logs[session_id]
+    last_event_id = request.headers.get("last-event-id")
+    if cursor is None and last_event_id and last_event_id.isdigit():
+        cursor = int(last_event_id)
+    return StreamingResponse(
+        session_event_stream(log, cursor, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/sessions/{session_id}/status")
 async def get_session_status(session_id: str):
-    """Get session status including real-time agent presence check."""
+    """
+    Get session status including agent presence from the room mirror. While
+    the session still waits for its agent, a room the mirror has not heard
+    about for ROOM_MIRROR_STALE_SECONDS is re-listed first (one RoomService
+    call per room however many clients poll).
+    """
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found")
     
     session = sessions[session_id]
+    if (not session.agent_joined and LIVEKIT_API_KEY and LIVEKIT_API_SECRET
+            and room_mirror.age(session.room_name) > ROOM_MIRROR_STALE_SECONDS):
+        await refresh_room(session.room_name)
     
-    # Check current room participants
-    participants = await list_room_participants(session.room_name)
-    agent_present = any("agent" in p.get("identity", "").lower() for p in participants)
-    
-    # Update session state
-    if agent_present and not session.agent_joined:
-        session.agent_joined = True
-        for p in participants:
-            if "agent" in p.get("identity", "").lower():
-                session.agent_identity = p.get("identity")
-                break
+    participants = room_mirror.participants(session.room_name)
+    agent_present = room_mirror.agent_identity(session.room_name) is not None
+    sync_agent_presence(session.room_name)
     
     return {
         "sessionId": session_id,
@@ -481,11 +1371,33 @@ async def get_session_status(session_id: str):
         "agentIdentity": session.agent_identity,
         "participantCount": len(participants),
         "livekitParticipants": [p.get("identity") for p in participants],
+        "prerender": session.prerender,
+        "currentQuestionId": session.current_question_id,
+        "currentSpeakerId": session.current_speaker_id,
+        "agentTiming": session.agent_timing,
     }
 
 
+@app.post("/api/sessions/{session_id}/agent-status")
+async def report_agent_status(session_id: str, request: AgentStatusRequest):
+    """Agent-side progress (TTS pre-render coverage) surfaced through session status."""
+    if session_id not in sessions:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    session = sessions[session_id]
+    if request.prerender is not None:
+        session.prerender = request.prerender
+        if request.prerender.get("done"):
+            print(f"[api][PRERENDER_DONE] session_id={session_id} "
+                  f"coverage={request.prerender.get('coverage')} "
+                  f"elapsed_ms={request.prerender.get('elapsedMs')}")
+        publish_session(session)
+    
+    return {"success": True}
+
+
 @app.post("/api/sessions/{session_id}/end")
-async def end_session(session_id: str):
+async def end_session(session_id: str, background_tasks: BackgroundTasks):
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -496,14 +1408,16 @@ async def end_session(session_id: str):
     
     session.status = SessionStatus.ENDED
     session.ended_at = datetime.now(timezone.utc).isoformat()
+    publish_session(session)
     
     print(f"[api][SESSION_END] session_id={session_id} room_name={session.room_name}")
+    background_tasks.add_task(notify_agent, session.room_name, session_status_message(session))
     
     return session_to_response(session)
 
 
 @app.post("/api/sessions/{session_id}/raise-hand")
-async def raise_hand(session_id: str, request: RaiseHandRequest):
+async def raise_hand(session_id: str, request: RaiseHandRequest, background_tasks: BackgroundTasks):
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -523,7 +1437,10 @@ async def raise_hand(session_id: str, request: RaiseHandRequest):
         if participant.identity not in session.hand_raise_queue:
             session.hand_raise_queue.append(participant.identity)
         
+        publish_session(session)
         print(f"[api][HAND_RAISE] session_id={session_id} participant={participant.identity}")
+        background_tasks.add_task(notify_agent, session.room_name,
+                                  {"type": "hand_raised", "identity": participant.identity})
     
     return {
         "success": True,
@@ -532,7 +1449,7 @@ async def raise_hand(session_id: str, request: RaiseHandRequest):
 
 
 @app.post("/api/sessions/{session_id}/lower-hand")
-async def lower_hand(session_id: str, request: RaiseHandRequest):
+async def lower_hand(session_id: str, request: RaiseHandRequest, background_tasks: BackgroundTasks):
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -551,7 +1468,10 @@ async def lower_hand(session_id: str, request: RaiseHandRequest):
     if participant.identity in session.hand_raise_queue:
         session.hand_raise_queue.remove(participant.identity)
     
+    publish_session(session)
     print(f"[api][HAND_LOWER] session_id={session_id} participant={participant.identity}")
+    background_tasks.add_task(notify_agent, session.room_name,
+                              {"type": "hand_lowered", "identity": participant.identity})
     
     return {"success": True}
 
@@ -172,22 +172,22 @@ class TestAgentJoinReliability:
         join_data = join_response.json()
         print(f"[test] Joined as organizer: identity={join_data['identity']}")
 
-        # Start session - this should trigger agent dispatch
-        print(f"[test] Starting session (this will wait for agent)...")
+        # Start session - accepted immediately; agent presence is confirmed asynchronously
+        print(f"[test] Starting session...")
         start_response = await api_client.post(f"/api/sessions/{session_id}/start")
-        assert start_response.status_code == 200
+        assert start_response.status_code == 202
         start_data = start_response.json()
         
         print(f"[test] Session started: agentConfirmed={start_data.get('agentConfirmed')}")
 
-        # Check if agent was confirmed during start
+        # Agent may already have been in the room
         if start_data.get("agentConfirmed"):
-            print(f"[test] ✅ Agent joined during session start!")
+            print(f"[test] ✅ Agent already present at session start!")
             assert start_data["agentJoined"] == True
             return
 
-        # If not confirmed during start, poll for agent presence
-        print(f"[test] Agent not confirmed during start, polling for up to {AGENT_JOIN_TIMEOUT}s...")
+        # Otherwise poll for the asynchronous confirmation
+        print(f"[test] Agent not yet confirmed, polling for up to {AGENT_JOIN_TIMEOUT}s...")
         
         agent_joined = False
         for i in range(AGENT_JOIN_TIMEOUT):
@@ -0,0 +1,240 @@
+"""
+Unit tests for the worker-to-API event channel.
+
+Tests:
+1. emit() coalesces state-like events and drops the oldest when the buffer is full
+2. The flush loop batches events and dispatches control messages per session
+3. The API folds agent events into session state and routes control over the channel
+   (re-sending a session's start/end when a worker subscribes)
+4. The API refuses channel connections without a valid agent token
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import aiohttp
+
+# Add services/agent and services/api to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "api"))
+
+
+def agent_headers(monkeypatch, main, worker="w1"):
+    """Configure LiveKit credentials and mint the worker's channel token."""
+    from api_channel import agent_token
+
+    monkeypatch.setenv("LIVEKIT_API_KEY", "devkey")
+    monkeypatch.setenv("LIVEKIT_API_SECRET", "devsecret-devsecret-devsecret-devsecret")
+    monkeypatch.setattr(main, "LIVEKIT_API_KEY", "devkey")
+    monkeypatch.setattr(main, "LIVEKIT_API_SECRET", "devsecret-devsecret-devsecret-devsecret")
+    return {"Authorization": f"Bearer {agent_token(worker)}"}
+
+
+class FakeWS:
+    """Stands in for an aiohttp websocket: records sends, yields queued messages."""
+
+    def __init__(self):
+        self.sent = []
+        self.incoming: asyncio.Queue = asyncio.Queue()
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    def push(self, data):
+        self.incoming.put_nowait(aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, json.dumps(data), None))
+
+    def close(self):
+        self.incoming.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        msg = await self.incoming.get()
+        if msg is None:
+            raise StopAsyncIteration
+        return msg
+
+
+class TestEmit:
+    """Test buffering, coalescing and backpressure."""
+
+    def test_state_events_coalesce(self):
+        from api_channel import ApiChannel
+
+        channel = ApiChannel("ws://unused")
+        for qid in ("q1", "q2", "q3"):
+            channel.emit("s1", "question", qid=qid)
+        channel.emit("s2", "question", qid="q9")
+        channel.emit("s1", "turn_end", reason="answer")
+        channel.emit("s1", "turn_end", reason="timeout")
+
+        events = list(channel._pending.values())
+        assert [(e["s"], e["k"]) for e in events] == [
+            ("s1", "question"), ("s2", "question"), ("s1", "turn_end"), ("s1", "turn_end")]
+        assert events[0]["qid"] == "q3"
+        assert channel.coalesced == 2
+
+    def test_full_buffer_drops_oldest(self):
+        from api_channel import ApiChannel
+
+        channel = ApiChannel("ws://unused", max_pending=10)
+        for i in range(25):
+            channel.emit("s1", "timing", name="first_speech", ms=i)
+
+        assert channel.pending() == 10
+        assert channel.dropped == 15
+        assert [e["ms"] for e in channel._pending.values()] == list(range(15, 25))
+
+    def test_channel_url(self):
+        from api_channel import channel_url
+
+        assert channel_url("http://localhost:8000") == "ws://localhost:8000/api/agent/ws"
+        assert channel_url("https://api.example.com/") == "wss://api.example.com/api/agent/ws"
+
+
+class TestServe:
+    """Test the connected flush / read loop against a fake socket."""
+
+    def test_batches_and_dispatches_control(self):
+        from api_channel import ApiChannel
+
+        async def run():
+            channel = ApiChannel("ws://unused", flush_interval=0.01)
+            received = []
+            channel.handlers["s1"] = received.append
+            channel.identities["s1"] = "agent-AJ_1"
+            ws = FakeWS()
+            serve = asyncio.create_task(channel._serve(ws))
+            await asyncio.sleep(0.02)
+
+            channel.emit("s1", "question", qid="q1", sid="intro")
+            channel.emit("s1", "turn_end", reason="answer", turnMs=1200)
+            ws.push({"type": "control", "s": "s1", "message": {"type": "session_started"}})
+            ws.push({"type": "control", "s": "other", "message": {"type": "session_ended"}})
+            await asyncio.sleep(0.05)
+            ws.close()
+            await serve
+            return channel, ws, received
+
+        channel, ws, received = asyncio.run(run())
+
+        assert ws.sent[0] == {"type": "hello", "worker": channel.worker_id, "sessions": ["s1"],
+                              "identities": {"s1": "agent-AJ_1"}}
+        batches = [m["events"] for m in ws.sent if m["type"] == "events"]
+        assert [e["k"] for batch in batches for e in batch] == ["question", "turn_end"]
+        assert received == [{"type": "session_started"}]
+        assert channel.sent == 2 and channel.pending() == 0
+
+    def test_subscribe_while_connected_sends_control(self):
+        from api_channel import ApiChannel
+
+        async def run():
+            channel = ApiChannel("ws://unused", flush_interval=0.01)
+            ws = FakeWS()
+            serve = asyncio.create_task(channel._serve(ws))
+            await asyncio.sleep(0.02)
+            channel.start = lambda: None
+            channel.subscribe("s2", lambda message: None, identity="agent-AJ_2")
+            channel.unsubscribe("s2")
+            await asyncio.sleep(0.03)
+            ws.close()
+            await serve
+            return ws
+
+        ws = asyncio.run(run())
+
+        assert [m for m in ws.sent if m["type"] != "hello"] == [
+            {"type": "subscribe", "s": "s2", "identity": "agent-AJ_2"}, {"type": "unsubscribe", "s": "s2"}]
+
+
+class TestApiSide:
+    """Test the API websocket endpoint."""
+
+    def test_events_update_session_and_control_routes_over_channel(self, monkeypatch):
+        import time
+        from fastapi.testclient import TestClient
+        import main
+
+        async def no_agent(room_name, max_attempts=10, delay=1.0):
+            return False
+
+        monkeypatch.setattr(main, "check_agent_in_room", no_agent)
+        client = TestClient(main.app)
+        session = client.post("/api/sessions").json()
+        sid = session["id"]
+
+        headers = agent_headers(monkeypatch, main)
+        with client.websocket_connect("/api/agent/ws?worker=w1", headers=headers) as ws:
+            ws.send_json({"type": "hello", "worker": "w1", "sessions": [sid]})
+            ws.send_json({"type": "events", "events": [
+                {"s": sid, "k": "question", "t": 1, "qid": "q2", "sid": "habits"},
+                {"s": sid, "k": "turn_start", "t": 2, "pid": "dana_1"},
+                {"s": sid, "k": "turn_end", "t": 3, "pid": "dana_1", "reason": "answer", "turnMs": 4000},
+                {"s": sid, "k": "turn_end", "t": 4, "pid": "lee_2", "reason": "timeout", "turnMs": 2000},
+            ]})
+            deadline = time.time() + 2
+            while main.sessions[sid].last_turn_end_reason is None and time.time() < deadline:
+                time.sleep(0.01)
+            client.post(f"/api/sessions/{sid}/start")
+            control = ws.receive_json()
+
+        state = main.sessions[sid]
+        assert (state.current_question_id, state.current_section_id) == ("q2", "habits")
+        assert state.last_turn_end_reason == "timeout"
+        assert state.agent_timing["turn"] == {"n": 2, "meanMs": 3000.0, "maxMs": 4000}
+        assert control["type"] == "control" and control["s"] == sid
+        assert control["message"]["type"] == "session_started"
+        assert main.agent_channels.get(sid) is None  # detached on disconnect
+
+    def test_subscribe_resends_session_status(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        async def no_agent(room_name, max_attempts=10, delay=1.0):
+            return False
+
+        async def dropped(room_name, message):
+            return False  # the push never reached the agent
+
+        monkeypatch.setattr(main, "check_agent_in_room", no_agent)
+        monkeypatch.setattr(main, "notify_agent", dropped)
+        client = TestClient(main.app)
+        waiting, started, ended = (client.post("/api/sessions").json()["id"] for _ in range(3))
+        client.post(f"/api/sessions/{started}/start")
+        client.post(f"/api/sessions/{ended}/start")
+        client.post(f"/api/sessions/{ended}/end")
+
+        headers = agent_headers(monkeypatch, main)
+        with client.websocket_connect("/api/agent/ws?worker=w1", headers=headers) as ws:
+            ws.send_json({"type": "hello", "worker": "w1", "sessions": [waiting, started]})
+            on_hello = ws.receive_json()
+            ws.send_json({"type": "subscribe", "s": ended})
+            on_subscribe = ws.receive_json()
+
+        assert (on_hello["s"], on_hello["message"]["type"]) == (started, "session_started")
+        assert (on_subscribe["s"], on_subscribe["message"]) == (ended, {"type": "session_ended"})
+
+    def test_channel_requires_agent_token(self, monkeypatch):
+        import pytest
+        from fastapi.testclient import TestClient
+        from livekit import api
+        from starlette.websockets import WebSocketDisconnect
+        import main
+
+        client = TestClient(main.app)
+        agent_headers(monkeypatch, main)
+        participant = (api.AccessToken("devkey", "devsecret-devsecret-devsecret-devsecret")
+                       .with_identity("p1").with_grants(api.VideoGrants(room_join=True, room="r1")).to_jwt())
+        forged = (api.AccessToken("devkey", "not-the-secret-not-the-secret-not-the")
+                  .with_identity("w1").with_grants(api.VideoGrants(agent=True)).to_jwt())
+
+        for url, headers in [("/api/agent/ws?worker=w1", {}),
+                             (f"/api/agent/ws?worker=w1&token={participant}", {}),
+                             ("/api/agent/ws?worker=w1", {"Authorization": f"Bearer {forged}"})]:
+            with pytest.raises(WebSocketDisconnect) as closed:
+                with client.websocket_connect(url, headers=headers) as ws:
+                    ws.receive_json()
+            assert closed.value.code == 1008
@@ -0,0 +1,131 @@
+"""
+Unit tests for explicit agent dispatch at session creation.
+
+Tests:
+1. create_session creates the room and dispatches the moderator with session metadata
+2. LiveKit failures do not fail session creation; start dispatches again
+3. The agent reads its session from the dispatch (or room) metadata, else the room name
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add services/agent and services/api to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "api"))
+
+
+class FakeLiveKitAPI:
+    """Records room creation and dispatch requests."""
+
+    def __init__(self, fail=False):
+        self.requests = []
+        self.fail = fail
+        self.room = SimpleNamespace(create_room=self.create_room)
+        self.agent_dispatch = SimpleNamespace(create_dispatch=self.create_dispatch)
+
+    async def create_room(self, request):
+        if self.fail:
+            raise ConnectionError("livekit unreachable")
+        self.requests.append(("room", request))
+
+    async def create_dispatch(self, request):
+        self.requests.append(("dispatch", request))
+        return SimpleNamespace(id="AD_test1")
+
+
+def make_client(monkeypatch, lkapi):
+    from fastapi.testclient import TestClient
+    import main
+
+    async def fake_livekit_api():
+        return lkapi
+
+    monkeypatch.setattr(main, "LIVEKIT_API_KEY", "key")
+    monkeypatch.setattr(main, "LIVEKIT_API_SECRET", "secret-secret-secret-secret-secret")
+    monkeypatch.setattr(main, "get_livekit_api", fake_livekit_api)
+    return TestClient(main.app), main
+
+
+class TestCreateDispatch:
+    """Test the API side."""
+
+    def test_create_session_warms_room(self, monkeypatch):
+        lkapi = FakeLiveKitAPI()
+        client, main = make_client(monkeypatch, lkapi)
+
+        session = client.post("/api/sessions").json()
+
+        (_, room), (_, dispatch) = lkapi.requests
+        assert room.name == dispatch.room == session["roomName"]
+        assert room.empty_timeout == main.ROOM_EMPTY_TIMEOUT_SECONDS
+        assert dispatch.agent_name == main.AGENT_NAME
+        assert json.loads(dispatch.metadata) == {"sessionId": session["id"], "guideHash": session["guideHash"]}
+        assert room.metadata == dispatch.metadata
+        assert main.sessions[session["id"]].agent_dispatch_id == "AD_test1"
+
+    def test_auto_dispatch_only_creates_room(self, monkeypatch):
+        lkapi = FakeLiveKitAPI()
+        client, main = make_client(monkeypatch, lkapi)
+        monkeypatch.setattr(main, "AGENT_NAME", "")
+
+        client.post("/api/sessions")
+
+        assert [kind for kind, _ in lkapi.requests] == ["room"]
+
+    def test_livekit_failure_still_creates_session(self, monkeypatch):
+        client, main = make_client(monkeypatch, FakeLiveKitAPI(fail=True))
+
+        response = client.post("/api/sessions")
+
+        assert response.status_code == 200
+        assert main.sessions[response.json()["id"]].agent_dispatch_id is None
+
+    def test_start_redispatches_after_failed_dispatch(self, monkeypatch):
+        lkapi = FakeLiveKitAPI(fail=True)
+        client, main = make_client(monkeypatch, lkapi)
+
+        async def fake_notify(room_name, message):
+            return True
+
+        async def no_agent(room_name, max_attempts=10, delay=1.0):
+            return False
+
+        monkeypatch.setattr(main, "notify_agent", fake_notify)
+        monkeypatch.setattr(main, "check_agent_in_room", no_agent)
+        session = client.post("/api/sessions").json()
+        lkapi.fail = False
+
+        assert client.post(f"/api/sessions/{session['id']}/start").status_code == 202
+
+        assert [kind for kind, _ in lkapi.requests] == ["room", "dispatch"]
+        assert main.sessions[session["id"]].agent_dispatch_id == "AD_test1"
+
+
+class TestJobMetadata:
+    """Test the agent side."""
+
+    def job(self, metadata="", room_metadata=""):
+        return SimpleNamespace(metadata=metadata, room=SimpleNamespace(metadata=room_metadata))
+
+    def test_dispatch_metadata_wins(self):
+        from moderator import job_metadata
+
+        job = self.job('{"sessionId": "abc123", "guideHash": "f00d"}', '{"sessionId": "other"}')
+
+        assert job_metadata(job) == {"sessionId": "abc123", "guideHash": "f00d"}
+
+    def test_falls_back_to_room_metadata(self):
+        from moderator import job_metadata
+
+        assert job_metadata(self.job("not json", '{"sessionId": "abc123"}')) == {"sessionId": "abc123"}
+        assert job_metadata(self.job()) == {}
+
+    def test_session_id_from_room_name(self):
+        from moderator import session_id_from_room
+
+        assert session_id_from_room("focusgroup-20261017120000-abc123") == "abc123"
+        assert session_id_from_room("focus-group-abc123") == "abc123"
+        assert session_id_from_room("lobby") == "lobby"
@@ -0,0 +1,111 @@
+"""
+Unit tests for the multi-signal end-of-turn detector.
+
+Tests:
+1. Sentence completeness heuristic
+2. Confidence combines VAD, finality, endpoint and completeness
+3. Hold time is short only when confident and VAD is not speaking
+4. Silence is measured from the latest speech activity
+"""
+
+import sys
+from pathlib import Path
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+
+class TestSentenceCompleteness:
+    """Test the local sentence-completeness check."""
+
+    def test_complete_sentences(self):
+        from end_of_turn import sentence_sounds_complete
+
+        for text in ["I think the price is too high.", "Honestly, I loved it!", "Yes", "no thanks",
+                     "Would you buy it again?"]:
+            assert sentence_sounds_complete(text), f"'{text}' should sound complete"
+
+    def test_incomplete_sentences(self):
+        from end_of_turn import sentence_sounds_complete
+
+        for text in ["", "I think the price is", "It was good and", "Well, um", "I mean...",
+                     "the packaging, the color,", "It was good because"]:
+            assert not sentence_sounds_complete(text), f"'{text}' should sound incomplete"
+
+
+class TestEndOfTurnDetector:
+    """Test signal fusion and hold-time decisions."""
+
+    def test_all_signals_reach_full_confidence(self):
+        from end_of_turn import EndOfTurnDetector
+
+        det = EndOfTurnDetector()
+        det.on_vad(True)
+        det.on_vad(False)
+        det.on_transcript("I liked the design.", is_final=True, speech_final=True)
+
+        assert det.confidence() == 1.0
+
+    def test_vad_final_and_complete_commit_quickly(self):
+        from end_of_turn import EndOfTurnDetector
+
+        det = EndOfTurnDetector(threshold=0.75, commit_seconds=0.3)
+        det.on_vad(True)
+        det.on_transcript("I liked the design.", is_final=True)
+        det.on_vad(False)
+
+        assert det.confidence() >= 0.75
+        assert det.hold_seconds(fallback=4.0) == 0.3
+        assert det.hold_seconds(fallback=4.0, floor=1.2) == 1.2  # the speaker's usual pause
+
+    def test_dangling_sentence_uses_fallback(self):
+        from end_of_turn import EndOfTurnDetector
+
+        det = EndOfTurnDetector(threshold=0.75)
+        det.on_vad(True)
+        det.on_transcript("I liked the design because", is_final=True)
+        det.on_vad(False)
+
+        assert det.confidence() < 0.75
+        assert det.hold_seconds(fallback=4.0) == 4.0
+
+    def test_vad_speaking_blocks_commit(self):
+        from end_of_turn import EndOfTurnDetector
+
+        det = EndOfTurnDetector(threshold=0.3)
+        det.on_transcript("I liked the design.", is_final=True)
+        det.on_vad(True)
+
+        assert det.hold_seconds(fallback=4.0) == 4.0
+
+    def test_listening_without_speaking_is_not_vad_end(self):
+        from end_of_turn import EndOfTurnDetector
+
+        det = EndOfTurnDetector()
+        det.on_vad(False)
+
+        assert det.vad_ended is False
+
+    def test_silence_measured_from_latest_activity(self):
+        from end_of_turn import EndOfTurnDetector
+
+        det = EndOfTurnDetector()
+        assert det.silence_elapsed() == float('inf')
+
+        det.on_transcript("Hello.", is_final=True, now=100.0)
+        det.on_vad(True, now=100.5)
+        det.on_vad(False, now=101.0)
+
+        assert abs(det.silence_elapsed(now=101.4) - 0.4) < 1e-9
+
+    def test_reset_clears_signals(self):
+        from end_of_turn import EndOfTurnDetector
+
+        det = EndOfTurnDetector()
+        det.on_vad(True)
+        det.on_vad(False)
+        det.on_transcript("Done.", is_final=True)
+        det.reset()
+
+        assert det.confidence() == 0
+        assert det.vad_speaking is False
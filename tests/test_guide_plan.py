@@ -0,0 +1,198 @@
+"""
+Unit tests for the compiled guide plan.
+
+Tests:
+1. Sections and questions flatten into steps in spoken order
+2. routing.include_if_group is applied per group type
+3. Steps are read-only and carry normalized speech
+4. Plans are cached by content hash; unchanged files skip parsing
+5. ModeratorState navigation runs on the plan, including routed guides
+6. run_discussion uses the step's question id, including the fallback for id-less questions
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+
+GUIDE = {
+    "meta": {"title": "**Coffee** Habits"},
+    "sections": [
+        {"id": "intro", "title": "Intro", "script_md": "Welcome, everyone.",
+         "questions": [{"id": "rc", "type": "rollcall", "text": "Please confirm consent."}]},
+        {"id": "break", "title": "Break", "script_md": "Let's take a short break."},
+        {"id": "students", "title": "Students", "routing": {"include_if_group": ["Students"]},
+         "questions": [{"id": "s1", "text": "How do you study?"}]},
+        {"id": "habits", "title": "Habits", "script_md": "Now, *habits*.",
+         "questions": [
+             {"id": "h1", "text": "How do you take it?"},
+             {"id": "h2", "type": "info", "script_md": "A quick note. Then more."},
+         ]},
+    ],
+}
+
+
+class TestCompile:
+    """Test flattening and routing."""
+
+    def test_flattens_in_spoken_order(self):
+        from guide_plan import compile_guide
+
+        plan = compile_guide(GUIDE, "Mixed")
+
+        assert plan[0].qid == "rc"
+        assert [(s.section_index, s.question_index) for s in plan.steps] == [(0, 0), (1, -1), (3, 0), (3, 1)]
+        assert [s.section_start for s in plan.steps] == [True, True, True, False]
+        assert plan.title == "Coffee Habits"
+
+    def test_routing_per_group_type(self):
+        from guide_plan import compile_guide
+
+        mixed = compile_guide(GUIDE, "Mixed")
+        students = compile_guide(GUIDE, "Students")
+
+        assert "s1" not in [s.qid for s in mixed.steps if s.question]
+        assert [s.qid for s in students.steps if s.question] == ["rc", "s1", "h1", "h2"]
+
+    def test_step_speech_is_normalized_and_read_only(self):
+        from guide_plan import compile_guide
+
+        plan = compile_guide(GUIDE, "Mixed")
+
+        assert plan[2].speech == ("Now, habits.", "How do you take it?")
+        assert plan[3].speech == ("A quick note.", "Then more.")
+        with pytest.raises(AttributeError):
+            plan[0].text = "changed"
+
+    def test_position_skips_excluded_sections(self):
+        from guide_plan import compile_guide
+
+        plan = compile_guide(GUIDE, "Mixed")
+
+        assert plan.position(3, 1) == 3
+        assert plan.position(2) == 2     # excluded section -> next included one
+        assert plan.position(3, 5) == 4  # past the last question -> end
+        assert plan.position(9) == len(plan)
+
+
+class TestPlanCache:
+    """Test content-hash caching."""
+
+    def test_same_content_reuses_plan(self):
+        import copy
+        from guide_plan import compile_guide
+
+        assert compile_guide(copy.deepcopy(GUIDE), "Mixed") is compile_guide(GUIDE, "Mixed")
+        assert compile_guide(GUIDE, "Students") is not compile_guide(GUIDE, "Mixed")
+
+    def test_unchanged_file_skips_parse(self, tmp_path, monkeypatch):
+        import guide_plan
+
+        path = tmp_path / "guide.json"
+        path.write_text(json.dumps(GUIDE))
+        first = guide_plan.load_guide_plan(str(path), "Mixed")
+
+        def no_parse(*args, **kwargs):
+            raise AssertionError("guide was parsed again")
+
+        monkeypatch.setattr(guide_plan.json, "loads", no_parse)
+        assert guide_plan.load_guide_plan(str(path), "Mixed") is first
+
+        path.write_text(json.dumps({**GUIDE, "meta": {"title": "Tea"}}))
+        monkeypatch.undo()
+        assert guide_plan.load_guide_plan(str(path), "Mixed").title == "Tea"
+
+    def test_large_guide_navigation(self):
+        from guide_plan import compile_guide
+
+        guide = {"sections": [{"questions": [{"id": f"q{s}_{q}", "text": f"Question {q}?"} for q in range(50)]}
+                              for s in range(10)]}
+        plan = compile_guide(guide, "Mixed")
+
+        assert len(plan) == 500
+        assert plan[plan.position(7, 25)].qid == "q7_25"
+
+
+class TestStateOnPlan:
+    """Test ModeratorState navigation over a routed guide."""
+
+    def test_walk_skips_routed_section(self):
+        import copy
+        from moderator import ModeratorState
+
+        state = ModeratorState()
+        state.guide = copy.deepcopy(GUIDE)
+        visited = []
+        while not state.is_complete():
+            section, question = state.get_current()
+            visited.append((section["id"], question["id"] if question else None))
+            state.advance()
+
+        assert visited == [("intro", "rc"), ("break", None), ("habits", "h1"), ("habits", "h2")]
+        assert state.section_idx == len(GUIDE["sections"])
+
+    def test_section_script_read_within_section(self):
+        import copy
+        from moderator import ModeratorState
+
+        state = ModeratorState()
+        state.guide = copy.deepcopy(GUIDE)
+        state.section_idx = 3
+        state.advance()
+
+        assert state.question_idx == 1
+        assert state.section_script_read is True
+
+    def test_speech_lines_respect_routing(self):
+        from moderator import guide_speech_lines
+
+        assert "How do you study?" not in guide_speech_lines(GUIDE, "Mixed")
+        assert "How do you study?" in guide_speech_lines(GUIDE, "Students")
+
+
+class TestDiscussionQuestionIds:
+    """Test that run_discussion and the plan agree on question ids."""
+
+    def test_fallback_id_matches_step(self, monkeypatch):
+        import moderator
+
+        guide = {
+            "meta": {"title": "Coffee"},
+            "sections": [
+                {"id": "intro", "script_md": "Welcome."},
+                {"id": "notes", "questions": [
+                    {"type": "info", "script_md": "A quick note."},
+                    {"id": "named", "type": "info", "script_md": "Another note."},
+                    {"type": "closing", "script_md": "That's all."},
+                ]},
+            ],
+        }
+        began = []
+
+        async def fake_speak(session, text, **kwargs):
+            return None
+
+        async def no_gap(name):
+            return None
+
+        def fake_log(event, **fields):
+            if event == "QUESTION_BEGIN":
+                began.append(fields["qid"])
+
+        monkeypatch.setattr(moderator, "speak", fake_speak)
+        monkeypatch.setattr(moderator, "log_event", fake_log)
+        state = moderator.ModeratorState()
+        state.guide = guide
+        monkeypatch.setattr(state.pacer, "gap", no_gap)
+
+        asyncio.run(moderator.run_discussion(state, None, None))
+
+        # Step indexes count the question-less intro, so the fallback is q1, not q0
+        assert began == ["q1", "named", "q3"]
+        assert began == [step.qid for step in state.plan.steps if step.question is not None]
@@ -0,0 +1,221 @@
+"""
+Unit tests for the shared guide registry.
+
+Tests:
+1. The API re-reads a guide only when its stat changes, and re-parses only new bytes
+2. Sessions record the content hash and serve their guide with ETag / 304
+3. The agent fetches by session and revalidates against plans it already holds
+4. Uploaded guides are stored by content hash and selected per session
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add services/agent and services/api to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "api"))
+
+
+GUIDE = {
+    "meta": {"title": "Coffee"},
+    "sections": [{"id": "s1", "questions": [{"id": "q1", "text": "How do you take it?"}]}],
+}
+
+
+def write_guide(path, guide):
+    path.write_text(json.dumps(guide))
+    return str(path)
+
+
+class TestGuideRegistry:
+    """Test stat-based invalidation and hash keying."""
+
+    def test_unchanged_file_is_not_reread(self, tmp_path):
+        import main
+
+        registry = main.GuideRegistry(None)
+        path = write_guide(tmp_path / "guide.json", GUIDE)
+
+        first = registry.load(path)
+        assert registry.load(path) is first
+        assert (registry.reads, registry.parses) == (1, 1)
+        assert registry.get(first.hash) is first
+        assert first.title == "Coffee"
+
+    def test_changed_file_is_reparsed_and_old_hash_kept(self, tmp_path):
+        import main
+
+        registry = main.GuideRegistry(None)
+        path = write_guide(tmp_path / "guide.json", GUIDE)
+        first = registry.load(path)
+
+        write_guide(tmp_path / "guide.json", {**GUIDE, "meta": {"title": "Tea"}})
+        os.utime(path, ns=(0, 0))
+        second = registry.load(path)
+
+        assert second.hash != first.hash and second.title == "Tea"
+        assert registry.get(first.hash) is first
+
+    def test_touched_file_with_same_bytes_is_not_reparsed(self, tmp_path):
+        import main
+
+        registry = main.GuideRegistry(None)
+        path = write_guide(tmp_path / "guide.json", GUIDE)
+        first = registry.load(path)
+        os.utime(path, ns=(0, 0))
+
+        assert registry.load(path) is first
+        assert (registry.reads, registry.parses) == (2, 1)
+
+    def test_missing_or_invalid_file(self, tmp_path):
+        import main
+
+        registry = main.GuideRegistry(None)
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+
+        assert registry.load(None) is None
+        assert registry.load(str(tmp_path / "missing.json")) is None
+        assert registry.load(str(bad)) is None
+
+
+class TestGuideEndpoints:
+    """Test session guide hash and ETag revalidation."""
+
+    def make_client(self, tmp_path, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        monkeypatch.setattr(main, "GUIDE_FILE", write_guide(tmp_path / "guide.json", GUIDE))
+        monkeypatch.setattr(main, "guide_registry", main.GuideRegistry(str(tmp_path / "store")))
+        return TestClient(main.app), main
+
+    def test_session_guide_etag_and_304(self, tmp_path, monkeypatch):
+        client, main = self.make_client(tmp_path, monkeypatch)
+        session = client.post("/api/sessions").json()
+
+        resp = client.get(f"/api/sessions/{session['id']}/guide")
+        assert resp.status_code == 200
+        assert resp.json() == GUIDE
+        assert resp.headers["etag"] == f'"{session["guideHash"]}"'
+
+        cached = client.get(f"/api/sessions/{session['id']}/guide",
+                            headers={"If-None-Match": f'"other", {resp.headers["etag"]}'})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == resp.headers["etag"]
+
+    def test_guide_info_and_by_hash(self, tmp_path, monkeypatch):
+        client, main = self.make_client(tmp_path, monkeypatch)
+
+        info = client.get("/api/guide").json()
+        assert (info["title"], info["sections"], info["questions"]) == ("Coffee", 1, 1)
+        assert client.get(f"/api/guides/{info['hash']}").json() == GUIDE
+        assert client.get("/api/guides/nope").status_code == 404
+
+        client.post("/api/sessions")
+        client.post("/api/sessions")
+        assert main.guide_registry.parses == 1
+
+
+class FakeHTTP:
+    """Minimal aiohttp.ClientSession stand-in backed by a TestClient."""
+
+    def __init__(self, client):
+        self.client = client
+        self.requests = []
+
+    def get(self, url, headers=None):
+        client, requests = self.client, self.requests
+
+        class Ctx:
+            async def __aenter__(self):
+                requests.append(dict(headers or {}))
+                self.resp = client.get(url, headers=headers or {})
+                self.status = self.resp.status_code
+                self.headers = self.resp.headers
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def read(self):
+                return self.resp.content
+
+        return Ctx()
+
+
+class TestAgentFetch:
+    """Test the agent-side fetch and revalidation."""
+
+    def test_fetch_then_revalidate(self, tmp_path, monkeypatch):
+        import guide_plan
+
+        client, main = TestGuideEndpoints().make_client(tmp_path, monkeypatch)
+        monkeypatch.setattr(guide_plan, "_plans", guide_plan.OrderedDict())
+        session = client.post("/api/sessions").json()
+        http = FakeHTTP(client)
+        url = f"/api/sessions/{session['id']}/guide"
+
+        first = asyncio.run(guide_plan.fetch_guide_plan(http, url, "Mixed"))
+        assert first.guide_hash == session["guideHash"]
+        assert http.requests[0] == {}
+
+        again = asyncio.run(guide_plan.fetch_guide_plan(http, url, "Mixed"))
+        assert again is first
+        assert http.requests[1]["If-None-Match"] == f'"{first.guide_hash}"'
+
+        # A 304 for another group type compiles from the held guide
+        other = asyncio.run(guide_plan.fetch_guide_plan(http, url, "Students"))
+        assert other.guide is first.guide and other.group_type == "Students"
+
+    def test_fetch_unknown_session(self, tmp_path, monkeypatch):
+        import guide_plan
+
+        client, main = TestGuideEndpoints().make_client(tmp_path, monkeypatch)
+
+        assert asyncio.run(guide_plan.fetch_guide_plan(FakeHTTP(client), "/api/sessions/nope/guide")) is None
+
+
+class TestGuideUpload:
+    """Test the content-addressed store and per-session guide selection."""
+
+    def test_upload_is_content_addressed(self, tmp_path, monkeypatch):
+        client, main = TestGuideEndpoints().make_client(tmp_path, monkeypatch)
+        body = json.dumps({**GUIDE, "meta": {"title": "Tea"}})
+
+        created = client.post("/api/guides", content=body)
+        again = client.post("/api/guides", content=body)
+
+        assert (created.status_code, again.status_code) == (201, 200)
+        assert created.json()["hash"] == again.json()["hash"]
+        assert (tmp_path / "store" / f"{created.json()['hash']}.json").read_text() == body
+        assert client.post("/api/guides", content="{}").status_code == 400
+        assert client.post("/api/guides", content="not json").status_code == 400
+
+    def test_session_selects_uploaded_guide(self, tmp_path, monkeypatch):
+        client, main = TestGuideEndpoints().make_client(tmp_path, monkeypatch)
+        tea = {**GUIDE, "meta": {"title": "Tea"}}
+        uploaded = client.post("/api/guides", json=tea).json()
+
+        default = client.post("/api/sessions").json()
+        chosen = client.post("/api/sessions", json={"guideId": uploaded["id"]}).json()
+
+        assert default["guideTitle"] == "Coffee"
+        assert (chosen["guideId"], chosen["guideHash"], chosen["guideTitle"]) == (
+            uploaded["id"], uploaded["hash"], "Tea")
+        assert client.get(f"/api/sessions/{chosen['id']}/guide").json() == tea
+        assert client.post("/api/sessions", json={"guideId": "deadbeef00"}).status_code == 404
+
+    def test_stored_guide_survives_restart(self, tmp_path, monkeypatch):
+        import main
+
+        store = str(tmp_path / "store")
+        entry, _ = main.GuideRegistry(store).put(json.dumps(GUIDE).encode())
+        fresh = main.GuideRegistry(store)
+
+        assert fresh.get(entry.hash).guide == GUIDE
+        assert fresh.resolve(entry.id).hash == entry.hash
+        assert fresh.resolve(entry.id[:4]) is None  # too short to be an ID
@@ -0,0 +1,110 @@
+"""
+Unit tests for the streaming intent matcher.
+
+Tests:
+1. Each intent is recognised from its phrases; normal answers match nothing
+2. Phrases split across final segments still match
+3. Interim results only count until the next interim or final replaces them
+4. The turn controller's repeat check reads the matcher, and resets per turn
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+
+def fed(*finals):
+    from intent_matcher import IntentMatcher
+
+    matcher = IntentMatcher()
+    for text in finals:
+        matcher.feed(text)
+    return matcher
+
+
+class TestIntents:
+    """Test single-pass matching of every intent."""
+
+    def test_phrases_map_to_intents(self):
+        cases = {
+            "Sorry, could you repeat the question?": ["repeat"],
+            "Pardon me": ["repeat"],
+            "Honestly I don't know.": ["dont_know"],
+            "No idea, really": ["dont_know"],
+            "By the way, did anyone watch the game?": ["off_topic"],
+            "I don't know, can you say that again": ["repeat", "dont_know"],
+        }
+        for text, intents in cases.items():
+            assert fed(text).intents() == intents, text
+
+    def test_normal_answers_match_nothing(self):
+        for text in ["I think the product is great", "The onboarding felt slow but fine",
+                     "I would recommend it to friends", "Repeatedly, the app crashed"]:
+            assert fed(text).intents() == [], text
+
+    def test_same_result_as_separate_searches(self):
+        from intent_matcher import INTENT_PATTERNS
+
+        texts = ["can you repeat that", "i didn't catch that", "not sure honestly",
+                 "this is unrelated but", "my answer is yes", "come again?"]
+        for text in texts:
+            expected = [intent for intent, patterns in INTENT_PATTERNS.items()
+                        if any(re.search(p, text) for p in patterns)]
+            assert fed(text).intents() == expected, text
+
+
+class TestStreaming:
+    """Test incremental feeding."""
+
+    def test_phrase_split_across_finals(self):
+        matcher = fed("I liked it but what was", "the question again")
+
+        assert matcher.matched("repeat")
+
+    def test_tail_is_bounded(self):
+        matcher = fed("word " * 500, "again")
+
+        assert len(matcher._tail) <= 40
+        assert not matcher.matched("repeat")
+
+    def test_interim_replaced_by_final(self):
+        matcher = fed("The price")
+        matcher.feed("The price, pardon", is_final=False)
+        assert matcher.matched("repeat")
+
+        matcher.feed("The price, partly", is_final=False)
+        assert not matcher.matched("repeat")
+
+        matcher.feed("The price, partly.")
+        assert matcher.intents() == []
+
+
+class TestTurnIntegration:
+    """Test the controllers' use of the matcher."""
+
+    def test_turn_controller_repeat_and_reset(self):
+        from moderator import TurnController
+
+        tc = TurnController()
+        tc.start_turn("p1", "Alice", "Question")
+        tc.on_speech_detected("could you say that", is_final=True)
+        tc.on_speech_detected("again", is_final=False)
+        assert tc.is_asking_to_repeat()
+        assert tc.intents.intents() == ["repeat"]
+
+        tc.start_turn("p1", "Alice", "Question")
+        tc.on_speech_detected("I think it's fine")
+        assert not tc.is_asking_to_repeat()
+
+    def test_question_context_dont_know(self):
+        from moderator import QuestionContext
+
+        ctx = QuestionContext()
+        ctx.add_transcript("hmm, I really don't know")
+        assert ctx.intents.matched("dont_know") and not ctx.is_asking_to_repeat()
+
+        ctx.reset()
+        assert ctx.intents.intents() == []
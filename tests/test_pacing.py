@@ -0,0 +1,88 @@
+"""
+Unit tests for playout-driven pacing.
+
+Tests:
+1. Profiles cover every gap and legacy matches the old fixed sleeps
+2. Gaps are counted from the end of the last playout
+3. Time saved versus the legacy schedule is accumulated
+4. Unknown profile names fall back to natural
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+
+class TestPacingProfiles:
+    """Test the named profiles."""
+
+    def test_tight_is_never_slower_than_natural_or_legacy(self):
+        from pacing import PROFILES, GAP_NAMES
+
+        for name in GAP_NAMES:
+            tight, natural, legacy = (getattr(PROFILES[p], name) for p in ("tight", "natural", "legacy"))
+            assert tight <= natural <= legacy, name
+
+    def test_legacy_matches_fixed_sleeps(self):
+        from pacing import PROFILES
+
+        legacy = PROFILES["legacy"]
+        assert (legacy.after_intro, legacy.after_question, legacy.after_prompt) == (2.0, 1.0, 0.5)
+
+    def test_unknown_profile_falls_back(self):
+        from pacing import get_profile
+
+        assert get_profile("nope").name == "natural"
+
+
+class TestPacer:
+    """Test playout-anchored gaps and time-saved accounting."""
+
+    def test_gap_counts_from_playout_end(self):
+        from pacing import Pacer, PROFILES
+
+        async def run_test():
+            pacer = Pacer(PROFILES["legacy"])
+            pacer.on_agent_state("speaking")
+            pacer.on_agent_state("listening")
+            await asyncio.sleep(0.3)
+
+            started = time.time()
+            await pacer.gap("after_prompt")  # 0.5s gap, 0.3s already elapsed since playout
+            assert 0.1 <= time.time() - started < 0.3
+
+        asyncio.run(run_test())
+
+    def test_gap_is_full_while_playout_state_is_pending(self):
+        from pacing import Pacer, PROFILES
+
+        async def run_test():
+            pacer = Pacer(PROFILES["tight"])
+            pacer.on_agent_state("speaking")
+            pacer.on_agent_state("listening")
+            await asyncio.sleep(0.2)
+            pacer.on_agent_state("speaking")  # next utterance still playing
+
+            started = time.time()
+            await pacer.gap("after_question")
+            assert time.time() - started >= 0.15
+
+        asyncio.run(run_test())
+
+    def test_saved_time_versus_legacy(self):
+        from pacing import Pacer, PROFILES
+
+        async def run_test():
+            pacer = Pacer(PROFILES["tight"])
+            await pacer.gap("between_participants")  # tight 0.0 vs legacy 0.5
+            await pacer.gap("after_step")            # tight 0.1 vs legacy 1.0
+            summary = pacer.summary()
+            assert summary["profile"] == "tight"
+            assert summary["gaps"] == 2
+            assert summary["saved_s"] == 1.4
+
+        asyncio.run(run_test())
@@ -0,0 +1,86 @@
+"""
+Unit tests for the per-participant pause model.
+
+Tests:
+1. Short gaps (interim cadence) are not recorded as pauses
+2. Threshold falls back until enough pauses are seen
+3. Threshold is a clamped high percentile plus margin
+4. Confident end-of-turn floor needs evidence and follows the pause percentile
+5. False end-of-turn rate
+"""
+
+import sys
+from pathlib import Path
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+
+class TestPauseModel:
+    """Test pause history and threshold derivation."""
+
+    def test_short_gaps_are_ignored(self):
+        from pause_model import PauseModel
+
+        model = PauseModel()
+        assert model.record_pause(0.1) is False
+        assert model.record_pause(0.8) is True
+        assert list(model.pauses) == [0.8]
+
+    def test_fallback_until_min_samples(self):
+        from pause_model import PauseModel, PAUSE_MIN_SAMPLES
+
+        model = PauseModel()
+        for _ in range(PAUSE_MIN_SAMPLES - 1):
+            model.record_pause(1.0)
+        assert model.threshold(4.0) == 4.0
+        model.record_pause(1.0)
+        assert model.threshold(4.0) != 4.0
+
+    def test_threshold_is_clamped_percentile_plus_margin(self):
+        from pause_model import (PauseModel, PAUSE_MARGIN_SECONDS,
+                                 END_OF_SPEECH_MIN_SECONDS, END_OF_SPEECH_MAX_SECONDS)
+
+        model = PauseModel()
+        for gap in [1.0, 1.2, 1.4, 1.6, 1.8, 2.0, 2.2, 2.4, 2.6, 3.0]:
+            model.record_pause(gap)
+        assert model.percentile(0.9) == 2.6
+        assert model.threshold(4.0) == round(2.6 + PAUSE_MARGIN_SECONDS, 2)
+
+        quick = PauseModel()
+        for _ in range(10):
+            quick.record_pause(0.3)
+        assert quick.threshold(4.0) == END_OF_SPEECH_MIN_SECONDS
+
+        slow = PauseModel()
+        for _ in range(10):
+            slow.record_pause(30.0)
+        assert slow.threshold(4.0) == END_OF_SPEECH_MAX_SECONDS
+
+    def test_min_hold_needs_evidence(self):
+        from pause_model import PauseModel, PAUSE_MIN_SAMPLES
+
+        model = PauseModel()
+        for _ in range(PAUSE_MIN_SAMPLES - 1):
+            model.record_pause(1.2)
+        assert model.min_hold(4.0) == 4.0  # no evidence: never below the threshold
+        model.record_pause(1.2)
+        assert model.min_hold(4.0) == 1.2
+        assert model.min_hold(1.0) == 1.0  # never above the threshold either
+
+    def test_history_is_bounded(self):
+        from pause_model import PauseModel
+
+        model = PauseModel(history=3)
+        for gap in [5.0, 5.0, 5.0, 0.5, 0.5, 0.5]:
+            model.record_pause(gap)
+        assert list(model.pauses) == [0.5, 0.5, 0.5]
+
+    def test_false_eot_rate(self):
+        from pause_model import PauseModel
+
+        model = PauseModel()
+        assert model.false_eot_rate() == 0.0
+        model.eot_commits = 4
+        model.false_eots = 1
+        assert model.false_eot_rate() == 0.25
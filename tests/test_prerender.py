@@ -0,0 +1,299 @@
+"""
+Unit tests for guide audio pre-rendering.
+
+Tests:
+1. Guide lines are listed in spoken order
+2. Lines start synthesizing in spoken order with bounded concurrency
+3. Already-cached and duplicate lines are counted, not re-synthesized
+4. Live playback waits for an in-flight pre-render instead of duplicating it
+5. Progress is reported through session status
+6. Participant phrases are queued once per participant and evicted at session end
+7. Join notifies the agent
+8. Lookahead predicts and fills the next utterances, and drops them on a branch
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add services/agent and services/api to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "api"))
+
+GUIDE = {
+    "meta": {"title": "Coffee"},
+    "sections": [
+        {"script_md": "**Welcome** to the group.", "questions": [
+            {"id": "consent", "type": "rollcall", "text": "Do you consent?"},
+        ]},
+        {"script_md": "", "questions": [
+            {"id": "q1", "type": "question", "text": "How do you take it?"},
+            {"id": "q2", "type": "question", "text": "Where do you buy it?"},
+            {"id": "end", "type": "closing", "script_md": "That's all."},
+        ]},
+    ],
+}
+
+
+class SlowTTS:
+    """Fake TTS plugin that records when each synthesis starts and how many overlap."""
+
+    def __init__(self, delay=0.02):
+        from livekit import rtc
+        self.frame = rtc.AudioFrame(b"\x00\x00" * 240, 24000, 1, 240)
+        self.delay = delay
+        self.started = []
+        self.active = 0
+        self.max_active = 0
+
+    def synthesize(self, text):
+        tts = self
+
+        class Stream:
+            async def __aenter__(self):
+                tts.started.append(text)
+                tts.active += 1
+                tts.max_active = max(tts.max_active, tts.active)
+                return self
+
+            async def __aexit__(self, *exc):
+                tts.active -= 1
+                return False
+
+            def __aiter__(self):
+                return self._gen()
+
+            async def _gen(self):
+                await asyncio.sleep(tts.delay)
+                yield type("Audio", (), {"frame": tts.frame})()
+
+        return Stream()
+
+
+class TestGuideSpeechLines:
+    """Test which lines are pre-rendered and in what order."""
+
+    def test_lines_follow_spoken_order(self):
+        from moderator import (guide_speech_lines, SPEECH_WELCOME, SPEECH_ROLLCALL_DONE,
+                               SPEECH_WRAPUP_PROMPT, SPEECH_CLOSING)
+
+        lines = guide_speech_lines(GUIDE)
+
+        assert lines[0] == SPEECH_WELCOME
+        assert lines[1] == "Let's begin our discussion on Coffee."
+        order = [lines.index(x) for x in ["Welcome to the group.", "Do you consent?",
+                                          SPEECH_ROLLCALL_DONE, "How do you take it?",
+                                          SPEECH_WRAPUP_PROMPT, "Where do you buy it?",
+                                          "That's all.", SPEECH_CLOSING]]
+        assert order == sorted(order)
+        assert "" not in lines
+        assert not any("{" in line for line in lines)
+
+
+class TestPrerenderer:
+    """Test ordering, concurrency bound and cache accounting."""
+
+    def test_spoken_order_with_bounded_concurrency(self, tmp_path):
+        from prerender import Prerenderer
+        from tts_cache import TTSCache
+
+        async def run_test():
+            tts = SlowTTS()
+            texts = [f"Line {i}." for i in range(8)]
+            progress = await Prerenderer(TTSCache(str(tmp_path)), tts, "echo", "m",
+                                         concurrency=3).run(texts)
+
+            assert tts.started == texts
+            assert tts.max_active == 3
+            assert progress.to_dict()["coverage"] == 1.0
+            assert progress.to_dict()["done"] is True
+
+        asyncio.run(run_test())
+
+    def test_cached_and_duplicate_lines_are_skipped(self, tmp_path):
+        from prerender import Prerenderer
+        from tts_cache import TTSCache
+
+        async def run_test():
+            cache = TTSCache(str(tmp_path))
+            await Prerenderer(cache, SlowTTS(), "echo", "m").run(["Hello."])
+
+            tts = SlowTTS()
+            reports = []
+
+            async def on_progress(progress):
+                reports.append(progress.to_dict())
+
+            progress = await Prerenderer(cache, tts, "echo", "m", on_progress=on_progress).run(
+                ["Hello.", "**Hello.**", "Goodbye.", ""])
+
+            assert tts.started == ["Goodbye."]
+            assert (progress.total, progress.cached, progress.rendered) == (2, 1, 1)
+            assert reports[0]["coverage"] == 0.5
+            assert reports[-1]["coverage"] == 1.0 and reports[-1]["done"]
+
+        asyncio.run(run_test())
+
+    def test_live_playback_waits_for_inflight_fill(self, tmp_path):
+        from tts_cache import TTSCache
+
+        async def run_test():
+            cache = TTSCache(str(tmp_path))
+            tts = SlowTTS(delay=0.05)
+            fill = asyncio.ensure_future(cache.fill(tts, "echo", "m", "Thank you."))
+            await asyncio.sleep(0.01)
+
+            frames = [f async for f in cache.audio(tts, "echo", "m", "Thank you.")]
+
+            assert await fill is True
+            assert len(frames) == 1
+            assert tts.started == ["Thank you."]
+
+        asyncio.run(run_test())
+
+
+class TestPrerenderStatus:
+    """Test the API side of pre-render reporting."""
+
+    def test_status_includes_reported_prerender(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        async def no_participants(room_name):
+            return []
+
+        monkeypatch.setattr(main, "list_room_participants", no_participants)
+        client = TestClient(main.app)
+        session_id = client.post("/api/sessions").json()["id"]
+
+        assert client.get(f"/api/sessions/{session_id}/status").json()["prerender"] is None
+
+        report = {"total": 10, "ready": 4, "failed": 0, "coverage": 0.4, "elapsedMs": 900, "done": False}
+        assert client.post(f"/api/sessions/{session_id}/agent-status",
+                           json={"prerender": report}).status_code == 200
+        assert client.get(f"/api/sessions/{session_id}/status").json()["prerender"] == report
+
+        assert client.post("/api/sessions/missing/agent-status", json={}).status_code == 404
+
+
+class TestParticipantPhrases:
+    """Test per-participant name-templated phrase pre-synthesis."""
+
+    def test_phrases_render_once_and_evict(self, tmp_path):
+        from moderator import ModeratorState, PARTICIPANT_SPEECH_LINES, SPEECH_CONSENT
+        from prerender import ParticipantPhrases
+        from speech_text import split_sentences
+        from tts_cache import TTSCache, cache_key
+
+        # Sentences without the name ("Thank you for sharing.") are shared between participants
+        rendered = {sentence for name in ("Dana", "Lee") for line in PARTICIPANT_SPEECH_LINES
+                    for sentence in split_sentences(line.format(name=name))}
+        shared = {sentence for sentence in rendered if "Dana" not in sentence and "Lee" not in sentence}
+        sentences = len(rendered)
+
+        async def run_test():
+            cache = TTSCache(str(tmp_path))
+            tts = SlowTTS()
+            state = ModeratorState()
+            state.phrases = ParticipantPhrases(cache, tts, "echo", "m")
+
+            assert state.queue_participant_phrases("dana_1", "Dana") is True
+            assert state.queue_participant_phrases("lee_2", "Lee") is True
+            assert state.queue_participant_phrases("dana_1", "Dana") is False
+            await state.phrases.wait_idle()
+
+            assert len(tts.started) == sentences
+            assert tts.started[0] == SPEECH_CONSENT.format(name="Dana")
+            assert cache_key("echo", "m", "Thank you, Lee.") in cache
+
+            # Only the named sentences go; shared ones stay for other sessions
+            assert shared and await state.phrases.evict() == sentences - len(shared)
+            assert len(cache) == len(shared)
+            assert all(cache_key("echo", "m", sentence) in cache for sentence in shared)
+            assert cache_key("echo", "m", "Thank you, Lee.") not in cache
+            assert len(list(tmp_path.glob("*/*.pcm"))) == len(shared)
+
+        asyncio.run(run_test())
+
+    def test_without_phrase_queue_is_noop(self):
+        from moderator import ModeratorState
+
+        assert ModeratorState().queue_participant_phrases("dana_1", "Dana") is False
+
+    def test_join_notifies_agent(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        sent = []
+
+        async def fake_notify(room_name, message):
+            sent.append((room_name, message))
+            return True
+
+        monkeypatch.setattr(main, "notify_agent", fake_notify)
+        monkeypatch.setattr(main, "LIVEKIT_API_KEY", "key")
+        monkeypatch.setattr(main, "LIVEKIT_API_SECRET", "secret-secret-secret-secret-secret")
+        client = TestClient(main.app)
+        session = client.post("/api/sessions").json()
+
+        joined = client.post(f"/api/sessions/{session['id']}/join", json={"displayName": "Dana Reyes"}).json()
+
+        assert sent == [(session["roomName"], {
+            "type": "participant_joined",
+            "identity": joined["identity"],
+            "displayName": "Dana Reyes",
+        })]
+
+
+class TestLookahead:
+    """Test next-utterance prediction and speculative synthesis."""
+
+    def make_state(self):
+        import copy
+        from moderator import ModeratorState
+
+        state = ModeratorState()
+        state.guide = copy.deepcopy(GUIDE)
+        state.participants = {
+            "dana_1": {"identity": "dana_1", "displayName": "Dana"},
+            "lee_2": {"identity": "lee_2", "displayName": "Lee"},
+        }
+        return state
+
+    def test_predicts_handoff_then_next_question(self):
+        from moderator import SPEECH_NEXT_TURN, SPEECH_QUESTION_DONE, SPEECH_CLOSING
+
+        state = self.make_state()
+        state.section_idx, state.question_idx = 1, 0  # "How do you take it?"
+
+        assert state.predict_next_utterances("dana_1") == [SPEECH_NEXT_TURN.format(name="Lee")]
+        assert state.predict_next_utterances("lee_2") == [SPEECH_QUESTION_DONE, "Where do you buy it?"]
+
+        state.section_idx, state.question_idx = 0, 0  # rollcall; next section has no script
+        assert state.peek_next_utterance() == "How do you take it?"
+        state.section_idx, state.question_idx = 1, 2  # last question of the guide
+        assert state.peek_next_utterance() == SPEECH_CLOSING
+
+    def test_schedule_fills_and_cancel_drops(self, tmp_path):
+        from prerender import Lookahead
+        from tts_cache import TTSCache, cache_key
+
+        async def run_test():
+            cache = TTSCache(str(tmp_path))
+            tts = SlowTTS(delay=0.05)
+            lookahead = Lookahead(cache, tts, "echo", "m", depth=2)
+
+            lookahead.schedule(["Thank you all for sharing. Let's move on.", "Next question?", "Ignored."])
+            await lookahead.wait_idle()
+            assert tts.started == ["Thank you all for sharing.", "Let's move on.", "Next question?"]
+            assert cache_key("echo", "m", "Next question?") in cache
+
+            lookahead.schedule(["Branch one.", "Branch two."])
+            await asyncio.sleep(0.01)
+            assert lookahead.cancel("repeat") is True
+            await asyncio.sleep(0.1)
+            assert "Branch two." not in tts.started
+            assert cache_key("echo", "m", "Branch one.") not in cache
+            assert lookahead.cancel() is False
+
+        asyncio.run(run_test())
@@ -0,0 +1,145 @@
+"""
+Unit tests for speculative follow-up probes.
+
+Tests:
+1. Drafting starts only past the answer-length threshold and follows new segments
+2. commit() returns a draft of the whole answer; stale drafts are discarded
+3. Drafts that overrun the latency budget are dropped
+4. The turn engine feeds the drafter only for turns that allow a probe
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+ANSWER = ["I mostly use the app on my commute.", "The offline maps are the best part."]
+
+
+def make_probe(delay=0.0, **kwargs):
+    from probes import SpeculativeProbe, StubProbeBackend
+
+    drafted = []
+    probe = SpeculativeProbe(StubProbeBackend(delay), on_draft=drafted.append, **kwargs)
+    probe.reset("How do you use the app?")
+    return probe, drafted
+
+
+class TestStubBackend:
+    """Test the deterministic backend."""
+
+    def test_asks_about_last_content_words(self):
+        from probes import StubProbeBackend, clean_probe
+
+        backend = StubProbeBackend()
+        probe = asyncio.run(backend.draft("Q", " ".join(ANSWER)))
+
+        assert probe == "Could you say more about maps best part?"
+        assert asyncio.run(backend.draft("Q", "um, yeah")) == "Could you say a bit more about that?"
+        assert clean_probe('"**Why** was that?" Thanks.') == "Why was that?"
+
+
+class TestSpeculativeProbe:
+    """Test drafting, committing and discarding."""
+
+    @pytest.mark.asyncio
+    async def test_drafts_after_threshold_and_commits(self):
+        probe, drafted = make_probe(min_answer_seconds=5)
+
+        probe.update(ANSWER[0], answer_duration=2)
+        await asyncio.sleep(0.01)
+        assert probe.backend.calls == 0
+
+        probe.update(ANSWER[0], answer_duration=6)
+        await asyncio.sleep(0.01)
+        probe.update(" ".join(ANSWER), answer_duration=1)  # already drafting: no threshold
+        await asyncio.sleep(0.01)
+
+        assert probe.backend.calls == 2 and len(drafted) == 2
+        assert await probe.commit(" ".join(ANSWER)) == "Could you say more about maps best part?"
+        assert not probe.active and probe.committed == 1
+
+    @pytest.mark.asyncio
+    async def test_one_draft_in_flight(self):
+        probe, drafted = make_probe(delay=0.05, min_answer_seconds=0)
+        answer = ""
+        for n in range(5):
+            answer += f" Point {n}."
+            probe.update(answer.strip(), answer_duration=10)
+            await asyncio.sleep(0.005)
+
+        result = await probe.commit(answer.strip())
+
+        assert probe.backend.calls == 2  # first segment, then the latest answer
+        assert result == "Could you say more about point 4?"
+
+    @pytest.mark.asyncio
+    async def test_stale_draft_discarded(self):
+        probe, _ = make_probe(delay=0.05, min_answer_seconds=0, commit_wait=0.01)
+        probe.update("Short start.", answer_duration=10)
+        await asyncio.sleep(0.08)
+
+        long_answer = "Short start. " + "And then a lot more happened after that. " * 3
+        assert await probe.commit(long_answer) is None
+        assert probe.discarded == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_overrun_dropped(self):
+        probe, drafted = make_probe(delay=0.2, min_answer_seconds=0, budget=0.05)
+        probe.update(ANSWER[0], answer_duration=10)
+        await asyncio.sleep(0.1)
+
+        assert probe.timeouts == 1 and drafted == []
+        assert await probe.commit(ANSWER[0]) is None
+
+    @pytest.mark.asyncio
+    async def test_discard_cancels_in_flight(self):
+        probe, drafted = make_probe(delay=0.05, min_answer_seconds=0)
+        probe.update(ANSWER[0], answer_duration=10)
+        probe.discard("repeat")
+        await asyncio.sleep(0.08)
+
+        assert drafted == [] and probe.discarded == 1 and not probe.active
+
+
+class TestTurnEngineProbe:
+    """Test drafting during a real turn."""
+
+    async def run_turn(self, probe_turn):
+        from moderator import ModeratorState, TurnEngine, TurnEventKind, wait_for_turn_completion
+
+        class Session:
+            def say(self, text, **kwargs):
+                raise RuntimeError("no audio in tests")
+
+        state = ModeratorState()
+        state.probe, _ = make_probe(min_answer_seconds=0)
+        state.turn_engine = TurnEngine(state, Session())
+        state.turn_controller.start_turn("p1", "Alice", "How do you use the app?", "q1")
+        for text in ANSWER:
+            state.turn_controller.on_speech_detected(text, True)
+            state.turn_engine.post(TurnEventKind.TRANSCRIPT, text=text, is_final=True)
+
+        with patch("moderator.END_OF_SPEECH_SILENCE", 0.2), patch("moderator.EOT_DETECTOR_ENABLED", False):
+            result = await asyncio.wait_for(
+                wait_for_turn_completion(state, Session(), "q1", 0, "Alice", probe=probe_turn), 3.0)
+        await state.turn_engine.stop()
+        return result, await state.probe.commit(" ".join(state.turn_controller.transcripts))
+
+    @pytest.mark.asyncio
+    async def test_probe_drafted_during_answer(self):
+        result, probe = await self.run_turn(True)
+
+        assert result == (True, False, "answer")
+        assert probe == "Could you say more about maps best part?"
+
+    @pytest.mark.asyncio
+    async def test_no_probe_when_not_requested(self):
+        result, probe = await self.run_turn(False)
+
+        assert result == (True, False, "answer") and probe is None
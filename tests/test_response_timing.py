@@ -6,10 +6,13 @@ Tests:
 2. No answer → triggers timeout and advances with no-response
 3. Timer cancellation when speech detected
 4. Repeat request detection
-5. TurnController turn_id guards and task management
+5. TurnController turn_id guards and deadline management
 6. Silence prompt and skip behavior
 7. Long-answer wrapup behavior
 8. Ghost timer prevention
+9. TurnEngine single-queue turn completion
+10. Per-participant end-of-speech silence and false end-of-turn counting
+11. Transcript ingestion: interim results are activity only, finals are the text
 """
 
 import pytest
@@ -217,107 +220,111 @@ class TestTurnController:
         assert "hello" in tc.transcripts
     
     def test_on_speech_detected_cancels_silence_timers(self):
-        """on_speech_detected should cancel silence timers."""
+        """on_speech_detected should cancel silence deadlines."""
         from moderator import TurnController
         
         async def run_test():
             tc = TurnController()
             tc.start_turn("p1", "Alice", "Question")
             
-            # Create fake silence tasks
-            async def fake_task():
-                await asyncio.sleep(10)
-            
-            tc.silence_prompt_task = asyncio.create_task(fake_task())
-            tc.silence_grace_task = asyncio.create_task(fake_task())
+            fired = []
+            tc.arm_deadline("silence_prompt", 0.1, lambda name, seq: fired.append(name))
+            tc.arm_deadline("silence_grace", 0.1, lambda name, seq: fired.append(name))
             
-            assert not tc.silence_prompt_task.done()
-            assert not tc.silence_grace_task.done()
+            assert "silence_prompt" in tc.deadlines
+            assert "silence_grace" in tc.deadlines
             
             tc.on_speech_detected("hello")
             
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(0.2)
             
-            assert tc.silence_prompt_task is None
-            assert tc.silence_grace_task is None
+            assert "silence_prompt" not in tc.deadlines
+            assert "silence_grace" not in tc.deadlines
+            assert fired == []
         
         asyncio.run(run_test())
     
     def test_on_speech_detected_does_not_cancel_wrapup_timer(self):
-        """on_speech_detected should NOT cancel max_answer or wrapup timers."""
+        """on_speech_detected should NOT cancel max_answer or wrapup deadlines."""
         from moderator import TurnController
         
         async def run_test():
             tc = TurnController()
             tc.start_turn("p1", "Alice", "Question")
             
-            async def fake_task():
-                await asyncio.sleep(10)
-            
-            tc.max_answer_task = asyncio.create_task(fake_task())
-            tc.wrapup_task = asyncio.create_task(fake_task())
+            tc.arm_deadline("max_answer", 10, lambda name, seq: None)
+            tc.arm_deadline("wrapup_end", 10, lambda name, seq: None)
             
             tc.on_speech_detected("hello")
             
             await asyncio.sleep(0.1)
             
-            # These should still be running (not cancelled by speech detection)
-            assert tc.max_answer_task is not None
-            assert tc.wrapup_task is not None
+            # These should still be armed (not cancelled by speech detection)
+            assert "max_answer" in tc.deadlines
+            assert "wrapup_end" in tc.deadlines
             
             # Cleanup
-            tc.cancel_all_tasks()
+            tc.cancel_all_deadlines()
         
         asyncio.run(run_test())
     
-    def test_cancel_all_tasks_cleans_up(self):
-        """cancel_all_tasks should cancel all running tasks."""
+    def test_cancel_all_deadlines_cleans_up(self):
+        """cancel_all_deadlines should cancel every armed deadline."""
         from moderator import TurnController
         
         async def run_test():
             tc = TurnController()
             tc.start_turn("p1", "Alice", "Question")
             
-            async def fake_task():
-                await asyncio.sleep(10)
-            
-            tc.silence_prompt_task = asyncio.create_task(fake_task())
-            tc.silence_grace_task = asyncio.create_task(fake_task())
-            tc.max_answer_task = asyncio.create_task(fake_task())
-            tc.wrapup_task = asyncio.create_task(fake_task())
-            tc.end_of_speech_task = asyncio.create_task(fake_task())
+            fired = []
+            for name in ["silence_prompt", "silence_grace", "max_answer", "wrapup_end", "end_of_speech"]:
+                tc.arm_deadline(name, 0.1, lambda name, seq: fired.append(name))
             
-            tc.cancel_all_tasks()
+            tc.cancel_all_deadlines()
             
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(0.2)
             
-            assert tc.silence_prompt_task is None
-            assert tc.silence_grace_task is None
-            assert tc.max_answer_task is None
-            assert tc.wrapup_task is None
-            assert tc.end_of_speech_task is None
+            assert tc.deadlines == {}
+            assert fired == []
         
         asyncio.run(run_test())
     
     def test_on_turn_end_sets_event_and_cancels_tasks(self):
-        """on_turn_end should set turn_ended event and cancel all tasks."""
+        """on_turn_end should set turn_ended event and cancel all deadlines."""
         from moderator import TurnController
         
         async def run_test():
             tc = TurnController()
             tc.start_turn("p1", "Alice", "Question")
             
-            async def fake_task():
-                await asyncio.sleep(10)
-            
-            tc.silence_prompt_task = asyncio.create_task(fake_task())
+            tc.arm_deadline("silence_prompt", 10, lambda name, seq: None)
             
             assert not tc.turn_ended.is_set()
             
             tc.on_turn_end("test_reason")
             
             assert tc.turn_ended.is_set()
-            assert tc.silence_prompt_task is None
+            assert tc.deadlines == {}
+        
+        asyncio.run(run_test())
+    
+    def test_claim_deadline_rejects_rearmed_fire(self):
+        """A fire from a re-armed deadline must not be honoured."""
+        from moderator import TurnController
+        
+        async def run_test():
+            tc = TurnController()
+            tc.start_turn("p1", "Alice", "Question")
+            
+            first_seq = tc.arm_deadline("end_of_speech", 0.05, lambda name, seq: None)
+            second_seq = tc.arm_deadline("end_of_speech", 0.05, lambda name, seq: None)
+            
+            assert tc.claim_deadline("end_of_speech", second_seq) is False  # not fired yet
+            await asyncio.sleep(0.1)
+            
+            assert tc.claim_deadline("end_of_speech", first_seq) is False
+            assert tc.claim_deadline("end_of_speech", second_seq) is True
+            assert tc.claim_deadline("end_of_speech", second_seq) is False
         
         asyncio.run(run_test())
     
@@ -358,6 +365,69 @@ class TestTurnController:
         tc.on_speech_detected("I think the product is excellent")
         
         assert tc.is_asking_to_repeat() is False
+    
+    def test_end_of_speech_silence_adapts_per_participant(self):
+        """VAD pauses within answers set each participant's own threshold."""
+        from moderator import TurnController
+        
+        clock = [1000.0]
+        tc = TurnController()
+        
+        def answer(gaps, word):
+            for gap in gaps:
+                tc.on_vad(True)
+                tc.on_speech_detected(word, False)
+                clock[0] += 1.0
+                tc.on_speech_detected(word)  # interim then final: not a pause
+                tc.on_vad(False)
+                clock[0] += gap
+            tc.on_turn_end("answer")
+        
+        with patch('moderator.time.time', lambda: clock[0]):
+            tc.start_turn("slow", "Sam", "Question")
+            answer([2.0, 2.5, 1.8, 2.2, 2.4, 0], "and then")
+            tc.start_turn("fast", "Fay", "Question")
+            answer([0.4, 0.3, 0.5, 0.4, 0], "right")
+        
+        tc.start_turn("slow", "Sam", "Question")
+        slow = tc.resolve_end_of_speech_silence(4.0)
+        tc.start_turn("fast", "Fay", "Question")
+        fast = tc.resolve_end_of_speech_silence(4.0)
+        tc.start_turn("new", "Nia", "Question")
+        cold = tc.resolve_end_of_speech_silence(4.0)
+        
+        assert slow == pytest.approx(3.0)  # p90 2.5 + 0.5 margin
+        assert fast == pytest.approx(1.5)  # clamped to the lower bound
+        assert cold == 4.0  # no history yet: fallback
+    
+    def test_late_speech_counts_false_end_of_turn_once(self):
+        """Speech right after an answer commit is a false end of turn."""
+        from moderator import TurnController
+        
+        clock = [1000.0]
+        tc = TurnController()
+        with patch('moderator.time.time', lambda: clock[0]):
+            tc.start_turn("p1", "Alice", "Question")
+            tc.on_vad(True)
+            tc.on_speech_detected("I liked it because")
+            tc.on_vad(False)
+            clock[0] += 1.5
+            tc.on_turn_end("answer")
+            clock[0] += 0.5
+            tc.on_vad(True)
+            
+            assert tc.on_late_speech("p2") is False  # someone else spoke up
+            assert tc.on_late_speech("p1") is True
+            assert tc.on_late_speech("p1") is False  # once per turn
+        model = tc.pause_models["p1"]
+        assert (tc.false_eot_count, model.false_eots, model.eot_commits) == (1, 1, 1)
+        assert list(model.pauses) == [2.0]  # the VAD silence that fooled us
+        assert "p2" not in tc.pause_models
+        
+        # Late speech after a silence skip is not a false end of turn
+        tc.start_turn("p1", "Alice", "Question")
+        tc.on_turn_end("silence_skip")
+        assert tc.on_late_speech("p1") is False
 
 
 class TestSilenceHandling:
@@ -432,16 +502,12 @@ class TestSilenceHandling:
         
         prompt_triggered = False
         
-        async def silence_prompt_watcher():
+        def silence_prompt_fired(name, seq):
             nonlocal prompt_triggered
-            try:
-                await asyncio.sleep(0.5)  # Would trigger prompt
-                if not tc.has_speech:
-                    prompt_triggered = True
-            except asyncio.CancelledError:
-                pass
+            if not tc.has_speech:
+                prompt_triggered = True
         
-        tc.silence_prompt_task = asyncio.create_task(silence_prompt_watcher())
+        tc.arm_deadline("silence_prompt", 0.5, silence_prompt_fired)  # Would trigger prompt
         
         # Speech arrives before prompt time
         await asyncio.sleep(0.2)
@@ -462,18 +528,14 @@ class TestSilenceHandling:
         
         skip_triggered = False
         
-        async def grace_watcher():
+        def grace_fired(name, seq):
             nonlocal skip_triggered
-            try:
-                await asyncio.sleep(0.5)
-                if not tc.has_speech:
-                    skip_triggered = True
-            except asyncio.CancelledError:
-                pass
+            if not tc.has_speech:
+                skip_triggered = True
         
         # Simulate prompt already happened
         tc.silence_prompted = True
-        tc.silence_grace_task = asyncio.create_task(grace_watcher())
+        tc.arm_deadline("silence_grace", 0.5, grace_fired)
         
         # Speech arrives during grace period
         await asyncio.sleep(0.2)
@@ -499,22 +561,15 @@ class TestLongAnswerHandling:
         wrapup_triggered = False
         max_answer_seconds = 0.3  # Short for test
         
-        async def max_answer_watcher():
+        def max_answer_fired(name, seq):
             nonlocal wrapup_triggered
-            try:
-                await tc.speech_detected.wait()
-                remaining = max_answer_seconds - tc.answer_duration()
-                if remaining > 0:
-                    await asyncio.sleep(remaining)
+            if tc.claim_deadline(name, seq):
                 wrapup_triggered = True
                 tc.wrapup_prompted = True
-            except asyncio.CancelledError:
-                pass
-        
-        tc.max_answer_task = asyncio.create_task(max_answer_watcher())
         
-        # Start speaking
+        # Start speaking, then arm max answer from first speech
         tc.on_speech_detected("This is a long answer that goes on and on...")
+        tc.arm_deadline("max_answer", max_answer_seconds - tc.answer_duration(), max_answer_fired)
         
         # Wait for wrapup
         await asyncio.sleep(0.5)
@@ -522,7 +577,7 @@ class TestLongAnswerHandling:
         assert wrapup_triggered is True
         assert tc.wrapup_prompted is True
         
-        tc.cancel_all_tasks()
+        tc.cancel_all_deadlines()
     
     @pytest.mark.asyncio
     async def test_wrapup_end_after_wrapup_seconds(self):
@@ -535,22 +590,18 @@ class TestLongAnswerHandling:
         wrapup_end_triggered = False
         wrapup_seconds = 0.2  # Short for test
         
-        async def wrapup_end_watcher():
+        def wrapup_end_fired(name, seq):
             nonlocal wrapup_end_triggered
-            try:
-                await asyncio.sleep(wrapup_seconds)
-                wrapup_end_triggered = True
-            except asyncio.CancelledError:
-                pass
+            wrapup_end_triggered = True
         
         tc.wrapup_prompted = True
-        tc.wrapup_task = asyncio.create_task(wrapup_end_watcher())
+        tc.arm_deadline("wrapup_end", wrapup_seconds, wrapup_end_fired)
         
         await asyncio.sleep(0.4)
         
         assert wrapup_end_triggered is True
         
-        tc.cancel_all_tasks()
+        tc.cancel_all_deadlines()
     
     @pytest.mark.asyncio
     async def test_early_stop_cancels_wrapup_timer(self):
@@ -563,20 +614,14 @@ class TestLongAnswerHandling:
         tc.on_speech_detected("Short answer.")
         tc.wrapup_prompted = True
         
-        async def fake_wrapup():
-            try:
-                await asyncio.sleep(10)
-            except asyncio.CancelledError:
-                pass
-        
-        tc.wrapup_task = asyncio.create_task(fake_wrapup())
+        tc.arm_deadline("wrapup_end", 10, lambda name, seq: None)
         
         # Turn ends early
         tc.on_turn_end("answer")
         
         await asyncio.sleep(0.1)
         
-        assert tc.wrapup_task is None
+        assert "wrapup_end" not in tc.deadlines
 
 
 class TestGhostTimerPrevention:
@@ -596,17 +641,13 @@ class TestGhostTimerPrevention:
         tc.start_turn("p1", "Alice", "Question 1", "q1")
         turn_a_id = tc.turn_id
         
-        async def turn_a_timer():
+        def turn_a_timer(name, seq):
             nonlocal turn_a_fired
-            try:
-                await asyncio.sleep(0.3)
-                # Should check turn_id before firing
-                if tc.turn_id == turn_a_id:
-                    turn_a_fired = True
-            except asyncio.CancelledError:
-                pass
+            # Should check turn_id before firing
+            if tc.turn_id == turn_a_id:
+                turn_a_fired = True
         
-        tc.silence_prompt_task = asyncio.create_task(turn_a_timer())
+        tc.arm_deadline("silence_prompt", 0.3, turn_a_timer)
         
         # Immediately start turn B (before timer fires)
         await asyncio.sleep(0.1)
@@ -645,15 +686,11 @@ class TestGhostTimerPrevention:
         
         effects_after_end = []
         
-        async def delayed_effect():
-            try:
-                await asyncio.sleep(0.2)
-                if not tc.turn_ended.is_set():
-                    effects_after_end.append("effect fired")
-            except asyncio.CancelledError:
-                pass
+        def delayed_effect(name, seq):
+            if not tc.turn_ended.is_set():
+                effects_after_end.append("effect fired")
         
-        tc.silence_prompt_task = asyncio.create_task(delayed_effect())
+        tc.arm_deadline("silence_prompt", 0.2, delayed_effect)
         
         # End turn immediately
         tc.on_turn_end("manual")
@@ -664,6 +701,374 @@ class TestGhostTimerPrevention:
         assert len(effects_after_end) == 0
 
 
+class FakeSpeechHandle:
+    """Minimal SpeechHandle stand-in: completes on the next loop iteration."""
+    
+    def __init__(self):
+        self._callbacks = []
+        asyncio.get_running_loop().call_soon(self._done)
+    
+    def add_done_callback(self, cb):
+        self._callbacks.append(cb)
+    
+    def _done(self):
+        for cb in self._callbacks:
+            cb(self)
+    
+    def __await__(self):
+        yield from asyncio.sleep(0).__await__()
+
+
+class FakeSession:
+    """Records what the agent says."""
+    
+    def __init__(self):
+        self.said = []
+    
+    def say(self, text, **kwargs):
+        self.said.append(text)
+        return FakeSpeechHandle()
+
+
+def inject_transcript(state, text, is_final=False):
+    """Mimic the transcript handler in entrypoint."""
+    from moderator import TurnEventKind
+    state.turn_controller.on_speech_detected(text, is_final)
+    state.turn_engine.post(TurnEventKind.TRANSCRIPT, text=text, is_final=is_final)
+
+
+class TestTranscriptIngestion:
+    """Test ingest_transcript and the final-only answer buffers."""
+    
+    def make_state(self):
+        from moderator import ModeratorState, QuestionState
+        
+        state = ModeratorState()
+        state.turn_engine = Mock()
+        state.turn_controller.start_turn("p1", "Dana", "Question", "q1")
+        state.current_question.state = QuestionState.WAITING_FOR_RESPONSE
+        return state
+    
+    def test_interims_mark_activity_but_only_finals_are_kept(self):
+        from moderator import ingest_transcript
+        
+        state = self.make_state()
+        for text in ["I think", "I think the price", "I think the price is"]:
+            ingest_transcript(state, text, False)
+        tc = state.turn_controller
+        
+        assert tc.has_speech and state.current_question.has_speech
+        assert tc.transcripts == [] and state.current_question.transcripts == []
+        assert tc.get_full_text() == "I think the price is"  # latest interim only
+        assert state.turn_engine.post.call_count == 3
+        
+        ingest_transcript(state, "I think the price is fair.", True)
+        ingest_transcript(state, "But", False)
+        
+        assert tc.transcripts == ["I think the price is fair."]
+        assert tc.get_full_text() == "I think the price is fair. But"
+        assert state.current_question.get_full_text() == "I think the price is fair. But"
+        tc.cancel_all_deadlines()
+    
+    def test_interim_logging_throttled(self, capsys):
+        from moderator import ingest_transcript
+        
+        state = self.make_state()
+        for n in range(10):
+            ingest_transcript(state, "word " * (n + 1), False)
+        ingest_transcript(state, "word word word.", True)
+        
+        lines = [l for l in capsys.readouterr().out.splitlines() if "USER_INPUT_TRANSCRIBED" in l]
+        assert len(lines) == 2
+        assert "skipped=9" in lines[1] and "is_final=True" in lines[1]
+        state.turn_controller.cancel_all_deadlines()
+
+
+class TestTurnEngine:
+    """Test the single-queue turn engine behind wait_for_turn_completion."""
+    
+    @pytest.mark.asyncio
+    async def test_answer_ends_on_end_of_speech(self):
+        """Speech followed by END_OF_SPEECH_SILENCE ends the turn as an answer."""
+        from moderator import ModeratorState, wait_for_turn_completion, QuestionState, TurnEngine
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_engine = TurnEngine(state, session)
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        
+        async def answer():
+            await asyncio.sleep(0.1)
+            inject_transcript(state, "I think it is great")
+        
+        with patch('moderator.END_OF_SPEECH_SILENCE', 0.3):
+            speaker = asyncio.ensure_future(answer())
+            result = await asyncio.wait_for(
+                wait_for_turn_completion(state, session, "q1", 0, "Alice"), timeout=3.0)
+        
+        await speaker
+        assert result == (True, False, "answer")
+        assert state.current_question.state == QuestionState.RESPONSE_COMPLETE
+        assert session.said == []
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_silence_prompts_then_skips(self):
+        """No speech: silence prompt is spoken, then the participant is skipped."""
+        from moderator import ModeratorState, wait_for_turn_completion, SPEECH_SILENCE_PROMPT
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        
+        with patch('moderator.SILENCE_PROMPT_SECONDS', 0.1), \
+             patch('moderator.SILENCE_GRACE_SECONDS', 0.1):
+            result = await asyncio.wait_for(
+                wait_for_turn_completion(state, session, "q1", 0, "Alice"), timeout=3.0)
+        
+        assert result == (False, False, "silence_skip")
+        assert session.said == [SPEECH_SILENCE_PROMPT.format(name="Alice")]
+        assert state.turn_controller.silence_prompted is True
+        assert state.agent_speaking is False
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_long_answer_wraps_up(self):
+        """Continuous speech past MAX_ANSWER_SECONDS triggers wrap-up, then ends."""
+        from moderator import ModeratorState, wait_for_turn_completion, SPEECH_WRAPUP_PROMPT
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        
+        async def keep_talking():
+            for _ in range(20):
+                inject_transcript(state, "and another thing")
+                await asyncio.sleep(0.05)
+        
+        with patch('moderator.MAX_ANSWER_SECONDS', 0.2), \
+             patch('moderator.WRAPUP_SECONDS', 0.2), \
+             patch('moderator.END_OF_SPEECH_SILENCE', 1.0):
+            talker = asyncio.ensure_future(keep_talking())
+            result = await asyncio.wait_for(
+                wait_for_turn_completion(state, session, "q1", 0, "Alice"), timeout=3.0)
+            talker.cancel()
+        
+        assert result == (True, False, "wrapup")
+        assert session.said == [SPEECH_WRAPUP_PROMPT]
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_repeat_request(self):
+        """A repeat request ends the turn with asked_to_repeat=True."""
+        from moderator import ModeratorState, wait_for_turn_completion, TurnEngine
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_engine = TurnEngine(state, session)
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        inject_transcript(state, "sorry, can you repeat the question")
+        
+        with patch('moderator.END_OF_SPEECH_SILENCE', 0.2):
+            result = await asyncio.wait_for(
+                wait_for_turn_completion(state, session, "q1", 0, "Alice"), timeout=3.0)
+        
+        assert result == (True, True, "repeat")
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_external_end(self):
+        """end_turn resolves the wait with end_reason 'external'."""
+        from moderator import ModeratorState, wait_for_turn_completion, TurnEngine
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_engine = TurnEngine(state, session)
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        
+        asyncio.get_running_loop().call_later(0.1, state.turn_engine.end_turn)
+        result = await asyncio.wait_for(
+            wait_for_turn_completion(state, session, "q1", 0, "Alice"), timeout=3.0)
+        
+        assert result == (False, False, "external")
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_stale_events_ignored(self):
+        """Events posted for a previous turn do not affect the current one."""
+        from moderator import ModeratorState, wait_for_turn_completion, TurnEngine, TurnEventKind
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_engine = TurnEngine(state, session)
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        state.turn_engine.end_turn()  # queued for turn 1
+        state.turn_controller.start_turn("p2", "Bob", "Question", "q1")
+        
+        asyncio.get_running_loop().call_later(0.2, state.turn_engine.end_turn)
+        started = time.time()
+        result = await asyncio.wait_for(
+            wait_for_turn_completion(state, session, "q1", 0, "Bob"), timeout=3.0)
+        
+        assert result == (False, False, "external")
+        assert time.time() - started >= 0.15
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_confident_end_of_turn_skips_fallback_silence(self):
+        """VAD end + final complete sentence ends the turn well before the fallback."""
+        from moderator import ModeratorState, wait_for_turn_completion, TurnEngine, TurnEventKind
+        from pause_model import PauseModel
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_engine = TurnEngine(state, session)
+        state.turn_controller.pause_models["p1"] = quick = PauseModel()  # a quick speaker
+        for _ in range(4):
+            quick.record_pause(0.3)
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        
+        async def answer():
+            await asyncio.sleep(0.05)
+            state.turn_engine.post(TurnEventKind.VAD, name="speaking")
+            inject_transcript(state, "I really liked the checkout flow.", is_final=True)
+            await asyncio.sleep(0.05)
+            state.turn_engine.post(TurnEventKind.VAD, name="listening")
+        
+        with patch('moderator.END_OF_SPEECH_SILENCE', 2.0), \
+             patch('moderator.EOT_DETECTOR_ENABLED', True):
+            state.turn_engine.detector.commit_seconds = 0.1
+            speaker = asyncio.ensure_future(answer())
+            started = time.time()
+            result = await asyncio.wait_for(
+                wait_for_turn_completion(state, session, "q1", 0, "Alice"), timeout=3.0)
+            elapsed = time.time() - started
+        
+        await speaker
+        assert result == (True, False, "answer")
+        assert elapsed < 1.0, f"Should commit on signals, took {elapsed:.2f}s"
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_confident_end_of_turn_waits_for_unknown_speaker(self):
+        """Without pause history, a confident end of turn still waits out the threshold."""
+        from moderator import ModeratorState, wait_for_turn_completion, TurnEngine, TurnEventKind
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_engine = TurnEngine(state, session)
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        
+        async def answer():
+            await asyncio.sleep(0.05)
+            state.turn_engine.post(TurnEventKind.VAD, name="speaking")
+            inject_transcript(state, "I really liked the checkout flow.", is_final=True)
+            await asyncio.sleep(0.05)
+            state.turn_engine.post(TurnEventKind.VAD, name="listening")
+        
+        with patch('moderator.END_OF_SPEECH_SILENCE', 0.6), \
+             patch('moderator.EOT_DETECTOR_ENABLED', True):
+            state.turn_engine.detector.commit_seconds = 0.05
+            speaker = asyncio.ensure_future(answer())
+            started = time.time()
+            result = await asyncio.wait_for(
+                wait_for_turn_completion(state, session, "q1", 0, "Alice"), timeout=3.0)
+            elapsed = time.time() - started
+        
+        await speaker
+        assert result == (True, False, "answer")
+        assert elapsed >= 0.65  # speech ends at 0.1s, then the full 0.6s threshold
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_confident_end_of_turn_holds_for_learned_pause(self):
+        """A speaker who pauses between sentences is not cut off at commit_seconds."""
+        from moderator import ModeratorState, wait_for_turn_completion, TurnEngine, TurnEventKind
+        from pause_model import PauseModel
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_engine = TurnEngine(state, session)
+        state.turn_controller.pause_models["p1"] = pauses = PauseModel()
+        for _ in range(4):
+            pauses.record_pause(0.8)
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        
+        async def answer():
+            await asyncio.sleep(0.05)
+            state.turn_engine.post(TurnEventKind.VAD, name="speaking")
+            inject_transcript(state, "I really liked the checkout flow.", is_final=True)
+            await asyncio.sleep(0.05)
+            state.turn_engine.post(TurnEventKind.VAD, name="listening")
+        
+        with patch('moderator.END_OF_SPEECH_SILENCE', 3.0), \
+             patch('moderator.EOT_DETECTOR_ENABLED', True):
+            state.turn_engine.detector.commit_seconds = 0.05
+            speaker = asyncio.ensure_future(answer())
+            started = time.time()
+            result = await asyncio.wait_for(
+                wait_for_turn_completion(state, session, "q1", 0, "Alice"), timeout=3.0)
+            elapsed = time.time() - started
+        
+        await speaker
+        assert result == (True, False, "answer")
+        assert 0.8 <= elapsed < 1.4  # their 0.8s pause, not 0.05s or the 1.5s threshold
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_incomplete_sentence_waits_for_fallback(self):
+        """A dangling sentence is not committed early even after VAD end."""
+        from moderator import ModeratorState, wait_for_turn_completion, TurnEngine, TurnEventKind
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_engine = TurnEngine(state, session)
+        state.turn_controller.start_turn("p1", "Alice", "Question", "q1")
+        
+        state.turn_engine.post(TurnEventKind.VAD, name="speaking")
+        inject_transcript(state, "I really liked the checkout flow because", is_final=True)
+        state.turn_engine.post(TurnEventKind.VAD, name="listening")
+        
+        with patch('moderator.END_OF_SPEECH_SILENCE', 0.6), \
+             patch('moderator.EOT_DETECTOR_ENABLED', True):
+            state.turn_engine.detector.commit_seconds = 0.05
+            started = time.time()
+            result = await asyncio.wait_for(
+                wait_for_turn_completion(state, session, "q1", 0, "Alice"), timeout=3.0)
+            elapsed = time.time() - started
+        
+        assert result == (True, False, "answer")
+        assert elapsed >= 0.5
+        await state.turn_engine.stop()
+    
+    @pytest.mark.asyncio
+    async def test_no_tasks_created_per_turn(self):
+        """Running turns must not create tasks beyond the engine loop."""
+        from moderator import ModeratorState, wait_for_turn_completion, TurnEngine
+        
+        state = ModeratorState()
+        session = FakeSession()
+        state.turn_engine = TurnEngine(state, session)
+        state.turn_engine.start()
+        await asyncio.sleep(0)
+        baseline = len(asyncio.all_tasks())
+        peak = baseline
+        
+        def sample():
+            nonlocal peak
+            peak = max(peak, len(asyncio.all_tasks()))
+        
+        with patch('moderator.END_OF_SPEECH_SILENCE', 0.05):
+            for i in range(5):
+                state.turn_controller.start_turn(f"p{i}", f"User{i}", "Question", "q1")
+                inject_transcript(state, "an answer")
+                asyncio.get_running_loop().call_later(0.02, sample)
+                await wait_for_turn_completion(state, session, "q1", 0, f"User{i}")
+        
+        assert peak == baseline
+        await state.turn_engine.stop()
+
+
 class TestWaitForResponseEventDriven:
     """Test the legacy event-driven response waiting logic."""
     
@@ -0,0 +1,295 @@
+"""
+Unit tests for the webhook-driven LiveKit room mirror.
+
+Tests:
+1. Signed webhooks update the mirror and the session's agent (joins and leaves); bad signatures are rejected
+2. Late (reordered) participant events do not undo newer ones
+3. Reconcile corrects drift without clobbering webhooks that land mid-listing
+4. Status, debug, health and agent checks answer from the mirror
+5. Status re-lists a stale room (once for concurrent polls) while waiting for the agent
+"""
+
+import asyncio
+import base64
+import hashlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from google.protobuf.json_format import MessageToJson
+from livekit import api
+
+# Add services/api to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "api"))
+
+API_KEY = "key"
+API_SECRET = "secret-secret-secret-secret-secret"
+
+
+def webhook(event, room, identity=None, created_at=100, secret=API_SECRET):
+    """Signed (body, headers) as LiveKit would POST them."""
+    message = api.WebhookEvent(event=event, room=api.Room(name=room), created_at=created_at)
+    if identity:
+        message.participant.CopyFrom(api.ParticipantInfo(identity=identity, name=identity))
+    body = MessageToJson(message)
+    sha = base64.b64encode(hashlib.sha256(body.encode()).digest()).decode()
+    token = api.AccessToken(API_KEY, secret).with_sha256(sha).to_jwt()
+    return body, {"Authorization": token, "Content-Type": "application/webhook+json"}
+
+
+class FakeRoomService:
+    """RoomService stub listing fixed rooms; `during` runs mid-listing."""
+
+    def __init__(self, rooms, during=None):
+        self.rooms = rooms
+        self.during = during
+        self.calls = 0
+
+    async def list_rooms(self, request):
+        self.calls += 1
+        return SimpleNamespace(rooms=[SimpleNamespace(name=name) for name in self.rooms])
+
+    async def list_participants(self, request):
+        self.calls += 1
+        if self.during is not None:
+            self.during()
+            self.during = None
+        return SimpleNamespace(participants=[
+            api.ParticipantInfo(identity=identity, name=identity) for identity in self.rooms[request.room]])
+
+
+def make_client(monkeypatch):
+    from fastapi.testclient import TestClient
+    import main
+
+    async def fake_notify(room_name, message):
+        return True
+
+    monkeypatch.setattr(main, "notify_agent", fake_notify)
+    monkeypatch.setattr(main, "LIVEKIT_API_KEY", API_KEY)
+    monkeypatch.setattr(main, "LIVEKIT_API_SECRET", API_SECRET)
+    monkeypatch.setattr(main, "room_mirror", main.RoomMirror())
+    return TestClient(main.app), main
+
+
+class TestWebhooks:
+    """Test the webhook endpoint and event application."""
+
+    def test_signed_webhooks_update_mirror_and_session(self, monkeypatch):
+        client, main = make_client(monkeypatch)
+        session = client.post("/api/sessions").json()
+        room = session["roomName"]
+
+        for event, identity in [("room_started", None), ("participant_joined", "dana_1"),
+                                ("participant_joined", "agent-AJ_x1")]:
+            body, headers = webhook(event, room, identity)
+            assert client.post("/api/livekit/webhook", content=body, headers=headers).status_code == 200
+
+        assert [p["identity"] for p in main.room_mirror.participants(room)] == ["dana_1", "agent-AJ_x1"]
+        assert main.sessions[session["id"]].agent_identity == "agent-AJ_x1"
+        assert main.event_logs[session["id"]].last["agent"]["agentJoined"] is True
+
+        body, headers = webhook("room_finished", room)
+        client.post("/api/livekit/webhook", content=body, headers=headers)
+        assert room not in main.room_mirror.rooms
+        assert room not in main.room_mirror._versions and room not in main.room_mirror._fresh_at
+        assert not any(key[0] == room for key in main.room_mirror._seen)
+
+    def test_agent_leaving_clears_session(self, monkeypatch):
+        client, main = make_client(monkeypatch)
+        session = client.post("/api/sessions").json()
+        room = session["roomName"]
+
+        for event, identity in [("participant_joined", "dana_1"), ("participant_joined", "agent-AJ_x1"),
+                                ("participant_left", "agent-AJ_x1")]:
+            body, headers = webhook(event, room, identity)
+            client.post("/api/livekit/webhook", content=body, headers=headers)
+
+        assert main.sessions[session["id"]].agent_joined is False
+        assert main.event_logs[session["id"]].last["agent"] == {"agentJoined": False, "agentIdentity": None}
+
+        # A human's webhook does not clear an agent the mirror still shows
+        for event, identity in [("participant_joined", "agent-AJ_x2"), ("participant_left", "dana_1")]:
+            body, headers = webhook(event, room, identity, created_at=200)
+            client.post("/api/livekit/webhook", content=body, headers=headers)
+        assert main.event_logs[session["id"]].last["agent"]["agentIdentity"] == "agent-AJ_x2"
+
+        # Nor does a status check of a room the mirror never saw
+        other = client.post("/api/sessions").json()
+        main.confirm_agent(main.sessions[other["id"]], "agent-AJ_x3", "channel")
+        monkeypatch.setattr(main, "ROOM_MIRROR_STALE_SECONDS", float("inf"))
+        client.get(f"/api/sessions/{other['id']}/status")
+        assert main.sessions[other["id"]].agent_joined is True
+
+    def test_bad_signature_rejected(self, monkeypatch):
+        client, main = make_client(monkeypatch)
+
+        body, headers = webhook("participant_joined", "r1", "dana_1", secret="wrong-wrong-wrong-wrong-wrong-wrong")
+        assert client.post("/api/livekit/webhook", content=body, headers=headers).status_code == 401
+        body, headers = webhook("participant_joined", "r1", "dana_1")
+        assert client.post("/api/livekit/webhook", content=body + " ", headers=headers).status_code == 401
+        assert main.room_mirror.rooms == {}
+
+    def test_late_event_ignored(self):
+        from main import RoomMirror
+
+        mirror = RoomMirror()
+        joined = api.WebhookEvent(event="participant_joined", room=api.Room(name="r1"), created_at=100,
+                                  participant=api.ParticipantInfo(identity="dana_1"))
+        left = api.WebhookEvent(event="participant_left", room=api.Room(name="r1"), created_at=105,
+                                participant=api.ParticipantInfo(identity="dana_1"))
+
+        assert mirror.apply_webhook(left) == "r1"
+        assert mirror.apply_webhook(joined) is None  # delivered after the newer leave
+        assert mirror.participants("r1") == []
+
+
+class TestReconcile:
+    """Test drift correction against a RoomService stub."""
+
+    def test_reconcile_corrects_drift(self):
+        from main import RoomMirror
+
+        mirror = RoomMirror()
+        mirror.replace_room("gone", [{"identity": "x", "is_agent": False}])
+        mirror.replace_room("r1", [{"identity": "dana_1", "is_agent": False}])
+        service = FakeRoomService({"r1": ["dana_1", "agent-AJ_x1"], "r2": ["lee_2"]})
+
+        drifted = asyncio.run(mirror.reconcile(service))
+
+        assert sorted(drifted) == ["gone", "r1", "r2"]
+        assert sorted(mirror.rooms) == ["r1", "r2"]
+        assert mirror.agent_identity("r1") == "agent-AJ_x1"
+        assert "gone" not in mirror._versions and "gone" not in mirror._fresh_at
+        assert asyncio.run(mirror.reconcile(service)) == []
+
+    def test_webhook_during_listing_wins(self):
+        from main import RoomMirror
+
+        mirror = RoomMirror()
+        left = api.WebhookEvent(event="participant_left", room=api.Room(name="r1"), created_at=200,
+                                participant=api.ParticipantInfo(identity="dana_1"))
+        service = FakeRoomService({"r1": ["dana_1"]}, during=lambda: mirror.apply_webhook(left))
+
+        asyncio.run(mirror.reconcile(service))
+
+        assert mirror.participants("r1") == []
+
+
+class TestEndpointsFromMemory:
+    """Test that presence endpoints never call RoomService."""
+
+    def test_status_debug_health_use_mirror(self, monkeypatch):
+        client, main = make_client(monkeypatch)
+
+        async def no_room_service():
+            raise AssertionError("RoomService called")
+
+        monkeypatch.setattr(main, "get_room_service", no_room_service)
+        session = client.post("/api/sessions").json()
+        room = session["roomName"]
+        asyncio.run(main.room_mirror.reconcile(FakeRoomService({room: ["dana_1", "agent-AJ_x1"]})))
+
+        status = client.get(f"/api/sessions/{session['id']}/status").json()
+        debug = client.get("/api/session/debug", params={"room": room}).json()
+        health = client.get("/api/agent/health").json()
+
+        assert status["agentJoined"] is True and status["livekitParticipants"] == ["dana_1", "agent-AJ_x1"]
+        assert status["agentIdentity"] == "agent-AJ_x1"
+        assert debug["agent_present"] is True and debug["api_session_found"] is True
+        assert health["livekit_reachable"] is True and room in health["active_rooms"]
+
+    def test_status_relists_stale_room_while_waiting_for_agent(self, monkeypatch):
+        client, main = make_client(monkeypatch)
+        session = client.post("/api/sessions").json()
+        room = session["roomName"]
+        service = FakeRoomService({room: ["dana_1"]})
+
+        async def room_service():
+            await asyncio.sleep(0.01)
+            return service
+
+        monkeypatch.setattr(main, "get_room_service", room_service)
+        monkeypatch.setattr(main, "room_listings", main.SingleFlight())
+        main.room_mirror.replace_room(room, [])  # fresh, but the agent joined since
+
+        assert client.get(f"/api/sessions/{session['id']}/status").json()["agentJoined"] is False
+        assert service.calls == 0
+
+        service.rooms[room].append("agent-AJ_x1")
+        monkeypatch.setattr(main, "ROOM_MIRROR_STALE_SECONDS", 0)
+
+        async def poll():
+            return await asyncio.gather(*(main.get_session_status(session["id"]) for _ in range(5)))
+
+        statuses = asyncio.run(poll())
+
+        assert all(s["agentJoined"] for s in statuses) and service.calls == 1
+        assert statuses[-1]["agentIdentity"] == "agent-AJ_x1"
+        client.get(f"/api/sessions/{session['id']}/status")
+        assert service.calls == 1  # agent confirmed: back to the mirror alone
+
+    def test_check_agent_wakes_on_webhook(self, monkeypatch):
+        import main
+
+        mirror = main.RoomMirror()
+        monkeypatch.setattr(main, "room_mirror", mirror)
+        mirror.webhooks = 1  # webhooks are flowing: no RoomService fallback
+        joined = api.WebhookEvent(event="participant_joined", room=api.Room(name="r1"), created_at=100,
+                                  participant=api.ParticipantInfo(identity="agent-AJ_x1"))
+
+        async def run():
+            check = asyncio.create_task(main.check_agent_in_room("r1", max_attempts=10, delay=1.0))
+            await asyncio.sleep(0.05)
+            mirror.apply_webhook(joined)
+            return await asyncio.wait_for(check, 0.5)
+
+        assert asyncio.run(run()) is True
+
+
+class TestRoomServiceClient:
+    """Test the shared client and per-room request coalescing."""
+
+    def test_concurrent_listings_share_one_call(self, monkeypatch):
+        import main
+
+        class SlowRoomService(FakeRoomService):
+            async def list_participants(self, request):
+                await asyncio.sleep(0.05)
+                return await super().list_participants(request)
+
+        service = SlowRoomService({"r1": ["dana_1", "agent-AJ_x1"], "r2": ["lee_2"]})
+
+        async def fake_room_service():
+            return service
+
+        monkeypatch.setattr(main, "get_room_service", fake_room_service)
+        monkeypatch.setattr(main, "room_listings", main.SingleFlight())
+
+        async def run():
+            return await asyncio.gather(*(main.list_room_participants(room) for room in ["r1"] * 50 + ["r2"] * 50))
+
+        results = asyncio.run(run())
+
+        assert service.calls == 2
+        assert [p["identity"] for p in results[0]] == ["dana_1", "agent-AJ_x1"]
+        assert [p["identity"] for p in results[-1]] == ["lee_2"]
+        assert main.room_listings.shared == 98
+        assert asyncio.run(main.list_room_participants("r1")) == results[0] and service.calls == 3
+
+    def test_lifespan_owns_one_client(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        monkeypatch.setattr(main, "LIVEKIT_API_KEY", API_KEY)
+        monkeypatch.setattr(main, "LIVEKIT_API_SECRET", API_SECRET)
+        monkeypatch.setattr(main, "LIVEKIT_RECONCILE_SECONDS", 0)
+
+        with TestClient(main.app) as client:
+            client.get("/api/health")
+            first, http = main.livekit_client, main.livekit_http
+            assert asyncio.run(main.get_room_service()) is first.room
+            assert http.connector.limit == main.LIVEKIT_POOL_SIZE
+
+        assert main.livekit_client is None and main.livekit_http is None
+        assert http.closed
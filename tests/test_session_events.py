@@ -0,0 +1,138 @@
+"""
+Unit tests for the server-sent session event stream.
+
+Tests:
+1. Topics are published only when their value changes
+2. A reconnect cursor replays missed events; a stale cursor gets a snapshot
+3. API actions (join, hand raise, agent events) publish deltas
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add services/api to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "api"))
+
+
+def parse(chunks):
+    """SSE chunks -> [(id, event, data)], ignoring comments."""
+    events = []
+    for chunk in chunks:
+        if chunk.startswith(":"):
+            continue
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+        events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def collect(log, cursor, count, during=None):
+    """Read up to `count` chunks from the stream, optionally acting once it is waiting."""
+    from main import session_event_stream
+
+    async def never():
+        return False
+
+    chunks = []
+
+    async def read():
+        stream = session_event_stream(log, cursor, never)
+        async for chunk in stream:
+            chunks.append(chunk)
+            if len(chunks) >= count:
+                break
+        await stream.aclose()
+
+    reader = asyncio.create_task(read())
+    await asyncio.sleep(0.05)
+    if during is not None:
+        during()
+    try:
+        await asyncio.wait_for(reader, 0.5)
+    except asyncio.TimeoutError:
+        pass
+    return chunks
+
+
+class TestEventLog:
+    """Test change detection and cursors."""
+
+    def test_publishes_only_changes(self):
+        from main import SessionEventLog
+
+        log = SessionEventLog()
+        assert log.publish({"status": {"status": "waiting"}, "hands": {"handRaiseQueue": []}}) == 2
+        assert log.publish({"status": {"status": "waiting"}, "hands": {"handRaiseQueue": []}}) == 0
+        assert log.publish({"status": {"status": "in_session"}, "hands": {"handRaiseQueue": []}}) == 1
+        assert [(i, t) for i, t, _ in log.events] == [(1, "status"), (2, "hands"), (3, "status")]
+
+    def test_since_cursor(self):
+        from main import SessionEventLog
+
+        log = SessionEventLog(size=3)
+        for n in range(5):
+            log.publish({"question": {"currentQuestionId": f"q{n}"}})
+
+        assert [i for i, _, _ in log.since(3)] == [4, 5]
+        assert log.since(5) == []
+        assert log.since(1) is None   # fell out of the buffer
+        assert log.since(99) is None  # from before an API restart
+
+
+class TestStream:
+    """Test the SSE body generator."""
+
+    def test_snapshot_then_live_delta(self):
+        from main import SessionEventLog
+
+        log = SessionEventLog()
+        log.publish({"status": {"status": "waiting"}, "hands": {"handRaiseQueue": []}})
+
+        chunks = asyncio.run(collect(log, None, 2, during=lambda: log.publish(
+            {"status": {"status": "in_session"}, "hands": {"handRaiseQueue": []}})))
+        events = parse(chunks)
+
+        assert events[0][:2] == (2, "snapshot")
+        assert events[0][2]["status"] == {"status": "waiting"}
+        assert events[1] == (3, "status", {"status": "in_session"})
+
+    def test_resume_replays_missed_events(self):
+        from main import SessionEventLog
+
+        log = SessionEventLog()
+        for queue in ([], ["dana_1"], ["dana_1", "lee_2"]):
+            log.publish({"hands": {"handRaiseQueue": queue}})
+
+        events = parse(asyncio.run(collect(log, 1, 5)))
+
+        assert [(i, t) for i, t, _ in events] == [(2, "hands"), (3, "hands")]
+        assert events[-1][2] == {"handRaiseQueue": ["dana_1", "lee_2"]}
+
+
+class TestApiPublishes:
+    """Test that session changes reach the event log."""
+
+    def test_actions_publish_deltas(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        async def fake_notify(room_name, message):
+            return True
+
+        monkeypatch.setattr(main, "notify_agent", fake_notify)
+        monkeypatch.setattr(main, "LIVEKIT_API_KEY", "key")
+        monkeypatch.setattr(main, "LIVEKIT_API_SECRET", "secret-secret-secret-secret-secret")
+        client = TestClient(main.app)
+        sid = client.post("/api/sessions").json()["id"]
+        log = main.event_logs[sid]
+        start = log.seq
+
+        joined = client.post(f"/api/sessions/{sid}/join", json={"displayName": "Dana"}).json()
+        client.post(f"/api/sessions/{sid}/raise-hand", json={"participantId": joined["identity"]})
+        main.apply_agent_event({"s": sid, "k": "question", "qid": "q1", "sid": "intro"})
+
+        topics = [t for i, t, _ in log.events if i > start]
+        assert topics == ["roster", "roster", "hands", "question"]
+        assert log.last["question"]["currentQuestionId"] == "q1"
+        assert client.get("/api/sessions/nope/events").status_code == 404
@@ -0,0 +1,199 @@
+"""
+Unit tests for the pushed session start signal.
+
+Tests:
+1. The API pushes session_started / session_ended to the agent
+   and accepts the start without waiting for the agent to appear
+2. The agent starts as soon as the push arrives, without polling
+3. A start that happened before the agent was listening is read once
+4. A pushed end stops the turn in progress instead of running it to its deadline
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add services/agent and services/api to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "api"))
+
+
+class FakeRoom:
+    def __init__(self):
+        self.remote_participants = {}
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+class TestStartPush:
+    """Test the API side of the start signal."""
+
+    def test_start_and_end_notify_agent(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        sent = []
+
+        async def fake_notify(room_name, message):
+            sent.append((room_name, message))
+            return True
+
+        async def no_agent(room_name, max_attempts=10, delay=1.0):
+            return False
+
+        monkeypatch.setattr(main, "notify_agent", fake_notify)
+        monkeypatch.setattr(main, "check_agent_in_room", no_agent)
+        client = TestClient(main.app)
+        session = client.post("/api/sessions").json()
+
+        client.post(f"/api/sessions/{session['id']}/start")
+        client.post(f"/api/sessions/{session['id']}/end")
+
+        assert [m["type"] for _, m in sent] == ["session_started", "session_ended"]
+        assert all(room == session["roomName"] for room, _ in sent)
+        assert sent[0][1]["participants"] == []
+
+    def test_start_accepts_then_agent_confirms_over_channel(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        import main
+
+        async def slow_agent(room_name, max_attempts=10, delay=1.0):
+            await asyncio.sleep(max_attempts * delay)
+            return False
+
+        monkeypatch.setattr(main, "check_agent_in_room", slow_agent)
+
+        with TestClient(main.app) as client:
+            sid = client.post("/api/sessions").json()["id"]
+            started_at = time.time()
+            response = client.post(f"/api/sessions/{sid}/start")
+            elapsed = time.time() - started_at
+
+            assert response.status_code == 202
+            assert response.json()["agentConfirmed"] is False
+            assert elapsed < 1.0
+            assert sid in main.agent_confirmations
+
+            from api_channel import agent_token
+
+            monkeypatch.setenv("LIVEKIT_API_KEY", "devkey")
+            monkeypatch.setenv("LIVEKIT_API_SECRET", "devsecret-devsecret-devsecret-devsecret")
+            monkeypatch.setattr(main, "LIVEKIT_API_KEY", "devkey")
+            monkeypatch.setattr(main, "LIVEKIT_API_SECRET", "devsecret-devsecret-devsecret-devsecret")
+            headers = {"Authorization": f"Bearer {agent_token('w1')}"}
+            with client.websocket_connect("/api/agent/ws?worker=w1", headers=headers) as ws:
+                ws.send_json({"type": "subscribe", "s": sid, "identity": "agent-AJ_w1"})
+                deadline = time.time() + 2
+                while not main.sessions[sid].agent_joined and time.time() < deadline:
+                    time.sleep(0.01)
+
+        assert main.sessions[sid].agent_identity == "agent-AJ_w1"
+        assert main.event_logs[sid].last["agent"] == {"agentJoined": True, "agentIdentity": "agent-AJ_w1"}
+        assert sid not in main.agent_confirmations
+
+
+class TestAgentWait:
+    """Test wait_for_session_start on the agent."""
+
+    def make_state(self, monkeypatch, status="waiting"):
+        import moderator
+
+        reads = []
+
+        async def fake_speak(session, text, **kwargs):
+            return None
+
+        async def fake_check(state):
+            reads.append(time.time())
+            state.apply_session_status({"status": status}, source="api")
+
+        monkeypatch.setattr(moderator, "speak", fake_speak)
+        monkeypatch.setattr(moderator, "check_session_status", fake_check)
+        state = moderator.ModeratorState()
+        state.session_id = "abc"
+        return state, reads
+
+    def test_push_starts_without_polling(self, monkeypatch):
+        import moderator
+
+        state, reads = self.make_state(monkeypatch)
+
+        async def run():
+            waiter = asyncio.create_task(moderator.wait_for_session_start(state, None, FakeRoom()))
+            await asyncio.sleep(0.2)
+            assert not waiter.done()
+            pushed_at = time.time()
+            state.apply_session_status({"status": "in_session", "participants": [
+                {"identity": "dana_1", "displayName": "Dana"}]}, source="push")
+            started = await waiter
+            return started, time.time() - pushed_at
+
+        started, latency = asyncio.run(run())
+
+        assert started is True
+        assert latency < 0.05
+        assert len(reads) == 1
+        assert "dana_1" in state.participants
+
+    def test_already_started_reads_once(self, monkeypatch):
+        import moderator
+
+        state, reads = self.make_state(monkeypatch, status="in_session")
+
+        assert asyncio.run(moderator.wait_for_session_start(state, None, FakeRoom())) is True
+        assert len(reads) == 1
+
+    def test_pushed_end_stops_waiting(self, monkeypatch):
+        import moderator
+
+        state, reads = self.make_state(monkeypatch)
+
+        async def run():
+            waiter = asyncio.create_task(moderator.wait_for_session_start(state, None, FakeRoom()))
+            await asyncio.sleep(0.05)
+            state.apply_session_status({"status": "ended"}, source="push")
+            return await waiter
+
+        assert asyncio.run(run()) is False
+        assert state.session_ended is True
+
+
+class TestAgentSessionEnd:
+    """Test session_ended arriving mid-discussion."""
+
+    def test_end_stops_current_turn(self, monkeypatch):
+        import moderator
+
+        said = []
+
+        async def fake_speak(session, text, **kwargs):
+            said.append(text)
+
+        async def no_gap(name):
+            return None
+
+        class Session:
+            def say(self, text, **kwargs):
+                raise RuntimeError("no audio in tests")
+
+        monkeypatch.setattr(moderator, "speak", fake_speak)
+        state = moderator.ModeratorState()
+        monkeypatch.setattr(state.pacer, "gap", no_gap)
+
+        async def run():
+            state.turn_engine = moderator.TurnEngine(state, Session())
+            asker = asyncio.create_task(moderator.ask_participant(
+                state, Session(), {"identity": "dana_1", "displayName": "Dana"}, "How do you shop?", "q1", 0))
+            await asyncio.sleep(0.1)
+            moderator.handle_control_message(state, {"type": "session_ended"})
+            result = await asyncio.wait_for(asker, 1.0)
+            await state.turn_engine.stop()
+            return result
+
+        assert asyncio.run(run()) is True
+        assert state.session_ended is True
+        assert state.turn_controller.end_reason == "session_end"
+        assert said == [moderator.SPEECH_NEXT_TURN.format(name="Dana")]  # no silence move-on afterwards
@@ -0,0 +1,142 @@
+"""
+Unit tests for the worker-wide hierarchical timer wheel.
+
+Tests:
+1. Deadlines fire after their delay
+2. Cancel and re-arm prevent stale fires
+3. Fired deadlines are claimed exactly once
+4. Long deadlines cascade through higher levels
+5. Keys are isolated per (room, turn_id, name)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+
+class TestTimerWheel:
+    """Test the TimerWheel arm/cancel/claim contract."""
+
+    def test_deadline_fires_after_delay(self):
+        """An armed deadline should fire once, after (not before) its delay."""
+        from timer_wheel import TimerWheel
+
+        async def run_test():
+            wheel = TimerWheel(tick=0.005)
+            loop = asyncio.get_running_loop()
+            fired = []
+            started = loop.time()
+            wheel.arm(("room", 1, "silence_prompt"), 0.05, lambda key, seq: fired.append(loop.time() - started))
+
+            await asyncio.sleep(0.02)
+            assert fired == []
+            assert len(wheel) == 1
+
+            await asyncio.sleep(0.08)
+            assert len(fired) == 1
+            assert fired[0] >= 0.05
+            assert len(wheel) == 0
+
+        asyncio.run(run_test())
+
+    def test_cancel_prevents_fire(self):
+        """A cancelled deadline should never fire."""
+        from timer_wheel import TimerWheel
+
+        async def run_test():
+            wheel = TimerWheel(tick=0.005)
+            fired = []
+            key = ("room", 1, "silence_grace")
+            wheel.arm(key, 0.03, lambda key, seq: fired.append(key))
+
+            assert wheel.cancel(key) is True
+            assert wheel.cancel(key) is False
+            await asyncio.sleep(0.08)
+
+            assert fired == []
+            assert wheel.is_armed(key) is False
+
+        asyncio.run(run_test())
+
+    def test_rearm_replaces_previous_deadline(self):
+        """Re-arming a key should drop the earlier deadline."""
+        from timer_wheel import TimerWheel
+
+        async def run_test():
+            wheel = TimerWheel(tick=0.005)
+            fired = []
+            key = ("room", 1, "end_of_speech")
+            first = wheel.arm(key, 0.03, lambda key, seq: fired.append(seq))
+            second = wheel.arm(key, 0.06, lambda key, seq: fired.append(seq))
+
+            await asyncio.sleep(0.1)
+
+            assert fired == [second]
+            assert wheel.claim(key, first) is False
+            assert wheel.claim(key, second) is True
+            assert wheel.claim(key, second) is False
+
+        asyncio.run(run_test())
+
+    def test_unclaimed_fire_can_be_cancelled(self):
+        """Cancelling after fire (before claim) should make the claim fail."""
+        from timer_wheel import TimerWheel
+
+        async def run_test():
+            wheel = TimerWheel(tick=0.005)
+            seqs = []
+            key = ("room", 1, "silence_prompt")
+            wheel.arm(key, 0.01, lambda key, seq: seqs.append(seq))
+
+            await asyncio.sleep(0.05)
+            assert len(seqs) == 1
+
+            wheel.cancel(key)
+            assert wheel.claim(key, seqs[0]) is False
+
+        asyncio.run(run_test())
+
+    def test_long_deadlines_cascade(self):
+        """Deadlines beyond level 0 should cascade down and fire in order."""
+        from timer_wheel import TimerWheel
+
+        async def run_test():
+            # 4 slots per level: level 0 covers 4 ticks, level 1 covers 16, level 2 covers 64
+            wheel = TimerWheel(tick=0.002, slot_bits=2, levels=3)
+            fired = []
+            delays = [0.004, 0.02, 0.05, 0.09, 0.2]
+            for i, delay in enumerate(delays):
+                wheel.arm(("room", i, "max_answer"), delay, lambda key, seq: fired.append(key[1]))
+
+            await asyncio.sleep(0.35)
+
+            assert fired == [0, 1, 2, 3, 4]
+            assert len(wheel) == 0
+
+        asyncio.run(run_test())
+
+    def test_keys_are_isolated_per_room_and_turn(self):
+        """Cancelling one room's turn must not touch another's."""
+        from timer_wheel import TimerWheel
+
+        async def run_test():
+            wheel = TimerWheel(tick=0.005)
+            fired = []
+            wheel.arm(("room-a", 3, "silence_prompt"), 0.02, lambda key, seq: fired.append(key))
+            wheel.arm(("room-b", 3, "silence_prompt"), 0.02, lambda key, seq: fired.append(key))
+
+            wheel.cancel(("room-a", 3, "silence_prompt"))
+            await asyncio.sleep(0.06)
+
+            assert fired == [("room-b", 3, "silence_prompt")]
+
+        asyncio.run(run_test())
+
+    def test_shared_wheel_is_singleton(self):
+        """get_timer_wheel returns the same worker-wide instance."""
+        from timer_wheel import get_timer_wheel
+
+        assert get_timer_wheel() is get_timer_wheel()
@@ -0,0 +1,208 @@
+"""
+Unit tests for embedding-based off-topic detection.
+
+Tests:
+1. Question vectors are built once per guide and skip unscored steps
+2. The tracker batches finals for embedding and scores the whole answer
+3. The hashing fallback only flags off-topic together with a spoken cue
+4. The turn engine embeds off the event loop and ends an off-topic answer
+   with end_reason "off_topic"
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+GUIDE = {
+    "meta": {"title": "Pricing study"},
+    "sections": [
+        {"id": "intro", "title": "Intro", "questions": [
+            {"id": "consent", "type": "rollcall", "text": "Do you consent?"},
+        ]},
+        {"id": "price", "title": "Pricing", "questions": [
+            {"id": "q_price", "text": "What do you think about the price?"},
+            {"id": "q_setup", "text": "How was the onboarding?"},
+        ]},
+    ],
+}
+
+ON_TOPIC = ["Honestly the price felt a bit expensive", "for what you get,", "but the cost is fair overall."]
+OFF_TOPIC = ["So I watched the football game", "with my brother last weekend", "and the match went to extra time."]
+
+
+class TopicEmbedder:
+    """Deterministic 'semantic' embedder: one axis per topic."""
+
+    semantic = True
+    name = "topics-test"
+    axes = {"price": 0, "expensive": 0, "cost": 0, "pricing": 0, "football": 1, "game": 1,
+            "weekend": 1, "match": 1, "onboarding": 2, "setup": 2}
+
+    def __init__(self):
+        self.calls = []
+
+    def embed(self, texts):
+        self.calls.append(len(texts))
+        vectors = np.full((len(texts), 4), 0.05, dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().replace(",", " ").replace(".", " ").replace("?", " ").split():
+                if word in self.axes:
+                    vectors[row, self.axes[word]] += 1.0
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def plan():
+    from guide_plan import compile_guide
+
+    return compile_guide(GUIDE, "Mixed")
+
+
+class TestQuestionVectors:
+    """Test precomputed question embeddings."""
+
+    def test_built_once_per_guide(self):
+        from topic_match import question_vectors
+
+        embedder = TopicEmbedder()
+        vectors = question_vectors(plan(), embedder)
+
+        assert sorted(vectors.rows) == ["q_price", "q_setup"]
+        assert vectors.vector("consent") is None
+        assert vectors.matrix.shape == (2, 4) and embedder.calls == [2]
+        assert question_vectors(plan(), embedder) is vectors and embedder.calls == [2]
+
+
+class TestTopicTracker:
+    """Test batched answer scoring."""
+
+    def feed(self, tracker, texts):
+        from topic_match import embed_texts
+
+        for text in texts:
+            batch = tracker.add(text)
+            if batch:
+                tracker.apply(embed_texts(tracker.embedder, batch))
+        tracker.flush()
+
+    def tracker(self, batch_size=2):
+        from topic_match import TopicTracker, question_vectors
+
+        embedder = TopicEmbedder()
+        tracker = TopicTracker(embedder, batch_size=batch_size)
+        tracker.reset(question_vectors(plan(), embedder).vector("q_price"))
+        return tracker, embedder
+
+    def test_batches_and_scores(self):
+        from topic_match import embed_texts
+
+        tracker, embedder = self.tracker()
+        embedder.calls.clear()
+        batches = [texts for texts in map(tracker.add, ON_TOPIC) if texts]
+
+        assert batches == [ON_TOPIC[:2]] and tracker.pending == [ON_TOPIC[2]]
+        assert embedder.calls == [] and tracker.similarity() is None
+        tracker.apply(embed_texts(embedder, batches[0]))
+        tracker.flush()
+        assert tracker.similarity() > 0.9 and embedder.calls == [2, 1]
+        assert tracker.words == 17 and not tracker.is_off_topic()
+
+    def test_off_topic_answer(self):
+        tracker, _ = self.tracker()
+        self.feed(tracker, OFF_TOPIC)
+
+        assert tracker.similarity() < 0.15
+        assert tracker.is_off_topic()
+
+    def test_short_answers_not_judged(self):
+        tracker, _ = self.tracker()
+        self.feed(tracker, ["The football game."])
+
+        assert not tracker.is_off_topic()
+
+    def test_hashing_fallback_needs_cue(self):
+        from topic_match import HashingEmbedder, TopicTracker, question_vectors
+
+        embedder = HashingEmbedder()
+        tracker = TopicTracker(embedder)
+        tracker.reset(question_vectors(plan(), embedder).vector("q_price"))
+        self.feed(tracker, OFF_TOPIC)
+
+        assert not tracker.is_off_topic()
+        assert tracker.is_off_topic(cue=True)
+
+        tracker.reset(tracker.question)
+        self.feed(tracker, ON_TOPIC)
+        assert not tracker.is_off_topic(cue=True)
+
+
+class TestTurnEngine:
+    """Test the redirect decision at end of turn."""
+
+    async def run_answer(self, qid, finals, embedder=None):
+        from moderator import ModeratorState, TurnEngine, TurnEventKind, wait_for_turn_completion
+        from topic_match import question_vectors
+
+        class Session:
+            def say(self, text, **kwargs):
+                raise RuntimeError("no audio in tests")
+
+        state = ModeratorState()
+        state.question_vectors = question_vectors(plan(), embedder or TopicEmbedder())
+        state.turn_engine = TurnEngine(state, Session())
+        state.turn_controller.start_turn("p1", "Alice", "Question", qid)
+        for text in finals:
+            state.turn_controller.on_speech_detected(text, True)
+            state.turn_engine.post(TurnEventKind.TRANSCRIPT, text=text, is_final=True)
+
+        with patch("moderator.END_OF_SPEECH_SILENCE", 0.2), patch("moderator.EOT_DETECTOR_ENABLED", False):
+            result = await asyncio.wait_for(wait_for_turn_completion(state, Session(), qid, 0, "Alice"), 3.0)
+        await state.turn_engine.stop()
+        return result
+
+    @pytest.mark.asyncio
+    async def test_off_topic_answer_redirects(self):
+        assert await self.run_answer("q_price", OFF_TOPIC) == (True, False, "off_topic")
+
+    @pytest.mark.asyncio
+    async def test_on_topic_and_unscored_answers(self):
+        assert await self.run_answer("q_price", ON_TOPIC) == (True, False, "answer")
+        assert await self.run_answer("consent", OFF_TOPIC) == (True, False, "answer")
+
+    @pytest.mark.asyncio
+    async def test_embeds_off_the_event_loop(self):
+        import threading
+
+        class SlowEmbedder(TopicEmbedder):
+            name = "topics-slow"
+
+            def embed(self, texts):
+                if not any("?" in t for t in texts):  # answer chunks, not the guide's questions
+                    self.threads.add(threading.current_thread().name)
+                    time.sleep(0.1)
+                return super().embed(texts)
+
+        embedder = SlowEmbedder()
+        embedder.threads = set()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await self.run_answer("q_price", OFF_TOPIC, embedder)
+        task.cancel()
+
+        assert result == (True, False, "off_topic")
+        assert all(name.startswith("topic-embed") for name in embedder.threads)
+        assert ticks > 20  # the loop kept running while the model did
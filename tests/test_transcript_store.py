@@ -0,0 +1,170 @@
+"""
+Unit tests for the append-only transcript store.
+
+Tests:
+1. Segments round-trip through the buffered writer and the mmap reader
+2. The question index reads one question's segments; a stale index is rebuilt
+3. A torn tail from a crash is dropped when the log is reopened
+4. A failed write is cut back and retried without corrupting the index
+5. The moderator records only final transcripts, attributed to the speaker and the current turn
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+
+def segment(n, qid="q1", pid="dana_1"):
+    from transcript_store import Segment
+
+    return Segment(pid, pid.split("_")[0].title(), qid, n, 1000 * n, 1000 * n + 800, f"answer {n} ✓")
+
+
+class TestTranscriptLog:
+    """Test writing and reading back a session log."""
+
+    def test_round_trip_and_question_index(self, tmp_path):
+        from transcript_store import TranscriptLog, read_segments
+
+        async def write():
+            log = TranscriptLog("abc", str(tmp_path), flush_interval=0.01)
+            for n in range(6):
+                log.append(segment(n, qid=f"q{n % 2}", pid=["dana_1", "lee_2"][n % 2]))
+            await asyncio.sleep(0.05)
+            flushed = log.flushes
+            log.append(segment(6, qid="q0"))
+            await log.close()
+            return log, flushed
+
+        log, flushed = asyncio.run(write())
+
+        assert flushed >= 1  # written in the background before close
+        assert [s.turn_id for s in read_segments(log.path)] == list(range(7))
+        assert [s.turn_id for s in read_segments(log.path, "q0")] == [0, 2, 4, 6]
+        assert list(read_segments(log.path, "missing")) == []
+        first = next(read_segments(log.path))
+        assert (first.participant, first.name, first.text) == ("dana_1", "Dana", "answer 0 ✓")
+
+    def test_reopen_appends_and_rebuilds_stale_index(self, tmp_path):
+        from transcript_store import TranscriptLog, read_segments
+
+        async def write(turns):
+            log = TranscriptLog("abc", str(tmp_path))
+            for n in turns:
+                log.append(segment(n, qid="q1"))
+            await log.close()
+            return log.path
+
+        path = asyncio.run(write([1, 2]))
+        asyncio.run(write([3]))
+        with open(path, "ab") as f:
+            f.write(segment(4, qid="q1").encode())  # appended behind the saved index's back
+
+        assert [s.turn_id for s in read_segments(path, "q1")] == [1, 2, 3, 4]
+
+    def test_torn_tail_dropped_on_reopen(self, tmp_path):
+        from transcript_store import TranscriptLog, read_segments
+
+        async def write(turns):
+            log = TranscriptLog("abc", str(tmp_path))
+            for n in turns:
+                log.append(segment(n))
+            await log.close()
+            return log.path
+
+        path = asyncio.run(write([1]))
+        with open(path, "ab") as f:
+            f.write(segment(2).encode()[:-5])  # crash mid-write
+
+        assert [s.turn_id for s in read_segments(path)] == [1]
+        asyncio.run(write([3]))
+        assert [s.turn_id for s in read_segments(path)] == [1, 3]
+
+
+    def test_failed_write_retried_without_advancing_index(self, tmp_path):
+        from transcript_store import TranscriptLog, load_index, read_segments
+
+        class FlakyFile:
+            """Writes part of the first chunk, then fails like a full disk."""
+
+            def __init__(self, f):
+                self.f = f
+                self.failures = 1
+
+            def write(self, data):
+                if self.failures:
+                    self.failures -= 1
+                    self.f.write(bytes(data[:7]))
+                    raise OSError("No space left on device")
+                return self.f.write(data)
+
+            def __getattr__(self, name):
+                return getattr(self.f, name)
+
+        async def write():
+            log = TranscriptLog("abc", str(tmp_path))
+            log._file = FlakyFile(log._file)
+            log.append(segment(1, qid="q1"))
+            log.append(segment(2, qid="q2"))
+            await log.flush()
+            failed = (log._size, dict(log.index), log.path.stat().st_size)
+            log.append(segment(3, qid="q1"))
+            await log.close()
+            return log, failed
+
+        log, (size, index, on_disk) = asyncio.run(write())
+
+        assert index == {} and size == on_disk  # nothing counted, torn bytes cut back
+        assert [s.turn_id for s in read_segments(log.path)] == [1, 2, 3]
+        assert [s.turn_id for s in read_segments(log.path, "q1")] == [1, 3]
+        assert load_index(log.path) == log.index
+
+
+class TestModeratorRecording:
+    """Test transcript attribution in ModeratorState."""
+
+    def test_records_final_segments_for_current_turn(self, tmp_path):
+        from moderator import ModeratorState
+        from transcript_store import TranscriptLog, read_segments
+
+        async def run():
+            state = ModeratorState()
+            state.transcript_log = TranscriptLog("abc", str(tmp_path))
+            state.turn_controller.start_turn("dana_1", "Dana", "How do you shop?", "q3")
+            state.record_transcript("I mostly", False)
+            await asyncio.sleep(0.02)
+            state.record_transcript("I mostly shop online.", True)
+            state.record_transcript("Late at night.", True)
+            await state.transcript_log.close()
+            state.turn_controller.cancel_all_deadlines()
+            return state.transcript_log.path
+
+        segments = list(read_segments(asyncio.run(run())))
+
+        assert [s.text for s in segments] == ["I mostly shop online.", "Late at night."]
+        assert {(s.participant, s.question_id, s.turn_id) for s in segments} == {("dana_1", "q3", 1)}
+        assert segments[0].end_ms - segments[0].start_ms >= 20
+
+    def test_attributes_segments_to_the_speaker(self, tmp_path):
+        from moderator import ModeratorState
+        from transcript_store import TranscriptLog, read_segments
+
+        async def run():
+            state = ModeratorState()
+            state.participants["lee_2"] = {"identity": "lee_2", "displayName": "Lee"}
+            state.transcript_log = TranscriptLog("abc", str(tmp_path))
+            state.turn_controller.start_turn("dana_1", "Dana", "How do you shop?", "q3")
+            state.record_transcript("I mostly shop online.", True, speaker="dana_1")
+            state.record_transcript("Same here.", True, speaker="lee_2")  # cross-talk
+            state.record_transcript("Late at night.", True)  # speaker unknown
+            await state.transcript_log.close()
+            state.turn_controller.cancel_all_deadlines()
+            return state.transcript_log.path
+
+        segments = list(read_segments(asyncio.run(run()), "q3"))
+
+        assert [(s.participant, s.name) for s in segments] == [("dana_1", "Dana"), ("lee_2", "Lee"),
+                                                               ("dana_1", "Dana")]
@@ -0,0 +1,249 @@
+"""
+Unit tests for the on-disk TTS cache.
+
+Tests:
+1. Text normalization and content-addressed keys
+2. Frames round-trip through disk
+3. LRU size eviction; load, store and discard touch disk off the event loop
+4. Miss synthesizes and fills, hit replays without synthesis
+5. Interrupted playback is not cached
+6. speak() routes session.say through the cache
+7. Scripts are split into sentences and streamed with one-sentence lookahead
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add services/agent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "services" / "agent"))
+
+
+def make_frames(count=3, samples=480, value=1):
+    from livekit import rtc
+    return [rtc.AudioFrame(bytes([value, 0]) * samples, 24000, 1, samples) for _ in range(count)]
+
+
+class FakeTTS:
+    """Stands in for a livekit TTS plugin: synthesize() yields audio frames."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.requests = []
+
+    def synthesize(self, text):
+        self.requests.append(text)
+        frames = self.frames
+
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __aiter__(self):
+                return self._gen()
+
+            async def _gen(self):
+                for frame in frames:
+                    await asyncio.sleep(0)
+                    yield type("Audio", (), {"frame": frame})()
+
+        return Stream()
+
+
+async def drain(agen):
+    return [frame async for frame in agen]
+
+
+class TestNormalization:
+    """Test speech text normalization and cache keys."""
+
+    def test_markdown_is_stripped(self):
+        from speech_text import normalize_text
+
+        text = "## Welcome\n\n- **First**, tell us about `your` [day](http://x.y).\n"
+        assert normalize_text(text) == "Welcome First, tell us about your day."
+
+    def test_key_ignores_formatting_but_not_voice(self):
+        from tts_cache import cache_key
+
+        assert cache_key("echo", "m", "Hello  *there*") == cache_key("echo", "m", "Hello there")
+        assert cache_key("echo", "m", "Hello") != cache_key("ash", "m", "Hello")
+        assert cache_key("echo", "m", "Hello") != cache_key("echo", "m2", "Hello")
+
+
+class TestTTSCache:
+    """Test storage, eviction and playback."""
+
+    def test_frames_round_trip(self, tmp_path):
+        from tts_cache import TTSCache
+
+        cache = TTSCache(str(tmp_path))
+        frames = make_frames(value=7)
+        asyncio.run(cache.store("ab" * 32, frames))
+
+        loaded = asyncio.run(TTSCache(str(tmp_path)).load("ab" * 32))
+        assert len(loaded) == 3
+        assert loaded[0].sample_rate == 24000
+        assert loaded[0].samples_per_channel == 480
+        assert loaded[0].data.tobytes() == frames[0].data.tobytes()
+
+    def test_lru_eviction(self, tmp_path):
+        from tts_cache import TTSCache
+
+        cache = TTSCache(str(tmp_path), max_bytes=5000)  # room for two 2-frame entries
+
+        async def run():
+            await cache.store("a" * 64, make_frames(count=2))
+            await cache.store("b" * 64, make_frames(count=2))
+            await cache.load("a" * 64)  # a is now most recently used
+            await cache.store("c" * 64, make_frames(count=2))
+
+        asyncio.run(run())
+
+        assert "a" * 64 in cache
+        assert "b" * 64 not in cache
+        assert "c" * 64 in cache
+        assert cache.total_bytes <= 5000
+        assert not (tmp_path / "bb" / ("b" * 64 + ".pcm")).exists()
+
+    def test_disk_io_off_the_loop(self, tmp_path, monkeypatch):
+        import threading
+        import tts_cache
+        from tts_cache import TTSCache
+
+        threads = []
+        read, write = TTSCache._read, TTSCache._write_file
+
+        def spy(fn):
+            def wrapper(*args):
+                threads.append(threading.current_thread() is threading.main_thread())
+                return fn(*args)
+            return wrapper
+
+        monkeypatch.setattr(TTSCache, "_read", spy(read))
+        monkeypatch.setattr(TTSCache, "_write_file", spy(write))
+        monkeypatch.setattr(tts_cache, "_unlink", spy(tts_cache._unlink))
+        monkeypatch.setattr(tts_cache, "_remove", spy(tts_cache._remove))
+
+        async def run_test():
+            cache = TTSCache(str(tmp_path), max_bytes=5000)
+            await cache.store("a" * 64, make_frames(count=2))
+            await cache.store("b" * 64, make_frames(count=2))
+            assert len(await cache.load("a" * 64)) == 2
+            await cache.store("c" * 64, make_frames(count=2))
+            assert await cache.load("d" * 64) is None
+            assert await cache.discard("c" * 64) is True
+            assert await cache.discard("c" * 64) is False
+            return cache
+
+        cache = asyncio.run(run_test())
+
+        assert len(threads) == 7 and not any(threads)  # every read, write and unlink on a worker thread
+        assert "b" * 64 not in cache and "c" * 64 not in cache and (cache.hits, cache.misses) == (1, 1)
+        assert not (tmp_path / "bb" / ("b" * 64 + ".pcm")).exists()
+
+    def test_miss_fills_then_hit_replays(self, tmp_path):
+        from tts_cache import TTSCache
+
+        async def run_test():
+            cache = TTSCache(str(tmp_path))
+            tts = FakeTTS(make_frames())
+
+            first = await drain(cache.audio(tts, "echo", "m", "**Thank you.**"))
+            second = await drain(cache.audio(tts, "echo", "m", "Thank you."))
+
+            assert len(first) == len(second) == 3
+            assert tts.requests == ["Thank you."]  # synthesized once, normalized
+            assert (cache.hits, cache.misses) == (1, 1)
+
+        asyncio.run(run_test())
+
+    def test_interrupted_playback_is_not_cached(self, tmp_path):
+        from tts_cache import TTSCache
+
+        async def run_test():
+            cache = TTSCache(str(tmp_path))
+            agen = cache.audio(FakeTTS(make_frames()), "echo", "m", "Hello")
+            await agen.__anext__()
+            await agen.aclose()
+            assert len(cache) == 0
+
+        asyncio.run(run_test())
+
+    def test_speak_uses_session_tts(self, tmp_path, monkeypatch):
+        import moderator
+        import tts_cache
+
+        monkeypatch.setattr(tts_cache, "_cache", tts_cache.TTSCache(str(tmp_path)))
+
+        class Session:
+            def __init__(self, tts):
+                self.tts = tts
+                self.calls = []
+
+            def say(self, text, audio=None):
+                self.calls.append((text, audio))
+                return audio
+
+        async def run_test():
+            session = Session(FakeTTS(make_frames()))
+            await drain(moderator.speak(session, "Got it—thank you."))
+            await drain(moderator.speak(session, "Got it—thank you."))
+            assert [text for text, _ in session.calls] == ["Got it—thank you."] * 2
+            assert len(session.tts.requests) == 1
+
+        asyncio.run(run_test())
+
+
+class TestSentenceStreaming:
+    """Test sentence splitting and the sentence playout pipeline."""
+
+    def test_split_sentences(self):
+        from speech_text import split_sentences
+
+        script = ("## Welcome\n\nThanks for joining, e.g. Dr. Smith said hi. We talk for **45 minutes**!\n"
+                  "- First item\n- Second item.\n\n\"Quoted.\" Next one")
+        assert split_sentences(script) == (
+            "Welcome", "Thanks for joining, e.g. Dr. Smith said hi.", "We talk for 45 minutes!",
+            "First item", "Second item.", '"Quoted."', "Next one")
+        assert split_sentences("Thank you, Dana.") == ("Thank you, Dana.",)
+        assert split_sentences("  ") == ()
+
+    def test_next_sentence_synthesizes_while_current_plays(self, tmp_path):
+        from tts_cache import TTSCache
+
+        async def run_test():
+            tts = FakeTTS(make_frames(count=4))
+            cache = TTSCache(str(tmp_path))
+            agen = cache.audio(tts, "echo", "m", "First one. Second one. Third one.")
+
+            await agen.__anext__()  # first frame of sentence one
+            await asyncio.sleep(0.01)
+            assert tts.requests == ["First one.", "Second one."]
+
+            rest = [frame async for frame in agen]
+            assert len(rest) == 11
+            assert tts.requests == ["First one.", "Second one.", "Third one."]
+            assert len(cache) == 3
+
+        asyncio.run(run_test())
+
+    def test_failed_sentence_is_skipped(self, tmp_path):
+        from tts_cache import TTSCache
+
+        class FlakyTTS(FakeTTS):
+            def synthesize(self, text):
+                if text.startswith("Broken"):
+                    self.requests.append(text)
+                    raise RuntimeError("synthesis failed")
+                return super().synthesize(text)
+
+        async def run_test():
+            tts = FlakyTTS(make_frames(count=2))
+            frames = await drain(TTSCache(str(tmp_path)).audio(tts, "echo", "m", "Fine. Broken here. Fine again."))
+            assert len(frames) == 4
+
+        asyncio.run(run_test())